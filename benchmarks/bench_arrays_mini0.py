@@ -0,0 +1,130 @@
+"""
+Benchmark de los arreglos del runtime de Mini-0
+Compara los arreglos compactos de runtime_mini0 (memoryview sobre array('q')
+o bytearray) con listas de Python del mismo tamaño: memoria retenida por
+elemento (tracemalloc) y tiempo por lectura y por escritura indexada. Incluye
+una matriz [][]int como la arman los programas (un arreglo de filas creadas
+con new) frente a una lista de listas.
+"""
+
+import sys
+import os
+import json
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.runtime_mini0 import default_value, new_array
+from benchmarks.bench_mini0 import environment
+
+# Tipo de elemento -> valor que se guarda en la posición i (ints fuera del caché de CPython)
+ELEMENT_VALUES: Dict[str, Callable[[int], object]] = {
+    'int': lambda i: i * 1000 + 7,
+    'bool': lambda i: i % 3 == 0,
+    'char': lambda i: i % 256,
+    'string': lambda i: 'abc',
+}
+
+def list_array(tamano: int, elemento: str) -> list:
+    """Arreglo como lo representaban antes los motores"""
+    return [default_value(elemento)] * tamano
+
+def fill(arreglo, elemento: str):
+    valor = ELEMENT_VALUES[elemento]
+    for i in range(len(arreglo)):
+        arreglo[i] = valor(i)
+    return arreglo
+
+def retained_bytes(construir: Callable[[], object]) -> int:
+    """Bytes que siguen asignados mientras vive el objeto construido"""
+    tracemalloc.start()
+    try:
+        objeto = construir()
+        actual, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del objeto
+    return actual
+
+def access_times(arreglo, repeat: int) -> Dict[str, float]:
+    """Nanosegundos por lectura y por escritura indexada (mínimo de las repeticiones)"""
+    n = len(arreglo)
+    indices = range(n)
+    valor = arreglo[0]
+    lectura = escritura = float('inf')
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        for i in indices:
+            arreglo[i]
+        lectura = min(lectura, time.perf_counter() - inicio)
+        inicio = time.perf_counter()
+        for i in indices:
+            arreglo[i] = valor
+        escritura = min(escritura, time.perf_counter() - inicio)
+    return {'lectura_ns': lectura / n * 1e9, 'escritura_ns': escritura / n * 1e9}
+
+def matrix_read_ns(filas: list, repeat: int) -> float:
+    """Nanosegundos por acceso m[i][j] recorriendo toda la matriz"""
+    total = sum(len(fila) for fila in filas)
+    mejor = float('inf')
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        for fila in range(len(filas)):
+            actual = filas[fila]
+            for j in range(len(actual)):
+                filas[fila][j]
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor / total * 1e9
+
+def bench_arrays(tamano: int, repeat: int) -> Dict[str, dict]:
+    """Mediciones por tipo de elemento y representación; claves 'tipo/representacion'"""
+    resultados = {}
+    for elemento in ELEMENT_VALUES:
+        for representacion, crear in (('lista', list_array), ('runtime', new_array)):
+            memoria = retained_bytes(lambda: fill(crear(tamano, elemento), elemento))
+            arreglo = fill(crear(tamano, elemento), elemento)
+            resultado = {'bytes_por_elemento': memoria / tamano}
+            resultado.update(access_times(arreglo, repeat))
+            resultados[f"{elemento}/{representacion}"] = resultado
+    lado = int(tamano ** 0.5)
+    for representacion, crear in (
+            ('lista', lambda: [fill(list_array(lado, 'int'), 'int') for _ in range(lado)]),
+            ('runtime', lambda: [fill(new_array(lado, 'int'), 'int') for _ in range(lado)])):
+        memoria = retained_bytes(crear)
+        resultados[f"[][]int/{representacion}"] = {
+            'bytes_por_elemento': memoria / (lado * lado),
+            'lectura_ns': matrix_read_ns(crear(), repeat),
+        }
+    return resultados
+
+def format_report(resultados: Dict[str, dict]) -> List[str]:
+    lineas = [f"{'Arreglo':<22}{'Bytes/elem':>12}{'Lectura (ns)':>15}{'Escritura (ns)':>16}"]
+    lineas.append("-" * len(lineas[0]))
+    for clave, resultado in resultados.items():
+        escritura = resultado.get('escritura_ns')
+        lineas.append(f"{clave:<22}{resultado['bytes_por_elemento']:>12.2f}"
+                      f"{resultado['lectura_ns']:>15.1f}"
+                      f"{(f'{escritura:.1f}' if escritura is not None else '—'):>16}")
+    return lineas
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Memoria y tiempo de acceso de los arreglos Mini-0")
+    arg_parser.add_argument('--size', type=int, default=100000, help="elementos por arreglo")
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--output', help="guarda las mediciones en JSON")
+    args = arg_parser.parse_args()
+
+    print(f"Arreglos Mini-0: lista de Python vs runtime ({args.size:,} elementos)")
+    print("=" * 65)
+    resultados = bench_arrays(args.size, args.repeat)
+    for linea in format_report(resultados):
+        print(linea)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entorno': environment(), 'tamano': args.size,
+                       'resultados': resultados}, f, indent=2, ensure_ascii=False)
+
+if __name__ == "__main__":
+    main()
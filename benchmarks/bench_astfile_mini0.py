@@ -0,0 +1,116 @@
+"""
+Benchmark del formato binario de tokens y AST (src/astfile_mini0.py)
+Para corpus sintéticos de --size bytes compara volver a analizar el fuente
+(Lexer + ParserASTMini0) con leer el análisis guardado: abrir el .m0ast con
+mmap, cargar un pickle de los tokens y el arena (deserialización por
+objeto) y recorrer el árbol entero desde el arena en memoria y desde el
+mapeado. Verifica que el árbol leído sea igual al original.
+"""
+
+import sys
+import os
+import json
+import time
+import pickle
+import tempfile
+from typing import Dict, List
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ast_mini0 import ASTArena, parse_ast
+from src.astfile_mini0 import dumps_ast, open_ast, write_ast
+from benchmarks.corpus_mini0 import generate, parse_size
+from benchmarks.bench_mini0 import environment
+
+PROFILES = ('funciones', 'expresiones', 'anidamiento', 'cadenas', 'comentarios')
+
+def best_time(funcion, repeat: int) -> float:
+    mejor = float('inf')
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+def walk(arena: ASTArena) -> int:
+    """Recorre todos los nodos desde la raíz leyendo tipo y texto"""
+    pila = [arena.root]
+    texto = 0
+    while pila:
+        nodo = pila.pop()
+        texto += len(arena.text(nodo)) + arena.kind[nodo]
+        pila.extend(arena.children(nodo))
+    return texto
+
+def open_and_close(ruta: str):
+    open_ast(ruta).close()
+
+def bench_astfile(perfil: str, tamano: int, repeat: int, directorio: str) -> dict:
+    fuente = generate(perfil, tamano)
+    arena = parse_ast(fuente)
+    ruta = os.path.join(directorio, f"{perfil}.m0ast")
+    write_ast(arena, ruta)
+    datos_pickle = pickle.dumps((arena.tokens, arena), pickle.HIGHEST_PROTOCOL)
+
+    with open_ast(ruta) as ast:
+        mapeado = ast.arena
+        resultado = {
+            'tokens': len(arena.tokens),
+            'nodos': len(arena),
+            'fuente_bytes': len(fuente),
+            'm0ast_bytes': os.path.getsize(ruta),
+            'pickle_bytes': len(datos_pickle),
+            'analizar': best_time(lambda: parse_ast(fuente), repeat),
+            'serializar': best_time(lambda: dumps_ast(arena), repeat),
+            'abrir': best_time(lambda: open_and_close(ruta), repeat),
+            'pickle_loads': best_time(lambda: pickle.loads(datos_pickle), repeat),
+            'recorrer_memoria': best_time(lambda: walk(arena), repeat),
+            'recorrer_mapeado': best_time(lambda: walk(mapeado), repeat),
+            'coinciden': mapeado.dump() == arena.dump(),
+        }
+    return resultado
+
+def format_report(resultados: Dict[str, dict]) -> List[str]:
+    encabezado = (f"{'Corpus':<13}{'Nodos':>9}{'.m0ast KB':>11}{'Analizar':>11}{'Abrir':>10}"
+                  f"{'pickle':>10}{'Recorrer (mem/map)':>22}")
+    lineas = [encabezado, "-" * len(encabezado)]
+    for perfil, r in resultados.items():
+        lineas.append(f"{perfil:<13}{r['nodos']:>9,}{r['m0ast_bytes'] / 1024:>11,.0f}"
+                      f"{r['analizar'] * 1000:>8.1f} ms{r['abrir'] * 1e6:>7.0f} µs"
+                      f"{r['pickle_loads'] * 1000:>7.1f} ms"
+                      f"{r['recorrer_memoria'] * 1000:>11.1f} / {r['recorrer_mapeado'] * 1000:.1f} ms")
+        if not r['coinciden']:
+            lineas.append(f"{perfil:<13}❌ el árbol leído no coincide")
+    return lineas
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Tokens y AST en formato .m0ast vs volver a analizar")
+    arg_parser.add_argument('--size', default='1M', help="tamaño de cada corpus (ej. 256K, 10M)")
+    arg_parser.add_argument('--profiles', default=','.join(PROFILES),
+                            help=f"perfiles de corpus separados por coma (por omisión {','.join(PROFILES)})")
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--output', help="guarda las mediciones en JSON")
+    args = arg_parser.parse_args()
+
+    tamano = parse_size(args.size)
+    perfiles = [p for p in args.profiles.split(',') if p]
+    desconocidos = [p for p in perfiles if p not in PROFILES]
+    if desconocidos:
+        arg_parser.error(f"perfiles desconocidos: {', '.join(desconocidos)}")
+
+    print(f"Formato .m0ast ({args.size} por corpus)")
+    print("=" * 86)
+    with tempfile.TemporaryDirectory() as directorio:
+        resultados = {perfil: bench_astfile(perfil, tamano, args.repeat, directorio)
+                      for perfil in perfiles}
+    for linea in format_report(resultados):
+        print(linea)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entorno': environment(), 'tamano': tamano,
+                       'resultados': resultados}, f, indent=2, ensure_ascii=False)
+    if not all(r['coinciden'] for r in resultados.values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
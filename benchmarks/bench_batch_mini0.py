@@ -0,0 +1,135 @@
+"""
+Benchmark de la verificación por lotes (src/batch_mini0.py)
+Escribe --files programas sintéticos de --size bytes en un directorio
+temporal y los verifica en serie, con un pool de hilos y con un pool de
+procesos, solo con el resultado (errores y conteos) y con el AST de cada
+archivo de vuelta en el proceso principal (keep_ast), que con procesos hay
+que serializar. Comprueba que todos los ejecutores den el mismo resultado.
+Cada configuración corre una vez sin medir antes de las --repeat medidas,
+para que la primera no pague la lectura inicial de los archivos ni el
+arranque de los procesos.
+
+Con --interpreters corre el benchmark bajo cada intérprete de la lista
+(por ejemplo python3.13 y python3.13t, con y sin GIL) y muestra las tablas
+juntas; los intérpretes que no se encuentran se informan y se saltean.
+"""
+
+import sys
+import os
+import json
+import time
+import shutil
+import subprocess
+import tempfile
+from typing import Dict, List
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.batch_mini0 import check_files, interpreter_mode, gil_enabled
+from benchmarks.corpus_mini0 import generate, parse_size
+from benchmarks.bench_mini0 import environment
+
+PROFILES = ('funciones', 'anidamiento', 'cadenas', 'comentarios')
+EXECUTORS = ('serial', 'threads', 'processes')
+
+def write_corpus(directorio: str, archivos: int, tamano: int) -> List[str]:
+    rutas = []
+    for i in range(archivos):
+        ruta = os.path.join(directorio, f"p{i}.mini0")
+        with open(ruta, 'w', encoding='utf-8') as f:
+            f.write(generate(PROFILES[i % len(PROFILES)], tamano, seed=i))
+        rutas.append(ruta)
+    return rutas
+
+def summary(resultados) -> list:
+    return [(r.path, r.ok, r.errors, r.tokens, r.nodes) for r in resultados]
+
+def bench_batch(rutas: List[str], workers: int, repeat: int) -> Dict[str, dict]:
+    resultado: Dict[str, dict] = {}
+    referencia = None
+    for keep_ast in (False, True):
+        for executor in EXECUTORS:
+            # Calentamiento, fuera del cronómetro
+            list(check_files(rutas, executor, workers, keep_ast))
+            mejor = float('inf')
+            for _ in range(repeat):
+                inicio = time.perf_counter()
+                obtenidos = list(check_files(rutas, executor, workers, keep_ast))
+                mejor = min(mejor, time.perf_counter() - inicio)
+            if referencia is None:
+                referencia = summary(obtenidos)
+            resultado[f"{executor}{' +AST' if keep_ast else ''}"] = {
+                'segundos': mejor,
+                'archivos_s': len(rutas) / mejor,
+                'coinciden': summary(obtenidos) == referencia
+                             and all((r.arena is not None) == (keep_ast and r.ok) for r in obtenidos),
+            }
+    return resultado
+
+def format_report(r: dict) -> List[str]:
+    lineas = [f"{r['interprete']} ({r['modo']}), {r['workers']} trabajadores",
+              f"{'Ejecutor':<18}{'Tiempo':>10}{'Archivos/s':>12}{'vs serie':>10}", "-" * 50]
+    for nombre, medicion in r['resultados'].items():
+        serie = r['resultados']['serial +AST' if nombre.endswith('+AST') else 'serial']
+        lineas.append(f"{nombre:<18}{medicion['segundos'] * 1000:>7.0f} ms{medicion['archivos_s']:>12.1f}"
+                      f"{serie['segundos'] / medicion['segundos']:>9.2f}x")
+        if not medicion['coinciden']:
+            lineas.append(f"{nombre:<18}❌ el resultado no coincide con el de la ejecución en serie")
+    return lineas
+
+def run_here(args) -> dict:
+    with tempfile.TemporaryDirectory() as directorio:
+        rutas = write_corpus(directorio, args.files, parse_size(args.size))
+        resultados = bench_batch(rutas, args.workers, args.repeat)
+    return {'interprete': sys.executable, 'modo': interpreter_mode(), 'gil': gil_enabled(),
+            'workers': args.workers, 'entorno': environment(), 'resultados': resultados}
+
+def run_under(interprete: str, args) -> dict:
+    """Corre este benchmark con otro intérprete y lee su JSON"""
+    with tempfile.TemporaryDirectory() as directorio:
+        salida = os.path.join(directorio, 'resultado.json')
+        comando = [interprete, os.path.abspath(__file__), '--files', str(args.files), '--size', args.size,
+                   '--repeat', str(args.repeat), '--workers', str(args.workers), '--output', salida]
+        subprocess.run(comando, check=False, stdout=subprocess.DEVNULL)
+        with open(salida, 'r', encoding='utf-8') as f:
+            return json.load(f)['ejecuciones'][0]
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Verificación por lotes: hilos vs procesos")
+    arg_parser.add_argument('--files', type=int, default=64, help="programas generados")
+    arg_parser.add_argument('--size', default='64K', help="tamaño de cada programa (ej. 16K, 256K)")
+    arg_parser.add_argument('-j', '--workers', type=int, default=4, help="hilos o procesos trabajadores")
+    arg_parser.add_argument('--interpreters', default='',
+                            help="intérpretes separados por coma (ej. python3.13,python3.13t); "
+                                 "por defecto, el actual")
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--output', help="guarda las mediciones en JSON")
+    args = arg_parser.parse_args()
+
+    print(f"Verificación por lotes ({args.files} programas de {args.size})")
+    print("=" * 50)
+    ejecuciones = []
+    if not args.interpreters:
+        ejecuciones.append(run_here(args))
+    for interprete in (i for i in args.interpreters.split(',') if i):
+        ruta = shutil.which(interprete)
+        if ruta is None:
+            print(f"⚠ {interprete}: no encontrado, se saltea\n")
+            continue
+        try:
+            ejecuciones.append(run_under(ruta, args))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠ {interprete}: falló ({e})\n")
+    for ejecucion in ejecuciones:
+        for linea in format_report(ejecucion):
+            print(linea)
+        print()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'parametros': vars(args), 'ejecuciones': ejecuciones},
+                      f, indent=2, ensure_ascii=False)
+    if not all(m['coinciden'] for e in ejecuciones for m in e['resultados'].values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
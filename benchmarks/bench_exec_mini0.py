@@ -0,0 +1,187 @@
+"""
+Benchmarks de ejecución de programas Mini-0
+Corre los programas de benchmarks/programs (y los que se pasen como
+argumento) en cada motor de ejecución, verifica que todos obtengan el mismo
+resultado y reporta tiempo e instrucciones por segundo. Los programas que
+no compilan (p. ej. los casos error*.mini0) se omiten. Con --optimize
+también mide cada motor sobre el AST optimizado y reporta la aceleración.
+"""
+
+import sys
+import os
+import json
+import time
+from typing import Callable, Dict, List, Tuple
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.bytecode_mini0 import BytecodeCompiler
+from src.vm_mini0 import VM
+from src.runtime_mini0 import CompileError, load_program
+from src.closures_mini0 import ClosureCompiler
+from src.interpreter_mini0 import TreeInterpreter
+from src.transpiler_mini0 import PythonTranspiler
+from src.ssa_python_mini0 import compile_ssa
+from src.native_mini0 import compile_native
+from src.vectorize_mini0 import compile_vectorized
+from src.optimizer_mini0 import optimize
+from benchmarks.bench_mini0 import environment
+
+PROGRAMS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'programs')
+
+# Sufijo de motor para las mediciones sobre el AST optimizado
+OPTIMIZED_SUFFIX = '+O'
+
+def _vm_run(programa) -> Tuple[object, int]:
+    vm = VM(programa)
+    return vm.run(), vm.instructions
+
+# Motor -> (compilación (arena, checker) fuera del cronómetro, ejecución que retorna (valor, instrucciones))
+ENGINES: Dict[str, Tuple[Callable, Callable]] = {
+    'vm': (lambda arena, checker: BytecodeCompiler(arena, checker).compile(), _vm_run),
+    'closures': (lambda arena, checker: ClosureCompiler(arena, checker).compile(),
+                 lambda programa: (programa.run(), None)),
+    'arbol': (TreeInterpreter, lambda interprete: (interprete.run(), None)),
+    'python': (lambda arena, checker: PythonTranspiler(arena, checker).compile(),
+               lambda programa: (programa.run(), None)),
+    'ssa': (compile_ssa, lambda programa: (programa.run(), None)),
+    'c': (compile_native, lambda programa: (programa.run(), None)),
+    'numpy': (compile_vectorized, lambda programa: (programa.run(), None)),
+}
+
+def collect_programs(rutas: List[str]) -> List[str]:
+    """Programas .mini0 indicados (archivos o directorios)"""
+    programas = []
+    for ruta in rutas:
+        if os.path.isdir(ruta):
+            programas.extend(os.path.join(ruta, nombre) for nombre in sorted(os.listdir(ruta))
+                             if nombre.endswith('.mini0'))
+        else:
+            programas.append(ruta)
+    return programas
+
+def bench_program(ruta: str, motores: List[str], repeat: int = 3, verbose: bool = True,
+                  optimizar: bool = False) -> Dict[str, dict]:
+    """Ejecuta un programa en cada motor; claves 'motor/programa'. Con optimizar
+    también mide cada motor sobre el AST optimizado ('motor+O/programa')"""
+    with open(ruta, 'r', encoding='utf-8') as f:
+        codigo = f.read()
+    nombre = os.path.splitext(os.path.basename(ruta))[0]
+    variantes = [(motor, False) for motor in motores]
+    if optimizar:
+        variantes += [(motor, True) for motor in motores]
+    resultados = {}
+    for motor, optimizado in variantes:
+        preparar, ejecutar = ENGINES[motor]
+        inicio = time.perf_counter()
+        arena, checker = load_program(codigo)
+        if optimizado:
+            nodos_eliminados = optimize(arena, checker).removed
+            motor += OPTIMIZED_SUFFIX
+        ejecutable = preparar(arena, checker)
+        compilacion = time.perf_counter() - inicio
+        tiempos = []
+        for _ in range(repeat):
+            inicio = time.perf_counter()
+            valor, instrucciones = ejecutar(ejecutable)
+            tiempos.append(time.perf_counter() - inicio)
+        resultado = {
+            'valor': valor,
+            'compilacion_s': compilacion,
+            'segundos_min': min(tiempos),
+            'repeticiones': repeat,
+        }
+        if optimizado:
+            resultado['nodos_eliminados'] = nodos_eliminados
+        if instrucciones:
+            resultado['instrucciones'] = instrucciones
+            resultado['instrucciones_por_s'] = instrucciones / resultado['segundos_min']
+        resultados[f"{motor}/{nombre}"] = resultado
+        if verbose:
+            ips = (f"{resultado['instrucciones_por_s'] / 1e6:>10.2f} M instr/s"
+                   if instrucciones else '')
+            print(f"  {motor + '/' + nombre:<28}{resultado['segundos_min'] * 1000:>12.2f} ms"
+                  f"{ips}   → {valor}")
+    return resultados
+
+def check_agreement(resultados: Dict[str, dict]) -> List[str]:
+    """Programas en los que los motores obtuvieron resultados distintos"""
+    por_programa: Dict[str, Dict[str, object]] = {}
+    for clave, resultado in resultados.items():
+        motor, programa = clave.split('/', 1)
+        por_programa.setdefault(programa, {})[motor] = resultado['valor']
+    return [f"{programa}: {valores}" for programa, valores in sorted(por_programa.items())
+            if len(set(map(repr, valores.values()))) > 1]
+
+def speedups(resultados: Dict[str, dict]) -> List[Tuple[str, int, float]]:
+    """(motor/programa, nodos eliminados, aceleración) de cada medición optimizada"""
+    filas = []
+    for clave, resultado in sorted(resultados.items()):
+        motor, programa = clave.split('/', 1)
+        if not motor.endswith(OPTIMIZED_SUFFIX):
+            continue
+        base = resultados.get(f"{motor[:-len(OPTIMIZED_SUFFIX)]}/{programa}")
+        if base:
+            filas.append((clave, resultado['nodos_eliminados'],
+                          base['segundos_min'] / max(resultado['segundos_min'], 1e-9)))
+    return filas
+
+def relative_speedups(resultados: Dict[str, dict], base: str) -> List[Tuple[str, float]]:
+    """(motor/programa, aceleración) de cada motor respecto del motor 'base' en el mismo programa"""
+    filas = []
+    for clave, resultado in sorted(resultados.items()):
+        motor, programa = clave.split('/', 1)
+        referencia = resultados.get(f"{base}/{programa}")
+        if motor != base and referencia:
+            filas.append((clave, referencia['segundos_min'] / max(resultado['segundos_min'], 1e-9)))
+    return filas
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Benchmarks de ejecución de programas Mini-0")
+    arg_parser.add_argument('programas', nargs='*', default=[PROGRAMS_DIR],
+                            help="archivos o directorios .mini0 (por defecto benchmarks/programs)")
+    arg_parser.add_argument('--engines', default=','.join(ENGINES),
+                            help="motores separados por comas")
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--optimize', action='store_true',
+                            help="mide además cada motor sobre el AST optimizado y reporta la aceleración")
+    arg_parser.add_argument('--baseline', metavar='MOTOR',
+                            help="reporta la aceleración de los demás motores respecto de este")
+    arg_parser.add_argument('--output', help="guarda las mediciones en JSON")
+    args = arg_parser.parse_args()
+
+    motores = args.engines.split(',')
+    print("Benchmarks de ejecución Mini-0")
+    print("=" * 80)
+    resultados = {}
+    for ruta in collect_programs(args.programas):
+        try:
+            resultados.update(bench_program(ruta, motores, args.repeat, optimizar=args.optimize))
+        except CompileError as e:
+            print(f"  (omitido) {ruta}: {e}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entorno': environment(), 'resultados': resultados},
+                      f, indent=2, ensure_ascii=False)
+
+    if args.optimize:
+        print("\nOptimización del AST (aceleración = tiempo sin optimizar / optimizado):")
+        for clave, eliminados, aceleracion in speedups(resultados):
+            print(f"  {clave:<30}{eliminados:>6} nodos eliminados{aceleracion:>10.2f}x")
+
+    if args.baseline:
+        print(f"\nAceleración respecto de {args.baseline} (tiempo de {args.baseline} / tiempo del motor):")
+        for clave, aceleracion in relative_speedups(resultados, args.baseline):
+            print(f"  {clave:<30}{aceleracion:>10.2f}x")
+
+    print("\n" + "=" * 80)
+    desacuerdos = check_agreement(resultados)
+    if desacuerdos:
+        print(f"❌ Los motores no coinciden en {len(desacuerdos)} programas:")
+        for desacuerdo in desacuerdos:
+            print(f"  {desacuerdo}")
+        sys.exit(1)
+    print("✅ Todos los motores obtuvieron los mismos resultados")
+
+if __name__ == "__main__":
+    main()
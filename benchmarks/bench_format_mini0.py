@@ -0,0 +1,117 @@
+"""
+Benchmark del formateador (src/formatter_mini0.py)
+Para corpus sintéticos de --size bytes mide el tiempo de formatear (en
+MB/s, para comprobar que es lineal se repite con la mitad del tamaño), la
+memoria pico por encima del fuente con tracemalloc y el tiempo de
+format_file() sobre un archivo ya formateado con y sin el caché de
+hashes. Verifica que el resultado conserve los tokens y que formatear dos
+veces no cambie nada.
+"""
+
+import sys
+import os
+import json
+import time
+import tempfile
+import tracemalloc
+from typing import Dict, List
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.formatter_mini0 import FormatCache, format_file, format_lines, format_source, same_tokens
+from benchmarks.corpus_mini0 import generate, parse_size
+from benchmarks.bench_mini0 import environment
+
+PROFILES = ('funciones', 'expresiones', 'anidamiento', 'cadenas', 'comentarios')
+
+def best_time(funcion, repeat: int) -> float:
+    mejor = float('inf')
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+def drain(fuente: str) -> int:
+    """Formatea descartando las líneas (como al escribir a un archivo)"""
+    total = 0
+    for linea in format_lines(fuente):
+        total += len(linea)
+    return total
+
+def peak_memory(fuente: str) -> int:
+    tracemalloc.start()
+    try:
+        drain(fuente)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def bench_format(perfil: str, tamano: int, repeat: int, directorio: str) -> dict:
+    fuente = generate(perfil, tamano)
+    mitad = generate(perfil, tamano // 2)
+    formateado = format_source(fuente)
+
+    ruta = os.path.join(directorio, f"{perfil}.mini0")
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write(formateado)
+    cache = FormatCache(os.path.join(directorio, 'cache'))
+    format_file(ruta, cache=cache)
+    segundos = best_time(lambda: drain(fuente), repeat)
+    return {
+        'fuente_bytes': len(fuente),
+        'formatear': segundos,
+        'mb_s': len(fuente) / segundos / 1e6,
+        'mb_s_mitad': len(mitad) / best_time(lambda: drain(mitad), repeat) / 1e6,
+        'memoria_pico': peak_memory(fuente),
+        'verificar_sin_cache': best_time(lambda: format_file(ruta), repeat),
+        'verificar_con_cache': best_time(lambda: format_file(ruta, cache=cache), repeat),
+        'conserva_tokens': same_tokens(fuente, formateado),
+        'idempotente': format_source(formateado) == formateado,
+    }
+
+def format_report(resultados: Dict[str, dict]) -> List[str]:
+    encabezado = (f"{'Corpus':<13}{'Formatear':>11}{'MB/s':>7}{'MB/s (½)':>10}{'Memoria pico':>14}"
+                  f"{'Ya formateado (sin/con caché)':>32}")
+    lineas = [encabezado, "-" * len(encabezado)]
+    for perfil, r in resultados.items():
+        lineas.append(f"{perfil:<13}{r['formatear'] * 1000:>8.0f} ms{r['mb_s']:>7.2f}{r['mb_s_mitad']:>10.2f}"
+                      f"{r['memoria_pico'] / 1024:>11,.0f} KB"
+                      f"{r['verificar_sin_cache'] * 1000:>19.1f} ms / {r['verificar_con_cache'] * 1000:.2f} ms")
+        if not r['conserva_tokens']:
+            lineas.append(f"{perfil:<13}❌ el resultado no conserva los tokens")
+        if not r['idempotente']:
+            lineas.append(f"{perfil:<13}❌ formatear dos veces cambia el resultado")
+    return lineas
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Formateador Mini-0: velocidad, memoria y caché")
+    arg_parser.add_argument('--size', default='1M', help="tamaño de cada corpus (ej. 256K, 10M)")
+    arg_parser.add_argument('--profiles', default=','.join(PROFILES),
+                            help=f"perfiles de corpus separados por coma (por omisión {','.join(PROFILES)})")
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--output', help="guarda las mediciones en JSON")
+    args = arg_parser.parse_args()
+
+    tamano = parse_size(args.size)
+    perfiles = [p for p in args.profiles.split(',') if p]
+    desconocidos = [p for p in perfiles if p not in PROFILES]
+    if desconocidos:
+        arg_parser.error(f"perfiles desconocidos: {', '.join(desconocidos)}")
+
+    print(f"Formateador ({args.size} por corpus)")
+    print("=" * 87)
+    with tempfile.TemporaryDirectory() as directorio:
+        resultados = {perfil: bench_format(perfil, tamano, args.repeat, directorio)
+                      for perfil in perfiles}
+    for linea in format_report(resultados):
+        print(linea)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entorno': environment(), 'tamano': tamano,
+                       'resultados': resultados}, f, indent=2, ensure_ascii=False)
+    if not all(r['conserva_tokens'] and r['idempotente'] for r in resultados.values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark del índice de símbolos (src/index_mini0.py)
+Escribe --files programas sintéticos de --size bytes (funciones chicas y
+expresiones enormes llenas de llamadas a g) en un directorio temporal, los
+indexa desde cero, vuelve a indexar sin cambios y con --changed archivos
+modificados, y mide consultas típicas contra la base: definiciones de una
+función, llamadas a g, la primera página de referencias de una variable,
+conteos y globales sin usar. Como línea base, busca las llamadas a g con
+una expresión regular sobre todos los fuentes (lo que haría grep).
+"""
+
+import sys
+import os
+import re
+import json
+import time
+import tempfile
+from typing import Dict, List
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.index_mini0 import SymbolIndex
+from benchmarks.corpus_mini0 import generate, parse_size
+from benchmarks.bench_mini0 import environment
+
+PROFILES = ('funciones', 'expresiones')
+
+def best_time(funcion, repeat: int):
+    """(mejor tiempo, último resultado)"""
+    mejor = float('inf')
+    resultado = None
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+def write_corpus(directorio: str, archivos: int, tamano: int) -> List[str]:
+    rutas = []
+    for i in range(archivos):
+        ruta = os.path.join(directorio, f"d{i % 8}", f"p{i}.mini0")
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        with open(ruta, 'w', encoding='utf-8') as f:
+            f.write(generate(PROFILES[i % len(PROFILES)], tamano, seed=i))
+        rutas.append(ruta)
+    return rutas
+
+def grep_calls(rutas: List[str], nombre: str) -> int:
+    # Sin las definiciones 'fun g(' (grep no distingue más que eso)
+    patron = re.compile(rf'(?<!fun )\b{re.escape(nombre)}\s*\(')
+    total = 0
+    for ruta in rutas:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            total += len(patron.findall(f.read()))
+    return total
+
+def bench_index(directorio: str, rutas: List[str], cambiados: int, workers, repeat: int) -> dict:
+    resultado: Dict[str, dict] = {}
+    with SymbolIndex(os.path.join(directorio, 'indice.sqlite')) as indice:
+        completo = indice.index([directorio], workers)
+        resultado['indexar'] = {
+            'completo': completo.seconds,
+            'sin_cambios': indice.index([directorio], workers).seconds,
+        }
+        for ruta in rutas[:cambiados]:
+            with open(ruta, 'a', encoding='utf-8') as f:
+                f.write("\nfun extra(): int\n    return g(1, 2)\nend\n")
+        incremental = indice.index([directorio], workers)
+        resultado['indexar']['incremental'] = incremental.seconds
+        resultado['indexar']['reindexados'] = incremental.indexed
+        resultado['conteos'] = indice.counts()
+
+        consultas = {
+            'definicion f10': lambda: indice.definitions('f10'),
+            'definiciones de g': lambda: indice.definitions('g', 'funcion'),
+            'referencias a r (100)': lambda: indice.references('r', limit=100),
+            'contar llamadas a g': lambda: indice.count_references('g', 'llamada'),
+            'contar referencias a a': lambda: indice.count_references('a', 'var'),
+            'globales sin usar': indice.unused_globals,
+        }
+        resultado['consultas'] = {}
+        for nombre, consulta in consultas.items():
+            segundos, filas = best_time(consulta, repeat)
+            resultado['consultas'][nombre] = {
+                'ms': segundos * 1000, 'filas': filas if isinstance(filas, int) else len(filas)}
+        llamadas_g = resultado['consultas']['contar llamadas a g']['filas']
+    segundos, encontradas = best_time(lambda: grep_calls(rutas, 'g'), 1)
+    resultado['grep'] = {'ms': segundos * 1000, 'filas': encontradas,
+                         'coincide': encontradas == llamadas_g}
+    return resultado
+
+def format_report(r: dict) -> List[str]:
+    indexar = r['indexar']
+    conteos = r['conteos']
+    lineas = [
+        f"Archivos: {conteos['archivos']:,}, definiciones: {conteos['definiciones']:,}, "
+        f"referencias: {conteos['referencias']:,}",
+        f"Indexar desde cero:   {indexar['completo']:.2f} s",
+        f"Sin cambios:          {indexar['sin_cambios'] * 1000:.1f} ms",
+        f"Incremental:          {indexar['incremental'] * 1000:.1f} ms "
+        f"({indexar['reindexados']} archivos)",
+        "",
+        f"{'Consulta':<28}{'Filas':>10}{'Tiempo (ms)':>14}",
+        "-" * 52,
+    ]
+    for nombre, consulta in r['consultas'].items():
+        lineas.append(f"{nombre:<28}{consulta['filas']:>10,}{consulta['ms']:>14.2f}")
+    grep = r['grep']
+    lineas.append(f"{'grep de llamadas a g':<28}{grep['filas']:>10,}{grep['ms']:>14.2f}")
+    if not grep['coincide']:
+        lineas.append("❌ grep y el índice no cuentan las mismas llamadas a g")
+    return lineas
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Índice de símbolos Mini-0: indexación y consultas")
+    arg_parser.add_argument('--files', type=int, default=64, help="programas generados")
+    arg_parser.add_argument('--size', default='256K', help="tamaño de cada programa (ej. 64K, 1M)")
+    arg_parser.add_argument('--changed', type=int, default=4, help="archivos modificados antes de reindexar")
+    arg_parser.add_argument('-j', '--workers', type=int, default=None,
+                            help="procesos trabajadores (por defecto, uno por CPU)")
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--output', help="guarda las mediciones en JSON")
+    args = arg_parser.parse_args()
+
+    print(f"Índice de símbolos ({args.files} programas de {args.size})")
+    print("=" * 52)
+    with tempfile.TemporaryDirectory() as directorio:
+        rutas = write_corpus(directorio, args.files, parse_size(args.size))
+        resultado = bench_index(directorio, rutas, args.changed, args.workers, args.repeat)
+    for linea in format_report(resultado):
+        print(linea)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entorno': environment(), 'parametros': vars(args),
+                       'resultado': resultado}, f, indent=2, ensure_ascii=False)
+    if not resultado['grep']['coincide']:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""
+Suite de benchmarks de escalamiento para el front end Mini-0
+Mide Lexer.tokenize, ParserMini0.parse, ParserASTMini0.parse (construcción
+del AST), SemanticChecker.check, GrammarMini0() y LL1TableMini0()
+sobre corpus sintéticos de tamaño creciente, con calentamiento y
+repeticiones, y compara contra una línea base JSON.
+
+Falla (código de salida 1) cuando el rendimiento cae más allá del umbral
+respecto a la línea base o cuando el tiempo crece de forma superlineal
+con el tamaño de la entrada.
+"""
+
+import sys
+import os
+import json
+import math
+import platform
+import time
+from typing import Callable, Dict, List, Tuple
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.lexer_mini0 import Lexer
+from src.parser_mini0 import ParserMini0
+from src.grammar_mini0 import GrammarMini0
+from src.ll1_table_mini0 import LL1TableMini0
+from src.ast_mini0 import ParserASTMini0
+from src.semantic_mini0 import SemanticChecker
+from benchmarks.corpus_mini0 import GENERATORS, generate, parse_size, format_size
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline_mini0.json')
+# Entradas lentas encontradas por fuzz_mini0.py, medidas como regresiones
+REGRESSIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'regressions')
+DEFAULT_SIZES = '1K,10K,100K,1M'
+# Entradas más grandes que esto se miden una sola vez y sin calentamiento
+LARGE_INPUT = 4 * 1024 * 1024
+# Tamaño mínimo considerado al ajustar el exponente de escalamiento
+SCALING_MIN_SIZE = 10 * 1024
+
+def _tokens(codigo: str):
+    tokens, errores = Lexer(codigo).tokenize()
+    if errores:
+        raise ValueError(f"Corpus con errores léxicos: {errores[0]}")
+    return tokens
+
+def _parse(tokens) -> bool:
+    parser = ParserMini0(tokens)
+    if not parser.parse():
+        raise ValueError(f"Corpus con errores sintácticos: {parser.errors[0]}")
+    return True
+
+def _parse_ast(tokens) -> int:
+    parser = ParserASTMini0(tokens)
+    if not parser.parse():
+        raise ValueError(f"Corpus con errores sintácticos: {parser.errors[0]}")
+    return len(parser.arena)
+
+def _arena(codigo: str):
+    parser = ParserASTMini0(_tokens(codigo))
+    if not parser.parse():
+        raise ValueError(f"Corpus con errores sintácticos: {parser.errors[0]}")
+    return parser.arena
+
+def _check(arena) -> int:
+    """Verificación semántica; los corpus derivados de la gramática no son
+    semánticamente válidos, así que solo se mide (no se exige éxito)"""
+    checker = SemanticChecker(arena)
+    checker.check()
+    return len(checker.errors)
+
+# Fase -> (preparación fuera del cronómetro, operación medida)
+PHASES: Dict[str, Tuple[Callable, Callable]] = {
+    'lexer': (lambda codigo: codigo, lambda codigo: Lexer(codigo).tokenize()),
+    'parser': (_tokens, _parse),
+    'ast': (_tokens, _parse_ast),
+    'semantico': (_arena, _check),
+}
+
+def _frontend(codigo: str) -> bool:
+    """Análisis léxico + sintáctico sin exigir que la entrada sea válida"""
+    tokens, errores = Lexer(codigo).tokenize()
+    return not errores and ParserMini0(tokens).parse()
+
+# Construcciones de tamaño fijo (no dependen de la entrada)
+CONSTRUCTIONS: Dict[str, Callable[[], object]] = {
+    'grammar': GrammarMini0,
+    'll1_table': lambda: LL1TableMini0(GrammarMini0()),
+}
+
+def time_call(operacion: Callable, argumento=None, warmup: int = 1, repeat: int = 5) -> List[float]:
+    """Ejecuta la operación con calentamiento y retorna los tiempos de cada repetición"""
+    for _ in range(warmup):
+        operacion(argumento) if argumento is not None else operacion()
+    tiempos = []
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        operacion(argumento) if argumento is not None else operacion()
+        tiempos.append(time.perf_counter() - inicio)
+    return tiempos
+
+def _summary(tiempos: List[float]) -> dict:
+    ordenados = sorted(tiempos)
+    return {
+        'segundos_min': ordenados[0],
+        'segundos_mediana': ordenados[len(ordenados) // 2],
+        'repeticiones': len(tiempos),
+    }
+
+def run_scaling(tipos: List[str], tamanos: List[int], fases: List[str],
+                warmup: int = 1, repeat: int = 5, verbose: bool = True) -> Dict[str, dict]:
+    """Mide cada fase sobre cada corpus; claves 'fase/tipo/tamaño'"""
+    resultados = {}
+    for tipo in tipos:
+        for tamano in tamanos:
+            codigo = generate(tipo, tamano)
+            bytes_fuente = len(codigo.encode('utf-8'))
+            n_tokens = None
+            for fase in fases:
+                preparar, operacion = PHASES[fase]
+                entrada = preparar(codigo)
+                if fase in ('parser', 'ast'):
+                    n_tokens = len(entrada)
+                grande = tamano > LARGE_INPUT
+                tiempos = time_call(operacion, entrada,
+                                    warmup=0 if grande else warmup,
+                                    repeat=1 if grande else repeat)
+                resultado = _summary(tiempos)
+                resultado['bytes'] = bytes_fuente
+                resultado['bytes_por_s'] = bytes_fuente / resultado['segundos_min']
+                if n_tokens:
+                    resultado['tokens'] = n_tokens
+                    resultado['tokens_por_s'] = n_tokens / resultado['segundos_min']
+                clave = f"{fase}/{tipo}/{format_size(tamano)}"
+                resultados[clave] = resultado
+                if verbose:
+                    print(f"  {clave:<32}{resultado['segundos_min'] * 1000:>12.2f} ms"
+                          f"{resultado['bytes_por_s'] / 1024:>14.1f} KB/s")
+    return resultados
+
+def run_constructions(warmup: int = 1, repeat: int = 5, verbose: bool = True) -> Dict[str, dict]:
+    """Mide la construcción de la gramática y de la tabla LL(1)"""
+    resultados = {}
+    for nombre, operacion in CONSTRUCTIONS.items():
+        resultado = _summary(time_call(operacion, warmup=warmup, repeat=repeat))
+        resultado['operaciones_por_s'] = 1.0 / resultado['segundos_min']
+        resultados[f"construccion/{nombre}"] = resultado
+        if verbose:
+            print(f"  {'construccion/' + nombre:<32}{resultado['segundos_min'] * 1000:>12.2f} ms")
+    return resultados
+
+def run_regressions(directorio: str = REGRESSIONS_DIR, warmup: int = 1, repeat: int = 5,
+                    verbose: bool = True) -> Dict[str, dict]:
+    """Mide el front end sobre las entradas patológicas guardadas por el fuzzer"""
+    resultados = {}
+    if not os.path.isdir(directorio):
+        return resultados
+    for nombre in sorted(os.listdir(directorio)):
+        if not nombre.endswith('.mini0'):
+            continue
+        with open(os.path.join(directorio, nombre), 'r', encoding='utf-8') as f:
+            codigo = f.read()
+        bytes_fuente = len(codigo.encode('utf-8'))
+        grande = bytes_fuente > LARGE_INPUT
+        resultado = _summary(time_call(_frontend, codigo, warmup=0 if grande else warmup,
+                                       repeat=1 if grande else repeat))
+        resultado['bytes'] = bytes_fuente
+        resultado['bytes_por_s'] = bytes_fuente / resultado['segundos_min']
+        clave = f"frontend/regresion-{os.path.splitext(nombre)[0]}/{bytes_fuente}"
+        resultados[clave] = resultado
+        if verbose:
+            print(f"  {clave:<32}{resultado['segundos_min'] * 1000:>12.2f} ms"
+                  f"{resultado['bytes_por_s'] / 1024:>14.1f} KB/s")
+    return resultados
+
+def scaling_exponent(puntos: List[Tuple[int, float]]) -> float:
+    """Pendiente de log(tiempo) contra log(tamaño) por mínimos cuadrados"""
+    xs = [math.log(tamano) for tamano, _ in puntos]
+    ys = [math.log(tiempo) for _, tiempo in puntos]
+    media_x = sum(xs) / len(xs)
+    media_y = sum(ys) / len(ys)
+    numerador = sum((x - media_x) * (y - media_y) for x, y in zip(xs, ys))
+    denominador = sum((x - media_x) ** 2 for x in xs)
+    return numerador / denominador if denominador else 0.0
+
+def check_scaling(resultados: Dict[str, dict], max_exponent: float) -> List[str]:
+    """Detecta fases cuyo tiempo crece más rápido que tamaño^max_exponent"""
+    series: Dict[str, List[Tuple[int, float]]] = {}
+    for clave, resultado in resultados.items():
+        if clave.startswith('construccion/'):
+            continue
+        fase, tipo, tamano = clave.split('/')
+        if parse_size(tamano) < SCALING_MIN_SIZE:
+            continue
+        series.setdefault(f"{fase}/{tipo}", []).append((resultado['bytes'], resultado['segundos_min']))
+    fallas = []
+    for serie, puntos in sorted(series.items()):
+        if len(puntos) < 2:
+            continue
+        exponente = scaling_exponent(puntos)
+        if exponente > max_exponent:
+            fallas.append(f"{serie}: escalamiento superlineal (exponente {exponente:.2f} > {max_exponent:.2f})")
+    return fallas
+
+def compare_baseline(resultados: Dict[str, dict], baseline: Dict[str, dict],
+                     threshold: float) -> List[str]:
+    """Detecta mediciones cuyo rendimiento cayó más que threshold respecto a la línea base"""
+    fallas = []
+    for clave, resultado in resultados.items():
+        base = baseline.get(clave)
+        if not base:
+            continue
+        actual = resultado['segundos_min']
+        referencia = base['segundos_min']
+        if actual > referencia * (1 + threshold):
+            fallas.append(f"{clave}: {actual * 1000:.2f} ms vs línea base {referencia * 1000:.2f} ms "
+                          f"(+{(actual / referencia - 1) * 100:.0f}%)")
+    return fallas
+
+def environment() -> dict:
+    """Descripción del entorno, guardada junto a las mediciones"""
+    return {
+        'python': platform.python_version(),
+        'implementacion': platform.python_implementation(),
+        'plataforma': platform.platform(),
+        'procesador': platform.processor() or platform.machine(),
+    }
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Benchmarks de escalamiento del front end Mini-0")
+    arg_parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                            help=f"tamaños de corpus separados por comas (por defecto {DEFAULT_SIZES}; hasta 100M)")
+    arg_parser.add_argument('--kinds', default=','.join(GENERATORS),
+                            help="perfiles de corpus separados por comas")
+    arg_parser.add_argument('--phases', default=','.join(PHASES),
+                            help="fases a medir separadas por comas")
+    arg_parser.add_argument('--regressions', default=REGRESSIONS_DIR,
+                            help="directorio de entradas de regresión del fuzzer")
+    arg_parser.add_argument('--warmup', type=int, default=1)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--baseline', default=BASELINE_FILE, help="línea base JSON para comparar")
+    arg_parser.add_argument('--save-baseline', action='store_true',
+                            help="guarda las mediciones como nueva línea base")
+    arg_parser.add_argument('--output', help="guarda las mediciones de esta corrida en JSON")
+    arg_parser.add_argument('--threshold', type=float, default=0.25,
+                            help="regresión tolerada respecto a la línea base (0.25 = 25%%)")
+    arg_parser.add_argument('--max-exponent', type=float, default=1.2,
+                            help="exponente máximo de escalamiento tiempo ~ tamaño^k")
+    args = arg_parser.parse_args()
+
+    tamanos = [parse_size(t) for t in args.sizes.split(',')]
+    tipos = args.kinds.split(',')
+    fases = args.phases.split(',')
+
+    print("Benchmarks del front end Mini-0")
+    print("=" * 80)
+    resultados = run_constructions(args.warmup, args.repeat)
+    resultados.update(run_scaling(tipos, tamanos, fases, args.warmup, args.repeat))
+    resultados.update(run_regressions(args.regressions, args.warmup, args.repeat))
+
+    registro = {'version': 1, 'entorno': environment(), 'resultados': resultados}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(registro, f, indent=2, ensure_ascii=False)
+
+    fallas = check_scaling(resultados, args.max_exponent)
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        fallas.extend(compare_baseline(resultados, baseline['resultados'], args.threshold))
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(registro, f, indent=2, ensure_ascii=False)
+        print(f"\n✓ Línea base guardada en: {args.baseline}")
+
+    print("\n" + "=" * 80)
+    if fallas:
+        print(f"❌ {len(fallas)} problemas de rendimiento:")
+        for falla in fallas:
+            print(f"  {falla}")
+        sys.exit(1)
+    print("✅ Sin regresiones de rendimiento")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark de las tablas de posiciones del código compilado
+Compila corpus sintéticos de --size bytes a bytecode (VM) y al backend
+Python, y compara la tabla de posiciones con deltas (src/positions_mini0.py)
+contra guardar la línea y columna de cada ítem: bytes en memoria, tamaño
+serializado (pickle del bytecode, marshal del programa Python) y tiempo de
+carga, que es lo que paga un proceso que recibe el programa ya compilado.
+También mide cuánto cuesta decodificar la tabla entera y ubicar un error.
+"""
+
+import sys
+import os
+import json
+import time
+import pickle
+import marshal
+from typing import Dict, List
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.runtime_mini0 import CompileError, load_program
+from src.bytecode_mini0 import BytecodeCompiler
+from src.transpiler_mini0 import PythonTranspiler, TRANSPILER_VERSION
+from benchmarks.corpus_mini0 import generate, parse_size
+from benchmarks.bench_mini0 import environment
+
+PROFILES = ('funciones', 'expresiones', 'anidamiento', 'cadenas', 'comentarios')
+
+def best_time(funcion, repeat: int) -> float:
+    mejor = float('inf')
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+def per_item_tables(programa) -> list:
+    """Las posiciones del bytecode como antes: dos array('i') por función"""
+    return [(f.code, *f.positions.decode()) for f in programa.functions]
+
+def bench_positions(perfil: str, tamano: int, repeat: int) -> dict:
+    arena, checker = load_program(generate(perfil, tamano))
+    bytecode = BytecodeCompiler(arena, checker).compile()
+
+    # Bytecode: la tabla contra línea y columna por instrucción
+    instrucciones = sum(len(f) for f in bytecode.functions)
+    tablas = [(f.code, f.positions) for f in bytecode.functions]
+    por_item = per_item_tables(bytecode)
+    datos_tabla = pickle.dumps(tablas, pickle.HIGHEST_PROTOCOL)
+    datos_item = pickle.dumps(por_item, pickle.HIGHEST_PROTOCOL)
+    funciones = bytecode.functions
+    ultima = max(funciones, key=len)
+
+    resultado = {'bytecode': {
+        'instrucciones': instrucciones,
+        'bytes_tabla': sum(f.positions.nbytes for f in funciones),
+        'bytes_por_item': sum(l.itemsize * len(l) + c.itemsize * len(c) for _, l, c in por_item),
+        'pickle_tabla': len(datos_tabla),
+        'pickle_por_item': len(datos_item),
+        'carga_tabla': best_time(lambda: pickle.loads(datos_tabla), repeat),
+        'carga_por_item': best_time(lambda: pickle.loads(datos_item), repeat),
+        'decodificar': best_time(lambda: [f.positions.decode() for f in funciones], repeat),
+        # Peor caso de ubicar un error: la última instrucción de la función más larga
+        'ubicar_error': best_time(lambda: ultima.position_at(len(ultima.code) - 2), repeat),
+    }}
+
+    # Backend Python: la tabla de líneas contra la tupla de líneas del formato anterior
+    try:
+        python = PythonTranspiler(arena, checker).compile()
+    except (CompileError, RecursionError):
+        resultado['python'] = {'error': "expresión demasiado anidada para el backend Python"}
+        return resultado
+    lineas_python = python.positions.decode()[0]
+    marshal_tabla = marshal.dumps((TRANSPILER_VERSION, python.code,
+                                   python.positions.data, len(python.positions)))
+    marshal_item = marshal.dumps((TRANSPILER_VERSION, python.code, tuple(lineas_python)))
+    solo_tabla = marshal.dumps((python.positions.data, len(python.positions)))
+    solo_item = marshal.dumps(tuple(lineas_python))
+
+    resultado['python'] = {
+        'lineas': len(lineas_python),
+        'bytes_tabla': python.positions.nbytes,
+        'marshal_lineas_tabla': len(solo_tabla),
+        'marshal_lineas_por_item': len(solo_item),
+        'marshal_tabla': len(marshal_tabla),
+        'marshal_por_item': len(marshal_item),
+        'carga_tabla': best_time(lambda: marshal.loads(marshal_tabla), repeat),
+        'carga_por_item': best_time(lambda: marshal.loads(marshal_item), repeat),
+    }
+    return resultado
+
+def format_report(resultados: Dict[str, dict]) -> List[str]:
+    def kb(n: int) -> str:
+        return f"{n / 1024:,.1f}"
+
+    encabezado = (f"{'Corpus':<13}{'Instr.':>10}{'Tabla KB':>10}{'Por ítem KB':>13}"
+                  f"{'Pickle KB':>18}{'Carga (ms)':>18}")
+    lineas = ["Bytecode (línea y columna por instrucción)", encabezado, "-" * len(encabezado)]
+    for perfil, r in resultados.items():
+        b = r['bytecode']
+        lineas.append(f"{perfil:<13}{b['instrucciones']:>10,}{kb(b['bytes_tabla']):>10}"
+                      f"{kb(b['bytes_por_item']):>13}"
+                      f"{kb(b['pickle_tabla']):>9} vs {kb(b['pickle_por_item']):<6}"
+                      f"{b['carga_tabla'] * 1000:>9.2f} vs {b['carga_por_item'] * 1000:.2f}")
+    encabezado = (f"{'Corpus':<13}{'Líneas':>10}{'Tabla KB':>10}{'Tupla KB':>13}"
+                  f"{'Marshal KB':>18}{'Carga (ms)':>18}")
+    lineas += ["", "Backend Python (línea Mini-0 de cada línea generada)", encabezado,
+               "-" * len(encabezado)]
+    for perfil, r in resultados.items():
+        p = r['python']
+        if 'error' in p:
+            lineas.append(f"{perfil:<13}{'no soportado':>10} ({p['error']})")
+            continue
+        lineas.append(f"{perfil:<13}{p['lineas']:>10,}{kb(p['marshal_lineas_tabla']):>10}"
+                      f"{kb(p['marshal_lineas_por_item']):>13}"
+                      f"{kb(p['marshal_tabla']):>9} vs {kb(p['marshal_por_item']):<6}"
+                      f"{p['carga_tabla'] * 1000:>9.2f} vs {p['carga_por_item'] * 1000:.2f}")
+    lineas.append("")
+    for perfil, r in resultados.items():
+        b = r['bytecode']
+        lineas.append(f"{perfil:<13}decodificar todo {b['decodificar'] * 1000:.2f} ms, "
+                      f"ubicar un error {b['ubicar_error'] * 1e6:.1f} µs")
+    return lineas
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Tablas de posiciones con deltas vs posiciones por ítem")
+    arg_parser.add_argument('--size', default='1M', help="tamaño de cada corpus (ej. 256K, 1M)")
+    arg_parser.add_argument('--profiles', default=','.join(PROFILES),
+                            help=f"perfiles de corpus separados por coma (por omisión {','.join(PROFILES)})")
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--output', help="guarda las mediciones en JSON")
+    args = arg_parser.parse_args()
+
+    tamano = parse_size(args.size)
+    perfiles = [p for p in args.profiles.split(',') if p]
+    desconocidos = [p for p in perfiles if p not in PROFILES]
+    if desconocidos:
+        arg_parser.error(f"perfiles desconocidos: {', '.join(desconocidos)}")
+
+    print(f"Tablas de posiciones ({args.size} por corpus, tabla vs por ítem)")
+    print("=" * 82)
+    resultados = {perfil: bench_positions(perfil, tamano, args.repeat) for perfil in perfiles}
+    for linea in format_report(resultados):
+        print(linea)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entorno': environment(), 'tamano': tamano,
+                       'resultados': resultados}, f, indent=2, ensure_ascii=False)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Benchmark de construcción de strings en Mini-0
+Genera programas que arman un string de --size piezas dentro de un ciclo
+(agregar al final, palabras de un arreglo, líneas armadas aparte, agregar
+al principio) y uno que compara contra literales, y mide cada motor con
+las Ropes del runtime y sin ellas (concatenación de str, cuadrática). Cada
+programa indexa el resultado al final, así que el tiempo incluye aplanar
+la Rope. Verifica que todas las variantes retornen lo mismo.
+"""
+
+import sys
+import os
+import json
+import time
+from typing import Dict, List
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.runtime_mini0 import CompileError, load_program
+from src import strings_mini0
+from benchmarks.bench_exec_mini0 import ENGINES
+from benchmarks.bench_mini0 import environment
+
+# Nombre -> programa; {n} es el tamaño. main() compara caracteres del resultado
+# (lo que obliga a aplanarlo) o cuenta coincidencias con un literal
+PROGRAMS: Dict[str, str] = {
+    'agregar': """fun main(): bool
+    s: string
+    i: int
+    n: int
+    n = {n}
+    i = 0
+    while i < n
+        s = s + "x"
+        i = i + 1
+    loop
+    return s[n - 1] = s[n / 2]
+end
+""",
+    'palabras': """fun main(): bool
+    s: string
+    p: []string
+    i: int
+    n: int
+    n = {n}
+    p = new [4] string
+    p[0] = "uno "
+    p[1] = "dos "
+    p[2] = "tres "
+    p[3] = "cuatro "
+    i = 0
+    while i < n
+        s = s + p[i - i / 4 * 4]
+        i = i + 1
+    loop
+    return s[0] = s[n]
+end
+""",
+    'lineas': """fun linea(i: int): string
+    l: string
+    j: int
+    j = 0
+    while j < 10
+        l = l + "ab"
+        j = j + 1
+    loop
+    return l + "\\n"
+end
+
+fun main(): bool
+    s: string
+    i: int
+    n: int
+    n = {n} / 10
+    i = 0
+    while i < n
+        s = s + linea(i)
+        i = i + 1
+    loop
+    return s[20] = s[n * 21 - 1]
+end
+""",
+    'prefijo': """fun main(): bool
+    s: string
+    i: int
+    n: int
+    n = {n}
+    i = 0
+    while i < n
+        s = "y" + s
+        i = i + 1
+    loop
+    return s[0] = s[n - 1]
+end
+""",
+    'literales': """fun main(): int
+    s: string
+    i: int
+    n: int
+    c: int
+    n = {n}
+    i = 0
+    while i < n
+        if i / 2 * 2 = i
+            s = "clave"
+        else
+            s = "valor"
+        end
+        if s = "clave"
+            c = c + 1
+        end
+        i = i + 1
+    loop
+    return c
+end
+""",
+}
+
+def run_best(preparar, ejecutar, arena, checker, repeat: int):
+    """(mejor tiempo, valor); el programa se prepara una sola vez"""
+    programa = preparar(arena, checker)
+    mejor = float('inf')
+    valor = None
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        valor, _ = ejecutar(programa)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, valor
+
+def bench_strings(tamano: int, motores: List[str], repeat: int = 3,
+                  verbose: bool = True) -> Dict[str, dict]:
+    """Por programa y motor: mejor tiempo con Ropes y con concatenación de str"""
+    resultados = {}
+    umbral = strings_mini0.ROPE_THRESHOLD
+    for nombre, plantilla in PROGRAMS.items():
+        arena, checker = load_program(plantilla.replace('{n}', str(tamano)))
+        resultado = {'motores': {}}
+        valores = set()
+        for motor in motores:
+            preparar, ejecutar = ENGINES[motor]
+            medicion = {}
+            try:
+                for variante, limite in (('ropes', umbral), ('str', sys.maxsize)):
+                    strings_mini0.ROPE_THRESHOLD = limite
+                    tiempo, valor = run_best(preparar, ejecutar, arena, checker, repeat)
+                    medicion[variante] = tiempo
+                    valores.add(valor)
+            except CompileError as e:
+                medicion = {'error': str(e)}
+            finally:
+                strings_mini0.ROPE_THRESHOLD = umbral
+            resultado['motores'][motor] = medicion
+            if verbose:
+                detalle = medicion.get('error') or \
+                    f"{medicion['ropes'] * 1000:>9.1f} ms con Ropes, {medicion['str'] * 1000:>9.1f} ms con str"
+                print(f"  {nombre:<12}{motor:<10}{detalle}")
+        resultado['coinciden'] = len(valores) <= 1
+        resultados[nombre] = resultado
+    return resultados
+
+def format_report(resultados: Dict[str, dict], motores: List[str]) -> List[str]:
+    encabezado = f"{'Programa':<12}{'Motor':<10}{'Ropes (ms)':>12}{'str (ms)':>12}{'Aceleración':>13}"
+    lineas = [encabezado, "-" * len(encabezado)]
+    for nombre, resultado in resultados.items():
+        for motor in motores:
+            medicion = resultado['motores'][motor]
+            if 'error' in medicion:
+                lineas.append(f"{nombre:<12}{motor:<10}{'no soportado':>12}")
+                continue
+            lineas.append(f"{nombre:<12}{motor:<10}{medicion['ropes'] * 1000:>12.1f}"
+                          f"{medicion['str'] * 1000:>12.1f}{medicion['str'] / medicion['ropes']:>12.1f}x")
+        if not resultado['coinciden']:
+            lineas.append(f"{nombre:<12}❌ valores distintos")
+    return lineas
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Construcción de strings en Mini-0: Ropes vs str")
+    arg_parser.add_argument('--size', type=int, default=100000, help="piezas que se concatenan")
+    arg_parser.add_argument('--engines', default='vm,closures,python,ssa',
+                            help="motores separados por coma (por omisión vm,closures,python,ssa)")
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--output', help="guarda las mediciones en JSON")
+    args = arg_parser.parse_args()
+
+    motores = [m for m in args.engines.split(',') if m]
+    desconocidos = [m for m in motores if m not in ENGINES]
+    if desconocidos:
+        arg_parser.error(f"motores desconocidos: {', '.join(desconocidos)}")
+
+    print(f"Strings Mini-0 ({args.size:,} concatenaciones por programa)")
+    print("=" * 65)
+    resultados = bench_strings(args.size, motores, args.repeat)
+    print()
+    for linea in format_report(resultados, motores):
+        print(linea)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entorno': environment(), 'tamano': args.size,
+                       'resultados': resultados}, f, indent=2, ensure_ascii=False)
+    if not all(r['coinciden'] for r in resultados.values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
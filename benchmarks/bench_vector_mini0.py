@@ -0,0 +1,178 @@
+"""
+Benchmark de la vectorización con NumPy de Mini-0
+Genera programas Mini-0 cuyos ciclos recorren arreglos de --size elementos
+(un millón por omisión) y compara el backend Python escalar con el motor
+'numpy' (y los demás motores pedidos). Cada programa es un patrón típico:
+inicialización, map, saxpy, producto punto, escritura con salto y la criba
+(ciclo externo escalar con el interno vectorizado). Verifica que todos los
+motores retornen lo mismo e informa cuántos ciclos se vectorizaron.
+"""
+
+import sys
+import os
+import json
+import time
+from typing import Dict, List
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.runtime_mini0 import load_program
+from src.vectorize_mini0 import VectorizingTranspiler, np
+from benchmarks.bench_exec_mini0 import ENGINES
+from benchmarks.bench_mini0 import environment
+
+HEADER = """fun main(): int
+    n: int
+    i: int
+    j: int
+    s: int
+    a: []int
+    b: []int
+    x: []int
+    y: []int
+    compuesto: []bool
+    n = {n}
+    a = new [n] int
+    b = new [n] int
+    i = 0
+    while i < n
+        a[i] = i * 3 - 7
+        b[i] = n - i
+        i = i + 1
+    loop
+"""
+
+# Nombre -> cuerpo que sigue a HEADER (n elementos, a y b inicializados)
+PROGRAMS: Dict[str, str] = {
+    'inicializacion': """    return a[n - 1] + b[0]
+end
+""",
+    'map': """    i = 0
+    while i < n
+        b[i] = a[i] * a[i] - 2 * b[i] + 5
+        i = i + 1
+    loop
+    return b[n / 2]
+end
+""",
+    'saxpy': """    x = a
+    y = b
+    i = 0
+    while i < n
+        y[i] = 7 * x[i] + y[i]
+        i = i + 1
+    loop
+    return y[n - 1]
+end
+""",
+    'producto_punto': """    i = 0
+    while i < n
+        s = s + a[i] * b[i]
+        i = i + 1
+    loop
+    return s
+end
+""",
+    'salto': """    i = 1
+    while i < n / 2
+        a[2 * i - 1] = b[2 * i] + a[2 * i - 1]
+        s = s + a[2 * i - 1] - i
+        i = i + 1
+    loop
+    return s
+end
+""",
+    'criba': """    compuesto = new [n + 1] bool
+    i = 2
+    while i <= n
+        if not compuesto[i]
+            s = s + 1
+            j = i * i
+            while j <= n
+                compuesto[j] = true
+                j = j + i
+            loop
+        end
+        i = i + 1
+    loop
+    return s
+end
+""",
+}
+
+def program_source(nombre: str, tamano: int) -> str:
+    return HEADER.format(n=tamano) + PROGRAMS[nombre]
+
+def bench_vector(tamano: int, motores: List[str], repeat: int = 3,
+                 verbose: bool = True) -> Dict[str, dict]:
+    """Por programa: ciclos vectorizados y, por motor, mejor tiempo y valor retornado"""
+    resultados = {}
+    for nombre in PROGRAMS:
+        arena, checker = load_program(program_source(nombre, tamano))
+        transpilador = VectorizingTranspiler(arena, checker)
+        transpilador.transpile()
+        resultado = {'ciclos': transpilador.loops, 'vectorizados': len(transpilador.vectorized),
+                     'motores': {}}
+        for motor in motores:
+            preparar, ejecutar = ENGINES[motor]
+            programa = preparar(arena, checker)
+            mejor = float('inf')
+            for _ in range(repeat):
+                inicio = time.perf_counter()
+                valor, _ = ejecutar(programa)
+                mejor = min(mejor, time.perf_counter() - inicio)
+            resultado['motores'][motor] = {'tiempo': mejor, 'valor': valor}
+            if verbose:
+                print(f"  {nombre:<16}{motor:<10}{mejor * 1000:>10.1f} ms")
+        valores = {r['valor'] for r in resultado['motores'].values()}
+        resultado['coinciden'] = len(valores) == 1
+        resultados[nombre] = resultado
+    return resultados
+
+def format_report(resultados: Dict[str, dict], motores: List[str], base: str) -> List[str]:
+    encabezado = f"{'Programa':<16}{'Vect.':>7}" + ''.join(f"{m + ' (ms)':>13}" for m in motores)
+    lineas = [encabezado + f"{'Aceleración':>13}", "-" * (len(encabezado) + 13)]
+    for nombre, resultado in resultados.items():
+        tiempos = {m: r['tiempo'] for m, r in resultado['motores'].items()}
+        fila = f"{nombre:<16}{resultado['vectorizados']:>3}/{resultado['ciclos']:<3}"
+        fila += ''.join(f"{tiempos[m] * 1000:>13.1f}" for m in motores)
+        if base in tiempos and 'numpy' in tiempos:
+            fila += f"{tiempos[base] / tiempos['numpy']:>12.1f}x"
+        if not resultado['coinciden']:
+            fila += "  ❌ valores distintos"
+        lineas.append(fila)
+    return lineas
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Ciclos de Mini-0 sobre arreglos grandes: escalar vs NumPy")
+    arg_parser.add_argument('--size', type=int, default=1000000, help="elementos por arreglo")
+    arg_parser.add_argument('--engines', default='python,numpy',
+                            help="motores separados por coma (por omisión python,numpy)")
+    arg_parser.add_argument('--baseline', default='python',
+                            help="motor respecto del cual se mide la aceleración de numpy")
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--output', help="guarda las mediciones en JSON")
+    args = arg_parser.parse_args()
+
+    motores = [m for m in args.engines.split(',') if m]
+    desconocidos = [m for m in motores if m not in ENGINES]
+    if desconocidos:
+        arg_parser.error(f"motores desconocidos: {', '.join(desconocidos)}")
+    if np is None:
+        print("⚠ NumPy no está instalado: el motor numpy corre todos los ciclos en escalar")
+
+    print(f"Vectorización Mini-0 ({args.size:,} elementos por arreglo)")
+    print("=" * 65)
+    resultados = bench_vector(args.size, motores, args.repeat)
+    print()
+    for linea in format_report(resultados, motores, args.baseline):
+        print(linea)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entorno': environment(), 'tamano': args.size,
+                       'resultados': resultados}, f, indent=2, ensure_ascii=False)
+    if not all(r['coinciden'] for r in resultados.values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Generador de corpus sintéticos Mini-0 para benchmarks
+Produce programas válidos de un tamaño objetivo (de 1 KB a 100 MB) con
+distintos perfiles de carga: muchas funciones pequeñas, expresiones enormes,
+anidamiento profundo, muchas cadenas, código con muchos comentarios y
+programas derivados aleatoriamente de la gramática.
+"""
+
+import random
+import re
+import sys
+import os
+from typing import Callable, Dict, List
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.generator_mini0 import ProgramGenerator
+
+# Profundidad de anidamiento segura para el parser recursivo (límite de recursión de Python)
+MAX_NESTING = 40
+
+def _function(nombre: str, cuerpo: List[str], declaraciones: List[str]) -> str:
+    """Arma una función Mini-0 con declaraciones locales y comandos"""
+    lineas = [f"fun {nombre}(a: int, b: int): int"]
+    lineas.extend(f"    {d}" for d in declaraciones)
+    lineas.extend(f"    {c}" for c in cuerpo)
+    lineas.append("end")
+    return "\n".join(lineas) + "\n\n"
+
+def _small_functions(rng: random.Random, indice: int) -> str:
+    """Función corta con if, while y llamada"""
+    k = rng.randint(1, 1000)
+    cuerpo = [
+        f"r = a + b * {k}",
+        f"if r > {k}",
+        "    r = r - 1",
+        "else",
+        f"    r = r + 0x{k:X}",
+        "end",
+        "while r < b",
+        "    r = r + 1",
+        "loop",
+        "return r",
+    ]
+    return _function(f"f{indice}", cuerpo, ["r: int"])
+
+def _huge_expression(rng: random.Random, indice: int, objetivo: int) -> str:
+    """Función con una única asignación cuya expresión ocupa ~objetivo bytes"""
+    operadores = ['+', '-', '*', '/']
+    partes = ['a']
+    largo = 1
+    while largo < objetivo:
+        if rng.random() < 0.2:
+            termino = f"(b {rng.choice(operadores)} {rng.randint(1, 99)})"
+        else:
+            termino = rng.choice(['a', 'b', str(rng.randint(1, 9999)), 'g(a, b)'])
+        parte = f" {rng.choice(operadores)} {termino}"
+        partes.append(parte)
+        largo += len(parte)
+    cuerpo = [f"r = {''.join(partes)}", "return r"]
+    return _function(f"e{indice}", cuerpo, ["r: int"])
+
+def _deep_nesting(rng: random.Random, indice: int) -> str:
+    """Función con if/while anidados hasta MAX_NESTING niveles"""
+    profundidad = rng.randint(MAX_NESTING // 2, MAX_NESTING)
+    cuerpo = []
+    for nivel in range(profundidad):
+        sangria = "    " * nivel
+        if nivel % 2 == 0:
+            cuerpo.append(f"{sangria}if a > {nivel}")
+        else:
+            cuerpo.append(f"{sangria}while b < {nivel}")
+        cuerpo.append(f"{sangria}    b = b + 1")
+    for nivel in reversed(range(profundidad)):
+        sangria = "    " * nivel
+        cuerpo.append(f"{sangria}{'end' if nivel % 2 == 0 else 'loop'}")
+    cuerpo.append("return b")
+    return _function(f"n{indice}", cuerpo, [])
+
+def _many_strings(rng: random.Random, indice: int) -> str:
+    """Función con muchas asignaciones de literales de cadena con escapes"""
+    palabras = ['hola', 'mundo', 'mini', 'cero', 'texto', 'cadena', 'valor']
+    cuerpo = []
+    for _ in range(rng.randint(5, 15)):
+        texto = ' '.join(rng.choice(palabras) for _ in range(rng.randint(1, 30)))
+        texto = texto.replace('o', '\\"', rng.randint(0, 2)).replace(' ', '\\t', 1)
+        cuerpo.append(f's = "{texto}\\n"')
+    cuerpo.append("return a")
+    return _function(f"s{indice}", cuerpo, ["s: string"])
+
+def _comment_heavy(rng: random.Random, indice: int) -> str:
+    """Función donde los comentarios dominan el volumen del código"""
+    cuerpo = []
+    for i in range(rng.randint(3, 8)):
+        cuerpo.append(f"// comentario de línea {i}: " + "x" * rng.randint(10, 80))
+        cuerpo.append(f"/* comentario de bloque {i}")
+        cuerpo.append("   " + "y" * rng.randint(10, 80) + " */")
+        cuerpo.append(f"a = a + {i} // al final de la línea")
+    cuerpo.append("return a")
+    return "/* función generada " + "z" * rng.randint(10, 60) + " */\n" + \
+        _function(f"c{indice}", cuerpo, [])
+
+def _grammar_driven(rng: random.Random, indice: int, restante: int) -> str:
+    """Declaraciones derivadas aleatoriamente de GrammarMini0.productions"""
+    generador = ProgramGenerator(seed=rng.getrandbits(32))
+    return generador.generate(min(restante, GRAMMAR_CHUNK))
+
+EXPRESSION_CHUNK = 64 * 1024
+GRAMMAR_CHUNK = 64 * 1024
+
+GENERATORS: Dict[str, Callable[[random.Random, int, int], str]] = {
+    'funciones': lambda rng, i, restante: _small_functions(rng, i),
+    'expresiones': lambda rng, i, restante: _huge_expression(
+        rng, i, max(64, min(restante, EXPRESSION_CHUNK))),
+    'anidamiento': lambda rng, i, restante: _deep_nesting(rng, i),
+    'cadenas': lambda rng, i, restante: _many_strings(rng, i),
+    'comentarios': lambda rng, i, restante: _comment_heavy(rng, i),
+    'gramatica': _grammar_driven,
+}
+
+PRELUDE = "fun g(a: int, b: int): int\n    return a + b\nend\n\n"
+
+def generate(tipo: str, tamano: int, seed: int = 0) -> str:
+    """Genera un programa Mini-0 válido del perfil dado con ~tamano bytes"""
+    rng = random.Random(f"{tipo}:{seed}")
+    generador = GENERATORS[tipo]
+    partes = [PRELUDE]
+    total = len(PRELUDE)
+    indice = 0
+    while total < tamano:
+        parte = generador(rng, indice, tamano - total)
+        partes.append(parte)
+        total += len(parte)
+        indice += 1
+    return ''.join(partes)
+
+SIZE_SUFFIXES = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+def parse_size(texto: str) -> int:
+    """Convierte '1K', '10M', '512' a bytes"""
+    coincidencia = re.fullmatch(r'(\d+)([KMG]?)B?', texto.strip().upper())
+    if not coincidencia:
+        raise ValueError(f"Tamaño inválido: {texto}")
+    return int(coincidencia.group(1)) * SIZE_SUFFIXES.get(coincidencia.group(2), 1)
+
+def format_size(tamano: int) -> str:
+    """Convierte bytes a '1K', '10M'"""
+    for sufijo in ('G', 'M', 'K'):
+        if tamano >= SIZE_SUFFIXES[sufijo] and tamano % SIZE_SUFFIXES[sufijo] == 0:
+            return f"{tamano // SIZE_SUFFIXES[sufijo]}{sufijo}"
+    return str(tamano)
+
+def main():
+    """Escribe un corpus sintético en disco"""
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Genera corpus sintéticos Mini-0")
+    arg_parser.add_argument('tipo', choices=sorted(GENERATORS))
+    arg_parser.add_argument('tamano', help="tamaño objetivo (p. ej. 1K, 10M)")
+    arg_parser.add_argument('salida', help="archivo .mini0 de salida")
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args()
+
+    codigo = generate(args.tipo, parse_size(args.tamano), args.seed)
+    with open(args.salida, 'w', encoding='utf-8') as f:
+        f.write(codigo)
+    print(f"✓ {len(codigo)} bytes escritos en {args.salida}")
+
+if __name__ == "__main__":
+    main()
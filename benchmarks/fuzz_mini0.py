@@ -0,0 +1,218 @@
+"""
+Fuzzer de entradas patológicas para el front end Mini-0
+Parte de programas generados desde la gramática (y de archivos semilla
+opcionales), los muta hacia casos de peor comportamiento y marca toda
+entrada cuyo tiempo de análisis léxico + sintáctico por byte supere un
+límite. Las entradas lentas se guardan como benchmarks de regresión en
+benchmarks/regressions/ y las que provocan excepciones internas en
+benchmarks/crashes/.
+"""
+
+import sys
+import os
+import hashlib
+import random
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.lexer_mini0 import Lexer
+from src.parser_mini0 import ParserMini0
+from src.generator_mini0 import ProgramGenerator
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REGRESSIONS_DIR = os.path.join(BENCH_DIR, 'regressions')
+CRASHES_DIR = os.path.join(BENCH_DIR, 'crashes')
+
+def _insert_line(rng: random.Random, codigo: str, linea: str) -> str:
+    lineas = codigo.split('\n')
+    posicion = rng.randint(0, len(lineas))
+    lineas.insert(posicion, linea)
+    return '\n'.join(lineas)
+
+# Tamaño máximo de los elementos que insertan las mutaciones (cadenas, comentarios...)
+MAX_GROWTH = 1 << 19
+
+def _grow(rng: random.Random, minimo: int = 16, maximo: int = MAX_GROWTH) -> int:
+    """Tamaño con distribución logarítmica: favorece tanto casos chicos como enormes"""
+    return int(2 ** rng.uniform(minimo.bit_length(), maximo.bit_length()))
+
+def mutate_long_string(rng: random.Random, codigo: str) -> str:
+    return _insert_line(rng, codigo, 's = "' + 'a' * _grow(rng) + '"')
+
+def mutate_escaped_string(rng: random.Random, codigo: str) -> str:
+    escapes = ''.join(rng.choice(['\\n', '\\t', '\\"', '\\\\']) for _ in range(_grow(rng) // 2))
+    return _insert_line(rng, codigo, 's = "' + escapes + '"')
+
+def mutate_long_comment(rng: random.Random, codigo: str) -> str:
+    if rng.random() < 0.5:
+        return _insert_line(rng, codigo, '/*' + '*' * _grow(rng) + '*/')
+    return _insert_line(rng, codigo, '//' + '/' * _grow(rng))
+
+def mutate_long_identifier(rng: random.Random, codigo: str) -> str:
+    return _insert_line(rng, codigo, 'x' * _grow(rng) + ' = 1')
+
+def mutate_long_number(rng: random.Random, codigo: str) -> str:
+    return _insert_line(rng, codigo, 'x = ' + '9' * _grow(rng))
+
+def mutate_deep_parentheses(rng: random.Random, codigo: str) -> str:
+    profundidad = _grow(rng, 4, 1 << 12)
+    return _insert_line(rng, codigo, 'x = ' + '(' * profundidad + '1' + ')' * profundidad)
+
+def mutate_repeat_lines(rng: random.Random, codigo: str) -> str:
+    lineas = codigo.split('\n')
+    inicio = rng.randrange(len(lineas))
+    fin = min(len(lineas), inicio + rng.randint(1, 20))
+    veces = rng.randint(2, 64)
+    return '\n'.join(lineas[:fin] + lineas[inicio:fin] * veces + lineas[fin:])
+
+def mutate_delete_span(rng: random.Random, codigo: str) -> str:
+    if not codigo:
+        return codigo
+    inicio = rng.randrange(len(codigo))
+    return codigo[:inicio] + codigo[inicio + rng.randint(1, 64):]
+
+def mutate_insert_noise(rng: random.Random, codigo: str) -> str:
+    posicion = rng.randint(0, len(codigo))
+    ruido = ''.join(rng.choice('"/*\\()[]@#\n\t x0') for _ in range(rng.randint(1, 16)))
+    return codigo[:posicion] + ruido + codigo[posicion:]
+
+MUTATIONS: Dict[str, Callable[[random.Random, str], str]] = {
+    'cadena_larga': mutate_long_string,
+    'escapes': mutate_escaped_string,
+    'comentario_largo': mutate_long_comment,
+    'identificador_largo': mutate_long_identifier,
+    'numero_largo': mutate_long_number,
+    'parentesis_profundos': mutate_deep_parentheses,
+    'repetir_lineas': mutate_repeat_lines,
+    'borrar_tramo': mutate_delete_span,
+    'ruido': mutate_insert_noise,
+}
+
+def measure(codigo: str) -> Tuple[float, str]:
+    """Tiempo de análisis léxico + sintáctico y estado ('ok', 'error' o 'crash: ...')"""
+    inicio = time.perf_counter()
+    try:
+        tokens, errores = Lexer(codigo).tokenize()
+        estado = 'error'
+        if not errores:
+            estado = 'ok' if ParserMini0(tokens).parse() else 'error'
+    except Exception as e:
+        return time.perf_counter() - inicio, f"crash: {type(e).__name__}: {str(e)[:80]}"
+    return time.perf_counter() - inicio, estado
+
+def save_case(codigo: str, directorio: str, etiqueta: str) -> str:
+    """Guarda una entrada con nombre estable derivado de su contenido"""
+    os.makedirs(directorio, exist_ok=True)
+    resumen = hashlib.sha1(codigo.encode('utf-8')).hexdigest()[:10]
+    ruta = os.path.join(directorio, f"{etiqueta}_{resumen}.mini0")
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write(codigo)
+    return ruta
+
+class Finding:
+    """Entrada que excedió el límite de tiempo por byte o que provocó una excepción"""
+
+    def __init__(self, mutacion: str, codigo: str, segundos: float, estado: str):
+        self.mutacion = mutacion
+        self.codigo = codigo
+        self.segundos = segundos
+        self.estado = estado
+        self.ruta: Optional[str] = None
+
+    @property
+    def us_per_byte(self) -> float:
+        return self.segundos * 1e6 / max(1, len(self.codigo))
+
+def fuzz(semillas: List[str], iteraciones: int, limite_us_por_byte: float,
+         min_bytes: int = 1024, max_bytes: int = 1 << 20, seed: int = 0,
+         time_budget: Optional[float] = None, verbose: bool = True) -> List[Finding]:
+    """Muta las semillas buscando entradas lentas; conserva las mutaciones más lentas por byte"""
+    if not semillas:
+        raise ValueError("Se necesita al menos una semilla")
+    rng = random.Random(seed)
+    # Poza de entradas: (costo por byte, código); crece con las más costosas
+    poza: List[Tuple[float, str]] = []
+    for codigo in semillas:
+        segundos, _ = measure(codigo)
+        poza.append((segundos / max(1, len(codigo)), codigo))
+    # Ordenada de menor a mayor costo: poza[0] es siempre la más barata
+    poza.sort(key=lambda par: par[0])
+    hallazgos: List[Finding] = []
+    vistos = set()
+    limite_tiempo = time.perf_counter() + time_budget if time_budget else None
+
+    for iteracion in range(iteraciones):
+        if limite_tiempo and time.perf_counter() > limite_tiempo:
+            break
+        # Preferir las entradas más lentas como padres (torneo de 3)
+        _, padre = max(rng.sample(poza, min(3, len(poza))))
+        nombre, mutacion = rng.choice(list(MUTATIONS.items()))
+        codigo = mutacion(rng, padre)
+        if len(codigo) > max_bytes:
+            continue
+        segundos, estado = measure(codigo)
+        costo = segundos / max(1, len(codigo))
+        fallo = estado.startswith('crash')
+        # Las entradas que provocan excepciones no se usan como padres
+        if not fallo and costo > poza[0][0]:
+            poza.append((costo, codigo))
+            poza.sort(key=lambda par: par[0])
+            del poza[:-32]
+
+        lento = len(codigo) >= min_bytes and costo * 1e6 > limite_us_por_byte
+        if not (lento or fallo):
+            continue
+        clave = estado if fallo else (nombre, round(costo * 1e6))
+        if clave in vistos:
+            continue
+        vistos.add(clave)
+        hallazgo = Finding(nombre, codigo, segundos, estado)
+        hallazgos.append(hallazgo)
+        if verbose:
+            print(f"  [{iteracion}] {nombre}: {len(codigo)} bytes, {hallazgo.us_per_byte:.1f} µs/byte, {estado}")
+    return hallazgos
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Fuzzer de rendimiento del front end Mini-0")
+    arg_parser.add_argument('semillas', nargs='*', help="archivos .mini0 semilla (además de los generados)")
+    arg_parser.add_argument('-n', '--iterations', type=int, default=200)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--generated', type=int, default=8,
+                            help="programas generados desde la gramática como semillas")
+    arg_parser.add_argument('--limit-us-per-byte', type=float, default=8.0,
+                            help="límite de tiempo léxico + sintáctico por byte")
+    arg_parser.add_argument('--min-bytes', type=int, default=1024,
+                            help="tamaño mínimo para evaluar el límite (evita ruido de entradas chicas)")
+    arg_parser.add_argument('--max-bytes', type=int, default=1 << 20)
+    arg_parser.add_argument('--time-budget', type=float, help="segundos máximos de búsqueda")
+    arg_parser.add_argument('--no-save', action='store_true', help="no guarda los hallazgos")
+    args = arg_parser.parse_args()
+
+    semillas = []
+    for ruta in args.semillas:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            semillas.append(f.read())
+    for i in range(args.generated):
+        semillas.append(ProgramGenerator(seed=args.seed * 1000 + i).generate(2048))
+
+    print(f"Fuzzing con {len(semillas)} semillas, {args.iterations} iteraciones, "
+          f"límite {args.limit_us_per_byte:g} µs/byte")
+    print("=" * 80)
+    hallazgos = fuzz(semillas, args.iterations, args.limit_us_per_byte, args.min_bytes,
+                     args.max_bytes, args.seed, args.time_budget)
+
+    print("=" * 80)
+    if not hallazgos:
+        print("✅ Ninguna entrada excedió el límite")
+        return
+    for hallazgo in hallazgos:
+        if not args.no_save:
+            directorio = CRASHES_DIR if hallazgo.estado.startswith('crash') else REGRESSIONS_DIR
+            hallazgo.ruta = save_case(hallazgo.codigo, directorio, hallazgo.mutacion)
+        print(f"❌ {hallazgo.mutacion}: {hallazgo.us_per_byte:.1f} µs/byte, {hallazgo.estado}"
+              + (f" → {hallazgo.ruta}" if hallazgo.ruta else ""))
+    sys.exit(1)
+
+if __name__ == "__main__":
+    main()
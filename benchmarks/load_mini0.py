@@ -0,0 +1,166 @@
+"""
+Generador de carga para el servicio Mini-0 (src/server_mini0.py)
+Abre --connections conexiones y envía --requests pedidos en total, con
+hasta --pipeline pedidos sin respuesta por conexión, tomando los programas de
+tests/mini0 (o de las rutas indicadas). Con --distinct N cada programa se
+envía en N variantes (un comentario distinto), para medir también los
+pedidos que no están en el caché del servidor. Reporta pedidos por segundo,
+percentiles de latencia vistos por el cliente, estados de las respuestas y
+las métricas del servidor. Con --spawn levanta el servidor en un subproceso.
+"""
+
+import asyncio
+import json
+import subprocess
+import time
+from collections import Counter
+from typing import List, Tuple
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.stats_mini0 import percentile
+from src.server_mini0 import DEFAULT_PORT
+from benchmarks.bench_exec_mini0 import collect_programs
+from benchmarks.bench_mini0 import environment
+
+DEFAULT_PROGRAMS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'tests', 'mini0')
+
+def load_sources(rutas: List[str], distinct: int) -> List[str]:
+    """Fuentes a enviar: los programas válidos (sin error*.mini0), en 'distinct' variantes"""
+    fuentes = []
+    for ruta in collect_programs(rutas):
+        if os.path.basename(ruta).startswith('error'):
+            continue
+        with open(ruta, 'r', encoding='utf-8') as f:
+            fuentes.append(f.read())
+    return [f"{fuente}\n// variante {i}\n" if i else fuente
+            for i in range(distinct) for fuente in fuentes]
+
+async def client(host: str, port: int, pedidos: List[dict], pipeline: int,
+                 latencias: List[float], estados: Counter):
+    """Una conexión: envía sus pedidos con a lo sumo 'pipeline' sin respuesta"""
+    reader, writer = await asyncio.open_connection(host, port, limit=1 << 22)
+    enviados = {}
+    ventana = asyncio.Semaphore(pipeline)
+
+    async def leer():
+        for _ in range(len(pedidos)):
+            linea = await reader.readline()
+            if not linea:
+                raise ConnectionError("el servidor cerró la conexión")
+            respuesta = json.loads(linea)
+            latencias.append((time.perf_counter() - enviados.pop(respuesta['id'])) * 1000)
+            estados[respuesta['status']] += 1
+            ventana.release()
+
+    lector = asyncio.create_task(leer())
+    for pedido in pedidos:
+        await ventana.acquire()
+        enviados[pedido['id']] = time.perf_counter()
+        writer.write(json.dumps(pedido).encode('utf-8') + b'\n')
+        await writer.drain()
+    await lector
+    writer.close()
+    await writer.wait_closed()
+
+async def server_metrics(host: str, port: int) -> dict:
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b'{"op": "metrics"}\n')
+    await writer.drain()
+    metricas = json.loads(await reader.readline())['metrics']
+    writer.close()
+    await writer.wait_closed()
+    return metricas
+
+async def run_load(host: str, port: int, fuentes: List[str], total: int, conexiones: int,
+                   pipeline: int, motor: str, timeout: float) -> dict:
+    pedidos = [{'id': i, 'source': fuentes[i % len(fuentes)], 'engine': motor, 'timeout': timeout}
+               for i in range(total)]
+    latencias: List[float] = []
+    estados: Counter = Counter()
+    inicio = time.perf_counter()
+    await asyncio.gather(*(client(host, port, pedidos[c::conexiones], pipeline, latencias, estados)
+                           for c in range(conexiones)))
+    segundos = time.perf_counter() - inicio
+    return {
+        'pedidos': total,
+        'segundos': segundos,
+        'pedidos_por_s': total / segundos,
+        'latencia_ms': {f"p{q}": percentile(latencias, q) for q in (50, 90, 99)},
+        'estados': dict(estados),
+        'servidor': await server_metrics(host, port),
+    }
+
+def spawn_server(workers: int, queue_size: int) -> Tuple[subprocess.Popen, int]:
+    """Levanta src/server_mini0.py en un puerto libre; retorna (proceso, puerto)"""
+    servidor = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            'src', 'server_mini0.py')
+    proceso = subprocess.Popen([sys.executable, servidor, '--port', '0', '--workers', str(workers),
+                                '--queue-size', str(queue_size)],
+                               stdout=subprocess.PIPE, text=True)
+    linea = proceso.stdout.readline()  # "✓ Escuchando en host:puerto (...)"
+    if not linea:
+        raise RuntimeError("el servidor no arrancó")
+    return proceso, int(linea.split()[3].rsplit(':', 1)[1])
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Carga sobre el servicio Mini-0: pedidos por segundo y latencias")
+    arg_parser.add_argument('programas', nargs='*', default=[DEFAULT_PROGRAMS],
+                            help="archivos o directorios .mini0 (por omisión tests/mini0)")
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    arg_parser.add_argument('--spawn', action='store_true', help="levanta el servidor en un subproceso")
+    arg_parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help="procesos del servidor con --spawn")
+    arg_parser.add_argument('--queue-size', type=int, default=256, help="cola del servidor con --spawn")
+    arg_parser.add_argument('--requests', type=int, default=5000)
+    arg_parser.add_argument('--connections', type=int, default=32)
+    arg_parser.add_argument('--pipeline', type=int, default=8,
+                            help="pedidos sin respuesta por conexión")
+    arg_parser.add_argument('--distinct', type=int, default=1,
+                            help="variantes de cada programa (1: todo sale del caché)")
+    arg_parser.add_argument('--engine', choices=('python', 'vm'), default='python')
+    arg_parser.add_argument('--timeout', type=float, default=5.0)
+    arg_parser.add_argument('--output', help="guarda las mediciones en JSON")
+    args = arg_parser.parse_args()
+
+    fuentes = load_sources(args.programas, args.distinct)
+    if not fuentes:
+        arg_parser.error("no hay programas válidos para enviar")
+    proceso = None
+    puerto = args.port
+    if args.spawn:
+        proceso, puerto = spawn_server(args.workers, args.queue_size)
+    try:
+        resultado = asyncio.run(run_load(args.host, puerto, fuentes, args.requests,
+                                         args.connections, args.pipeline, args.engine,
+                                         args.timeout))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait()
+
+    servidor = resultado['servidor']
+    latencia = resultado['latencia_ms']
+    print(f"Servicio Mini-0: {args.requests:,} pedidos, {args.connections} conexiones, "
+          f"{len(fuentes)} fuentes distintas ({args.engine})")
+    print("=" * 65)
+    print(f"Pedidos por segundo:  {resultado['pedidos_por_s']:,.0f}")
+    print(f"Latencia (cliente):   p50 {latencia['p50']:.2f} ms, p90 {latencia['p90']:.2f} ms, "
+          f"p99 {latencia['p99']:.2f} ms")
+    print(f"Estados:              {resultado['estados']}")
+    print(f"Servidor:             {servidor['workers']} procesos, cola máx. "
+          f"{servidor['max_queue_depth']}/{servidor['queue_capacity']}, caché "
+          f"{servidor['cache']['hits']} aciertos / {servidor['cache']['misses']} fallos")
+    print(f"Espera en cola:       p50 {servidor['queue_wait_ms']['p50']:.2f} ms, "
+          f"p99 {servidor['queue_wait_ms']['p99']:.2f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entorno': environment(), 'parametros': vars(args),
+                       'resultado': resultado}, f, indent=2, ensure_ascii=False)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Script para ejecutar los casos de ejecución de Mini-0 en todos los motores
+Cada caso de tests/ejecucion corre main() en cada motor de
+main_mini0.ENGINES, y por el camino del servidor (compile_job y run_job de
+server_mini0, como en un proceso del pool) con servidor-vm y
+servidor-python, y compara el resultado con su cabecera:
+
+    // esperado: VALOR 5050
+    // esperado: ERROR división por cero
+    // esperado: LIMITE instructions
+
+ERROR compara el comienzo del mensaje del Mini0RuntimeError (sin la línea)
+y LIMITE el límite de ExecutionLimits que cortó la ejecución; un límite
+excedido no cuenta como ERROR. Con "// motores: vm,python" el caso corre
+solo en esos motores, y "// opciones: --max-depth 50" le da a la VM los
+límites de vm_mini0.add_limit_arguments. El motor c se saltea si no hay
+compilador de C, y numpy si no está instalado. Cualquier otra excepción
+que escape del motor es un fallo.
+"""
+
+import sys
+import re
+import time
+import argparse
+import importlib.util
+import shlex
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Agregar directorio actual al path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.main_mini0 import ENGINES
+from src.bytecode_mini0 import BytecodeCompiler
+from src.native_mini0 import find_compiler
+from src.runtime_mini0 import CompileError, Mini0LimitError, Mini0RuntimeError, load_program
+from src.vm_mini0 import VM, add_limit_arguments, limits_from_args
+from src.server_mini0 import DEFAULT_TIMEOUT, ENGINES as SERVER_ENGINES, compile_job, run_job
+
+# Motores del servidor y lo que cada estado de run_job significa aquí
+SERVER_PREFIX = 'servidor-'
+ALL_ENGINES = list(ENGINES) + [SERVER_PREFIX + m for m in SERVER_ENGINES]
+SERVER_OUTCOMES = {'ok': ('VALOR', 'value'), 'error': ('ERROR', 'error'), 'limit': ('LIMITE', 'limit'),
+                   'timeout': ('TIEMPO', 'error')}
+
+HEADER = re.compile(r'^\s*//\s*(esperado|motores|opciones)\s*:\s*(.*?)\s*$', re.IGNORECASE)
+EXPECTATION = re.compile(r'^(VALOR|ERROR|LIMITE)\s+(.+)$', re.IGNORECASE)
+HEADER_LINES = 5
+
+def read_case(archivo: Path) -> Optional[dict]:
+    """Expectativa y motores de un caso según su cabecera (None si no tiene)"""
+    caso = {'archivo': str(archivo), 'motores': ALL_ENGINES, 'opciones': ''}
+    with open(archivo, 'r', encoding='utf-8') as f:
+        for _, linea in zip(range(HEADER_LINES), f):
+            coincidencia = HEADER.match(linea)
+            if coincidencia is None:
+                continue
+            clave, valor = coincidencia.group(1).lower(), coincidencia.group(2)
+            if clave == 'motores':
+                caso['motores'] = [m.strip() for m in valor.split(',') if m.strip()]
+                continue
+            if clave == 'opciones':
+                caso['opciones'] = valor
+                continue
+            esperado = EXPECTATION.match(valor)
+            if esperado:
+                caso['tipo'], caso['esperado'] = esperado.group(1).upper(), esperado.group(2)
+    return caso if 'tipo' in caso else None
+
+def discover_cases(test_dir: Path) -> Tuple[List[dict], List[str]]:
+    """Descubre los casos; retorna (casos, archivos sin expectativa)"""
+    casos = []
+    omitidos = []
+    for archivo in sorted(test_dir.glob('*.mini0')):
+        caso = read_case(archivo)
+        if caso is None:
+            omitidos.append(str(archivo))
+        else:
+            casos.append(caso)
+    return casos, omitidos
+
+def unavailable(motor: str) -> Optional[str]:
+    """Motivo por el que un motor no puede correr aquí (None si puede)"""
+    if motor not in ALL_ENGINES:
+        return f"motor desconocido: {motor}"
+    if motor == 'c' and find_compiler() is None:
+        return "no hay compilador de C"
+    if motor == 'numpy' and importlib.util.find_spec('numpy') is None:
+        return "NumPy no está instalado"
+    return None
+
+def parse_options(opciones: str):
+    """ExecutionLimits de la cabecera "// opciones:" (None si no hay límites)"""
+    arg_parser = argparse.ArgumentParser(prog='opciones', add_help=False)
+    add_limit_arguments(arg_parser)
+    return limits_from_args(arg_parser.parse_args(shlex.split(opciones)))
+
+def run_engine(codigo: str, motor: str, opciones: str = ''):
+    """Valor de main() en un motor (o la excepción que lanzó)"""
+    arena, checker = load_program(codigo)
+    limites = parse_options(opciones)
+    if motor == 'vm' and limites is not None:
+        return VM(BytecodeCompiler(arena, checker).compile(), limites).run()
+    return ENGINES[motor](arena, checker).run()
+
+def run_server(codigo: str, motor: str, opciones: str = '') -> Tuple[str, str]:
+    """Compila y ejecuta como el servidor; retorna (resultado, detalle)"""
+    estado, compilado = compile_job(codigo, motor)
+    if estado == 'compile_error':
+        return 'COMPILACION', compilado[0]
+    limites = parse_options(opciones) if motor == 'vm' else None
+    respuesta = run_job(f"{motor}:{codigo}", motor, compilado, DEFAULT_TIMEOUT, limites)
+    obtenido, campo = SERVER_OUTCOMES.get(respuesta['status'], ('EXCEPCION', 'status'))
+    return obtenido, str(respuesta[campo])
+
+def execute_case(archivo: str, motor: str, tipo: str, esperado: str, opciones: str = '') -> dict:
+    """Corre un caso en un motor y compara con lo esperado"""
+    resultado = {'archivo': archivo, 'motor': motor, 'esperado': f"{tipo} {esperado}", 'tiempo_ms': 0.0}
+    with open(archivo, 'r', encoding='utf-8') as f:
+        codigo = f.read()
+    inicio = time.perf_counter()
+    try:
+        if motor.startswith(SERVER_PREFIX):
+            obtenido, detalle = run_server(codigo, motor[len(SERVER_PREFIX):], opciones)
+        else:
+            obtenido, detalle = 'VALOR', str(run_engine(codigo, motor, opciones))
+    except Mini0LimitError as e:
+        obtenido, detalle = 'LIMITE', e.limit
+    except Mini0RuntimeError as e:
+        obtenido, detalle = 'ERROR', e.message
+    except CompileError as e:
+        obtenido, detalle = 'COMPILACION', e.errors[0]
+    except Exception as e:
+        obtenido, detalle = 'EXCEPCION', f"{type(e).__name__}: {e}"
+    resultado['tiempo_ms'] = (time.perf_counter() - inicio) * 1000
+    if tipo == 'ERROR':
+        correcto = obtenido == 'ERROR' and detalle.startswith(esperado)
+    else:
+        correcto = obtenido == tipo and detalle == esperado
+    resultado.update(resultado=f"{obtenido} {detalle}", correcto=correcto)
+    return resultado
+
+def _execute_case_args(trabajo: Tuple[str, str, str, str, str]) -> dict:
+    """Adaptador para ProcessPoolExecutor.map"""
+    return execute_case(*trabajo)
+
+class ExecTestRunner:
+    def __init__(self):
+        self.total_tests = 0
+        self.passed_tests = 0
+        self.failed_tests = 0
+        self.skipped = []
+        self.results = []
+
+    def record(self, resultado: dict):
+        self.total_tests += 1
+        if resultado['correcto']:
+            self.passed_tests += 1
+        else:
+            self.failed_tests += 1
+        self.results.append(resultado)
+
+    def run_all(self, casos: List[dict], motores: Optional[List[str]] = None,
+                workers: Optional[int] = None):
+        """Corre cada caso en cada uno de sus motores, repartidos en un pool de procesos"""
+        trabajos = []
+        for caso in casos:
+            for motor in caso['motores']:
+                if motores and motor not in motores:
+                    continue
+                motivo = unavailable(motor)
+                if motivo is not None:
+                    self.skipped.append((caso['archivo'], motor, motivo))
+                    continue
+                trabajos.append((caso['archivo'], motor, caso['tipo'], caso['esperado'], caso['opciones']))
+        if workers == 1 or len(trabajos) <= 1:
+            for resultado in map(_execute_case_args, trabajos):
+                self.record(resultado)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for resultado in executor.map(_execute_case_args, trabajos):
+                self.record(resultado)
+
+    def print_results(self):
+        print("\n" + "=" * 80)
+        print("RESULTADOS DE LAS PRUEBAS DE EJECUCIÓN - MINI-0")
+        print("=" * 80)
+
+        print("\n📊 RESUMEN:")
+        print(f"  Total de pruebas: {self.total_tests}")
+        print(f"  ✅ Pasadas: {self.passed_tests}")
+        print(f"  ❌ Falladas: {self.failed_tests}")
+        print(f"  ⏭  Salteadas: {len(self.skipped)}")
+
+        print("\n📝 DETALLE DE PRUEBAS:")
+        print("-" * 80)
+        for i, result in enumerate(self.results, 1):
+            simbolo = "✅" if result['correcto'] else "❌"
+            print(f"{i:>3}. {simbolo} {Path(result['archivo']).name} [{result['motor']}] "
+                  f"{result['tiempo_ms']:.1f} ms")
+            if not result['correcto']:
+                print(f"     Esperado: {result['esperado']}")
+                print(f"     Obtenido: {result['resultado']}")
+        for archivo, motor, motivo in self.skipped:
+            print(f"  ⏭  {Path(archivo).name} [{motor}]: {motivo}")
+
+        print("\n" + "=" * 80)
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Ejecuta los casos de ejecución de Mini-0")
+    arg_parser.add_argument('--dir', default='tests/ejecucion',
+                            help="directorio de casos (por defecto tests/ejecucion)")
+    arg_parser.add_argument('--engines', default='',
+                            help="motores separados por coma (por defecto, los de cada caso)")
+    arg_parser.add_argument('-j', '--workers', type=int, default=None,
+                            help="procesos trabajadores (por defecto, uno por CPU; 1 = secuencial)")
+    args = arg_parser.parse_args()
+
+    print("Ejecutando pruebas de ejecución de Mini-0...")
+    print("=" * 80)
+
+    test_dir = Path(args.dir)
+    casos, omitidos = discover_cases(test_dir)
+    print(f"\n🔍 Casos descubiertos en {test_dir}: {len(casos)}")
+    for archivo in omitidos:
+        print(f"  ⚠ Sin expectativa (se omite): {Path(archivo).name}")
+
+    runner = ExecTestRunner()
+    runner.run_all(casos, [m for m in args.engines.split(',') if m], args.workers)
+    runner.print_results()
+    sys.exit(1 if runner.failed_tests > 0 else 0)
+
+if __name__ == "__main__":
+    main()
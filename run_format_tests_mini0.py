@@ -0,0 +1,129 @@
+"""
+Script para probar el formateador de Mini-0 (src/formatter_mini0.py)
+Formatea cada programa de tests/mini0, tests/ejecucion y
+benchmarks/programs, un caso con comentarios en todas las posiciones y los
+corpus sintéticos de benchmarks/corpus_mini0, y verifica en cada uno:
+
+  - idempotencia: formatear la salida no la cambia
+  - same_tokens: la salida tiene los mismos tokens y comentarios
+  - load_program: si el original carga, la salida carga con el mismo AST;
+    si no carga, la salida tampoco
+
+Un fuente que el formateador rechaza (FormatError) solo es correcto si el
+original tampoco carga, como los error*.mini0 de tests/mini0.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Agregar directorio actual al path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.files_mini0 import collect_files
+from src.formatter_mini0 import FormatError, format_source, same_tokens
+from src.runtime_mini0 import CompileError, load_program
+from benchmarks.corpus_mini0 import GENERATORS, format_size, generate, parse_size
+
+DIRECTORIES = ('tests/mini0', 'tests/ejecucion', 'benchmarks/programs')
+
+# Comentarios de línea y de bloque en cada posición que el formateador
+# conserva, con indentación y espacios desparejos para que haya cambios
+COMENTARIOS = """// cabecera del archivo
+/* bloque
+   de varias líneas */
+total: int   // global con comentario al final
+
+
+/* antes de la función */ fun doble(n: int): int // después de la firma
+      // primera línea del cuerpo
+  return n*2   /* al final del return */
+end
+fun main(): int
+    i: int // declaración
+    /* antes del while */
+    i=0
+    while i<10   // condición
+        // dentro del ciclo
+
+
+        i = i+( 1 /* dentro de la expresión */ )
+    loop // después del loop
+    if i=10
+        total = doble(i)
+        // antes del else
+    else
+        /* rama vacía de código */ total = -1
+    end
+    return total // fin
+end
+// comentario final sin salto de línea"""
+
+def load_outcome(fuente: str) -> Tuple[bool, Optional[str]]:
+    """(carga, AST en S-expresiones) de un fuente"""
+    try:
+        arena, _ = load_program(fuente)
+    except CompileError:
+        return False, None
+    return True, arena.dump()
+
+def check_source(nombre: str, fuente: str) -> dict:
+    """Formatea un fuente y verifica las tres propiedades"""
+    fallas = []
+    carga, ast = load_outcome(fuente)
+    try:
+        formateado = format_source(fuente)
+    except FormatError as e:
+        if carga:
+            fallas.append(f"FormatError en un programa que carga: {e}")
+        return {'caso': nombre, 'correcto': not fallas, 'fallas': fallas,
+                'detalle': 'rechazado por el formateador'}
+    if format_source(formateado) != formateado:
+        fallas.append("no es idempotente: formatear la salida la cambia")
+    if not same_tokens(fuente, formateado):
+        fallas.append("same_tokens: la salida cambió tokens o comentarios")
+    carga_formateado, ast_formateado = load_outcome(formateado)
+    if carga_formateado != carga:
+        fallas.append(f"load_program: el original {'carga' if carga else 'no carga'}, "
+                      f"la salida {'sí' if carga_formateado else 'no'}")
+    elif ast_formateado != ast:
+        fallas.append("load_program: la salida carga con otro AST")
+    detalle = 'sin cambios' if formateado == fuente else 'reformateado'
+    return {'caso': nombre, 'correcto': not fallas, 'fallas': fallas,
+            'detalle': detalle + ('' if carga else ', no carga')}
+
+def cases(tamano: int) -> List[Tuple[str, str]]:
+    """(nombre, fuente) de los archivos, el caso de comentarios y los corpus"""
+    casos = []
+    for archivo in collect_files(DIRECTORIES):
+        with open(archivo, 'r', encoding='utf-8') as f:
+            casos.append((archivo, f.read()))
+    casos.append(("comentarios en todas las posiciones", COMENTARIOS))
+    for tipo in GENERATORS:
+        casos.append((f"corpus {tipo}/{format_size(tamano)}", generate(tipo, tamano)))
+    return casos
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Prueba el formateador de Mini-0")
+    arg_parser.add_argument('--size', default='16K',
+                            help="tamaño de los corpus sintéticos (por defecto 16K)")
+    args = arg_parser.parse_args()
+
+    print("Ejecutando pruebas del formateador de Mini-0...")
+    print("=" * 80)
+    resultados = [check_source(nombre, fuente) for nombre, fuente in cases(parse_size(args.size))]
+
+    fallidos = 0
+    for i, resultado in enumerate(resultados, 1):
+        simbolo = "✅" if resultado['correcto'] else "❌"
+        print(f"{i:>3}. {simbolo} {resultado['caso']} ({resultado['detalle']})")
+        for falla in resultado['fallas']:
+            print(f"     {falla}")
+        fallidos += not resultado['correcto']
+    print("=" * 80)
+    print(f"{len(resultados)} casos, {fallidos} fallidos")
+    sys.exit(1 if fallidos else 0)
+
+if __name__ == "__main__":
+    main()
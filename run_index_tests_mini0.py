@@ -0,0 +1,172 @@
+"""
+Script para probar la indexación incremental del índice de símbolos
+Recorre un escenario sobre un directorio temporal con src/index_mini0.py:
+carga inicial, reindexar sin cambios, tocar un archivo (solo cambia el
+mtime), editarlo, romperlo, borrar otro, agregar uno nuevo y reabrir la
+base. En cada paso verifica qué archivos se volvieron a analizar, los
+conteos de la base y algunas consultas, para comprobar que las filas de
+un archivo se reemplazan sin duplicarse y que las de uno borrado se van.
+"""
+
+import sys
+import os
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Callable, List
+
+# Agregar directorio actual al path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.index_mini0 import SymbolIndex
+
+PRINCIPAL = """total: int
+
+fun sumar(n: int): int
+    total = total + n
+    return total
+end
+
+fun main(): int
+    total = 0
+    return sumar(3)
+end
+"""
+
+# sumar ahora llama a doble, que es nueva
+PRINCIPAL_EDITADO = """total: int
+
+fun doble(n: int): int
+    return n * 2
+end
+
+fun sumar(n: int): int
+    total = total + doble(n)
+    return total
+end
+
+fun main(): int
+    total = 0
+    return sumar(3)
+end
+"""
+
+PRINCIPAL_ROTO = """fun main(): int
+    return 1 +
+end
+"""
+
+AUXILIAR = """contador: int
+
+fun incrementar(): int
+    contador = contador + 1
+    return contador
+end
+"""
+
+NUEVO = """fun cero(): int
+    return 0
+end
+"""
+
+class IndexScenario:
+    """Pasos del escenario sobre un directorio y una base temporales"""
+
+    def __init__(self, directorio: str):
+        self.directorio = directorio
+        self.db_path = os.path.join(directorio, 'indice.sqlite')
+        self.fuentes = os.path.join(directorio, 'fuentes')
+        os.makedirs(self.fuentes)
+        self.index = SymbolIndex(self.db_path)
+        self.results = []
+
+    def path(self, nombre: str) -> str:
+        return os.path.join(self.fuentes, nombre)
+
+    def write(self, nombre: str, codigo: str):
+        with open(self.path(nombre), 'w', encoding='utf-8') as f:
+            f.write(codigo)
+
+    def touch(self, nombre: str):
+        """Adelanta el mtime un segundo sin cambiar el contenido"""
+        estado = os.stat(self.path(nombre))
+        os.utime(self.path(nombre), ns=(estado.st_atime_ns, estado.st_mtime_ns + 1_000_000_000))
+
+    def reopen(self):
+        self.index.close()
+        self.index = SymbolIndex(self.db_path)
+
+    def step(self, nombre: str, accion: Callable[[], None], indexados: int, borrados: int,
+             conteos: dict, consultas: List[tuple] = ()):
+        """Aplica la acción, reindexa y compara con lo esperado; cada consulta
+        es (descripción, función, valor esperado)"""
+        accion()
+        stats = self.index.index([self.fuentes], workers=1)
+        fallas = []
+        if (stats.indexed, stats.removed) != (indexados, borrados):
+            fallas.append(f"analizados/borrados: esperado {indexados}/{borrados}, "
+                          f"obtenido {stats.indexed}/{stats.removed}")
+        obtenidos = self.index.counts()
+        if obtenidos != conteos:
+            fallas.append(f"conteos: esperado {conteos}, obtenido {obtenidos}")
+        for descripcion, consulta, esperado in consultas:
+            obtenido = consulta()
+            if obtenido != esperado:
+                fallas.append(f"{descripcion}: esperado {esperado}, obtenido {obtenido}")
+        self.results.append({'paso': nombre, 'correcto': not fallas, 'fallas': fallas})
+
+    def lines(self, nombre: str) -> List[int]:
+        return [linea for _, _, linea, _, _ in self.index.definitions(nombre)]
+
+    def run(self):
+        conteos_iniciales = {'archivos': 2, 'con_errores': 0, 'definiciones': 5, 'referencias': 9}
+        self.step("carga inicial", lambda: (self.write('principal.mini0', PRINCIPAL),
+                                            self.write('auxiliar.mini0', AUXILIAR)),
+                  2, 0, conteos_iniciales,
+                  [("definición de sumar", lambda: self.lines('sumar'), [3]),
+                   ("llamadas a sumar", lambda: self.index.count_references('sumar', 'llamada'), 1)])
+        self.step("sin cambios", lambda: None, 0, 0, conteos_iniciales)
+        self.step("tocar (solo mtime)", lambda: self.touch('principal.mini0'), 1, 0, conteos_iniciales,
+                  [("definición de sumar", lambda: self.lines('sumar'), [3])])
+        self.step("editar", lambda: self.write('principal.mini0', PRINCIPAL_EDITADO), 1, 0,
+                  {'archivos': 2, 'con_errores': 0, 'definiciones': 6, 'referencias': 11},
+                  [("definición de sumar", lambda: self.lines('sumar'), [7]),
+                   ("definición de doble", lambda: self.lines('doble'), [3]),
+                   ("llamadas a doble", lambda: self.index.count_references('doble', 'llamada'), 1)])
+        self.step("romper", lambda: self.write('principal.mini0', PRINCIPAL_ROTO), 1, 0,
+                  {'archivos': 2, 'con_errores': 1, 'definiciones': 2, 'referencias': 3},
+                  [("definición de sumar", lambda: self.lines('sumar'), [])])
+        self.step("borrar", lambda: os.remove(self.path('auxiliar.mini0')), 0, 1,
+                  {'archivos': 1, 'con_errores': 1, 'definiciones': 0, 'referencias': 0},
+                  [("definición de incrementar", lambda: self.lines('incrementar'), []),
+                   ("referencias a contador", lambda: self.index.count_references('contador'), 0)])
+        self.step("agregar", lambda: self.write('nuevo.mini0', NUEVO), 1, 0,
+                  {'archivos': 2, 'con_errores': 1, 'definiciones': 1, 'referencias': 0},
+                  [("definición de cero", lambda: self.lines('cero'), [1])])
+        self.step("reabrir la base", self.reopen, 0, 0,
+                  {'archivos': 2, 'con_errores': 1, 'definiciones': 1, 'referencias': 0})
+        self.index.close()
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Prueba la indexación incremental del índice de símbolos")
+    arg_parser.parse_args()
+
+    print("Ejecutando pruebas del índice de símbolos...")
+    print("=" * 80)
+    with tempfile.TemporaryDirectory() as directorio:
+        escenario = IndexScenario(directorio)
+        escenario.run()
+
+    fallidos = 0
+    for i, resultado in enumerate(escenario.results, 1):
+        simbolo = "✅" if resultado['correcto'] else "❌"
+        print(f"{i}. {simbolo} {resultado['paso']}")
+        for falla in resultado['fallas']:
+            print(f"   {falla}")
+        fallidos += not resultado['correcto']
+    print("=" * 80)
+    print(f"{len(escenario.results)} pasos, {fallidos} fallidos")
+    sys.exit(1 if fallidos else 0)
+
+if __name__ == "__main__":
+    main()
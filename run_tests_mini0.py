@@ -1,11 +1,23 @@
 """
 Script para ejecutar todos los casos de prueba del parser Mini-0
 Genera un reporte detallado de los resultados
+
+Los casos se descubren en tests/mini0: un archivo programa*.mini0 debe
+pasar y uno error*.mini0 debe fallar. Una cabecera en las primeras líneas
+del archivo tiene prioridad sobre el nombre:
+
+    // esperado: PASS
+    // esperado: FAIL
 """
 
 import sys
 import os
+import re
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 # Agregar directorio actual al path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -13,180 +25,246 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.lexer_mini0 import Lexer
 from src.parser_mini0 import ParserMini0
 
+# Cabecera de expectativa: "// esperado: PASS" (también se acepta "expect")
+EXPECTATION_HEADER = re.compile(r'^\s*//\s*(?:esperado|expect)\s*:\s*(PASS|FAIL)\b', re.IGNORECASE)
+HEADER_LINES = 5
+
+# Prefijos de nombre de archivo y su resultado esperado
+NAMING_CONVENTION = {
+    'programa': True,
+    'error': False,
+}
+
+def read_expectation(archivo: Path) -> Optional[bool]:
+    """Determina si un caso debe pasar según su cabecera o su nombre"""
+    try:
+        with open(archivo, 'r', encoding='utf-8') as f:
+            for _, linea in zip(range(HEADER_LINES), f):
+                coincidencia = EXPECTATION_HEADER.match(linea)
+                if coincidencia:
+                    return coincidencia.group(1).upper() == 'PASS'
+    except (OSError, UnicodeDecodeError):
+        pass
+    for prefijo, debe_pasar in NAMING_CONVENTION.items():
+        if archivo.name.startswith(prefijo):
+            return debe_pasar
+    return None
+
+def discover_cases(test_dir: Path) -> Tuple[List[Tuple[str, bool]], List[str]]:
+    """Descubre los casos de prueba; retorna (casos, archivos sin expectativa)"""
+    casos = []
+    omitidos = []
+    for archivo in sorted(test_dir.glob('*.mini0')):
+        debe_pasar = read_expectation(archivo)
+        if debe_pasar is None:
+            omitidos.append(str(archivo))
+        else:
+            casos.append((str(archivo), debe_pasar))
+    # Primero los válidos y luego los de error, como en el reporte
+    casos.sort(key=lambda caso: not caso[1])
+    return casos, omitidos
+
+def execute_case(archivo: str, debe_pasar: bool = True) -> dict:
+    """Ejecuta un caso y retorna su resultado con los tiempos de cada fase"""
+    esperado = 'PASS' if debe_pasar else 'FAIL'
+    resultado = {
+        'archivo': archivo,
+        'esperado': esperado,
+        'tiempo_lexico_ms': 0.0,
+        'tiempo_sintactico_ms': 0.0,
+    }
+
+    try:
+        with open(archivo, 'r', encoding='utf-8') as f:
+            codigo = f.read()
+    except Exception as e:
+        resultado.update(resultado='ERROR', correcto=False,
+                         mensaje=f"No se pudo leer el archivo: {e}")
+        return resultado
+
+    # Análisis léxico
+    inicio = time.perf_counter()
+    lexer = Lexer(codigo)
+    tokens, errores_lexicos = lexer.tokenize()
+    resultado['tiempo_lexico_ms'] = (time.perf_counter() - inicio) * 1000
+
+    if errores_lexicos:
+        if debe_pasar:
+            resultado.update(resultado='FAIL', correcto=False,
+                             mensaje=f"Errores léxicos: {errores_lexicos[0]}")
+        else:
+            resultado.update(resultado='FAIL', correcto=True,
+                             mensaje=f"Error detectado correctamente: {errores_lexicos[0]}")
+        return resultado
+
+    # Análisis sintáctico
+    parser = ParserMini0(tokens)
+    inicio = time.perf_counter()
+
+    try:
+        exito = parser.parse()
+        resultado['tiempo_sintactico_ms'] = (time.perf_counter() - inicio) * 1000
+
+        if exito and not parser.errors:
+            if debe_pasar:
+                resultado.update(resultado='PASS', correcto=True, mensaje='Análisis exitoso')
+            else:
+                resultado.update(resultado='PASS', correcto=False,
+                                 mensaje='Debería haber fallado pero pasó')
+        else:
+            if debe_pasar:
+                mensaje = parser.errors[0] if parser.errors else "Error desconocido"
+                resultado.update(resultado='FAIL', correcto=False, mensaje=mensaje)
+            else:
+                mensaje = parser.errors[0] if parser.errors else "Error detectado"
+                resultado.update(resultado='FAIL', correcto=True,
+                                 mensaje=f"Error detectado correctamente: {mensaje}")
+
+    except Exception as e:
+        resultado['tiempo_sintactico_ms'] = (time.perf_counter() - inicio) * 1000
+        if debe_pasar:
+            resultado.update(resultado='ERROR', correcto=False, mensaje=f"Excepción: {str(e)}")
+        else:
+            resultado.update(resultado='ERROR', correcto=True,
+                             mensaje=f"Error detectado: {str(e)}")
+
+    return resultado
+
+def _execute_case_args(caso: Tuple[str, bool]) -> dict:
+    """Adaptador para ProcessPoolExecutor.map"""
+    return execute_case(*caso)
+
 class TestRunner:
-    def __init__(self):
+    def __init__(self, budget_ms: float = 100.0):
         self.total_tests = 0
         self.passed_tests = 0
         self.failed_tests = 0
+        self.slow_tests = 0
+        self.budget_ms = budget_ms
         self.results = []
-    
-    def run_test(self, archivo, debe_pasar=True):
-        """Ejecuta un test individual"""
+
+    def record(self, resultado: dict):
+        """Registra el resultado de un caso y marca si excede el presupuesto de tiempo"""
         self.total_tests += 1
-        
-        try:
-            with open(archivo, 'r', encoding='utf-8') as f:
-                codigo = f.read()
-        except Exception as e:
+        if resultado['correcto']:
+            self.passed_tests += 1
+        else:
             self.failed_tests += 1
-            self.results.append({
-                'archivo': archivo,
-                'esperado': 'PASS' if debe_pasar else 'FAIL',
-                'resultado': 'ERROR',
-                'mensaje': f"No se pudo leer el archivo: {e}"
-            })
-            return
-        
-        # Análisis léxico
-        lexer = Lexer(codigo)
-        tokens, errores_lexicos = lexer.tokenize()
-        
-        if errores_lexicos:
-            if debe_pasar:
-                self.failed_tests += 1
-                self.results.append({
-                    'archivo': archivo,
-                    'esperado': 'PASS',
-                    'resultado': 'FAIL',
-                    'mensaje': f"Errores léxicos: {errores_lexicos[0]}"
-                })
-            else:
-                self.passed_tests += 1
-                self.results.append({
-                    'archivo': archivo,
-                    'esperado': 'FAIL',
-                    'resultado': 'FAIL',
-                    'mensaje': f"Error detectado correctamente: {errores_lexicos[0]}"
-                })
+        resultado['tiempo_total_ms'] = resultado['tiempo_lexico_ms'] + resultado['tiempo_sintactico_ms']
+        resultado['lento'] = resultado['tiempo_total_ms'] > self.budget_ms
+        if resultado['lento']:
+            self.slow_tests += 1
+        self.results.append(resultado)
+
+    def run_test(self, archivo, debe_pasar=True):
+        """Ejecuta un test individual"""
+        self.record(execute_case(archivo, debe_pasar))
+
+    def run_all(self, casos: List[Tuple[str, bool]], workers: Optional[int] = None):
+        """Ejecuta los casos repartidos en un pool de procesos (workers=1: secuencial)"""
+        if workers == 1 or len(casos) <= 1:
+            resultados = map(_execute_case_args, casos)
+            for resultado in resultados:
+                self.record(resultado)
             return
-        
-        # Análisis sintáctico
-        parser = ParserMini0(tokens)
-        
-        try:
-            exito = parser.parse()
-            
-            if exito and not parser.errors:
-                if debe_pasar:
-                    self.passed_tests += 1
-                    self.results.append({
-                        'archivo': archivo,
-                        'esperado': 'PASS',
-                        'resultado': 'PASS',
-                        'mensaje': 'Análisis exitoso'
-                    })
-                else:
-                    self.failed_tests += 1
-                    self.results.append({
-                        'archivo': archivo,
-                        'esperado': 'FAIL',
-                        'resultado': 'PASS',
-                        'mensaje': 'Debería haber fallado pero pasó'
-                    })
-            else:
-                if debe_pasar:
-                    self.failed_tests += 1
-                    mensaje = parser.errors[0] if parser.errors else "Error desconocido"
-                    self.results.append({
-                        'archivo': archivo,
-                        'esperado': 'PASS',
-                        'resultado': 'FAIL',
-                        'mensaje': mensaje
-                    })
-                else:
-                    self.passed_tests += 1
-                    mensaje = parser.errors[0] if parser.errors else "Error detectado"
-                    self.results.append({
-                        'archivo': archivo,
-                        'esperado': 'FAIL',
-                        'resultado': 'FAIL',
-                        'mensaje': f"Error detectado correctamente: {mensaje}"
-                    })
-        
-        except Exception as e:
-            if debe_pasar:
-                self.failed_tests += 1
-                self.results.append({
-                    'archivo': archivo,
-                    'esperado': 'PASS',
-                    'resultado': 'ERROR',
-                    'mensaje': f"Excepción: {str(e)}"
-                })
-            else:
-                self.passed_tests += 1
-                self.results.append({
-                    'archivo': archivo,
-                    'esperado': 'FAIL',
-                    'resultado': 'ERROR',
-                    'mensaje': f"Error detectado: {str(e)}"
-                })
-    
-    def print_results(self):
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map conserva el orden de los casos aunque terminen en otro orden
+            for resultado in executor.map(_execute_case_args, casos):
+                self.record(resultado)
+
+    def slowest(self, n: int = 5) -> List[dict]:
+        """Los n casos más lentos"""
+        return sorted(self.results, key=lambda r: -r['tiempo_total_ms'])[:n]
+
+    def print_results(self, slowest_n: int = 5):
         """Imprime los resultados de las pruebas"""
         print("\n" + "=" * 80)
         print("RESULTADOS DE LAS PRUEBAS - PARSER MINI-0")
         print("=" * 80)
-        
+
         print("\n📊 RESUMEN:")
         print(f"  Total de pruebas: {self.total_tests}")
         print(f"  ✅ Pasadas: {self.passed_tests}")
         print(f"  ❌ Falladas: {self.failed_tests}")
         print(f"  Porcentaje de éxito: {(self.passed_tests/self.total_tests*100):.1f}%")
-        
+        print(f"  🐢 Lentas (> {self.budget_ms:g} ms): {self.slow_tests}")
+
         print("\n📝 DETALLE DE PRUEBAS:")
         print("-" * 80)
-        
+
         for i, result in enumerate(self.results, 1):
             archivo_nombre = Path(result['archivo']).name
             esperado = result['esperado']
             resultado = result['resultado']
-            
+
             # Determinar símbolo
-            if esperado == 'PASS' and resultado == 'PASS':
-                simbolo = "✅"
-            elif esperado == 'FAIL' and resultado == 'FAIL':
-                simbolo = "✅"
-            else:
-                simbolo = "❌"
-            
-            print(f"\n{i}. {simbolo} {archivo_nombre}")
+            simbolo = "✅" if result['correcto'] else "❌"
+            lento = " 🐢" if result['lento'] else ""
+
+            print(f"\n{i}. {simbolo} {archivo_nombre}{lento}")
             print(f"   Esperado: {esperado} | Resultado: {resultado}")
+            print(f"   Léxico: {result['tiempo_lexico_ms']:.2f} ms | "
+                  f"Sintáctico: {result['tiempo_sintactico_ms']:.2f} ms")
             print(f"   {result['mensaje']}")
-        
+
+        print(f"\n⏱  CASOS MÁS LENTOS:")
+        for result in self.slowest(slowest_n):
+            print(f"  {result['tiempo_total_ms']:8.2f} ms  {Path(result['archivo']).name}")
+
         print("\n" + "=" * 80)
-    
-    def generate_report(self, output_file='TESTING_REPORT.md'):
+
+    def generate_report(self, output_file='TESTING_REPORT.md', slowest_n: int = 5):
         """Genera un reporte en formato Markdown"""
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write("# Reporte de Pruebas - Parser Mini-0\n\n")
             f.write(f"**Fecha:** {Path(__file__).stat().st_mtime}\n\n")
-            
+
             f.write("## Resumen\n\n")
             f.write(f"- **Total de pruebas:** {self.total_tests}\n")
             f.write(f"- **Pruebas pasadas:** {self.passed_tests}\n")
             f.write(f"- **Pruebas falladas:** {self.failed_tests}\n")
-            f.write(f"- **Porcentaje de éxito:** {(self.passed_tests/self.total_tests*100):.1f}%\n\n")
-            
+            f.write(f"- **Porcentaje de éxito:** {(self.passed_tests/self.total_tests*100):.1f}%\n")
+            f.write(f"- **Presupuesto por caso:** {self.budget_ms:g} ms\n")
+            f.write(f"- **Casos lentos:** {self.slow_tests}\n")
+            total_ms = sum(r['tiempo_total_ms'] for r in self.results)
+            f.write(f"- **Tiempo total (léxico + sintáctico):** {total_ms:.2f} ms\n\n")
+
             f.write("## Casos de Prueba Válidos\n\n")
-            f.write("| # | Archivo | Resultado | Descripción |\n")
-            f.write("|---|---------|-----------|-------------|\n")
-            
-            for i, result in enumerate([r for r in self.results if 'programa' in r['archivo']], 1):
+            f.write("| # | Archivo | Resultado | Léxico (ms) | Sintáctico (ms) | Descripción |\n")
+            f.write("|---|---------|-----------|-------------|-----------------|-------------|\n")
+
+            for i, result in enumerate([r for r in self.results if r['esperado'] == 'PASS'], 1):
                 archivo = Path(result['archivo']).name
                 resultado = "✅ PASS" if result['resultado'] == 'PASS' else "❌ FAIL"
+                if result['lento']:
+                    resultado += " 🐢"
                 mensaje = result['mensaje'][:50] + "..." if len(result['mensaje']) > 50 else result['mensaje']
-                f.write(f"| {i} | `{archivo}` | {resultado} | {mensaje} |\n")
-            
+                f.write(f"| {i} | `{archivo}` | {resultado} | {result['tiempo_lexico_ms']:.2f} | "
+                        f"{result['tiempo_sintactico_ms']:.2f} | {mensaje} |\n")
+
             f.write("\n## Casos de Prueba con Errores\n\n")
-            f.write("| # | Archivo | Resultado | Error Detectado |\n")
-            f.write("|---|---------|-----------|----------------|\n")
-            
-            for i, result in enumerate([r for r in self.results if 'error' in r['archivo']], 1):
+            f.write("| # | Archivo | Resultado | Léxico (ms) | Sintáctico (ms) | Error Detectado |\n")
+            f.write("|---|---------|-----------|-------------|-----------------|----------------|\n")
+
+            for i, result in enumerate([r for r in self.results if r['esperado'] == 'FAIL'], 1):
                 archivo = Path(result['archivo']).name
                 resultado = "✅ DETECTADO" if result['resultado'] in ['FAIL', 'ERROR'] else "❌ NO DETECTADO"
+                if result['lento']:
+                    resultado += " 🐢"
                 mensaje = result['mensaje'][:60] + "..." if len(result['mensaje']) > 60 else result['mensaje']
-                f.write(f"| {i} | `{archivo}` | {resultado} | {mensaje} |\n")
-            
+                f.write(f"| {i} | `{archivo}` | {resultado} | {result['tiempo_lexico_ms']:.2f} | "
+                        f"{result['tiempo_sintactico_ms']:.2f} | {mensaje} |\n")
+
+            f.write(f"\n## Casos Más Lentos\n\n")
+            f.write("| # | Archivo | Total (ms) | Léxico (ms) | Sintáctico (ms) | Excede presupuesto |\n")
+            f.write("|---|---------|------------|-------------|-----------------|--------------------|\n")
+            for i, result in enumerate(self.slowest(slowest_n), 1):
+                archivo = Path(result['archivo']).name
+                excede = "🐢 Sí" if result['lento'] else "No"
+                f.write(f"| {i} | `{archivo}` | {result['tiempo_total_ms']:.2f} | "
+                        f"{result['tiempo_lexico_ms']:.2f} | {result['tiempo_sintactico_ms']:.2f} | "
+                        f"{excede} |\n")
+
             f.write("\n## Cobertura de Reglas Gramaticales\n\n")
             f.write("### Reglas Ejercitadas:\n\n")
             f.write("- ✅ Declaración de funciones (con y sin parámetros)\n")
@@ -206,7 +284,7 @@ class TestRunner:
             f.write("- ✅ Operador new para arrays\n")
             f.write("- ✅ Expresiones con paréntesis\n")
             f.write("- ✅ Precedencia de operadores\n\n")
-            
+
             f.write("### Tipos de Errores Detectados:\n\n")
             f.write("- ✅ Errores léxicos (caracteres inválidos)\n")
             f.write("- ✅ Errores sintácticos (falta de end)\n")
@@ -216,58 +294,43 @@ class TestRunner:
             f.write("- ✅ Errores sintácticos (paréntesis desbalanceados)\n")
 
 def main():
-    runner = TestRunner()
-    
+    arg_parser = argparse.ArgumentParser(description="Ejecuta los casos de prueba del parser Mini-0")
+    arg_parser.add_argument('--dir', default='tests/mini0', help="directorio de casos (por defecto tests/mini0)")
+    arg_parser.add_argument('-j', '--workers', type=int, default=None,
+                            help="procesos trabajadores (por defecto, uno por CPU; 1 = secuencial)")
+    arg_parser.add_argument('--budget-ms', type=float, default=100.0,
+                            help="tiempo máximo por caso (léxico + sintáctico) antes de marcarlo lento")
+    arg_parser.add_argument('--slowest', type=int, default=5, help="cantidad de casos lentos a listar")
+    arg_parser.add_argument('--fail-on-slow', action='store_true',
+                            help="sale con código 1 si algún caso excede el presupuesto")
+    arg_parser.add_argument('--report', default='TESTING_REPORT.md', help="archivo del reporte Markdown")
+    args = arg_parser.parse_args()
+
+    runner = TestRunner(budget_ms=args.budget_ms)
+
     print("Ejecutando pruebas del parser Mini-0...")
     print("=" * 80)
-    
-    # Casos válidos
-    print("\n🔍 Probando casos válidos...")
-    test_dir = Path('tests/mini0')
-    
-    programas_validos = [
-        'programa1_simple.mini0',
-        'programa2_parametros.mini0',
-        'programa3_ifelse.mini0',
-        'programa4_while.mini0',
-        'programa5_expresiones.mini0',
-        'programa6_arrays.mini0',
-        'programa7_completo.mini0',
-    ]
-    
-    for programa in programas_validos:
-        archivo = test_dir / programa
-        if archivo.exists():
-            print(f"  Probando {programa}...")
-            runner.run_test(str(archivo), debe_pasar=True)
-    
-    # Casos con errores
-    print("\n🔍 Probando casos con errores...")
-    
-    programas_error = [
-        'error1_falta_end.mini0',
-        'error2_falta_loop.mini0',
-        'error3_tipo_invalido.mini0',
-        'error4_expresion_incompleta.mini0',
-        'error5_parentesis_desbalanceados.mini0',
-        'error6_caracter_invalido.mini0',
-    ]
-    
-    for programa in programas_error:
-        archivo = test_dir / programa
-        if archivo.exists():
-            print(f"  Probando {programa}...")
-            runner.run_test(str(archivo), debe_pasar=False)
-    
+
+    test_dir = Path(args.dir)
+    casos, omitidos = discover_cases(test_dir)
+
+    print(f"\n🔍 Casos descubiertos en {test_dir}: "
+          f"{sum(1 for _, p in casos if p)} válidos, {sum(1 for _, p in casos if not p)} con errores")
+    for archivo in omitidos:
+        print(f"  ⚠ Sin expectativa (se omite): {Path(archivo).name}")
+
+    runner.run_all(casos, workers=args.workers)
+
     # Mostrar resultados
-    runner.print_results()
-    
+    runner.print_results(slowest_n=args.slowest)
+
     # Generar reporte
-    runner.generate_report()
-    print(f"\n📄 Reporte generado en: TESTING_REPORT.md")
-    
+    runner.generate_report(args.report, slowest_n=args.slowest)
+    print(f"\n📄 Reporte generado en: {args.report}")
+
     # Retornar código de salida
-    sys.exit(0 if runner.failed_tests == 0 else 1)
+    fallo = runner.failed_tests > 0 or (args.fail_on_slow and runner.slow_tests > 0)
+    sys.exit(1 if fallo else 0)
 
 if __name__ == "__main__":
     main()
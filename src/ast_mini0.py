@@ -0,0 +1,546 @@
+"""
+Árbol de sintaxis abstracta compacto para Mini-0
+Los nodos se guardan en un arena de arreglos paralelos (tipo, primer hijo,
+siguiente hermano, índice de token): cada nodo es un entero y los objetos
+ASTNode son vistas livianas creadas solo cuando se recorren.
+"""
+
+from array import array
+from enum import IntEnum
+from typing import Iterator, List, Optional
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.lexer_mini0 import Lexer, Token, TokenType
+from src.parser_mini0 import ParserMini0, ParseError
+
+# Índice nulo en los arreglos de hijos, hermanos y tokens
+NONE = -1
+
+class NodeKind(IntEnum):
+    """Tipos de nodo del AST (cabe en un byte)"""
+    PROGRAM = 1     # hijos: FUNC | GLOBAL ...
+    FUNC = 2        # token: nombre; hijos: PARAMS, TYPE | VOID, BLOCK
+    PARAMS = 3      # hijos: PARAM ...
+    PARAM = 4       # token: nombre; hijos: TYPE
+    GLOBAL = 5      # token: nombre; hijos: TYPE
+    VARDECL = 6     # token: nombre; hijos: TYPE
+    TYPE = 7        # token: tipo base (int, bool, char, string)
+    ARRAY_TYPE = 8  # token: '['; hijos: TYPE | ARRAY_TYPE
+    VOID = 9        # tipo de retorno omitido
+    BLOCK = 10      # hijos: VARDECL ... comando ...
+    IF = 11         # token: 'if'; hijos: cond, BLOCK, [cond, BLOCK]..., [BLOCK else]
+    WHILE = 12      # token: 'while'; hijos: cond, BLOCK
+    ASSIGN = 13     # token: '='; hijos: VAR | INDEX, exp
+    RETURN = 14     # token: 'return'; hijos: [exp]
+    CALL = 15       # token: nombre; hijos: argumentos
+    VAR = 16        # token: nombre
+    INDEX = 17      # token: '['; hijos: base, índice
+    BINOP = 18      # token: operador; hijos: izquierda, derecha
+    UNOP = 19       # token: operador; hijos: operando
+    NUM = 20        # token: literal numérico
+    STR = 21        # token: literal de cadena
+    BOOL = 22       # token: true | false
+    NEW = 23        # token: 'new'; hijos: tamaño, TYPE | ARRAY_TYPE
+
+def numeral_value(texto: str) -> int:
+    """Valor de un LITNUMERAL (decimal con ceros a la izquierda o hexadecimal)"""
+    if texto[:2] in ('0x', '0X'):
+        return int(texto[2:], 16)
+    return int(texto, 10)
+
+class ASTArena:
+    """Almacén de nodos en arreglos paralelos indexados por número de nodo"""
+
+    __slots__ = ('tokens', 'kind', 'first_child', 'next_sibling', 'token', 'root')
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.kind = array('B')
+        self.first_child = array('i')
+        self.next_sibling = array('i')
+        self.token = array('i')
+        self.root = NONE
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    def new(self, kind: NodeKind, token: int = NONE, children=()) -> int:
+        """Agrega un nodo con sus hijos (ya construidos) y retorna su índice"""
+        indice = len(self.kind)
+        self.kind.append(kind)
+        self.token.append(token)
+        self.next_sibling.append(NONE)
+        anterior = NONE
+        for hijo in children:
+            if anterior == NONE:
+                self.first_child.append(hijo)
+            else:
+                self.next_sibling[anterior] = hijo
+            anterior = hijo
+        if anterior == NONE:
+            self.first_child.append(NONE)
+        return indice
+
+    def children(self, nodo: int) -> Iterator[int]:
+        """Índices de los hijos de un nodo, en orden"""
+        hijo = self.first_child[nodo]
+        siguiente = self.next_sibling
+        while hijo != NONE:
+            yield hijo
+            hijo = siguiente[hijo]
+
+    def node(self, nodo: int) -> 'ASTNode':
+        return ASTNode(self, nodo)
+
+    def text(self, nodo: int) -> str:
+        """Texto del token asociado al nodo ('' si no tiene)"""
+        token = self.token[nodo]
+        return self.tokens[token].value if token != NONE else ''
+
+    def line(self, nodo: int) -> int:
+        token = self.token[nodo]
+        return self.tokens[token].line if token != NONE else 0
+
+    def column(self, nodo: int) -> int:
+        token = self.token[nodo]
+        return self.tokens[token].column if token != NONE else 0
+
+    @property
+    def bytes_per_node(self) -> int:
+        """Bytes por nodo en los arreglos paralelos (sin sobreasignación)"""
+        return sum(a.itemsize for a in (self.kind, self.first_child, self.next_sibling, self.token))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados por los búferes de los arreglos"""
+        return sum(a.buffer_info()[1] * a.itemsize
+                   for a in (self.kind, self.first_child, self.next_sibling, self.token))
+
+    def dump(self, nodo: Optional[int] = None) -> str:
+        """Representación en S-expresiones (recorrido iterativo)"""
+        partes: List[str] = []
+        pila: List[object] = [self.root if nodo is None else nodo]
+        while pila:
+            actual = pila.pop()
+            if isinstance(actual, str):
+                partes.append(actual)
+                continue
+            texto = self.text(actual)
+            partes.append(f"({NodeKind(self.kind[actual]).name}" + (f" {texto!r}" if texto else ''))
+            pila.append(')')
+            for hijo in reversed(list(self.children(actual))):
+                pila.append(hijo)
+                pila.append(' ')
+        return ''.join(partes)
+
+class ASTNode:
+    """Vista de un nodo del arena; no guarda datos propios"""
+
+    __slots__ = ('arena', 'index')
+
+    def __init__(self, arena: ASTArena, index: int):
+        self.arena = arena
+        self.index = index
+
+    @property
+    def kind(self) -> NodeKind:
+        return NodeKind(self.arena.kind[self.index])
+
+    @property
+    def token(self) -> Optional[Token]:
+        token = self.arena.token[self.index]
+        return self.arena.tokens[token] if token != NONE else None
+
+    @property
+    def text(self) -> str:
+        return self.arena.text(self.index)
+
+    @property
+    def line(self) -> int:
+        return self.arena.line(self.index)
+
+    @property
+    def children(self) -> List['ASTNode']:
+        return [ASTNode(self.arena, hijo) for hijo in self.arena.children(self.index)]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ASTNode) and other.arena is self.arena and other.index == self.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.arena), self.index))
+
+    def __repr__(self) -> str:
+        texto = self.text
+        return f"ASTNode({self.kind.name}{', ' + repr(texto) if texto else ''}, #{self.index})"
+
+# Operadores binarios por nivel de precedencia (de menor a mayor)
+OR_OPS = (TokenType.OR,)
+AND_OPS = (TokenType.AND,)
+EQ_OPS = (TokenType.EQ, TokenType.NEQ)
+REL_OPS = (TokenType.GT, TokenType.LT, TokenType.GTE, TokenType.LTE)
+ADD_OPS = (TokenType.PLUS, TokenType.MINUS)
+MUL_OPS = (TokenType.MULT, TokenType.DIV)
+
+LITERAL_KINDS = {
+    TokenType.LITNUMERAL: NodeKind.NUM,
+    TokenType.LITSTRING: NodeKind.STR,
+    TokenType.TRUE: NodeKind.BOOL,
+    TokenType.FALSE: NodeKind.BOOL,
+}
+
+class ParserASTMini0(ParserMini0):
+    """ParserMini0 que además construye el AST en un ASTArena
+
+    Cada parse_* retorna el índice del nodo construido (o una lista de
+    índices para las reglas de lista); las reglas de precedencia solo crean
+    un nodo cuando aparece su operador.
+    """
+
+    def __init__(self, tokens: List[Token]):
+        super().__init__(tokens)
+        self.arena = ASTArena(tokens)
+
+    def take(self) -> int:
+        """Avanza y retorna el índice del token consumido"""
+        indice = self.pos
+        self.advance()
+        return indice
+
+    def expect_index(self, token_type: TokenType) -> int:
+        """expect() que retorna el índice del token consumido"""
+        indice = self.pos
+        self.expect(token_type)
+        return indice
+
+    def parse(self) -> bool:
+        """Punto de entrada; el AST queda en self.arena (raíz en arena.root)"""
+        try:
+            self.arena.root = self.parse_programa()
+            self.skip_newlines()
+            if not self.match(TokenType.EOF):
+                self.error("Se esperaba fin de archivo")
+            return True
+        except ParseError:
+            return False
+
+    # ========== Programa y Declaraciones ==========
+
+    def parse_programa(self) -> int:
+        self.skip_newlines()
+        return self.arena.new(NodeKind.PROGRAM, NONE, self.parse_decl_list())
+
+    def parse_decl_list(self) -> List[int]:
+        decls = []
+        while self.match(TokenType.FUN, TokenType.ID):
+            decls.append(self.parse_decl())
+        return decls
+
+    def parse_decl(self) -> int:
+        if self.match(TokenType.FUN):
+            return self.parse_funcion()
+        if self.match(TokenType.ID):
+            return self.parse_global()
+        self.error("Se esperaba 'fun' o identificador")
+
+    def parse_global(self) -> int:
+        nombre, tipo = self.parse_declvar()
+        self.expect_nl()
+        return self.arena.new(NodeKind.GLOBAL, nombre, (tipo,))
+
+    def parse_funcion(self) -> int:
+        self.expect(TokenType.FUN)
+        nombre = self.expect_index(TokenType.ID)
+        self.expect(TokenType.LPAREN)
+        params = self.parse_params()
+        self.expect(TokenType.RPAREN)
+        retorno = self.parse_tipo_ret()
+        self.expect_nl()
+        bloque = self.parse_bloque()
+        self.expect(TokenType.END)
+        self.expect_nl()
+        return self.arena.new(NodeKind.FUNC, nombre, (params, retorno, bloque))
+
+    def parse_params(self) -> int:
+        params = []
+        if self.match(TokenType.ID):
+            params.append(self.parse_parametro())
+            params.extend(self.parse_params_rest())
+        return self.arena.new(NodeKind.PARAMS, NONE, params)
+
+    def parse_params_rest(self) -> List[int]:
+        params = []
+        while self.match(TokenType.COMMA):
+            self.advance()
+            params.append(self.parse_parametro())
+        return params
+
+    def parse_parametro(self) -> int:
+        nombre = self.expect_index(TokenType.ID)
+        self.expect(TokenType.COLON)
+        return self.arena.new(NodeKind.PARAM, nombre, (self.parse_tipo(),))
+
+    def parse_tipo_ret(self) -> int:
+        if self.match(TokenType.COLON):
+            self.advance()
+            return self.parse_tipo()
+        return self.arena.new(NodeKind.VOID, NONE)
+
+    # ========== Tipos ==========
+
+    def parse_tipo(self) -> int:
+        corchetes = self.parse_tipo_array()
+        tipo = self.parse_tipobase()
+        for corchete in reversed(corchetes):
+            tipo = self.arena.new(NodeKind.ARRAY_TYPE, corchete, (tipo,))
+        return tipo
+
+    def parse_tipobase(self) -> int:
+        if self.match(TokenType.INT, TokenType.BOOL, TokenType.CHAR, TokenType.STRING):
+            return self.arena.new(NodeKind.TYPE, self.take())
+        self.error("Se esperaba un tipo (int, bool, char, string)")
+
+    def parse_tipo_array(self) -> List[int]:
+        corchetes = []
+        while self.match(TokenType.LBRACKET):
+            corchetes.append(self.take())
+            self.expect(TokenType.RBRACKET)
+        return corchetes
+
+    def parse_declvar(self):
+        """Retorna (índice del token del nombre, nodo del tipo)"""
+        nombre = self.expect_index(TokenType.ID)
+        self.expect(TokenType.COLON)
+        return nombre, self.parse_tipo()
+
+    # ========== Bloques y Comandos ==========
+
+    def parse_bloque(self) -> int:
+        hijos = self.parse_declvars()
+        hijos.extend(self.parse_comandos())
+        return self.arena.new(NodeKind.BLOCK, NONE, hijos)
+
+    def parse_declvars(self) -> List[int]:
+        decls = []
+        while self.match(TokenType.ID):
+            next_token = self.peek_token(1)
+            if next_token and next_token.type == TokenType.COLON:
+                nombre, tipo = self.parse_declvar()
+                self.expect_nl()
+                decls.append(self.arena.new(NodeKind.VARDECL, nombre, (tipo,)))
+            else:
+                break
+        return decls
+
+    def parse_comandos(self) -> List[int]:
+        comandos = []
+        while self.match(TokenType.IF, TokenType.WHILE, TokenType.RETURN, TokenType.ID):
+            comandos.append(self.parse_comando())
+            self.expect_nl()
+        return comandos
+
+    def parse_comando(self) -> int:
+        if self.match(TokenType.IF):
+            return self.parse_cmdif()
+        if self.match(TokenType.WHILE):
+            return self.parse_cmdwhile()
+        if self.match(TokenType.RETURN):
+            return self.parse_cmdreturn()
+        if self.match(TokenType.ID):
+            next_token = self.peek_token(1)
+            if next_token and next_token.type == TokenType.LPAREN:
+                return self.parse_llamada()
+            return self.parse_cmdatrib()
+        self.error("Se esperaba un comando")
+
+    def parse_cmdif(self) -> int:
+        token = self.expect_index(TokenType.IF)
+        hijos = [self.parse_exp()]
+        self.expect_nl()
+        hijos.append(self.parse_bloque())
+        hijos.extend(self.parse_elseif_list())
+        otro = self.parse_else_opt()
+        if otro != NONE:
+            hijos.append(otro)
+        self.expect(TokenType.END)
+        return self.arena.new(NodeKind.IF, token, hijos)
+
+    def parse_elseif_list(self) -> List[int]:
+        ramas = []
+        while self.match(TokenType.ELSE):
+            next_token = self.peek_token(1)
+            if next_token and next_token.type == TokenType.IF:
+                self.advance()  # else
+                self.advance()  # if
+                ramas.append(self.parse_exp())
+                self.expect_nl()
+                ramas.append(self.parse_bloque())
+            else:
+                break
+        return ramas
+
+    def parse_else_opt(self) -> int:
+        if self.match(TokenType.ELSE):
+            self.advance()
+            self.expect_nl()
+            return self.parse_bloque()
+        return NONE
+
+    def parse_cmdwhile(self) -> int:
+        token = self.expect_index(TokenType.WHILE)
+        condicion = self.parse_exp()
+        self.expect_nl()
+        bloque = self.parse_bloque()
+        self.expect(TokenType.LOOP)
+        return self.arena.new(NodeKind.WHILE, token, (condicion, bloque))
+
+    def parse_cmdatrib(self) -> int:
+        destino = self.parse_var()
+        token = self.expect_index(TokenType.EQ)
+        return self.arena.new(NodeKind.ASSIGN, token, (destino, self.parse_exp()))
+
+    def parse_cmdreturn(self) -> int:
+        token = self.expect_index(TokenType.RETURN)
+        if not self.match(TokenType.NL, TokenType.EOF):
+            return self.arena.new(NodeKind.RETURN, token, (self.parse_exp(),))
+        return self.arena.new(NodeKind.RETURN, token)
+
+    # ========== Variables y Llamadas ==========
+
+    def parse_var(self) -> int:
+        nodo = self.arena.new(NodeKind.VAR, self.expect_index(TokenType.ID))
+        return self.parse_var_index(nodo)
+
+    def parse_var_index(self, base: int) -> int:
+        while self.match(TokenType.LBRACKET):
+            corchete = self.take()
+            indice = self.parse_exp()
+            self.expect(TokenType.RBRACKET)
+            base = self.arena.new(NodeKind.INDEX, corchete, (base, indice))
+        return base
+
+    def parse_llamada(self) -> int:
+        nombre = self.expect_index(TokenType.ID)
+        self.expect(TokenType.LPAREN)
+        argumentos = self.parse_listaexp()
+        self.expect(TokenType.RPAREN)
+        return self.arena.new(NodeKind.CALL, nombre, argumentos)
+
+    def parse_listaexp(self) -> List[int]:
+        if self.match(TokenType.RPAREN):
+            return []
+        argumentos = [self.parse_exp()]
+        argumentos.extend(self.parse_listaexp_rest())
+        return argumentos
+
+    def parse_listaexp_rest(self) -> List[int]:
+        argumentos = []
+        while self.match(TokenType.COMMA):
+            self.advance()
+            argumentos.append(self.parse_exp())
+        return argumentos
+
+    # ========== Expresiones ==========
+
+    def _binary(self, izquierda: int, operadores, operando) -> int:
+        """Arma BINOP asociativos a izquierda mientras aparezcan los operadores"""
+        while self.match(*operadores):
+            operador = self.take()
+            izquierda = self.arena.new(NodeKind.BINOP, operador, (izquierda, operando()))
+        return izquierda
+
+    def parse_exp(self) -> int:
+        return self.parse_exp_or()
+
+    def parse_exp_or(self) -> int:
+        return self.parse_exp_or_prime(self.parse_exp_and())
+
+    def parse_exp_or_prime(self, izquierda: int) -> int:
+        return self._binary(izquierda, OR_OPS, self.parse_exp_and)
+
+    def parse_exp_and(self) -> int:
+        return self.parse_exp_and_prime(self.parse_exp_eq())
+
+    def parse_exp_and_prime(self, izquierda: int) -> int:
+        return self._binary(izquierda, AND_OPS, self.parse_exp_eq)
+
+    def parse_exp_eq(self) -> int:
+        return self.parse_exp_eq_prime(self.parse_exp_rel())
+
+    def parse_exp_eq_prime(self, izquierda: int) -> int:
+        return self._binary(izquierda, EQ_OPS, self.parse_exp_rel)
+
+    def parse_exp_rel(self) -> int:
+        return self.parse_exp_rel_prime(self.parse_exp_add())
+
+    def parse_exp_rel_prime(self, izquierda: int) -> int:
+        return self._binary(izquierda, REL_OPS, self.parse_exp_add)
+
+    def parse_exp_add(self) -> int:
+        return self.parse_exp_add_prime(self.parse_exp_mul())
+
+    def parse_exp_add_prime(self, izquierda: int) -> int:
+        return self._binary(izquierda, ADD_OPS, self.parse_exp_mul)
+
+    def parse_exp_mul(self) -> int:
+        return self.parse_exp_mul_prime(self.parse_exp_unary())
+
+    def parse_exp_mul_prime(self, izquierda: int) -> int:
+        return self._binary(izquierda, MUL_OPS, self.parse_exp_unary)
+
+    def parse_exp_unary(self) -> int:
+        if self.match(TokenType.NOT, TokenType.MINUS):
+            operador = self.take()
+            return self.arena.new(NodeKind.UNOP, operador, (self.parse_exp_unary(),))
+        return self.parse_exp_primary()
+
+    def parse_exp_primary(self) -> int:
+        tipo = self.current_token().type
+        if tipo in LITERAL_KINDS:
+            return self.arena.new(LITERAL_KINDS[tipo], self.take())
+        if tipo == TokenType.NEW:
+            token = self.take()
+            self.expect(TokenType.LBRACKET)
+            tamano = self.parse_exp()
+            self.expect(TokenType.RBRACKET)
+            return self.arena.new(NodeKind.NEW, token, (tamano, self.parse_tipo()))
+        if tipo == TokenType.LPAREN:
+            self.advance()
+            nodo = self.parse_exp()
+            self.expect(TokenType.RPAREN)
+            return nodo
+        if tipo == TokenType.ID:
+            next_token = self.peek_token(1)
+            if next_token and next_token.type == TokenType.LPAREN:
+                return self.parse_llamada()
+            return self.parse_var()
+        self.error("Se esperaba una expresión")
+
+def parse_ast(codigo: str) -> Optional[ASTArena]:
+    """Análisis léxico + sintáctico; retorna el arena o None si hay errores"""
+    tokens, errores = Lexer(codigo).tokenize()
+    if errores:
+        return None
+    parser = ParserASTMini0(tokens)
+    return parser.arena if parser.parse() else None
+
+def main():
+    """Imprime el AST de un archivo y el uso de memoria por nodo"""
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Construye el AST de un programa Mini-0")
+    arg_parser.add_argument('archivo')
+    arg_parser.add_argument('--quiet', action='store_true', help="solo estadísticas, sin el árbol")
+    args = arg_parser.parse_args()
+
+    with open(args.archivo, 'r', encoding='utf-8') as f:
+        arena = parse_ast(f.read())
+    if arena is None:
+        print(f"❌ {args.archivo} no es un programa Mini-0 válido", file=sys.stderr)
+        sys.exit(1)
+    if not args.quiet:
+        print(arena.dump())
+    print(f"{len(arena)} nodos, {arena.bytes_per_node} bytes/nodo "
+          f"({arena.nbytes} bytes en arreglos)")
+
+if __name__ == "__main__":
+    main()
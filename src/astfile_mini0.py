@@ -0,0 +1,341 @@
+"""
+Formato binario de tokens y AST de Mini-0 (.m0ast)
+Guarda el flujo de tokens y el ASTArena de un programa ya analizado para
+que otras herramientas (linters, indexadores, formateadores) no vuelvan a
+correr el Lexer y el ParserMini0. El archivo es una cabecera seguida de
+arreglos planos little-endian alineados a 8 bytes, uno por columna:
+
+    tokens: tipo (uint8), valor (int32, índice en la tabla de strings),
+            línea (int32), columna (int32)
+    nodos:  tipo (uint8), primer hijo, siguiente hermano, token (int32)
+    strings: desplazamientos (uint32, n + 1) y los bytes UTF-8 seguidos
+
+Los valores de token repetidos (identificadores, palabras reservadas) se
+guardan una sola vez en la tabla de strings. open_ast() mapea el archivo
+con mmap y cada columna es un memoryview sobre el mapeo: abrirlo no crea
+un objeto por token ni por nodo, solo lee la cabecera. MappedArena es un
+ASTArena de solo lectura sobre esas vistas, así que children(), text() o
+el SemanticChecker recorren el árbol directamente desde el archivo, y los
+Token se crean recién cuando alguien los pide.
+"""
+
+import hashlib
+import mmap
+import struct
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.lexer_mini0 import Token, TokenType
+from src.ast_mini0 import ASTArena, NONE, parse_ast
+from src.files_mini0 import DEFAULT_CACHE_DIR
+
+# Cambia cuando cambia el formato, TokenType o NodeKind; invalida los archivos
+AST_FORMAT_VERSION = 2
+MAGIC = b'M0AS'
+
+# Tipo de token por número guardado en el archivo
+TOKEN_TYPES = tuple(TokenType)
+TOKEN_CODES = {tipo: codigo for codigo, tipo in enumerate(TOKEN_TYPES)}
+
+# Cabecera: magia, versión, tipos de token, tokens, nodos, strings, bytes de
+# strings, raíz, tamaño y mtime (ns) del fuente (0 si no viene de un archivo)
+HEADER = struct.Struct('<4sHHIIIIiQq')
+
+# Columnas en orden de aparición: (nombre, formato)
+COLUMNS = (
+    ('token_type', 'B'), ('token_value', 'i'), ('token_line', 'i'), ('token_column', 'i'),
+    ('kind', 'B'), ('first_child', 'i'), ('next_sibling', 'i'), ('token', 'i'),
+    ('string_offsets', 'I'), ('string_data', 'B'),
+)
+
+def _align(posicion: int) -> int:
+    return (posicion + 7) & ~7
+
+class ASTFormatError(ValueError):
+    """Archivo .m0ast inválido, truncado o de otra versión del formato"""
+
+def dumps_ast(arena: ASTArena, source_size: int = 0, source_mtime: int = 0) -> bytes:
+    """Serializa los tokens y el arena en el formato .m0ast"""
+    strings: Dict[str, int] = {}
+    columnas = {nombre: array(formato) for nombre, formato in COLUMNS}
+    datos = bytearray()
+    columnas['string_offsets'].append(0)
+    for token in arena.tokens:
+        indice = strings.get(token.value)
+        if indice is None:
+            indice = strings[token.value] = len(strings)
+            datos += token.value.encode('utf-8')
+            columnas['string_offsets'].append(len(datos))
+        columnas['token_type'].append(TOKEN_CODES[token.type])
+        columnas['token_value'].append(indice)
+        columnas['token_line'].append(token.line)
+        columnas['token_column'].append(token.column)
+    for nombre in ('kind', 'first_child', 'next_sibling', 'token'):
+        columnas[nombre] = getattr(arena, nombre)
+    columnas['string_data'] = datos
+
+    salida = bytearray(HEADER.pack(MAGIC, AST_FORMAT_VERSION, len(TOKEN_TYPES), len(arena.tokens),
+                                   len(arena), len(strings), len(datos), arena.root,
+                                   source_size, source_mtime))
+    for nombre, _ in COLUMNS:
+        salida += bytes(_align(len(salida)) - len(salida))
+        columna = columnas[nombre]
+        if sys.byteorder == 'big' and isinstance(columna, array) and columna.itemsize > 1:
+            columna = array(columna.typecode, columna)
+            columna.byteswap()
+        salida += columna
+    return bytes(salida)
+
+def write_ast(arena: ASTArena, ruta: str, source_size: int = 0, source_mtime: int = 0):
+    """Escribe el archivo de forma atómica (temporal + rename)"""
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, 'wb') as f:
+        f.write(dumps_ast(arena, source_size, source_mtime))
+    os.replace(temporal, ruta)
+
+class TokenTable:
+    """Secuencia de solo lectura de los tokens de un archivo .m0ast; cada
+    Token se crea al pedirlo"""
+
+    __slots__ = ('ast', 'types', 'values', 'lines', 'columns')
+
+    def __init__(self, ast: 'MappedAST'):
+        self.ast = ast
+        self.types = ast.columns['token_type']
+        self.values = ast.columns['token_value']
+        self.lines = ast.columns['token_line']
+        self.columns = ast.columns['token_column']
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, i: int) -> Token:
+        return Token(TOKEN_TYPES[self.types[i]], self.ast.string(self.values[i]),
+                     self.lines[i], self.columns[i])
+
+    def __iter__(self) -> Iterator[Token]:
+        for i in range(len(self.types)):
+            yield self[i]
+
+    def type_at(self, i: int) -> TokenType:
+        return TOKEN_TYPES[self.types[i]]
+
+    def value_at(self, i: int) -> str:
+        return self.ast.string(self.values[i])
+
+class MappedArena(ASTArena):
+    """ASTArena de solo lectura sobre las columnas de un MappedAST (new() no
+    está disponible: el optimizador necesita un arena en memoria)"""
+
+    __slots__ = ('ast',)
+
+    def __init__(self, ast: 'MappedAST'):
+        self.ast = ast
+        self.tokens = ast.tokens
+        self.kind = ast.columns['kind']
+        self.first_child = ast.columns['first_child']
+        self.next_sibling = ast.columns['next_sibling']
+        self.token = ast.columns['token']
+        self.root = ast.root
+
+    def new(self, kind, token: int = NONE, children=()) -> int:
+        raise TypeError("MappedArena es de solo lectura")
+
+    def text(self, nodo: int) -> str:
+        token = self.token[nodo]
+        return self.ast.string(self.tokens.values[token]) if token != NONE else ''
+
+    def line(self, nodo: int) -> int:
+        token = self.token[nodo]
+        return self.tokens.lines[token] if token != NONE else 0
+
+    def column(self, nodo: int) -> int:
+        token = self.token[nodo]
+        return self.tokens.columns[token] if token != NONE else 0
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in (self.kind, self.first_child, self.next_sibling, self.token))
+
+class MappedAST:
+    """Archivo .m0ast abierto: columnas como memoryviews sobre 'buffer'
+    (un mmap o bytes) y la tabla de strings decodificada a demanda"""
+
+    def __init__(self, buffer, mapa: Optional[mmap.mmap] = None):
+        self.mmap = mapa
+        self.views: List[memoryview] = []
+        vista = memoryview(buffer)
+        self.views.append(vista)
+        try:
+            self._read_columns(vista)
+        except ASTFormatError:
+            self.close()
+            raise
+        self.offsets = self.columns['string_offsets']
+        self.data = self.columns['string_data']
+        self.decoded: Dict[int, str] = {}
+        self._tokens: Optional[TokenTable] = None
+        self._arena: Optional[MappedArena] = None
+
+    def _read_columns(self, vista: memoryview):
+        if len(vista) < HEADER.size:
+            raise ASTFormatError("archivo truncado")
+        (magia, version, n_tipos, n_tokens, n_nodos, n_strings, n_bytes, self.root,
+         self.source_size, self.source_mtime) = HEADER.unpack_from(vista)
+        if magia != MAGIC:
+            raise ASTFormatError("no es un archivo .m0ast")
+        if version != AST_FORMAT_VERSION or n_tipos != len(TOKEN_TYPES):
+            raise ASTFormatError(f"versión {version} del formato (se espera {AST_FORMAT_VERSION})")
+        cantidades = (n_tokens,) * 4 + (n_nodos,) * 4 + (n_strings + 1, n_bytes)
+        self.columns = {}
+        posicion = HEADER.size
+        for (nombre, formato), cantidad in zip(COLUMNS, cantidades):
+            posicion = _align(posicion)
+            fin = posicion + cantidad * struct.calcsize(formato)
+            if fin > len(vista):
+                raise ASTFormatError("archivo truncado")
+            columna = vista[posicion:fin]
+            self.views.append(columna)
+            self.columns[nombre] = self._column(columna, formato)
+            posicion = fin
+
+    def _column(self, vista: memoryview, formato: str):
+        if sys.byteorder == 'big' and formato != 'B':
+            columna = array(formato)
+            columna.frombytes(vista)
+            columna.byteswap()
+            return columna
+        columna = vista.cast(formato)
+        self.views.append(columna)
+        return columna
+
+    def string(self, indice: int) -> str:
+        texto = self.decoded.get(indice)
+        if texto is None:
+            texto = str(self.data[self.offsets[indice]:self.offsets[indice + 1]], 'utf-8')
+            self.decoded[indice] = texto
+        return texto
+
+    @property
+    def tokens(self) -> TokenTable:
+        if self._tokens is None:
+            self._tokens = TokenTable(self)
+        return self._tokens
+
+    @property
+    def arena(self) -> MappedArena:
+        if self._arena is None:
+            self._arena = MappedArena(self)
+        return self._arena
+
+    def close(self):
+        """Libera las vistas y el mapeo; los nodos y tokens ya no se pueden leer"""
+        self._tokens = self._arena = None
+        self.columns = {}
+        self.offsets = self.data = None
+        for vista in reversed(self.views):
+            vista.release()
+        self.views = []
+        if self.mmap is not None:
+            self.mmap.close()
+            self.mmap = None
+
+    def __enter__(self) -> 'MappedAST':
+        return self
+
+    def __exit__(self, *excepcion):
+        self.close()
+
+def loads_ast(datos: bytes) -> MappedAST:
+    """MappedAST sobre un bytes (sin copiarlo)"""
+    return MappedAST(datos)
+
+def open_ast(ruta: str) -> MappedAST:
+    """Mapea un archivo .m0ast en memoria (lanza ASTFormatError si no es válido)"""
+    with open(ruta, 'rb') as f:
+        try:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # archivo vacío
+            raise ASTFormatError("archivo truncado") from None
+    return MappedAST(mapa, mapa)
+
+def cache_path(ruta: str, cache_dir: str = DEFAULT_CACHE_DIR) -> str:
+    """Archivo .m0ast del caché para un fuente (indexado por su ruta absoluta)"""
+    clave = hashlib.sha256(os.path.abspath(ruta).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, 'ast', clave + '.m0ast')
+
+def open_cached(ruta: str, cache_dir: str = DEFAULT_CACHE_DIR) -> Tuple[Optional[MappedAST], bool]:
+    """Análisis de un archivo .mini0 desde el caché si el fuente no cambió
+    (mismo tamaño y mtime); si no, lo analiza y lo guarda. Retorna
+    (MappedAST o None si el programa tiene errores, acierto)"""
+    estado = os.stat(ruta)
+    destino = cache_path(ruta, cache_dir)
+    try:
+        ast = open_ast(destino)
+        if ast.source_size == estado.st_size and ast.source_mtime == estado.st_mtime_ns:
+            return ast, True
+        ast.close()
+    except (OSError, ASTFormatError):
+        pass
+    with open(ruta, 'r', encoding='utf-8') as f:
+        arena = parse_ast(f.read())
+    if arena is None:
+        return None, False
+    datos = dumps_ast(arena, estado.st_size, estado.st_mtime_ns)
+    try:
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        temporal = f"{destino}.{os.getpid()}.tmp"
+        with open(temporal, 'wb') as f:
+            f.write(datos)
+        os.replace(temporal, destino)
+    except OSError:
+        pass  # sin caché el análisis igual se usa
+    return loads_ast(datos), False
+
+def main():
+    """Escribe o abre el .m0ast de un programa y mide cuánto tarda"""
+    import argparse
+    import time
+    arg_parser = argparse.ArgumentParser(description="Tokens y AST de Mini-0 en formato binario mapeable")
+    arg_parser.add_argument('archivo', help="archivo .mini0 (o .m0ast con --open)")
+    arg_parser.add_argument('--output', '-o', help="escribe el .m0ast en esta ruta")
+    arg_parser.add_argument('--open', action='store_true', help="abre un .m0ast existente")
+    arg_parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                            help=f"directorio del caché (por defecto {DEFAULT_CACHE_DIR})")
+    arg_parser.add_argument('--dump', action='store_true', help="imprime el árbol")
+    args = arg_parser.parse_args()
+
+    inicio = time.perf_counter()
+    try:
+        if args.open:
+            ast, origen = open_ast(args.archivo), 'archivo'
+        elif args.output:
+            with open(args.archivo, 'r', encoding='utf-8') as f:
+                arena = parse_ast(f.read())
+            if arena is None:
+                ast = None
+            else:
+                write_ast(arena, args.output)
+                ast, origen = open_ast(args.output), 'escrito'
+        else:
+            ast, acierto = open_cached(args.archivo, args.cache_dir)
+            origen = 'caché' if acierto else 'analizado'
+    except (OSError, ASTFormatError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    segundos = time.perf_counter() - inicio
+    if ast is None:
+        print(f"❌ {args.archivo} no es un programa Mini-0 válido", file=sys.stderr)
+        sys.exit(1)
+    with ast:
+        arena = ast.arena
+        if args.dump:
+            print(arena.dump())
+        print(f"{len(arena.tokens):,} tokens, {len(arena):,} nodos, "
+              f"{len(ast.offsets) - 1:,} strings distintos")
+        print(f"Apertura: {segundos * 1e6:,.0f} µs ({origen})")
+
+if __name__ == "__main__":
+    main()
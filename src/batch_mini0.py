@@ -0,0 +1,122 @@
+"""
+Verificación por lotes de archivos Mini-0
+Analiza léxica, sintáctica y semánticamente muchos archivos repartiéndolos
+entre hilos (ThreadPoolExecutor), entre procesos (ProcessPoolExecutor) o en
+serie, y resume los errores de cada uno.
+
+Con hilos todo ocurre en el mismo proceso: los resultados (y el AST, con
+keep_ast) no se serializan para volver al proceso principal, y no hay que
+arrancar intérpretes. El Lexer, ParserASTMini0 y SemanticChecker guardan
+todo su estado en la instancia y de los módulos solo leen tablas fijas
+(Lexer.KEYWORDS es de solo lectura), así que cada hilo usa sus propias
+instancias sin locks. En CPython con GIL los hilos solo se
+solapan al leer los archivos; en un build free-threaded (python3.13t con el
+GIL desactivado) también analizan en paralelo.
+"""
+
+import sys
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Iterator, List, Optional
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.lexer_mini0 import Lexer
+from src.ast_mini0 import ASTArena, ParserASTMini0
+from src.semantic_mini0 import SemanticChecker
+from src.files_mini0 import collect_files
+
+EXECUTORS = ('threads', 'processes', 'serial')
+
+def gil_enabled() -> bool:
+    """False solo en un intérprete free-threaded que corre sin GIL"""
+    return getattr(sys, '_is_gil_enabled', lambda: True)()
+
+def interpreter_mode() -> str:
+    return 'con GIL' if gil_enabled() else 'free-threaded (sin GIL)'
+
+class FileCheck:
+    """Resultado de verificar un archivo"""
+
+    __slots__ = ('path', 'ok', 'errors', 'tokens', 'nodes', 'arena')
+
+    def __init__(self, path: str, ok: bool, errors: List[str], tokens: int = 0, nodes: int = 0,
+                 arena: Optional[ASTArena] = None):
+        self.path = path
+        self.ok = ok
+        self.errors = errors
+        self.tokens = tokens
+        self.nodes = nodes
+        self.arena = arena
+
+def check_path(ruta: str, keep_ast: bool = False) -> FileCheck:
+    """Trabajador: análisis léxico, sintáctico y semántico de un archivo"""
+    try:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            codigo = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return FileCheck(ruta, False, [str(e)])
+    tokens, errores = Lexer(codigo).tokenize()
+    if errores:
+        return FileCheck(ruta, False, errores, len(tokens))
+    parser = ParserASTMini0(tokens)
+    try:
+        valido = parser.parse()
+    except RecursionError:
+        return FileCheck(ruta, False, ["anidamiento demasiado profundo"], len(tokens))
+    if not valido:
+        return FileCheck(ruta, False, parser.errors, len(tokens))
+    checker = SemanticChecker(parser.arena)
+    valido = checker.check()
+    return FileCheck(ruta, valido, checker.errors, len(tokens), len(parser.arena),
+                     parser.arena if keep_ast else None)
+
+def check_files(archivos: List[str], executor: str = 'threads', workers: Optional[int] = None,
+                keep_ast: bool = False) -> Iterator[FileCheck]:
+    """Resultados de check_path en el orden de archivos"""
+    trabajo = partial(check_path, keep_ast=keep_ast)
+    if executor == 'serial' or workers == 1 or len(archivos) <= 1:
+        yield from map(trabajo, archivos)
+        return
+    workers = workers or os.cpu_count() or 1
+    if executor == 'threads':
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(trabajo, archivos)
+    elif executor == 'processes':
+        chunk = max(1, len(archivos) // (workers * 8))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(trabajo, archivos, chunksize=chunk)
+    else:
+        raise ValueError(f"ejecutor desconocido: {executor}")
+
+def main():
+    """Verifica archivos Mini-0 en paralelo"""
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Verificación por lotes de archivos Mini-0")
+    arg_parser.add_argument('rutas', nargs='+', help="archivos .mini0 o directorios")
+    arg_parser.add_argument('--executor', choices=EXECUTORS, default='threads',
+                            help="hilos, procesos o en serie (por defecto hilos)")
+    arg_parser.add_argument('-j', '--workers', type=int, default=None,
+                            help="hilos o procesos trabajadores (por defecto, uno por CPU)")
+    arg_parser.add_argument('--quiet', '-q', action='store_true', help="solo los archivos con errores")
+    args = arg_parser.parse_args()
+
+    archivos = collect_files(args.rutas)
+    inicio = time.perf_counter()
+    fallidos = 0
+    for resultado in check_files(archivos, args.executor, args.workers):
+        if resultado.ok:
+            if not args.quiet:
+                print(f"✓ {resultado.path}")
+            continue
+        fallidos += 1
+        print(f"❌ {resultado.path}")
+        for error in resultado.errors:
+            print(f"  {error}")
+    segundos = time.perf_counter() - inicio
+    print(f"{len(archivos)} archivos, {fallidos} con errores, en {segundos:.2f} s "
+          f"({args.executor}, {interpreter_mode()})")
+    sys.exit(1 if fallidos else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+"""
+Compilador de Mini-0 a bytecode
+Traduce el AST verificado (ASTArena + tipos del SemanticChecker) a código
+de pila compacto: cada función es un array('i') de pares (opcode, argumento)
+con su tabla de posiciones (línea y columna de cada instrucción, con deltas)
+y los literales van a un pool de constantes compartido (los strings,
+internados). Las variables se resuelven en tiempo de compilación a índices
+de slot locales o globales.
+"""
+
+from array import array
+from typing import Dict, List, Optional, Tuple
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ast_mini0 import ASTArena, NodeKind, NONE, numeral_value
+from src.semantic_mini0 import SemanticChecker
+from src.runtime_mini0 import CompileError, ENTRY_POINT, default_value, load_program
+from src.strings_mini0 import intern_literal
+from src.positions_mini0 import PositionTable, PositionTableBuilder
+
+# ========== Opcodes ==========
+# Cada instrucción ocupa dos enteros: opcode y argumento (0 si no se usa)
+
+LOAD_CONST = 0            # push consts[arg]
+LOAD_LOCAL = 1            # push locals[arg]
+STORE_LOCAL = 2           # locals[arg] = pop
+LOAD_GLOBAL = 3           # push globals[arg]
+STORE_GLOBAL = 4          # globals[arg] = pop
+ADD = 5
+SUB = 6
+MUL = 7
+DIV = 8                   # división entera truncada hacia cero
+NEG = 9
+NOT = 10
+EQ = 11
+NE = 12
+IS = 13                   # igualdad de arreglos (identidad)
+IS_NOT = 14
+LT = 15
+LE = 16
+GT = 17
+GE = 18
+JUMP = 19                 # pc = arg
+JUMP_IF_FALSE = 20        # if not pop: pc = arg
+JUMP_IF_FALSE_OR_POP = 21  # 'and': deja el operando izquierdo si es falso
+JUMP_IF_TRUE_OR_POP = 22   # 'or': deja el operando izquierdo si es verdadero
+CALL = 23                 # llama a functions[arg] con sus argumentos en la pila
+RETURN = 24               # retorna pop (None en funciones sin tipo de retorno)
+POP = 25
+NEW_ARRAY = 26            # push new_array(pop, consts[arg]) (tipo de elemento)
+INDEX_LOAD = 27           # i = pop; a = pop; push a[i]
+INDEX_STORE = 28          # v = pop; i = pop; a = pop; a[i] = v
+CONCAT = 29               # b = pop; a = pop; push concat(a, b) (strings)
+CHAR_AT = 30              # i = pop; s = pop; push char_at(s, i)
+
+OPCODE_NAMES = (
+    'LOAD_CONST', 'LOAD_LOCAL', 'STORE_LOCAL', 'LOAD_GLOBAL', 'STORE_GLOBAL',
+    'ADD', 'SUB', 'MUL', 'DIV', 'NEG', 'NOT', 'EQ', 'NE', 'IS', 'IS_NOT',
+    'LT', 'LE', 'GT', 'GE', 'JUMP', 'JUMP_IF_FALSE', 'JUMP_IF_FALSE_OR_POP',
+    'JUMP_IF_TRUE_OR_POP', 'CALL', 'RETURN', 'POP', 'NEW_ARRAY', 'INDEX_LOAD',
+    'INDEX_STORE', 'CONCAT', 'CHAR_AT',
+)
+
+BINARY_OPCODES = {
+    '+': ADD, '-': SUB, '*': MUL, '/': DIV,
+    '=': EQ, '<>': NE, '<': LT, '<=': LE, '>': GT, '>=': GE,
+}
+
+# Acciones del recorrido iterativo de expresiones
+_VISIT, _EMIT, _JUMP, _PATCH = range(4)
+
+class FunctionCode:
+    """Código compilado de una función"""
+
+    __slots__ = ('name', 'index', 'n_params', 'n_locals', 'code', 'positions', 'return_type', 'line')
+
+    def __init__(self, name: str, index: int, n_params: int, return_type: str, line: int = 0):
+        self.name = name
+        self.index = index
+        # Línea del 'fun' que la define
+        self.line = line
+        self.n_params = n_params
+        self.n_locals = n_params
+        self.code = array('i')
+        # Línea y columna de cada instrucción (índice pc // 2), se decodifica solo
+        # cuando un error o el perfilador las necesita
+        self.positions = PositionTable()
+        self.return_type = return_type
+
+    def line_at(self, pc: int) -> int:
+        """Línea de la instrucción que comienza en pc"""
+        return self.positions.line_at(pc // 2) if pc >= 0 else 0
+
+    def position_at(self, pc: int) -> Tuple[int, int]:
+        """(línea, columna) de la instrucción que comienza en pc"""
+        return self.positions.position_at(pc // 2) if pc >= 0 else (0, 0)
+
+    def __len__(self) -> int:
+        return len(self.code) // 2
+
+class Program:
+    """Programa compilado: funciones, pool de constantes y globales"""
+
+    def __init__(self):
+        self.functions: List[FunctionCode] = []
+        self.function_index: Dict[str, int] = {}
+        self.consts: list = []
+        self.global_names: List[str] = []
+        self.global_defaults: list = []
+
+    def entry(self, nombre: str = ENTRY_POINT) -> FunctionCode:
+        if nombre not in self.function_index:
+            raise CompileError([f"El programa no define la función '{nombre}'"])
+        return self.functions[self.function_index[nombre]]
+
+    @property
+    def instruction_count(self) -> int:
+        return sum(len(f) for f in self.functions)
+
+class BytecodeCompiler:
+    """Compila un AST verificado a un Program"""
+
+    def __init__(self, arena: ASTArena, checker: SemanticChecker):
+        self.arena = arena
+        self.types = checker.types
+        self.program = Program()
+        self._const_index: Dict[Tuple[type, object], int] = {}
+        self.globals: Dict[str, int] = {}
+        # Compilación de la función actual
+        self.function: Optional[FunctionCode] = None
+        self.positions = PositionTableBuilder()
+        self.scopes: List[Dict[str, int]] = []
+        self.next_slot = 0
+
+    # ========== Emisión ==========
+
+    def const(self, valor) -> int:
+        """Índice de un valor en el pool de constantes (sin duplicados)"""
+        clave = (type(valor), valor)
+        indice = self._const_index.get(clave)
+        if indice is None:
+            indice = len(self.program.consts)
+            self.program.consts.append(valor)
+            self._const_index[clave] = indice
+        return indice
+
+    def emit(self, opcode: int, arg: int, nodo: int) -> int:
+        """Agrega una instrucción y retorna su posición"""
+        funcion = self.function
+        posicion = len(funcion.code)
+        funcion.code.append(opcode)
+        funcion.code.append(arg)
+        if nodo != NONE:
+            self.positions.add(self.arena.line(nodo), self.arena.column(nodo))
+        else:
+            self.positions.add(0)
+        return posicion
+
+    def patch(self, posicion: int):
+        """Apunta el salto en 'posicion' a la siguiente instrucción a emitir"""
+        self.function.code[posicion + 1] = len(self.function.code)
+
+    # ========== Programa ==========
+
+    def compile(self) -> Program:
+        arena = self.arena
+        programa = self.program
+        for decl in arena.children(arena.root):
+            nombre = arena.text(decl)
+            if arena.kind[decl] == NodeKind.FUNC:
+                params, retorno, _ = arena.children(decl)
+                n_params = sum(1 for _ in arena.children(params))
+                funcion = FunctionCode(nombre, len(programa.functions), n_params,
+                                       self.type_of(retorno), arena.line(decl))
+                programa.function_index[nombre] = funcion.index
+                programa.functions.append(funcion)
+            else:
+                self.globals[nombre] = len(programa.global_names)
+                programa.global_names.append(nombre)
+                programa.global_defaults.append(default_value(self.type_of(arena.first_child[decl])))
+        for decl in arena.children(arena.root):
+            if arena.kind[decl] == NodeKind.FUNC:
+                self.compile_function(decl)
+        return programa
+
+    def type_of(self, nodo: int) -> str:
+        kind = self.arena.kind[nodo]
+        if kind == NodeKind.VOID:
+            return 'void'
+        if kind == NodeKind.ARRAY_TYPE:
+            return '[]' + self.type_of(self.arena.first_child[nodo])
+        return self.arena.text(nodo)
+
+    def compile_function(self, nodo: int):
+        arena = self.arena
+        params, _, bloque = arena.children(nodo)
+        self.function = self.program.functions[self.program.function_index[arena.text(nodo)]]
+        self.scopes = [{}]
+        self.next_slot = 0
+        self.positions = PositionTableBuilder()
+        for param in arena.children(params):
+            self.declare(arena.text(param))
+        self.compile_block(bloque, new_scope=False)
+        # Retorno implícito al final del cuerpo
+        retorno = self.function.return_type
+        self.emit(LOAD_CONST, self.const(None if retorno == 'void' else default_value(retorno)), NONE)
+        self.emit(RETURN, 0, NONE)
+        self.function.positions = self.positions.finish()
+        self.function = None
+
+    def declare(self, nombre: str) -> int:
+        slot = self.next_slot
+        self.scopes[-1][nombre] = slot
+        self.next_slot += 1
+        self.function.n_locals = max(self.function.n_locals, self.next_slot)
+        return slot
+
+    def resolve(self, nombre: str) -> Tuple[bool, int]:
+        """(es_local, índice) de una variable"""
+        for ambito in reversed(self.scopes):
+            if nombre in ambito:
+                return True, ambito[nombre]
+        return False, self.globals[nombre]
+
+    # ========== Comandos ==========
+
+    def compile_block(self, nodo: int, new_scope: bool = True):
+        arena = self.arena
+        if new_scope:
+            self.scopes.append({})
+            slots_previos = self.next_slot
+        for hijo in arena.children(nodo):
+            kind = arena.kind[hijo]
+            if kind == NodeKind.VARDECL:
+                # Cada declaración reinicia la variable (p. ej. dentro de un while)
+                tipo = self.type_of(arena.first_child[hijo])
+                self.emit(LOAD_CONST, self.const(default_value(tipo)), hijo)
+                self.emit(STORE_LOCAL, self.declare(arena.text(hijo)), hijo)
+            elif kind == NodeKind.ASSIGN:
+                self.compile_assign(hijo)
+            elif kind == NodeKind.CALL:
+                self.compile_expr(hijo)
+                self.emit(POP, 0, hijo)
+            elif kind == NodeKind.IF:
+                self.compile_if(hijo)
+            elif kind == NodeKind.WHILE:
+                self.compile_while(hijo)
+            elif kind == NodeKind.RETURN:
+                valor = arena.first_child[hijo]
+                if valor == NONE:
+                    self.emit(LOAD_CONST, self.const(None), hijo)
+                else:
+                    self.compile_expr(valor)
+                self.emit(RETURN, 0, hijo)
+        if new_scope:
+            self.scopes.pop()
+            # Los slots del bloque se reutilizan en los bloques siguientes
+            self.next_slot = slots_previos
+
+    def compile_if(self, nodo: int):
+        hijos = list(self.arena.children(nodo))
+        saltos_al_final = []
+        for i in range(0, len(hijos) - 1, 2):
+            self.compile_expr(hijos[i])
+            siguiente = self.emit(JUMP_IF_FALSE, 0, hijos[i])
+            self.compile_block(hijos[i + 1])
+            saltos_al_final.append(self.emit(JUMP, 0, nodo))
+            self.patch(siguiente)
+        if len(hijos) % 2:
+            self.compile_block(hijos[-1])
+        for salto in saltos_al_final:
+            self.patch(salto)
+
+    def compile_while(self, nodo: int):
+        condicion, cuerpo = self.arena.children(nodo)
+        inicio = len(self.function.code)
+        self.compile_expr(condicion)
+        salida = self.emit(JUMP_IF_FALSE, 0, condicion)
+        self.compile_block(cuerpo)
+        self.emit(JUMP, inicio, nodo)
+        self.patch(salida)
+
+    def compile_assign(self, nodo: int):
+        arena = self.arena
+        destino, valor = arena.children(nodo)
+        if arena.kind[destino] == NodeKind.VAR:
+            self.compile_expr(valor)
+            local, indice = self.resolve(arena.text(destino))
+            self.emit(STORE_LOCAL if local else STORE_GLOBAL, indice, nodo)
+        else:
+            base, indice = arena.children(destino)
+            self.compile_expr(base)
+            self.compile_expr(indice)
+            self.compile_expr(valor)
+            self.emit(INDEX_STORE, 0, nodo)
+
+    # ========== Expresiones ==========
+
+    def compile_expr(self, raiz: int):
+        """Emite el código de una expresión con un recorrido iterativo"""
+        arena = self.arena
+        kinds = arena.kind
+        pendientes: Dict[int, int] = {}
+        pila: List[Tuple[int, int]] = [(_VISIT, raiz)]
+        while pila:
+            accion, nodo = pila.pop()
+            kind = kinds[nodo]
+            if accion == _VISIT:
+                if kind == NodeKind.NUM:
+                    self.emit(LOAD_CONST, self.const(numeral_value(arena.text(nodo))), nodo)
+                elif kind == NodeKind.STR:
+                    self.emit(LOAD_CONST, self.const(intern_literal(arena.text(nodo))), nodo)
+                elif kind == NodeKind.BOOL:
+                    self.emit(LOAD_CONST, self.const(arena.text(nodo) == 'true'), nodo)
+                elif kind == NodeKind.VAR:
+                    local, indice = self.resolve(arena.text(nodo))
+                    self.emit(LOAD_LOCAL if local else LOAD_GLOBAL, indice, nodo)
+                elif kind == NodeKind.BINOP and arena.text(nodo) in ('and', 'or'):
+                    izquierda, derecha = arena.children(nodo)
+                    pila.extend(((_PATCH, nodo), (_VISIT, derecha), (_JUMP, nodo), (_VISIT, izquierda)))
+                else:
+                    hijos = list(arena.children(nodo))
+                    if kind == NodeKind.NEW:
+                        hijos = hijos[:1]
+                    pila.append((_EMIT, nodo))
+                    pila.extend((_VISIT, hijo) for hijo in reversed(hijos))
+            elif accion == _EMIT:
+                self.emit_operation(nodo, kind)
+            elif accion == _JUMP:
+                opcode = JUMP_IF_FALSE_OR_POP if arena.text(nodo) == 'and' else JUMP_IF_TRUE_OR_POP
+                pendientes[nodo] = self.emit(opcode, 0, nodo)
+            else:
+                self.patch(pendientes.pop(nodo))
+
+    def emit_operation(self, nodo: int, kind: int):
+        """Instrucción que combina los operandos ya emitidos de un nodo"""
+        arena = self.arena
+        if kind == NodeKind.BINOP:
+            operador = arena.text(nodo)
+            opcode = BINARY_OPCODES[operador]
+            if opcode in (EQ, NE) and self.types.get(arena.first_child[nodo], '').startswith('[]'):
+                opcode = IS if opcode == EQ else IS_NOT
+            elif opcode == ADD and self.types.get(nodo) == 'string':
+                opcode = CONCAT
+            self.emit(opcode, 0, nodo)
+        elif kind == NodeKind.UNOP:
+            self.emit(NOT if arena.text(nodo) == 'not' else NEG, 0, nodo)
+        elif kind == NodeKind.INDEX:
+            base = arena.first_child[nodo]
+            self.emit(CHAR_AT if self.types.get(base) == 'string' else INDEX_LOAD, 0, nodo)
+        elif kind == NodeKind.NEW:
+            tipo = self.type_of(arena.next_sibling[arena.first_child[nodo]])
+            self.emit(NEW_ARRAY, self.const(tipo), nodo)
+        elif kind == NodeKind.CALL:
+            self.emit(CALL, self.program.function_index[arena.text(nodo)], nodo)
+
+def compile_source(codigo: str) -> Program:
+    """Compila código fuente Mini-0 (lanza CompileError si no es válido)"""
+    arena, checker = load_program(codigo)
+    return BytecodeCompiler(arena, checker).compile()
+
+def disassemble(programa: Program, funcion: FunctionCode) -> str:
+    """Listado legible del bytecode de una función"""
+    lineas = [f"fun {funcion.name} (params={funcion.n_params}, locals={funcion.n_locals})"]
+    destinos = {funcion.code[pc + 1] for pc in range(0, len(funcion.code), 2)
+                if OPCODE_NAMES[funcion.code[pc]].startswith('JUMP')}
+    lineas_pc, _ = funcion.positions.decode()
+    for pc in range(0, len(funcion.code), 2):
+        opcode, arg = funcion.code[pc], funcion.code[pc + 1]
+        nombre = OPCODE_NAMES[opcode]
+        detalle = ''
+        if opcode in (LOAD_CONST, NEW_ARRAY):
+            detalle = f"({programa.consts[arg]!r})"
+        elif opcode in (LOAD_GLOBAL, STORE_GLOBAL):
+            detalle = f"({programa.global_names[arg]})"
+        elif opcode == CALL:
+            detalle = f"({programa.functions[arg].name})"
+        marca = '>>' if pc in destinos else '  '
+        lineas.append(f"{lineas_pc[pc // 2]:>5} {marca} {pc:>5} {nombre:<22}{arg:>6} {detalle}")
+    return "\n".join(lineas)
@@ -0,0 +1,442 @@
+"""
+Motor de ejecución por compilación a closures para Mini-0
+Cada función del AST verificado se convierte una sola vez en un árbol de
+closures de Python anidadas. Las variables se resuelven en compilación a
+índices fijos de una lista de marco, así que al ejecutar no hay despacho
+por tipo de nodo ni búsqueda de nombres.
+
+Convenciones de las closures:
+  - expresión: e(f) -> valor, donde f es la lista del marco actual
+  - comando:   s(f) -> True solo si ejecutó un 'return' (el valor queda en
+    el último slot del marco); cualquier otro resultado es falso
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ast_mini0 import ASTArena, NodeKind, NONE, numeral_value
+from src.semantic_mini0 import SemanticChecker
+from src.runtime_mini0 import (
+    CompileError, Mini0RuntimeError, ENTRY_POINT, default_value, int_div,
+    load_program, new_array, runtime_error,
+)
+from src.strings_mini0 import char_at, concat, flatten_value, intern_literal
+
+# Operadores de Mini-0 con su equivalente directo en Python
+PYTHON_OPERATORS = {
+    '+': '+', '-': '-', '*': '*',
+    '<': '<', '<=': '<=', '>': '>', '>=': '>=', '=': '==', '<>': '!=',
+}
+
+# Formas de operandos especializadas: E = expresión, L = variable local, C = constante
+_SHAPES = {
+    'EE': "lambda a, b: lambda f: a(f) {op} b(f)",
+    'EC': "lambda a, b: lambda f: a(f) {op} b",
+    'LC': "lambda a, b: lambda f: f[a] {op} b",
+    'LL': "lambda a, b: lambda f: f[a] {op} f[b]",
+    'LE': "lambda a, b: lambda f: f[a] {op} b(f)",
+}
+
+# Fábricas de closures binarias, generadas una vez al importar el módulo
+BINARY_FACTORIES: Dict[Tuple[str, str], Callable] = {
+    (operador, forma): eval(plantilla.format(op=python))
+    for operador, python in PYTHON_OPERATORS.items()
+    for forma, plantilla in _SHAPES.items()
+}
+
+Closure = Callable[[list], object]
+
+class ClosureProgram:
+    """Programa compilado: cuerpos de funciones, rellenos de marco y globales"""
+
+    def __init__(self):
+        self.function_index: Dict[str, int] = {}
+        self.bodies: List[Optional[Closure]] = []
+        # Slots locales (más el de retorno) que se agregan a los argumentos de cada llamada
+        self.pads: List[list] = []
+        self.globals: list = []
+
+    def run(self, nombre: str = ENTRY_POINT, args=()):
+        """Ejecuta la función 'nombre' y retorna su valor de retorno"""
+        if nombre not in self.function_index:
+            raise CompileError([f"El programa no define la función '{nombre}'"])
+        indice = self.function_index[nombre]
+        marco = list(args) + self.pads[indice]
+        try:
+            self.bodies[indice](marco)
+        except RecursionError as e:
+            raise runtime_error(e, 0) from None
+        return flatten_value(marco[-1])
+
+class ClosureCompiler:
+    """Convierte el AST verificado en closures anidadas"""
+
+    def __init__(self, arena: ASTArena, checker: SemanticChecker):
+        self.arena = arena
+        self.types = checker.types
+        self.program = ClosureProgram()
+        self.globals: Dict[str, int] = {}
+        self.scopes: List[Dict[str, int]] = []
+        self.next_slot = 0
+        self.n_slots = 0
+
+    def compile(self) -> ClosureProgram:
+        arena = self.arena
+        programa = self.program
+        for decl in arena.children(arena.root):
+            nombre = arena.text(decl)
+            if arena.kind[decl] == NodeKind.FUNC:
+                programa.function_index[nombre] = len(programa.bodies)
+                programa.bodies.append(None)
+                programa.pads.append([])
+            else:
+                self.globals[nombre] = len(programa.globals)
+                programa.globals.append(default_value(self.type_of(arena.first_child[decl])))
+        try:
+            for decl in arena.children(arena.root):
+                if arena.kind[decl] == NodeKind.FUNC:
+                    self.compile_function(decl)
+        except RecursionError:
+            raise CompileError(["Expresión demasiado anidada para el motor de closures"]) from None
+        return programa
+
+    def type_of(self, nodo: int) -> str:
+        kind = self.arena.kind[nodo]
+        if kind == NodeKind.VOID:
+            return 'void'
+        if kind == NodeKind.ARRAY_TYPE:
+            return '[]' + self.type_of(self.arena.first_child[nodo])
+        return self.arena.text(nodo)
+
+    # ========== Variables ==========
+
+    def declare(self, nombre: str) -> int:
+        slot = self.next_slot
+        self.scopes[-1][nombre] = slot
+        self.next_slot += 1
+        self.n_slots = max(self.n_slots, self.next_slot)
+        return slot
+
+    def resolve(self, nombre: str) -> Tuple[bool, int]:
+        for ambito in reversed(self.scopes):
+            if nombre in ambito:
+                return True, ambito[nombre]
+        return False, self.globals[nombre]
+
+    # ========== Funciones y comandos ==========
+
+    def compile_function(self, nodo: int):
+        arena = self.arena
+        params, retorno, bloque = arena.children(nodo)
+        indice = self.program.function_index[arena.text(nodo)]
+        self.scopes = [{}]
+        self.next_slot = 0
+        self.n_slots = 0
+        n_params = 0
+        for param in arena.children(params):
+            self.declare(arena.text(param))
+            n_params += 1
+        cuerpo = self.compile_block(bloque, new_scope=False)
+        tipo_retorno = self.type_of(retorno)
+        valor_implicito = None if tipo_retorno == 'void' else default_value(tipo_retorno)
+        self.program.pads[indice] = [None] * (self.n_slots - n_params) + [valor_implicito]
+        self.program.bodies[indice] = cuerpo
+
+    def compile_block(self, nodo: int, new_scope: bool = True) -> Closure:
+        arena = self.arena
+        if new_scope:
+            self.scopes.append({})
+            slots_previos = self.next_slot
+        comandos = [self.compile_statement(hijo) for hijo in arena.children(nodo)]
+        if new_scope:
+            self.scopes.pop()
+            self.next_slot = slots_previos
+        if not comandos:
+            return lambda f: False
+        if len(comandos) == 1:
+            return comandos[0]
+        if len(comandos) == 2:
+            primero, segundo = comandos
+
+            def bloque2(f):
+                return primero(f) or segundo(f)
+            return bloque2
+        comandos = tuple(comandos)
+
+        def bloque(f):
+            for comando in comandos:
+                if comando(f):
+                    return True
+            return False
+        return bloque
+
+    def compile_statement(self, nodo: int) -> Closure:
+        arena = self.arena
+        kind = arena.kind[nodo]
+        if kind == NodeKind.VARDECL:
+            inicial = default_value(self.type_of(arena.first_child[nodo]))
+            slot = self.declare(arena.text(nodo))
+
+            def declarar(f):
+                f[slot] = inicial
+            return declarar
+        if kind == NodeKind.ASSIGN:
+            return self.compile_assign(nodo)
+        if kind == NodeKind.CALL:
+            llamada = self.compile_expr(nodo)
+
+            def llamar(f):
+                llamada(f)
+            return llamar
+        if kind == NodeKind.IF:
+            return self.compile_if(nodo)
+        if kind == NodeKind.WHILE:
+            condicion_nodo, cuerpo_nodo = arena.children(nodo)
+            condicion = self.compile_expr(condicion_nodo)
+            cuerpo = self.compile_block(cuerpo_nodo)
+
+            def mientras(f):
+                while condicion(f):
+                    if cuerpo(f):
+                        return True
+                return False
+            return mientras
+        # RETURN
+        valor_nodo = arena.first_child[nodo]
+        valor = self.compile_expr(valor_nodo) if valor_nodo != NONE else (lambda f: None)
+
+        def retornar(f):
+            f[-1] = valor(f)
+            return True
+        return retornar
+
+    def compile_if(self, nodo: int) -> Closure:
+        hijos = list(self.arena.children(nodo))
+        ramas = tuple((self.compile_expr(hijos[i]), self.compile_block(hijos[i + 1]))
+                      for i in range(0, len(hijos) - 1, 2))
+        otro = self.compile_block(hijos[-1]) if len(hijos) % 2 else None
+        if len(ramas) == 1:
+            condicion, entonces = ramas[0]
+            if otro is None:
+                def si(f):
+                    if condicion(f):
+                        return entonces(f)
+                    return False
+                return si
+
+            def si_sino(f):
+                if condicion(f):
+                    return entonces(f)
+                return otro(f)
+            return si_sino
+
+        def si_multiple(f):
+            for condicion, bloque in ramas:
+                if condicion(f):
+                    return bloque(f)
+            return otro(f) if otro is not None else False
+        return si_multiple
+
+    def compile_assign(self, nodo: int) -> Closure:
+        arena = self.arena
+        destino, valor_nodo = arena.children(nodo)
+        valor = self.compile_expr(valor_nodo)
+        if arena.kind[destino] == NodeKind.VAR:
+            local, slot = self.resolve(arena.text(destino))
+            if local:
+                def asignar_local(f):
+                    f[slot] = valor(f)
+                return asignar_local
+            globales = self.program.globals
+
+            def asignar_global(f):
+                globales[slot] = valor(f)
+            return asignar_global
+        base_nodo, indice_nodo = arena.children(destino)
+        base = self.compile_expr(base_nodo)
+        indice = self.compile_expr(indice_nodo)
+        linea = arena.line(nodo)
+
+        def asignar_indice(f):
+            arreglo = base(f)
+            i = indice(f)
+            try:
+                if i < 0:
+                    raise IndexError(i)
+                arreglo[i] = valor(f)
+            except (IndexError, TypeError, ValueError) as e:
+                raise runtime_error(e, linea) from None
+        return asignar_indice
+
+    # ========== Expresiones ==========
+
+    def operand(self, nodo: int) -> Tuple[str, object]:
+        """Forma del operando para elegir una closure especializada"""
+        arena = self.arena
+        kind = arena.kind[nodo]
+        if kind == NodeKind.NUM:
+            return 'C', numeral_value(arena.text(nodo))
+        if kind == NodeKind.VAR:
+            local, slot = self.resolve(arena.text(nodo))
+            if local:
+                return 'L', slot
+        return 'E', self.compile_expr(nodo)
+
+    def compile_expr(self, nodo: int) -> Closure:
+        arena = self.arena
+        kind = arena.kind[nodo]
+        if kind in (NodeKind.NUM, NodeKind.STR, NodeKind.BOOL):
+            texto = arena.text(nodo)
+            valor = (numeral_value(texto) if kind == NodeKind.NUM
+                     else intern_literal(texto) if kind == NodeKind.STR else texto == 'true')
+            return lambda f: valor
+        if kind == NodeKind.VAR:
+            local, slot = self.resolve(arena.text(nodo))
+            if local:
+                return lambda f: f[slot]
+            globales = self.program.globals
+            return lambda f: globales[slot]
+        if kind == NodeKind.BINOP:
+            return self.compile_binary(nodo)
+        if kind == NodeKind.UNOP:
+            operando = self.compile_expr(arena.first_child[nodo])
+            if arena.text(nodo) == 'not':
+                return lambda f: not operando(f)
+            return lambda f: -operando(f)
+        if kind == NodeKind.INDEX:
+            base_nodo, indice_nodo = arena.children(nodo)
+            base = self.compile_expr(base_nodo)
+            indice = self.compile_expr(indice_nodo)
+            linea = arena.line(nodo)
+            if self.types.get(base_nodo) == 'string':
+                def caracter(f):
+                    try:
+                        return char_at(base(f), indice(f))
+                    except IndexError as e:
+                        raise runtime_error(e, linea) from None
+                return caracter
+
+            def indexar(f):
+                i = indice(f)
+                try:
+                    if i < 0:
+                        raise IndexError(i)
+                    return base(f)[i]
+                except (IndexError, TypeError) as e:
+                    raise runtime_error(e, linea) from None
+            return indexar
+        if kind == NodeKind.NEW:
+            tamano_nodo = arena.first_child[nodo]
+            tamano = self.compile_expr(tamano_nodo)
+            elemento = self.type_of(arena.next_sibling[tamano_nodo])
+            linea = arena.line(nodo)
+
+            def nuevo(f):
+                try:
+                    return new_array(tamano(f), elemento)
+                except (ValueError, OverflowError, MemoryError) as e:
+                    raise runtime_error(e, linea) from None
+            return nuevo
+        return self.compile_call(nodo)
+
+    def compile_binary(self, nodo: int) -> Closure:
+        arena = self.arena
+        operador = arena.text(nodo)
+        izquierda_nodo, derecha_nodo = arena.children(nodo)
+        if operador in ('and', 'or'):
+            izquierda = self.compile_expr(izquierda_nodo)
+            derecha = self.compile_expr(derecha_nodo)
+            if operador == 'and':
+                return lambda f: izquierda(f) and derecha(f)
+            return lambda f: izquierda(f) or derecha(f)
+        if operador == '/':
+            izquierda = self.compile_expr(izquierda_nodo)
+            derecha = self.compile_expr(derecha_nodo)
+            linea = arena.line(nodo)
+
+            def dividir(f):
+                a = izquierda(f)
+                b = derecha(f)
+                if b == 0:
+                    raise Mini0RuntimeError("división por cero", linea)
+                return int_div(a, b)
+            return dividir
+        if operador == '+' and self.types.get(nodo) == 'string':
+            izquierda = self.compile_expr(izquierda_nodo)
+            derecha = self.compile_expr(derecha_nodo)
+            return lambda f: concat(izquierda(f), derecha(f))
+        if operador in ('=', '<>') and self.types.get(izquierda_nodo, '').startswith('[]'):
+            izquierda = self.compile_expr(izquierda_nodo)
+            derecha = self.compile_expr(derecha_nodo)
+            if operador == '=':
+                return lambda f: izquierda(f) is derecha(f)
+            return lambda f: izquierda(f) is not derecha(f)
+        forma_izq, a = self.operand(izquierda_nodo)
+        forma_der, b = self.operand(derecha_nodo)
+        if forma_izq == 'C':
+            forma_izq, a = 'E', (lambda valor: lambda f: valor)(a)
+        forma = forma_izq + forma_der
+        if forma == 'EL':
+            forma, b = 'EE', (lambda slot: lambda f: f[slot])(b)
+        return BINARY_FACTORIES[(operador, forma)](a, b)
+
+    def compile_call(self, nodo: int) -> Closure:
+        arena = self.arena
+        programa = self.program
+        indice = programa.function_index[arena.text(nodo)]
+        argumentos = tuple(self.compile_expr(hijo) for hijo in arena.children(nodo))
+        cuerpos = programa.bodies
+        rellenos = programa.pads
+        if not argumentos:
+            def llamar0(f):
+                marco = rellenos[indice][:]
+                cuerpos[indice](marco)
+                return flatten_value(marco[-1])
+            return llamar0
+        if len(argumentos) == 1:
+            (primero,) = argumentos
+
+            def llamar1(f):
+                marco = [primero(f)] + rellenos[indice]
+                cuerpos[indice](marco)
+                return flatten_value(marco[-1])
+            return llamar1
+
+        def llamar(f):
+            marco = [argumento(f) for argumento in argumentos] + rellenos[indice]
+            cuerpos[indice](marco)
+            return flatten_value(marco[-1])
+        return llamar
+
+def compile_source(codigo: str) -> ClosureProgram:
+    """Compila código fuente Mini-0 a closures (lanza CompileError si no es válido)"""
+    arena, checker = load_program(codigo)
+    return ClosureCompiler(arena, checker).compile()
+
+def main():
+    import argparse
+    import time
+    arg_parser = argparse.ArgumentParser(description="Ejecuta un programa Mini-0 compilado a closures")
+    arg_parser.add_argument('archivo')
+    args = arg_parser.parse_args()
+
+    with open(args.archivo, 'r', encoding='utf-8') as f:
+        codigo = f.read()
+    try:
+        programa = compile_source(codigo)
+    except CompileError as e:
+        for error in e.errors:
+            print(f"  {error}", file=sys.stderr)
+        sys.exit(1)
+    inicio = time.perf_counter()
+    try:
+        valor = programa.run()
+    except Mini0RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Resultado: {valor}")
+    print(f"Tiempo: {(time.perf_counter() - inicio) * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
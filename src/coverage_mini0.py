@@ -0,0 +1,332 @@
+"""
+Cobertura de producciones gramaticales para ParserMini0
+Asocia cada decisión del parser recursivo descendente con la producción de
+GrammarMini0.productions que aplica y cuenta cuántas veces se dispara,
+agregando en paralelo sobre corpus de muchos archivos.
+
+Durante el análisis solo se registra, por cada llamada a una regla, la
+secuencia de eventos que produjo (reglas hijas invocadas y terminales
+consumidos). La traducción de esas firmas a producciones se hace después,
+una sola vez por firma distinta, contra la gramática.
+"""
+
+import sys
+import os
+import json
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.lexer_mini0 import Lexer, TokenType
+from src.parser_mini0 import ParserMini0
+from src.grammar_mini0 import GrammarMini0, shared_grammar
+from src.instrument_mini0 import wrap_rules, unwrap_rules
+from src.files_mini0 import collect_files
+
+# Terminal de la gramática que corresponde a cada tipo de token
+TERMINAL_OF_TOKEN: Dict[TokenType, str] = {
+    TokenType.ID: 'ID',
+    TokenType.LITNUMERAL: 'LITNUMERAL',
+    TokenType.LITSTRING: 'LITSTRING',
+    TokenType.PLUS: '+',
+    TokenType.MINUS: '-',
+    TokenType.MULT: '*',
+    TokenType.DIV: '/',
+    TokenType.GT: '>',
+    TokenType.LT: '<',
+    TokenType.GTE: '>=',
+    TokenType.LTE: '<=',
+    TokenType.EQ: '=',
+    TokenType.NEQ: '<>',
+    TokenType.LPAREN: '(',
+    TokenType.RPAREN: ')',
+    TokenType.LBRACKET: '[',
+    TokenType.RBRACKET: ']',
+    TokenType.COMMA: ',',
+    TokenType.COLON: ':',
+    TokenType.NL: 'NL',
+    TokenType.EOF: '$',
+}
+for _token_type in TokenType:
+    # Palabras reservadas: el terminal es la palabra en minúsculas
+    TERMINAL_OF_TOKEN.setdefault(_token_type, _token_type.name.lower())
+
+# Métodos auxiliares del parser que implementan no terminales de la gramática
+HELPER_RULES = {
+    'expect_nl': 'nl',
+    'skip_newlines': 'nls',
+}
+
+Signature = Tuple[str, Tuple[str, ...]]
+Production = Tuple[str, int]
+
+class ProductionCoverage:
+    """Registra firmas de decisiones del parser y las resuelve a producciones"""
+
+    def __init__(self, grammar: Optional[GrammarMini0] = None):
+        self.grammar = grammar or shared_grammar()
+        self.signatures: Counter = Counter()
+        self._resolved: Dict[Signature, Optional[Counter]] = {}
+
+    def attach(self, parser: ParserMini0) -> ParserMini0:
+        """Instala el registro de eventos sobre la instancia del parser"""
+        signatures = self.signatures
+        # Pila de listas de eventos; la base recoge lo que ocurre fuera de reglas
+        stack: List[List[str]] = [[]]
+
+        def make_wrapper(regla: str, metodo: Callable) -> Callable:
+            def wrapper(*args):
+                eventos: List[str] = []
+                stack.append(eventos)
+                try:
+                    resultado = metodo(*args)
+                finally:
+                    stack.pop()
+                signatures[(regla, tuple(eventos))] += 1
+                stack[-1].append(regla)
+                return resultado
+            wrapper.__wrapped__ = metodo
+            return wrapper
+
+        wrap_rules(parser, make_wrapper)
+        for metodo, regla in HELPER_RULES.items():
+            setattr(parser, metodo, make_wrapper(regla, getattr(parser, metodo)))
+
+        advance = parser.advance
+        terminal_of = TERMINAL_OF_TOKEN
+
+        def recorded_advance():
+            token = advance()
+            stack[-1].append(terminal_of[token.type])
+            return token
+
+        parser.advance = recorded_advance
+        return parser
+
+    def detach(self, parser: ParserMini0):
+        """Restaura la instancia del parser a su estado sin instrumentar"""
+        unwrap_rules(parser, extras=tuple(HELPER_RULES) + ('advance',))
+
+    def cover_tokens(self, tokens) -> bool:
+        """Analiza una lista de tokens y acumula sus firmas si el análisis es exitoso"""
+        local = ProductionCoverage(self.grammar)
+        parser = local.attach(ParserMini0(tokens))
+        exito = parser.parse()
+        if exito:
+            self.signatures.update(local.signatures)
+        return exito
+
+    # ========== Resolución de firmas a producciones ==========
+
+    def resolve(self, firma: Signature) -> Optional[Counter]:
+        """Producciones aplicadas por una llamada a regla con la secuencia de eventos dada"""
+        if firma not in self._resolved:
+            regla, eventos = firma
+            conteo: Counter = Counter()
+            fin = self._expand(regla, eventos, 0, conteo)
+            self._resolved[firma] = conteo if fin == len(eventos) else None
+        return self._resolved[firma]
+
+    def _expand(self, no_terminal: str, eventos: Tuple[str, ...], i: int,
+                conteo: Counter) -> Optional[int]:
+        """Prueba las alternativas de no_terminal desde eventos[i]; retorna el nuevo índice"""
+        for indice, produccion in enumerate(self.grammar.productions[no_terminal]):
+            parcial: Counter = Counter()
+            j = self._match_sequence(produccion, eventos, i, parcial)
+            if j is not None:
+                conteo.update(parcial)
+                conteo[(no_terminal, indice)] += 1
+                return j
+        return None
+
+    def _match_sequence(self, simbolos: List[str], eventos: Tuple[str, ...], i: int,
+                        conteo: Counter) -> Optional[int]:
+        """Empareja una producción con los eventos; los no terminales que el parser
+        no invoca como método (recursión convertida en bucle, exp_opt, nl_rest)
+        se expanden en línea"""
+        for simbolo in simbolos:
+            if simbolo == 'ε':
+                continue
+            if i < len(eventos) and eventos[i] == simbolo:
+                i += 1
+            elif simbolo in self.grammar.non_terminals:
+                i = self._expand(simbolo, eventos, i, conteo)
+                if i is None:
+                    return None
+            else:
+                return None
+        return i
+
+    def production_counts(self) -> Tuple[Counter, Counter]:
+        """Retorna (conteo por producción, firmas sin producción asociada)"""
+        producciones: Counter = Counter()
+        sin_resolver: Counter = Counter()
+        for firma, veces in self.signatures.items():
+            conteo = self.resolve(firma)
+            if conteo is None:
+                sin_resolver[firma] += veces
+                continue
+            for produccion, n in conteo.items():
+                producciones[produccion] += n * veces
+        return producciones, sin_resolver
+
+# ========== Agregación paralela sobre corpus ==========
+
+_worker_coverage: Optional[ProductionCoverage] = None
+
+def _cover_file(archivo: str) -> Tuple[str, bool, Counter, Counter]:
+    """Tarea de un proceso trabajador: cobertura de un archivo"""
+    global _worker_coverage
+    if _worker_coverage is None:
+        _worker_coverage = ProductionCoverage()
+    cobertura = _worker_coverage
+    cobertura.signatures = Counter()
+    try:
+        with open(archivo, 'r', encoding='utf-8') as f:
+            tokens, errores = Lexer(f.read()).tokenize()
+    except (OSError, UnicodeDecodeError):
+        return archivo, False, Counter(), Counter()
+    if errores or not cobertura.cover_tokens(tokens):
+        return archivo, False, Counter(), Counter()
+    producciones, sin_resolver = cobertura.production_counts()
+    return archivo, True, producciones, sin_resolver
+
+class CoverageResult:
+    """Resultado agregado de cobertura sobre un corpus"""
+
+    def __init__(self, grammar: GrammarMini0):
+        self.grammar = grammar
+        self.counts: Counter = Counter()
+        self.unresolved: Counter = Counter()
+        self.files = 0
+        self.failed: List[str] = []
+
+    def all_productions(self) -> List[Production]:
+        """Todas las producciones de la gramática como (no_terminal, índice)"""
+        return [(nt, i) for nt in sorted(self.grammar.productions)
+                for i in range(len(self.grammar.productions[nt]))]
+
+    def production_text(self, produccion: Production) -> str:
+        """Texto legible 'A → α' de una producción"""
+        nt, indice = produccion
+        return f"{nt} → {' '.join(self.grammar.productions[nt][indice])}"
+
+    def never_exercised(self) -> List[Production]:
+        """Producciones que ningún archivo del corpus disparó"""
+        return [p for p in self.all_productions() if not self.counts[p]]
+
+    def percentage(self) -> float:
+        """Porcentaje de producciones ejercitadas al menos una vez"""
+        todas = self.all_productions()
+        cubiertas = len(todas) - len(self.never_exercised())
+        return cubiertas / len(todas) * 100 if todas else 0.0
+
+    def to_dict(self) -> dict:
+        """Representación serializable a JSON"""
+        return {
+            'archivos': self.files,
+            'fallidos': len(self.failed),
+            'porcentaje': self.percentage(),
+            'producciones': [
+                {'produccion': self.production_text(p), 'veces': self.counts[p]}
+                for p in sorted(self.all_productions(), key=lambda p: -self.counts[p])
+            ],
+            'sin_resolver': [
+                {'regla': regla, 'eventos': list(eventos), 'veces': veces}
+                for (regla, eventos), veces in self.unresolved.most_common()
+            ],
+        }
+
+    def write_report(self, output_file: str = 'COVERAGE_REPORT.md') -> str:
+        """Genera el reporte de cobertura en formato Markdown"""
+        todas = self.all_productions()
+        nunca = self.never_exercised()
+        total_disparos = sum(self.counts.values()) or 1
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write("# Reporte de Cobertura de Producciones - Mini-0\n\n")
+            f.write("## Resumen\n\n")
+            f.write(f"- **Archivos analizados:** {self.files}\n")
+            f.write(f"- **Archivos con errores (excluidos):** {len(self.failed)}\n")
+            f.write(f"- **Producciones ejercitadas:** {len(todas) - len(nunca)} de {len(todas)}\n")
+            f.write(f"- **Cobertura:** {self.percentage():.1f}%\n\n")
+
+            f.write("## Producciones más frecuentes\n\n")
+            f.write("| # | Producción | Veces | % |\n")
+            f.write("|---|------------|-------|---|\n")
+            ordenadas = sorted((p for p in todas if self.counts[p]),
+                               key=lambda p: (-self.counts[p], p))
+            for i, produccion in enumerate(ordenadas, 1):
+                veces = self.counts[produccion]
+                f.write(f"| {i} | `{self.production_text(produccion)}` | {veces} | "
+                        f"{veces / total_disparos * 100:.2f} |\n")
+
+            f.write("\n## Producciones nunca ejercitadas\n\n")
+            if nunca:
+                for produccion in nunca:
+                    f.write(f"- `{self.production_text(produccion)}`\n")
+            else:
+                f.write("Ninguna: todas las producciones fueron ejercitadas.\n")
+
+            if self.unresolved:
+                f.write("\n## Decisiones sin producción asociada\n\n")
+                f.write("El parser aceptó estas secuencias pero ninguna producción de la "
+                        "gramática las describe (divergencia gramática/parser).\n\n")
+                for (regla, eventos), veces in self.unresolved.most_common(20):
+                    f.write(f"- `{regla}`: `{' '.join(eventos) or 'ε'}` ({veces} veces)\n")
+        return output_file
+
+def cover_corpus(archivos: List[str], workers: Optional[int] = None) -> CoverageResult:
+    """Calcula la cobertura de un corpus repartiendo los archivos entre procesos"""
+    resultado = CoverageResult(shared_grammar())
+    if workers == 1:
+        resultados = map(_cover_file, archivos)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        chunk = max(1, len(archivos) // ((workers or os.cpu_count() or 1) * 8))
+        resultados = executor.map(_cover_file, archivos, chunksize=chunk)
+    try:
+        for archivo, exito, producciones, sin_resolver in resultados:
+            resultado.files += 1
+            if not exito:
+                resultado.failed.append(archivo)
+                continue
+            resultado.counts.update(producciones)
+            resultado.unresolved.update(sin_resolver)
+    finally:
+        if workers != 1:
+            executor.shutdown()
+    return resultado
+
+def main():
+    """Cobertura de producciones sobre archivos o directorios Mini-0"""
+    import argparse
+    arg_parser = argparse.ArgumentParser(
+        description="Cobertura de producciones de GrammarMini0 sobre un corpus")
+    arg_parser.add_argument('rutas', nargs='*', default=['tests/mini0'],
+                            help="archivos .mini0 o directorios (por defecto tests/mini0)")
+    arg_parser.add_argument('-j', '--workers', type=int, default=None,
+                            help="procesos trabajadores (por defecto, uno por CPU)")
+    arg_parser.add_argument('-o', '--output', default='COVERAGE_REPORT.md',
+                            help="archivo del reporte Markdown")
+    arg_parser.add_argument('--json', action='store_true',
+                            help="imprime el resultado en JSON")
+    args = arg_parser.parse_args()
+
+    resultado = cover_corpus(collect_files(args.rutas), args.workers)
+    if args.json:
+        print(json.dumps(resultado.to_dict(), indent=2, ensure_ascii=False))
+        return
+
+    print(f"Archivos analizados: {resultado.files} ({len(resultado.failed)} con errores)")
+    print(f"Cobertura de producciones: {resultado.percentage():.1f}%")
+    nunca = resultado.never_exercised()
+    if nunca:
+        print(f"\nProducciones nunca ejercitadas ({len(nunca)}):")
+        for produccion in nunca:
+            print(f"  {resultado.production_text(produccion)}")
+    if resultado.unresolved:
+        print(f"\n⚠ {sum(resultado.unresolved.values())} decisiones sin producción asociada")
+    print(f"\n📄 Reporte generado en: {resultado.write_report(args.output)}")
+
+if __name__ == "__main__":
+    main()
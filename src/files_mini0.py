@@ -0,0 +1,25 @@
+"""
+Utilidades de archivos compartidas por las herramientas de Mini-0
+Directorio del caché en disco (transpilador, backend nativo, AST mapeado y
+formateador) y expansión de rutas a archivos .mini0 (cobertura, índice de
+símbolos, verificación por lotes y formateador).
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable, List
+
+# Directorio del caché en disco (MINI0_CACHE_DIR lo reemplaza)
+DEFAULT_CACHE_DIR = os.environ.get('MINI0_CACHE_DIR') or os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'mini0')
+
+def collect_files(rutas: Iterable[str]) -> List[str]:
+    """Expande directorios a sus archivos .mini0"""
+    archivos = []
+    for ruta in rutas:
+        path = Path(ruta)
+        if path.is_dir():
+            archivos.extend(str(p) for p in sorted(path.rglob('*.mini0')))
+        else:
+            archivos.append(str(path))
+    return archivos
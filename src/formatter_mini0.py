@@ -0,0 +1,315 @@
+"""
+Formateador canónico de Mini-0
+Recorre el flujo de tokens del Lexer (con el canal de trivia, para no
+perder los comentarios) y la estructura de bloques que reconoce
+ParserMini0 ('fun'/'end', 'if'/'else'/'end', 'while'/'loop'), sin construir
+el AST:
+  - indentación de 4 espacios por bloque abierto
+  - un espacio alrededor de los operadores binarios y después de ',' y ':',
+    ninguno dentro de paréntesis y corchetes ni después del '-' unario
+  - a lo sumo una línea en blanco seguida, ninguna al abrir o cerrar un
+    bloque y exactamente una entre funciones
+  - los comentarios se conservan en su línea; los de bloque, textuales
+
+Las líneas se arman con los números de línea de los tokens (el Lexer
+colapsa los NL seguidos y los comentarios no generan NL) y se entregan
+apenas termina cada una: el tiempo es lineal y la memoria extra es una
+línea más la pila de bloques abiertos. format_file() escribe a un
+temporal y solo reemplaza el archivo si cambió; un caché de hashes del
+contenido ya formateado permite saltear esos archivos sin analizarlos.
+"""
+
+import hashlib
+import sys
+import os
+from typing import Iterator, List, Optional, Set
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.lexer_mini0 import Lexer, Token, TokenType
+from src.files_mini0 import DEFAULT_CACHE_DIR, collect_files
+
+# Cambia cuando cambia la salida; invalida el caché de archivos formateados
+FORMATTER_VERSION = 1
+
+INDENT = '    '
+
+# Tokens que terminan un operando: un '-' después de ellos es binario
+OPERAND_END = frozenset((TokenType.ID, TokenType.LITNUMERAL, TokenType.LITSTRING,
+                         TokenType.TRUE, TokenType.FALSE, TokenType.RPAREN, TokenType.RBRACKET))
+# Sin espacio antes
+NO_SPACE_BEFORE = frozenset((TokenType.RPAREN, TokenType.RBRACKET, TokenType.COMMA, TokenType.COLON))
+# Sin espacio después
+NO_SPACE_AFTER = frozenset((TokenType.LPAREN, TokenType.LBRACKET))
+# Tokens pegados a un '(' o '[' siguiente (llamada, indexación)
+CALLEE = frozenset((TokenType.ID, TokenType.RPAREN, TokenType.RBRACKET))
+
+# Primer token de una línea que abre un bloque -> token que lo cierra
+OPENERS = {TokenType.FUN: TokenType.END, TokenType.IF: TokenType.END, TokenType.WHILE: TokenType.LOOP}
+CLOSERS = frozenset((TokenType.END, TokenType.LOOP))
+
+STRING_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\t': '\\t'})
+
+class FormatError(Exception):
+    """El fuente no se puede formatear (error léxico o bloques desbalanceados)"""
+
+def token_text(token: Token) -> str:
+    """Texto canónico de un token"""
+    if token.type == TokenType.LITSTRING:
+        return '"' + token.value.translate(STRING_ESCAPES) + '"'
+    if token.type == TokenType.COMMENT and token.value.startswith('//'):
+        return token.value.rstrip()
+    return token.value
+
+def end_line(token: Token) -> int:
+    """Última línea que ocupa el token (los comentarios de bloque pueden ocupar varias)"""
+    return token.line + token.value.count('\n') if token.type == TokenType.COMMENT else token.line
+
+def render_line(tokens: List[Token]) -> str:
+    """Texto de una línea con el espaciado canónico"""
+    partes = []
+    anterior: Optional[Token] = None
+    antes_anterior: Optional[Token] = None
+    unario = False  # el token anterior es un '-' unario
+    for token in tokens:
+        tipo = token.type
+        if anterior is not None:
+            previo = anterior.type
+            if tipo == TokenType.COMMENT or previo == TokenType.COMMENT:
+                espacio = True
+            elif tipo in NO_SPACE_BEFORE or previo in NO_SPACE_AFTER or unario:
+                espacio = False
+            elif tipo in (TokenType.LPAREN, TokenType.LBRACKET):
+                espacio = previo not in CALLEE
+            elif previo == TokenType.RBRACKET:
+                # '[]' de un tipo: pegado a lo que sigue ('[]int', '[][]bool')
+                espacio = antes_anterior is None or antes_anterior.type != TokenType.LBRACKET
+            else:
+                espacio = True
+            if espacio:
+                partes.append(' ')
+        partes.append(token_text(token))
+        unario = tipo == TokenType.MINUS and (anterior is None or anterior.type not in OPERAND_END)
+        antes_anterior, anterior = anterior, token
+    return ''.join(partes)
+
+class StreamFormatter:
+    """Formatea un flujo de tokens con trivia línea por línea"""
+
+    def __init__(self, lexer: Lexer):
+        self.lexer = lexer
+        # Bloques abiertos: token que los cierra
+        self.blocks: List[TokenType] = []
+        self.line: List[Token] = []
+        # Última línea del fuente ocupada por la línea en curso y la anterior
+        self.line_end = 0
+        self.previous_end = 0
+        # Primer token de la línea emitida anterior y nivel al terminarla
+        self.previous_first: Optional[TokenType] = None
+        self.previous_level = 0
+
+    def error(self, token: Token, mensaje: str):
+        raise FormatError(f"línea {token.line}, columna {token.column}: {mensaje}")
+
+    def lines(self) -> Iterator[str]:
+        """Líneas formateadas (con '\\n'), a medida que se completan"""
+        lexer = self.lexer
+        for token in lexer.scan():
+            if lexer.errors:
+                raise FormatError(lexer.errors[0])
+            tipo = token.type
+            if tipo == TokenType.NL:
+                continue
+            if self.line and (token.line > self.line_end or tipo == TokenType.EOF):
+                yield from self.flush()
+            if tipo == TokenType.EOF:
+                break
+            self.line.append(token)
+            self.line_end = end_line(token)
+        if self.blocks:
+            raise FormatError(f"fin de archivo con {len(self.blocks)} bloque(s) sin cerrar "
+                              f"(falta '{self.blocks[-1].name.lower()}')")
+
+    def flush(self) -> Iterator[str]:
+        tokens = self.line
+        primero = next((t for t in tokens if t.type != TokenType.COMMENT), None)
+        tipo = primero.type if primero is not None else TokenType.COMMENT
+        if tipo in CLOSERS:
+            if not self.blocks or self.blocks[-1] != tipo:
+                self.error(primero, f"'{primero.value}' sin bloque abierto que cierre")
+            self.blocks.pop()
+        elif tipo == TokenType.ELSE and (not self.blocks or self.blocks[-1] != TokenType.END):
+            self.error(primero, "'else' fuera de un 'if'")
+        nivel = len(self.blocks) - (tipo == TokenType.ELSE)
+
+        inicio = tokens[0].line
+        if self.previous_first is not None and self.blank_before(tipo, inicio, nivel):
+            yield '\n'
+        yield INDENT * nivel + render_line(tokens) + '\n'
+
+        if tipo in OPENERS:
+            self.blocks.append(OPENERS[tipo])
+        self.previous_first = tipo
+        self.previous_level = len(self.blocks)
+        self.previous_end = self.line_end
+        self.line = []
+
+    def blank_before(self, tipo: TokenType, inicio: int, nivel: int) -> bool:
+        """Línea en blanco antes de la línea que empieza con 'tipo'"""
+        anterior = self.previous_first
+        if anterior in OPENERS or anterior == TokenType.ELSE:
+            return False
+        if tipo in CLOSERS or tipo == TokenType.ELSE:
+            return False
+        if nivel == 0 and anterior == TokenType.END and self.previous_level == 0:
+            return True  # después de una función
+        if tipo == TokenType.FUN and anterior != TokenType.COMMENT:
+            return True
+        return inicio > self.previous_end + 1
+
+def format_lines(fuente: str) -> Iterator[str]:
+    """Líneas del fuente formateado (lanza FormatError si no se puede)"""
+    return StreamFormatter(Lexer(fuente, trivia=True)).lines()
+
+def format_source(fuente: str) -> str:
+    return ''.join(format_lines(fuente))
+
+def same_tokens(a: str, b: str) -> bool:
+    """True si dos fuentes tienen los mismos tokens y comentarios, sin
+    contar los NL (el formateador nunca une ni parte líneas de código;
+    solo agrega o quita líneas en blanco). Recorre ambos flujos a la par"""
+    def flujo(fuente: str):
+        for token in Lexer(fuente, trivia=True).scan():
+            if token.type == TokenType.COMMENT:
+                yield token.type, token_text(token)
+            elif token.type != TokenType.NL:
+                yield token.type, token.value
+    centinela = object()
+    flujo_a, flujo_b = flujo(a), flujo(b)
+    while True:
+        x = next(flujo_a, centinela)
+        y = next(flujo_b, centinela)
+        if x is centinela or y is centinela:
+            return x is y
+        if x != y:
+            return False
+
+class FormatCache:
+    """Hashes del contenido de archivos ya formateados con esta versión"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.path = os.path.join(cache_dir, f"format-v{FORMATTER_VERSION}.txt")
+        self.known: Set[str] = set()
+        self.new: List[str] = []
+        try:
+            with open(self.path, 'r', encoding='ascii') as f:
+                self.known.update(linea.strip() for linea in f)
+        except OSError:
+            pass
+
+    def __contains__(self, clave: str) -> bool:
+        return clave in self.known
+
+    def add(self, clave: str):
+        if clave not in self.known:
+            self.known.add(clave)
+            self.new.append(clave)
+
+    def save(self):
+        if not self.new:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'a', encoding='ascii') as f:
+                f.write(''.join(clave + '\n' for clave in self.new))
+            self.new = []
+        except OSError:
+            pass  # sin caché solo se pierde el atajo
+
+def read_text(ruta: str) -> str:
+    with open(ruta, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def content_hash(datos: bytes) -> str:
+    return hashlib.blake2b(datos, digest_size=16).hexdigest()
+
+def format_file(ruta: str, check: bool = False, cache: Optional[FormatCache] = None,
+                verify: bool = False) -> str:
+    """Formatea un archivo en el lugar. Retorna 'omitido' (ya estaba en el
+    caché), 'sin cambios' o 'formateado' ('cambiaría' con check=True).
+    Con verify=True compara los tokens del resultado con los del original
+    antes de reemplazarlo"""
+    with open(ruta, 'rb') as f:
+        datos = f.read()
+    clave = content_hash(datos)
+    if cache is not None and clave in cache:
+        return 'omitido'
+    fuente = datos.decode('utf-8')
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    salida = hashlib.blake2b(digest_size=16)
+    try:
+        with open(temporal, 'w', encoding='utf-8', newline='') as f:
+            for linea in format_lines(fuente):
+                f.write(linea)
+                salida.update(linea.encode('utf-8'))
+        if salida.hexdigest() == clave:
+            estado = 'sin cambios'
+        elif verify and not same_tokens(fuente, read_text(temporal)):
+            raise FormatError("el resultado no conserva los tokens del original")
+        elif check:
+            estado = 'cambiaría'
+        else:
+            os.replace(temporal, ruta)
+            estado = 'formateado'
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+    if cache is not None and estado != 'cambiaría':
+        cache.add(salida.hexdigest())
+    return estado
+
+def main():
+    """Formatea archivos Mini-0 en el lugar (o verifica con --check)"""
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Formateador canónico de Mini-0")
+    arg_parser.add_argument('rutas', nargs='+', help="archivos .mini0 o directorios")
+    arg_parser.add_argument('--check', action='store_true',
+                            help="no modifica nada; termina con 1 si algún archivo cambiaría")
+    arg_parser.add_argument('--stdout', action='store_true', help="imprime el resultado en lugar de escribirlo")
+    arg_parser.add_argument('--no-cache', action='store_true', help="no lee ni escribe el caché de hashes")
+    arg_parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                            help=f"directorio del caché (por defecto {DEFAULT_CACHE_DIR})")
+    arg_parser.add_argument('--verify', action='store_true',
+                            help="comprueba que el resultado tenga los mismos tokens y comentarios")
+    arg_parser.add_argument('--quiet', '-q', action='store_true', help="solo los archivos que cambian")
+    args = arg_parser.parse_args()
+
+    archivos = collect_files(args.rutas)
+    if args.stdout:
+        for ruta in archivos:
+            try:
+                fuente = read_text(ruta)
+                sys.stdout.writelines(format_lines(fuente))
+            except FormatError as e:
+                print(f"❌ {ruta}: {e}", file=sys.stderr)
+                sys.exit(1)
+        return
+
+    cache = None if args.no_cache else FormatCache(args.cache_dir)
+    conteo = {'omitido': 0, 'sin cambios': 0, 'formateado': 0, 'cambiaría': 0, 'error': 0}
+    for ruta in archivos:
+        try:
+            estado = format_file(ruta, args.check, cache, args.verify)
+        except (FormatError, UnicodeDecodeError) as e:
+            print(f"❌ {ruta}: {e}", file=sys.stderr)
+            conteo['error'] += 1
+            continue
+        conteo[estado] += 1
+        if estado in ('formateado', 'cambiaría') or not args.quiet:
+            print(f"{estado:<12} {ruta}")
+    if cache is not None:
+        cache.save()
+    print(', '.join(f"{n} {estado}" for estado, n in conteo.items() if n) or "sin archivos")
+    if conteo['error'] or (args.check and conteo['cambiaría']):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Generador aleatorio de programas Mini-0 dirigido por la gramática
+Recorre GrammarMini0.productions con control de profundidad, tamaño y
+semilla para producir programas sintácticamente válidos.
+"""
+
+import random
+import sys
+import os
+from typing import Dict, List, Optional, Tuple
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.grammar_mini0 import GrammarMini0, shared_grammar
+from src.lexer_mini0 import Lexer
+
+# Texto fijo de los terminales que no son palabras reservadas ni literales
+TERMINAL_TEXT = {
+    'NL': '\n',
+}
+
+IDENTIFIERS = ['a', 'b', 'c', 'i', 'j', 'n', 'x', 'y', 'suma', 'total',
+               'valor', 'datos', 'contador', 'resultado', 'tmp_1', '_aux']
+
+STRING_PIECES = ['hola', 'mundo', ' ', 'mini0', '\\n', '\\t', '\\"', '\\\\', 'abc', '123']
+
+class ProgramGenerator:
+    """Genera programas derivando la gramática desde 'decl' con recorrido iterativo"""
+
+    def __init__(self, grammar: Optional[GrammarMini0] = None, seed: int = 0,
+                 max_depth: int = 8, list_continue: float = 0.6):
+        self.grammar = grammar or shared_grammar()
+        self.rng = random.Random(seed)
+        self.max_depth = max_depth
+        self.list_continue = list_continue
+        self.min_size = self._compute_min_sizes()
+        # No terminales con alternativa ε (las producciones pueden ser tuplas)
+        self.nullable = {nt for nt, producciones in self.grammar.productions.items()
+                         if any(tuple(p) == ('ε',) for p in producciones)}
+
+    def _compute_min_sizes(self) -> Dict[str, int]:
+        """Cantidad mínima de terminales que deriva cada no terminal (punto fijo)"""
+        infinito = float('inf')
+        minimo: Dict[str, float] = {nt: infinito for nt in self.grammar.non_terminals}
+        cambio = True
+        while cambio:
+            cambio = False
+            for nt, producciones in self.grammar.productions.items():
+                for produccion in producciones:
+                    tamano = sum(self._symbol_size(s, minimo) for s in produccion)
+                    if tamano < minimo[nt]:
+                        minimo[nt] = tamano
+                        cambio = True
+        return minimo
+
+    def _symbol_size(self, simbolo: str, minimo: Dict[str, float]) -> float:
+        if simbolo == 'ε':
+            return 0
+        if simbolo in self.grammar.non_terminals:
+            return minimo[simbolo]
+        return 1
+
+    def _alternative_size(self, produccion: List[str]) -> float:
+        return sum(self._symbol_size(s, self.min_size) for s in produccion)
+
+    def _is_list_tail(self, no_terminal: str, produccion: List[str]) -> bool:
+        """Producción recursiva por la derecha (A → α A | ε): representa una lista"""
+        return (len(produccion) > 1 and produccion[-1] == no_terminal
+                and no_terminal in self.nullable)
+
+    def choose(self, no_terminal: str, profundidad: int) -> List[str]:
+        """Elige una alternativa de no_terminal respetando la profundidad máxima"""
+        producciones = self.grammar.productions[no_terminal]
+        if len(producciones) == 1:
+            return producciones[0]
+        if profundidad >= self.max_depth:
+            return min(producciones, key=self._alternative_size)
+        recursivas = [p for p in producciones if self._is_list_tail(no_terminal, p)]
+        if recursivas:
+            # Lista: continuar con probabilidad decreciente con la profundidad
+            continuar = self.list_continue * (1 - profundidad / (self.max_depth + 1))
+            if self.rng.random() >= continuar:
+                return ['ε']
+            return self.rng.choice(recursivas)
+        return self.rng.choice(producciones)
+
+    def terminal_text(self, terminal: str) -> str:
+        """Texto concreto para un terminal"""
+        if terminal == 'ID':
+            return self.rng.choice(IDENTIFIERS)
+        if terminal == 'LITNUMERAL':
+            numero = self.rng.randint(0, 4096)
+            return hex(numero) if self.rng.random() < 0.2 else str(numero)
+        if terminal == 'LITSTRING':
+            piezas = self.rng.randint(0, 8)
+            return '"' + ''.join(self.rng.choice(STRING_PIECES) for _ in range(piezas)) + '"'
+        return TERMINAL_TEXT.get(terminal, terminal)
+
+    def derive(self, simbolo: str) -> List[str]:
+        """Deriva un símbolo hasta terminales sin usar la pila de Python"""
+        salida: List[str] = []
+        pila: List[Tuple[str, int]] = [(simbolo, 0)]
+        while pila:
+            actual, profundidad = pila.pop()
+            if actual == 'ε':
+                continue
+            if actual not in self.grammar.non_terminals:
+                salida.append(self.terminal_text(actual))
+                continue
+            produccion = self.choose(actual, profundidad)
+            lista = self._is_list_tail(actual, produccion)
+            # Solo las decisiones consumen profundidad: las cadenas de producciones
+            # únicas (exp → exp_or → exp_and ...) no limitan el anidamiento real
+            siguiente = profundidad + (len(self.grammar.productions[actual]) > 1)
+            for i in range(len(produccion) - 1, -1, -1):
+                # La cola de una lista no consume profundidad; sí cada elemento
+                if lista and i == len(produccion) - 1:
+                    pila.append((produccion[i], profundidad))
+                else:
+                    pila.append((produccion[i], siguiente))
+        return salida
+
+    @staticmethod
+    def render(terminales: List[str]) -> str:
+        """Une terminales con espacios, sin espacios alrededor de saltos de línea"""
+        partes: List[str] = []
+        for texto in terminales:
+            if texto == '\n' or not partes or partes[-1] == '\n':
+                partes.append(texto)
+            else:
+                partes.append(' ')
+                partes.append(texto)
+        return ''.join(partes)
+
+    def generate(self, target_bytes: int = 1024) -> str:
+        """Genera un programa válido de al menos target_bytes bytes"""
+        partes = [self.render(self.derive('nls'))]
+        total = len(partes[0])
+        while total < target_bytes:
+            decl = self.render(self.derive('decl'))
+            partes.append(decl)
+            total += len(decl)
+        return ''.join(partes)
+
+def main():
+    """Genera un programa aleatorio y verifica que el parser lo acepte"""
+    import argparse
+    from src.parser_mini0 import ParserMini0
+    arg_parser = argparse.ArgumentParser(description="Generador de programas Mini-0 desde la gramática")
+    arg_parser.add_argument('--size', type=int, default=2048, help="tamaño objetivo en bytes")
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--max-depth', type=int, default=8)
+    arg_parser.add_argument('-o', '--output', help="archivo de salida (por defecto stdout)")
+    args = arg_parser.parse_args()
+
+    codigo = ProgramGenerator(seed=args.seed, max_depth=args.max_depth).generate(args.size)
+    tokens, errores = Lexer(codigo).tokenize()
+    parser = ParserMini0(tokens)
+    if errores or not parser.parse():
+        print(f"❌ Programa generado inválido: {(errores or parser.errors)[0]}", file=sys.stderr)
+        sys.exit(1)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(codigo)
+        print(f"✓ {len(codigo)} bytes escritos en {args.output}")
+    else:
+        print(codigo)
+
+if __name__ == "__main__":
+    main()
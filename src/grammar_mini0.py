@@ -1,9 +1,14 @@
 """
 Definición de la Gramática Mini-0 (Especificación Oficial)
 Gramática transformada para análisis LL(1) con cálculo de FIRST y FOLLOW
+
+shared_grammar() retorna una única instancia congelada (inmutable) que se
+construye una sola vez por proceso y se puede compartir entre hilos.
 """
 
-from typing import Dict, Set, List
+import threading
+from types import MappingProxyType
+from typing import Dict, Set, List, Optional
 
 class GrammarMini0:
     """Representa la gramática del lenguaje Mini-0 transformada para LL(1)"""
@@ -89,7 +94,7 @@ class GrammarMini0:
                 ['ID', ':', 'tipo']
             ],
             'tipo': [
-                ['tipobase', 'tipo_array']
+                ['tipo_array', 'tipobase']
             ],
             'tipo_array': [
                 ['[', ']', 'tipo_array'],
@@ -340,6 +345,24 @@ class GrammarMini0:
                             if len(self.follow_sets[symbol]) > old_size:
                                 changed = True
     
+    def freeze(self) -> 'GrammarMini0':
+        """Hace inmutable la gramática: conjuntos frozenset, producciones en
+        tuplas y diccionarios de solo lectura. Después no admite asignaciones"""
+        self.non_terminals = frozenset(self.non_terminals)
+        self.terminals = frozenset(self.terminals)
+        self.productions = MappingProxyType({
+            nt: tuple(tuple(produccion) for produccion in producciones)
+            for nt, producciones in self.productions.items()})
+        self.first_sets = MappingProxyType({s: frozenset(c) for s, c in self.first_sets.items()})
+        self.follow_sets = MappingProxyType({s: frozenset(c) for s, c in self.follow_sets.items()})
+        self.frozen = True
+        return self
+
+    def __setattr__(self, nombre: str, valor):
+        if getattr(self, 'frozen', False):
+            raise AttributeError(f"la gramática está congelada: no se puede asignar '{nombre}'")
+        super().__setattr__(nombre, valor)
+
     def get_first(self, symbol: str) -> Set[str]:
         """Retorna el conjunto FIRST de un símbolo"""
         return self.first_sets.get(symbol, set())
@@ -374,6 +397,19 @@ class GrammarMini0:
             follow = sorted(self.follow_sets[non_terminal])
             print(f"FOLLOW({non_terminal:20}) = {{{', '.join(follow)}}}")
 
+_shared: Optional[GrammarMini0] = None
+_shared_lock = threading.Lock()
+
+def shared_grammar() -> GrammarMini0:
+    """Gramática congelada compartida por todo el proceso (se construye una
+    sola vez, aunque varios hilos la pidan a la vez)"""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = GrammarMini0().freeze()
+    return _shared
+
 def main():
     """Función de prueba"""
     grammar = GrammarMini0()
@@ -0,0 +1,368 @@
+"""
+Índice de símbolos de Mini-0 en SQLite
+Analiza muchos archivos en paralelo (un proceso por CPU) y guarda en una
+base SQLite local cada definición ('funcion', 'global', 'declvar') y cada
+referencia ('llamada', 'var') con su archivo, línea, columna y la función
+que la contiene. Las referencias a variables se resuelven con los ámbitos
+del programa: 'target' dice si el nombre es un global o un local (parámetro
+o variable declarada en un bloque que la contiene).
+
+Las filas se insertan en lote, en una sola transacción; si la base está
+vacía los índices se crean después de cargarla. Al volver a indexar solo se
+analizan los archivos cuyo tamaño o mtime cambió y se borran los que ya no
+existen, así que las consultas ("dónde se define o se llama X", "qué
+globales no se usan") leen siempre el estado actual sin recorrer el árbol.
+"""
+
+import sqlite3
+import sys
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ast_mini0 import ASTArena, NodeKind, parse_ast
+from src.files_mini0 import collect_files
+
+DEFAULT_DB = 'mini0_index.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    ok INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS definitions (
+    file_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    scope TEXT
+);
+CREATE TABLE IF NOT EXISTS refs (
+    file_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    scope TEXT,
+    target TEXT
+);
+"""
+
+# Índice -> tabla y columnas; se crean después de una carga completa
+# (insertar sin índices es más rápido)
+INDEXES = {
+    'definitions_name': 'definitions (name, kind)',
+    'definitions_kind': 'definitions (kind, file_id)',
+    'definitions_file': 'definitions (file_id)',
+    'refs_name': 'refs (name, kind)',
+    'refs_file': 'refs (file_id, name)',
+}
+
+# (nombre, tipo, línea, columna, función que la contiene)
+Definition = Tuple[str, str, int, int, Optional[str]]
+# (nombre, tipo, línea, columna, función que la contiene, 'global' | 'local' | None)
+Reference = Tuple[str, str, int, int, Optional[str], Optional[str]]
+
+class SymbolCollector:
+    """Definiciones y referencias de un arena, resolviendo los ámbitos
+    como el SemanticChecker (parámetros y locales del cuerpo comparten
+    ámbito; cada bloque interno abre uno nuevo)"""
+
+    def __init__(self, arena: ASTArena):
+        self.arena = arena
+        self.definitions: List[Definition] = []
+        self.references: List[Reference] = []
+        self.scopes: List[Set[str]] = []
+        self.function: Optional[str] = None
+
+    def collect(self) -> 'SymbolCollector':
+        arena = self.arena
+        for decl in arena.children(arena.root):
+            if arena.kind[decl] == NodeKind.FUNC:
+                self.define(decl, 'funcion')
+            else:
+                self.define(decl, 'global')
+        for decl in arena.children(arena.root):
+            if arena.kind[decl] == NodeKind.FUNC:
+                params, _, bloque = arena.children(decl)
+                self.function = arena.text(decl)
+                self.scopes = [{arena.text(p) for p in arena.children(params)}]
+                self.collect_block(bloque, new_scope=False)
+        return self
+
+    def define(self, nodo: int, tipo: str):
+        arena = self.arena
+        self.definitions.append((arena.text(nodo), tipo, arena.line(nodo), arena.column(nodo),
+                                 self.function))
+
+    def collect_block(self, nodo: int, new_scope: bool = True):
+        arena = self.arena
+        kinds = arena.kind
+        if new_scope:
+            self.scopes.append(set())
+        for hijo in arena.children(nodo):
+            kind = kinds[hijo]
+            if kind == NodeKind.VARDECL:
+                self.define(hijo, 'declvar')
+                self.scopes[-1].add(arena.text(hijo))
+            elif kind in (NodeKind.IF, NodeKind.WHILE):
+                # Condiciones y bloques alternados (el else es un bloque al final)
+                for parte in arena.children(hijo):
+                    if kinds[parte] == NodeKind.BLOCK:
+                        self.collect_block(parte)
+                    else:
+                        self.collect_expression(parte)
+            else:
+                self.collect_expression(hijo)
+        if new_scope:
+            self.scopes.pop()
+
+    def collect_expression(self, nodo: int):
+        """Referencias dentro de un comando simple o una expresión (iterativo:
+        las expresiones pueden ser muy profundas)"""
+        arena = self.arena
+        kinds = arena.kind
+        referencias = self.references
+        funcion = self.function
+        pila = [nodo]
+        while pila:
+            actual = pila.pop()
+            kind = kinds[actual]
+            if kind == NodeKind.VAR:
+                nombre = arena.text(actual)
+                destino = 'local' if any(nombre in ambito for ambito in self.scopes) else 'global'
+                referencias.append((nombre, 'var', arena.line(actual), arena.column(actual),
+                                    funcion, destino))
+            elif kind == NodeKind.CALL:
+                referencias.append((arena.text(actual), 'llamada', arena.line(actual),
+                                    arena.column(actual), funcion, None))
+            pila.extend(arena.children(actual))
+
+def _index_file(ruta: str) -> Tuple[str, int, int, bool, List[Definition], List[Reference]]:
+    """Trabajador: (ruta, tamaño, mtime, válido, definiciones, referencias)"""
+    estado = os.stat(ruta)
+    try:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            arena = parse_ast(f.read())
+    except (OSError, UnicodeDecodeError, RecursionError):
+        arena = None
+    if arena is None:
+        return ruta, estado.st_size, estado.st_mtime_ns, False, [], []
+    simbolos = SymbolCollector(arena).collect()
+    return ruta, estado.st_size, estado.st_mtime_ns, True, simbolos.definitions, simbolos.references
+
+class IndexStats:
+    """Resultado de una indexación"""
+
+    def __init__(self):
+        self.scanned = 0
+        self.indexed = 0
+        self.failed = 0
+        self.removed = 0
+        self.definitions = 0
+        self.references = 0
+        self.seconds = 0.0
+
+class SymbolIndex:
+    """Base SQLite de definiciones y referencias"""
+
+    def __init__(self, db_path: str = DEFAULT_DB):
+        self.db_path = db_path
+        self.db = sqlite3.connect(db_path)
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA synchronous = NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self) -> 'SymbolIndex':
+        return self
+
+    def __exit__(self, *excepcion):
+        self.close()
+
+    # ========== Indexación ==========
+
+    def index(self, rutas: Iterable[str], workers: Optional[int] = None) -> IndexStats:
+        """Indexa los archivos .mini0 de las rutas; solo vuelve a analizar los
+        que cambiaron y borra los que ya no están"""
+        inicio = time.perf_counter()
+        stats = IndexStats()
+        db = self.db
+        raices = [os.path.abspath(r) for r in rutas]
+        archivos = [os.path.abspath(a) for a in collect_files(raices)]
+        stats.scanned = len(archivos)
+        conocidos: Dict[str, Tuple[int, int, int]] = {
+            ruta: (id_, tamano, mtime)
+            for id_, ruta, tamano, mtime in db.execute("SELECT id, path, size, mtime_ns FROM files")}
+        presentes = set(archivos)
+        cambiados = []
+        for ruta in archivos:
+            anterior = conocidos.get(ruta)
+            estado = os.stat(ruta)
+            if anterior is None or anterior[1:] != (estado.st_size, estado.st_mtime_ns):
+                cambiados.append(ruta)
+        borrados = [ruta for ruta in conocidos if ruta not in presentes and
+                    (not os.path.exists(ruta) or any(_inside(ruta, r) for r in raices))]
+
+        carga_completa = not conocidos
+        with db:
+            if carga_completa:
+                for nombre in INDEXES:
+                    db.execute(f"DROP INDEX IF EXISTS {nombre}")
+            for ruta in borrados + [r for r in cambiados if r in conocidos]:
+                self._forget(conocidos[ruta][0])
+            stats.removed = len(borrados)
+            db.executemany("DELETE FROM files WHERE id = ?", [(conocidos[r][0],) for r in borrados])
+            for ruta, tamano, mtime, valido, definiciones, referencias in _parse_files(cambiados, workers):
+                # Sin RETURNING (SQLite 3.35+): el id se lee aparte
+                db.execute("INSERT INTO files (path, size, mtime_ns, ok) VALUES (?, ?, ?, ?) "
+                           "ON CONFLICT (path) DO UPDATE SET size = excluded.size, "
+                           "mtime_ns = excluded.mtime_ns, ok = excluded.ok",
+                           (ruta, tamano, mtime, valido))
+                file_id = db.execute("SELECT id FROM files WHERE path = ?", (ruta,)).fetchone()[0]
+                db.executemany("INSERT INTO definitions VALUES (?, ?, ?, ?, ?, ?)",
+                               [(file_id, *d) for d in definiciones])
+                db.executemany("INSERT INTO refs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                               [(file_id, *r) for r in referencias])
+                stats.indexed += 1
+                stats.failed += not valido
+                stats.definitions += len(definiciones)
+                stats.references += len(referencias)
+        self.create_indexes()
+        if carga_completa:
+            db.execute("ANALYZE")
+        stats.seconds = time.perf_counter() - inicio
+        return stats
+
+    def create_indexes(self):
+        with self.db:
+            for nombre, columnas in INDEXES.items():
+                self.db.execute(f"CREATE INDEX IF NOT EXISTS {nombre} ON {columnas}")
+
+    def _forget(self, file_id: int):
+        self.db.execute("DELETE FROM definitions WHERE file_id = ?", (file_id,))
+        self.db.execute("DELETE FROM refs WHERE file_id = ?", (file_id,))
+
+    # ========== Consultas ==========
+
+    def definitions(self, nombre: str, tipo: Optional[str] = None) -> List[tuple]:
+        """(ruta, tipo, línea, columna, función) de cada definición del nombre"""
+        consulta = ("SELECT f.path, d.kind, d.line, d.col, d.scope FROM definitions d "
+                    "JOIN files f ON f.id = d.file_id WHERE d.name = ?")
+        parametros: tuple = (nombre,)
+        if tipo is not None:
+            consulta += " AND d.kind = ?"
+            parametros += (tipo,)
+        return self.db.execute(consulta + " ORDER BY f.path, d.line", parametros).fetchall()
+
+    def references(self, nombre: str, tipo: Optional[str] = None,
+                   limit: Optional[int] = None) -> List[tuple]:
+        """(ruta, tipo, línea, columna, función, destino) de cada referencia"""
+        consulta = ("SELECT f.path, r.kind, r.line, r.col, r.scope, r.target FROM refs r "
+                    "JOIN files f ON f.id = r.file_id WHERE r.name = ?")
+        parametros: tuple = (nombre,)
+        if tipo is not None:
+            consulta += " AND r.kind = ?"
+            parametros += (tipo,)
+        if limit is not None:
+            consulta += " LIMIT ?"
+            parametros += (limit,)
+        return self.db.execute(consulta, parametros).fetchall()
+
+    def count_references(self, nombre: str, tipo: Optional[str] = None) -> int:
+        if tipo is None:
+            return self.db.execute("SELECT count(*) FROM refs WHERE name = ?", (nombre,)).fetchone()[0]
+        return self.db.execute("SELECT count(*) FROM refs WHERE name = ? AND kind = ?",
+                               (nombre, tipo)).fetchone()[0]
+
+    def unused_globals(self) -> List[tuple]:
+        """(ruta, nombre, línea) de los globales que ninguna función de su
+        archivo lee ni asigna"""
+        return self.db.execute(
+            "SELECT f.path, d.name, d.line FROM definitions d JOIN files f ON f.id = d.file_id "
+            "WHERE d.kind = 'global' AND NOT EXISTS (SELECT 1 FROM refs r WHERE "
+            "r.file_id = d.file_id AND r.name = d.name AND r.target = 'global') "
+            "ORDER BY f.path, d.line").fetchall()
+
+    def counts(self) -> Dict[str, int]:
+        db = self.db
+        return {
+            'archivos': db.execute("SELECT count(*) FROM files").fetchone()[0],
+            'con_errores': db.execute("SELECT count(*) FROM files WHERE NOT ok").fetchone()[0],
+            'definiciones': db.execute("SELECT count(*) FROM definitions").fetchone()[0],
+            'referencias': db.execute("SELECT count(*) FROM refs").fetchone()[0],
+        }
+
+def _inside(ruta: str, raiz: str) -> bool:
+    return ruta == raiz or ruta.startswith(raiz.rstrip(os.sep) + os.sep)
+
+def _parse_files(archivos: List[str], workers: Optional[int]):
+    """Resultados de _index_file repartiendo los archivos entre procesos"""
+    if workers == 1 or len(archivos) <= 1:
+        yield from map(_index_file, archivos)
+        return
+    chunk = max(1, len(archivos) // ((workers or os.cpu_count() or 1) * 8))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_index_file, archivos, chunksize=chunk)
+
+def main():
+    """Indexa archivos Mini-0 y consulta definiciones y referencias"""
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Índice de símbolos Mini-0 en SQLite")
+    arg_parser.add_argument('rutas', nargs='*',
+                            help="archivos .mini0 o directorios a indexar (incremental)")
+    arg_parser.add_argument('--db', default=DEFAULT_DB, help=f"base SQLite (por defecto {DEFAULT_DB})")
+    arg_parser.add_argument('-j', '--workers', type=int, default=None,
+                            help="procesos trabajadores (por defecto, uno por CPU)")
+    arg_parser.add_argument('--definition', metavar='NOMBRE', help="dónde se define el nombre")
+    arg_parser.add_argument('--calls', metavar='NOMBRE', help="dónde se llama a la función")
+    arg_parser.add_argument('--references', metavar='NOMBRE', help="todas las referencias al nombre")
+    arg_parser.add_argument('--unused-globals', action='store_true', help="globales que no se usan")
+    arg_parser.add_argument('--limit', type=int, default=50, help="filas mostradas por consulta")
+    args = arg_parser.parse_args()
+
+    with SymbolIndex(args.db) as indice:
+        if args.rutas:
+            stats = indice.index(args.rutas, args.workers)
+            print(f"Indexados {stats.indexed:,} de {stats.scanned:,} archivos "
+                  f"({stats.failed} con errores, {stats.removed} borrados) en {stats.seconds:.2f} s: "
+                  f"{stats.definitions:,} definiciones, {stats.references:,} referencias")
+        def ubicacion(ruta, tipo, linea, columna, funcion, destino=None) -> str:
+            detalle = tipo + (f" en {funcion}" if funcion else '') + (f" ({destino})" if destino else '')
+            return f"{os.path.relpath(ruta)}:{linea}:{columna}  {detalle}"
+
+        consultas = []
+        if args.definition:
+            consultas.append((f"Definiciones de '{args.definition}'",
+                              lambda: indice.definitions(args.definition), ubicacion))
+        if args.calls:
+            consultas.append((f"Llamadas a '{args.calls}'",
+                              lambda: indice.references(args.calls, 'llamada'), ubicacion))
+        if args.references:
+            consultas.append((f"Referencias a '{args.references}'",
+                              lambda: indice.references(args.references), ubicacion))
+        if args.unused_globals:
+            consultas.append(("Globales sin usar", indice.unused_globals,
+                              lambda ruta, nombre, linea: f"{os.path.relpath(ruta)}:{linea}  {nombre}"))
+        for titulo, consulta, formato in consultas:
+            inicio = time.perf_counter()
+            filas = consulta()
+            milisegundos = (time.perf_counter() - inicio) * 1000
+            print(f"\n{titulo}: {len(filas):,} ({milisegundos:.2f} ms)")
+            for fila in filas[:args.limit]:
+                print(f"  {formato(*fila)}")
+            if len(filas) > args.limit:
+                print(f"  ... {len(filas) - args.limit:,} más")
+        if not args.rutas and not consultas:
+            for nombre, valor in indice.counts().items():
+                print(f"{nombre}: {valor:,}")
+
+if __name__ == "__main__":
+    main()
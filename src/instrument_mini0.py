@@ -0,0 +1,188 @@
+"""
+Instrumentación por regla gramatical para ParserMini0
+Registra llamadas, tiempo acumulado y tiempo propio de cada método parse_*,
+conteos de match()/peek_token() y elecciones de producción por lookahead.
+
+La instrumentación se instala sobre una instancia concreta del parser
+(los métodos envueltos sombrean a los de la clase), de modo que un parser
+sin instrumentar no paga ningún costo adicional.
+"""
+
+import sys
+import os
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterator, List, Tuple
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.lexer_mini0 import Lexer
+from src.parser_mini0 import ParserMini0
+
+RULE_PREFIX = 'parse_'
+
+def rule_methods(parser: ParserMini0) -> Iterator[Tuple[str, Callable]]:
+    """Enumera (no_terminal, método ligado) de cada regla parse_* del parser"""
+    for nombre in sorted(dir(type(parser))):
+        if nombre.startswith(RULE_PREFIX):
+            yield nombre[len(RULE_PREFIX):], getattr(parser, nombre)
+
+def wrap_rules(parser: ParserMini0, make_wrapper: Callable[[str, Callable], Callable]):
+    """Sombrea cada regla parse_* de la instancia con make_wrapper(regla, método)"""
+    for regla, metodo in rule_methods(parser):
+        setattr(parser, RULE_PREFIX + regla, make_wrapper(regla, metodo))
+
+def unwrap_rules(parser: ParserMini0, extras=()):
+    """Elimina los métodos sombreados de la instancia"""
+    for nombre in list(vars(parser)):
+        if nombre.startswith(RULE_PREFIX) or nombre in extras:
+            delattr(parser, nombre)
+
+class RuleProfiler:
+    """Perfilador de reglas gramaticales con salida en formato folded-stack"""
+
+    def __init__(self, clock: Callable[[], int] = time.perf_counter_ns):
+        self.clock = clock
+        self.calls: Counter = Counter()
+        self.inclusive_ns: Counter = Counter()
+        self.exclusive_ns: Counter = Counter()
+        self.match_calls: Counter = Counter()
+        self.peek_calls: Counter = Counter()
+        self.choices: Counter = Counter()  # (regla, terminal de lookahead)
+        # Árbol de pilas: (nodo padre, regla) -> nodo; tiempo propio por nodo
+        self._nodes: Dict[Tuple[int, str], int] = {}
+        self._node_info: List[Tuple[int, str]] = [(-1, 'parse')]
+        self._node_ns: Counter = Counter()
+
+    def attach(self, parser: ParserMini0) -> ParserMini0:
+        """Instala la instrumentación sobre la instancia del parser"""
+        clock = self.clock
+        calls = self.calls
+        inclusive = self.inclusive_ns
+        exclusive = self.exclusive_ns
+        choices = self.choices
+        nodes = self._nodes
+        node_info = self._node_info
+        node_ns = self._node_ns
+        tokens = parser.tokens
+        # Pila de marcos activos: [nodo, tiempo de hijos]
+        stack: List[list] = [[0, 0]]
+        active: Counter = Counter()
+
+        def make_wrapper(regla: str, metodo: Callable) -> Callable:
+            def wrapper(*args):
+                marco_padre = stack[-1]
+                clave = (marco_padre[0], regla)
+                nodo = nodes.get(clave)
+                if nodo is None:
+                    nodo = len(node_info)
+                    nodes[clave] = nodo
+                    node_info.append(clave)
+                calls[regla] += 1
+                choices[(regla, tokens[parser.pos].type.name)] += 1
+                marco = [nodo, 0]
+                stack.append(marco)
+                active[regla] += 1
+                inicio = clock()
+                try:
+                    return metodo(*args)
+                finally:
+                    transcurrido = clock() - inicio
+                    stack.pop()
+                    active[regla] -= 1
+                    propio = transcurrido - marco[1]
+                    exclusive[regla] += propio
+                    node_ns[nodo] += propio
+                    marco_padre[1] += transcurrido
+                    # En recursión solo cuenta la activación más externa
+                    if not active[regla]:
+                        inclusive[regla] += transcurrido
+            wrapper.__wrapped__ = metodo
+            return wrapper
+
+        wrap_rules(parser, make_wrapper)
+
+        match = parser.match
+        peek_token = parser.peek_token
+        match_calls = self.match_calls
+        peek_calls = self.peek_calls
+
+        def counted_match(*token_types):
+            match_calls[node_info[stack[-1][0]][1]] += 1
+            return match(*token_types)
+
+        def counted_peek(offset: int = 1):
+            peek_calls[node_info[stack[-1][0]][1]] += 1
+            return peek_token(offset)
+
+        parser.match = counted_match
+        parser.peek_token = counted_peek
+        return parser
+
+    def detach(self, parser: ParserMini0):
+        """Restaura la instancia del parser a su estado sin instrumentar"""
+        unwrap_rules(parser, extras=('match', 'peek_token'))
+
+    def folded_stacks(self) -> Iterator[Tuple[str, int]]:
+        """Genera pares ('regla;regla;...', tiempo propio en µs)"""
+        for nodo, ns in self._node_ns.items():
+            marcos = []
+            actual = nodo
+            while actual > 0:
+                padre, regla = self._node_info[actual]
+                marcos.append(regla)
+                actual = padre
+            yield ';'.join(reversed(marcos)), ns // 1000
+
+    def write_folded(self, filename: str) -> str:
+        """Escribe el archivo folded-stack (compatible con flamegraph.pl/speedscope)"""
+        with open(filename, 'w', encoding='utf-8') as f:
+            for pila, microsegundos in sorted(self.folded_stacks()):
+                if microsegundos > 0:
+                    f.write(f"{pila} {microsegundos}\n")
+        return filename
+
+    def report(self, top: int = 20) -> str:
+        """Tabla de reglas ordenadas por tiempo propio"""
+        lineas = [f"{'Regla':<20}{'Llamadas':>10}{'Acum. (ms)':>12}{'Propio (ms)':>13}"
+                  f"{'match()':>10}{'peek()':>9}"]
+        lineas.append("-" * 74)
+        for regla, propio in self.exclusive_ns.most_common(top):
+            lineas.append(f"{regla:<20}{self.calls[regla]:>10}"
+                          f"{self.inclusive_ns[regla] / 1e6:>12.3f}{propio / 1e6:>13.3f}"
+                          f"{self.match_calls[regla]:>10}{self.peek_calls[regla]:>9}")
+        lineas.append("-" * 74)
+        lineas.append(f"Total match(): {sum(self.match_calls.values())}, "
+                      f"peek_token(): {sum(self.peek_calls.values())}")
+        lineas.append("\nElecciones más frecuentes (regla, lookahead):")
+        for (regla, terminal), veces in self.choices.most_common(10):
+            lineas.append(f"  {regla:<20} {terminal:<12} {veces}")
+        return "\n".join(lineas)
+
+def main():
+    """Perfila las reglas del parser sobre uno o más archivos Mini-0"""
+    if len(sys.argv) < 2:
+        print("Uso: python instrument_mini0.py <archivo.mini0> [...] [--folded salida.folded]")
+        return
+
+    argumentos = sys.argv[1:]
+    destino = 'mini0.folded'
+    if '--folded' in argumentos:
+        indice = argumentos.index('--folded')
+        destino = argumentos[indice + 1]
+        del argumentos[indice:indice + 2]
+
+    profiler = RuleProfiler()
+    for archivo in argumentos:
+        with open(archivo, 'r', encoding='utf-8') as f:
+            tokens, errores = Lexer(f.read()).tokenize()
+        if errores:
+            print(f"Se omite {archivo}: {errores[0]}")
+            continue
+        parser = profiler.attach(ParserMini0(tokens))
+        if not parser.parse():
+            print(f"Análisis incompleto en {archivo}: {parser.errors[0]}")
+
+    print(profiler.report())
+    print(f"\n✓ Pilas folded escritas en: {profiler.write_folded(destino)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Intérprete ingenuo de Mini-0 que recorre el árbol
+Evalúa el AST directamente: despacha por tipo de nodo en cada visita y
+busca las variables por nombre en una cadena de diccionarios. Sirve como
+línea base para comparar los motores de bytecode y de closures (por eso
+concatena strings con el '+' de str, sin Ropes); las expresiones se
+evalúan recursivamente, así que cadenas muy largas de operadores pueden
+exceder el límite de recursión de Python.
+"""
+
+from typing import Dict, List
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ast_mini0 import ASTArena, NodeKind, NONE, numeral_value
+from src.semantic_mini0 import SemanticChecker
+from src.runtime_mini0 import (
+    CompileError, Mini0RuntimeError, ENTRY_POINT, default_value, int_div,
+    load_program, new_array, runtime_error,
+)
+from src.strings_mini0 import char_at, flatten_value
+
+class _Return(Exception):
+    """Señal de 'return' que atraviesa los bloques anidados"""
+    def __init__(self, value):
+        self.value = value
+
+class TreeInterpreter:
+    """Evalúa el AST verificado nodo por nodo"""
+
+    def __init__(self, arena: ASTArena, checker: SemanticChecker):
+        self.arena = arena
+        self.types = checker.types
+        self.functions: Dict[str, int] = {}
+        self.globals: Dict[str, object] = {}
+        for decl in arena.children(arena.root):
+            if arena.kind[decl] == NodeKind.FUNC:
+                self.functions[arena.text(decl)] = decl
+            else:
+                self.globals[arena.text(decl)] = default_value(self.type_of(arena.first_child[decl]))
+        self.statements = {
+            NodeKind.VARDECL: self.exec_vardecl,
+            NodeKind.ASSIGN: self.exec_assign,
+            NodeKind.CALL: self.eval_call,
+            NodeKind.IF: self.exec_if,
+            NodeKind.WHILE: self.exec_while,
+            NodeKind.RETURN: self.exec_return,
+        }
+        self.expressions = {
+            NodeKind.NUM: lambda nodo, env: numeral_value(self.arena.text(nodo)),
+            NodeKind.STR: lambda nodo, env: self.arena.text(nodo),
+            NodeKind.BOOL: lambda nodo, env: self.arena.text(nodo) == 'true',
+            NodeKind.VAR: self.eval_var,
+            NodeKind.BINOP: self.eval_binop,
+            NodeKind.UNOP: self.eval_unop,
+            NodeKind.INDEX: self.eval_index,
+            NodeKind.NEW: self.eval_new,
+            NodeKind.CALL: self.eval_call,
+        }
+
+    def type_of(self, nodo: int) -> str:
+        kind = self.arena.kind[nodo]
+        if kind == NodeKind.VOID:
+            return 'void'
+        if kind == NodeKind.ARRAY_TYPE:
+            return '[]' + self.type_of(self.arena.first_child[nodo])
+        return self.arena.text(nodo)
+
+    def run(self, nombre: str = ENTRY_POINT, args=()):
+        if nombre not in self.functions:
+            raise CompileError([f"El programa no define la función '{nombre}'"])
+        try:
+            return flatten_value(self.call_function(self.functions[nombre], list(args)))
+        except RecursionError as e:
+            raise runtime_error(e, 0) from None
+
+    def call_function(self, nodo: int, argumentos: list):
+        arena = self.arena
+        params, retorno, bloque = arena.children(nodo)
+        env: List[Dict[str, object]] = [dict(zip((arena.text(p) for p in arena.children(params)),
+                                                 argumentos))]
+        try:
+            self.exec_block(bloque, env)
+        except _Return as r:
+            return r.value
+        tipo = self.type_of(retorno)
+        return None if tipo == 'void' else default_value(tipo)
+
+    # ========== Entornos ==========
+
+    def lookup_scope(self, nombre: str, env: List[Dict[str, object]]) -> Dict[str, object]:
+        for ambito in reversed(env):
+            if nombre in ambito:
+                return ambito
+        return self.globals
+
+    # ========== Comandos ==========
+
+    def exec_block(self, nodo: int, env: List[Dict[str, object]]):
+        env.append({})
+        try:
+            for hijo in self.arena.children(nodo):
+                self.statements[self.arena.kind[hijo]](hijo, env)
+        finally:
+            env.pop()
+
+    def exec_vardecl(self, nodo: int, env):
+        env[-1][self.arena.text(nodo)] = default_value(self.type_of(self.arena.first_child[nodo]))
+
+    def exec_assign(self, nodo: int, env):
+        arena = self.arena
+        destino, valor = arena.children(nodo)
+        if arena.kind[destino] == NodeKind.VAR:
+            nombre = arena.text(destino)
+            self.lookup_scope(nombre, env)[nombre] = self.eval(valor, env)
+            return
+        base, indice = arena.children(destino)
+        arreglo = self.eval(base, env)
+        i = self.eval(indice, env)
+        try:
+            if i < 0:
+                raise IndexError(i)
+            arreglo[i] = self.eval(valor, env)
+        except (IndexError, TypeError, ValueError) as e:
+            raise runtime_error(e, arena.line(nodo)) from None
+
+    def exec_if(self, nodo: int, env):
+        hijos = list(self.arena.children(nodo))
+        for i in range(0, len(hijos) - 1, 2):
+            if self.eval(hijos[i], env):
+                self.exec_block(hijos[i + 1], env)
+                return
+        if len(hijos) % 2:
+            self.exec_block(hijos[-1], env)
+
+    def exec_while(self, nodo: int, env):
+        condicion, cuerpo = self.arena.children(nodo)
+        while self.eval(condicion, env):
+            self.exec_block(cuerpo, env)
+
+    def exec_return(self, nodo: int, env):
+        valor = self.arena.first_child[nodo]
+        raise _Return(self.eval(valor, env) if valor != NONE else None)
+
+    # ========== Expresiones ==========
+
+    def eval(self, nodo: int, env):
+        return self.expressions[self.arena.kind[nodo]](nodo, env)
+
+    def eval_var(self, nodo: int, env):
+        nombre = self.arena.text(nodo)
+        return self.lookup_scope(nombre, env)[nombre]
+
+    def eval_binop(self, nodo: int, env):
+        arena = self.arena
+        operador = arena.text(nodo)
+        izquierda, derecha = arena.children(nodo)
+        a = self.eval(izquierda, env)
+        if operador == 'and':
+            return a and self.eval(derecha, env)
+        if operador == 'or':
+            return a or self.eval(derecha, env)
+        b = self.eval(derecha, env)
+        if operador == '+':
+            return a + b
+        if operador == '-':
+            return a - b
+        if operador == '*':
+            return a * b
+        if operador == '/':
+            if b == 0:
+                raise Mini0RuntimeError("división por cero", arena.line(nodo))
+            return int_div(a, b)
+        if operador == '<':
+            return a < b
+        if operador == '<=':
+            return a <= b
+        if operador == '>':
+            return a > b
+        if operador == '>=':
+            return a >= b
+        arreglos = self.types.get(izquierda, '').startswith('[]')
+        if operador == '=':
+            return a is b if arreglos else a == b
+        return a is not b if arreglos else a != b
+
+    def eval_unop(self, nodo: int, env):
+        valor = self.eval(self.arena.first_child[nodo], env)
+        return not valor if self.arena.text(nodo) == 'not' else -valor
+
+    def eval_index(self, nodo: int, env):
+        base, indice = self.arena.children(nodo)
+        arreglo = self.eval(base, env)
+        i = self.eval(indice, env)
+        try:
+            if self.types.get(base) == 'string':
+                return char_at(arreglo, i)
+            if i < 0:
+                raise IndexError(i)
+            return arreglo[i]
+        except (IndexError, TypeError) as e:
+            raise runtime_error(e, self.arena.line(nodo)) from None
+
+    def eval_new(self, nodo: int, env):
+        tamano = self.arena.first_child[nodo]
+        elemento = self.type_of(self.arena.next_sibling[tamano])
+        try:
+            return new_array(self.eval(tamano, env), elemento)
+        except (ValueError, OverflowError, MemoryError) as e:
+            raise runtime_error(e, self.arena.line(nodo)) from None
+
+    def eval_call(self, nodo: int, env):
+        argumentos = [self.eval(hijo, env) for hijo in self.arena.children(nodo)]
+        return self.call_function(self.functions[self.arena.text(nodo)], argumentos)
+
+def interpret_source(codigo: str, nombre: str = ENTRY_POINT):
+    """Analiza y ejecuta código Mini-0 con el intérprete de árbol"""
+    arena, checker = load_program(codigo)
+    return TreeInterpreter(arena, checker).run(nombre)
@@ -1,11 +1,21 @@
 """
 Analizador Léxico para Mini-0 (Especificación Oficial)
 Convierte el código fuente en una secuencia de tokens según la especificación de Mini-0
+
+Los comentarios no son tokens del lenguaje y se descartan. Con trivia=True
+el lexer los conserva en un canal aparte (tokens COMMENT): tokenize() los
+deja en Lexer.trivia y scan() los entrega intercalados con los demás
+tokens, en el orden del fuente, para herramientas como el formateador.
+
+Todo el estado de un análisis vive en la instancia de Lexer; lo que se
+comparte entre instancias (KEYWORDS, TokenType) es de solo lectura, así que
+varios hilos pueden analizar archivos distintos a la vez.
 """
 
 import re
 from enum import Enum, auto
-from typing import List, Optional, Tuple
+from types import MappingProxyType
+from typing import Iterator, List, Optional, Tuple
 
 class TokenType(Enum):
     """Tipos de tokens del lenguaje Mini-0"""
@@ -67,6 +77,9 @@ class TokenType(Enum):
     # Fin de archivo
     EOF = auto()
 
+    # Comentario (solo en el canal de trivia, nunca llega al parser)
+    COMMENT = auto()
+
 class Token:
     """Representa un token con su tipo, valor y posición"""
     def __init__(self, token_type: TokenType, value: str, line: int, column: int):
@@ -86,8 +99,8 @@ class Token:
 class Lexer:
     """Analizador léxico para Mini-0"""
     
-    # Palabras reservadas
-    KEYWORDS = {
+    # Palabras reservadas (de solo lectura: se comparte entre hilos)
+    KEYWORDS = MappingProxyType({
         'if': TokenType.IF,
         'else': TokenType.ELSE,
         'end': TokenType.END,
@@ -105,9 +118,9 @@ class Lexer:
         'and': TokenType.AND,
         'or': TokenType.OR,
         'not': TokenType.NOT,
-    }
+    })
     
-    def __init__(self, source_code: str):
+    def __init__(self, source_code: str, trivia: bool = False):
         self.source = source_code
         self.pos = 0
         self.line = 1
@@ -115,6 +128,9 @@ class Lexer:
         self.tokens: List[Token] = []
         self.errors: List[str] = []
         self.last_was_newline = False  # Para manejar múltiples NL consecutivos
+        # Canal de trivia: comentarios conservados (solo si trivia=True)
+        self.keep_trivia = trivia
+        self.trivia: List[Token] = []
     
     def error(self, message: str):
         """Registra un error léxico"""
@@ -270,7 +286,21 @@ class Lexer:
         return Token(token_type, id_str, start_line, start_column)
     
     def tokenize(self) -> Tuple[List[Token], List[str]]:
-        """Convierte el código fuente en una lista de tokens"""
+        """Convierte el código fuente en una lista de tokens (y los
+        comentarios en self.trivia si trivia=True)"""
+        if not self.keep_trivia:
+            self.tokens.extend(self.scan())
+            return self.tokens, self.errors
+        for token in self.scan():
+            if token.type == TokenType.COMMENT:
+                self.trivia.append(token)
+            else:
+                self.tokens.append(token)
+        return self.tokens, self.errors
+
+    def scan(self) -> Iterator[Token]:
+        """Genera los tokens a medida que los reconoce (los errores quedan en
+        self.errors); con trivia=True también genera los comentarios"""
         while self.pos < len(self.source):
             # Saltar espacios en blanco (excepto newline)
             self.skip_whitespace_except_newline()
@@ -278,20 +308,23 @@ class Lexer:
             if self.pos >= len(self.source):
                 break
             
-            # Saltar comentarios
+            # Saltar comentarios (o entregarlos en el canal de trivia)
+            inicio = self.pos
+            start_line = self.line
+            start_column = self.column
             if self.skip_comment():
+                if self.keep_trivia:
+                    yield Token(TokenType.COMMENT, self.source[inicio:self.pos], start_line, start_column)
                 continue
             
             char = self.current_char()
-            start_line = self.line
-            start_column = self.column
             
             # Saltos de línea (significativos en Mini-0)
             if char == '\n':
                 self.advance()
                 # Solo agregar un token NL si el anterior no fue NL
                 if not self.last_was_newline:
-                    self.tokens.append(Token(TokenType.NL, '\\n', start_line, start_column))
+                    yield Token(TokenType.NL, '\\n', start_line, start_column)
                     self.last_was_newline = True
                 continue
             else:
@@ -299,36 +332,36 @@ class Lexer:
             
             # Strings
             if char == '"':
-                self.tokens.append(self.read_string())
+                yield self.read_string()
                 continue
             
             # Números
             if char.isdigit():
-                self.tokens.append(self.read_number())
+                yield self.read_number()
                 continue
             
             # Identificadores y palabras reservadas
             if char.isalpha() or char == '_':
-                self.tokens.append(self.read_identifier())
+                yield self.read_identifier()
                 continue
             
             # Operadores de dos caracteres
             if char == '>' and self.peek_char() == '=':
                 self.advance()
                 self.advance()
-                self.tokens.append(Token(TokenType.GTE, '>=', start_line, start_column))
+                yield Token(TokenType.GTE, '>=', start_line, start_column)
                 continue
             
             if char == '<' and self.peek_char() == '=':
                 self.advance()
                 self.advance()
-                self.tokens.append(Token(TokenType.LTE, '<=', start_line, start_column))
+                yield Token(TokenType.LTE, '<=', start_line, start_column)
                 continue
             
             if char == '<' and self.peek_char() == '>':
                 self.advance()
                 self.advance()
-                self.tokens.append(Token(TokenType.NEQ, '<>', start_line, start_column))
+                yield Token(TokenType.NEQ, '<>', start_line, start_column)
                 continue
             
             # Operadores de un carácter
@@ -351,7 +384,7 @@ class Lexer:
             if char in single_char_tokens:
                 token_type = single_char_tokens[char]
                 self.advance()
-                self.tokens.append(Token(token_type, char, start_line, start_column))
+                yield Token(token_type, char, start_line, start_column)
                 continue
             
             # Carácter no reconocido
@@ -359,9 +392,7 @@ class Lexer:
             self.advance()
         
         # Agregar token EOF
-        self.tokens.append(Token(TokenType.EOF, '', self.line, self.column))
-        
-        return self.tokens, self.errors
+        yield Token(TokenType.EOF, '', self.line, self.column)
 
 def main():
     """Función de prueba del lexer"""
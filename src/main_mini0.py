@@ -1,14 +1,100 @@
 """
 Programa principal para el parser Mini-0
-Ejecuta el análisis léxico y sintáctico de programas Mini-0
+Ejecuta el análisis léxico y sintáctico de programas Mini-0 y, a pedido,
+el análisis semántico y la ejecución en la máquina virtual
 """
 
+import argparse
+import json
 import sys
 import os
 from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.lexer_mini0 import Lexer
 from src.parser_mini0 import ParserMini0
+from src.ast_mini0 import ParserASTMini0
+from src.semantic_mini0 import SemanticChecker
+from src.optimizer_mini0 import optimize
+from src.bytecode_mini0 import BytecodeCompiler
+from src.vm_mini0 import VM, add_limit_arguments, limits_from_args
+from src.closures_mini0 import ClosureCompiler
+from src.interpreter_mini0 import TreeInterpreter
+from src.transpiler_mini0 import PythonTranspiler
+from src.ssa_python_mini0 import compile_ssa
+from src.native_mini0 import compile_native
+from src.vectorize_mini0 import compile_vectorized
+from src.runtime_mini0 import CompileError, Mini0RuntimeError, runtime_error
+from src.stats_mini0 import PhaseStats
+
+# Motor de ejecución -> fábrica (arena, checker) de un objeto con run()
+ENGINES = {
+    'vm': lambda arena, checker: VM(BytecodeCompiler(arena, checker).compile()),
+    'closures': lambda arena, checker: ClosureCompiler(arena, checker).compile(),
+    'arbol': TreeInterpreter,
+    'python': lambda arena, checker: PythonTranspiler(arena, checker).compile(),
+    'ssa': compile_ssa,
+    'c': compile_native,
+    'numpy': compile_vectorized,
+}
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Define los argumentos de línea de comandos"""
+    arg_parser = argparse.ArgumentParser(
+        description="Analizador léxico y sintáctico para programas Mini-0",
+        epilog="Ejemplo: python main_mini0.py tests/mini0/programa1_simple.mini0")
+    arg_parser.add_argument('archivo', help="archivo .mini0 a analizar")
+    arg_parser.add_argument('-v', '--verbose', action='store_true',
+                            help="muestra los primeros tokens generados")
+    arg_parser.add_argument('--debug', action='store_true',
+                            help="muestra la traza completa de excepciones internas")
+    arg_parser.add_argument('--stats', action='store_true',
+                            help="reporta tiempo de pared/CPU, rendimiento y memoria pico por fase")
+    arg_parser.add_argument('--json', action='store_true',
+                            help="con --stats, imprime solo un registro JSON en stdout")
+    arg_parser.add_argument('--ast', action='store_true',
+                            help="construye el AST (arena compacto) y reporta nodos y bytes por nodo")
+    arg_parser.add_argument('--semantic', action='store_true',
+                            help="verifica declaraciones y tipos (implica --ast)")
+    arg_parser.add_argument('-O', '--optimize', action='store_true',
+                            help="pliega constantes y elimina código muerto (implica --semantic)")
+    arg_parser.add_argument('--run', action='store_true',
+                            help="ejecuta main() (implica --semantic)")
+    arg_parser.add_argument('--engine', choices=sorted(ENGINES), default='vm',
+                            help="motor de ejecución para --run (por defecto vm)")
+    add_limit_arguments(arg_parser)
+    arg_parser.add_argument('--profile', nargs='?', const='mini0.pstats', metavar='ARCHIVO',
+                            help="guarda un perfil cProfile/pstats (por defecto mini0.pstats)")
+    return arg_parser
+
+def read_source(archivo: str) -> str:
+    """Lee el código fuente de un archivo Mini-0"""
+    with open(archivo, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def measure_memory(archivo: str, stats: PhaseStats, parser_class=ParserMini0):
+    """Repite las fases bajo tracemalloc para medir la memoria pico de cada una"""
+    with stats.memory('lectura'):
+        codigo = read_source(archivo)
+    with stats.memory('lexico'):
+        tokens, errores_lexicos = Lexer(codigo).tokenize()
+    if errores_lexicos:
+        return
+    with stats.memory('sintactico'):
+        parser_class(tokens).parse()
+
+def profile_phases(archivo: str, destino: str, parser_class=ParserMini0):
+    """Ejecuta lectura, análisis léxico y sintáctico bajo cProfile"""
+    import cProfile
+    perfil = cProfile.Profile()
+    perfil.enable()
+    try:
+        codigo = read_source(archivo)
+        tokens, errores_lexicos = Lexer(codigo).tokenize()
+        if not errores_lexicos:
+            parser_class(tokens).parse()
+    finally:
+        perfil.disable()
+    perfil.dump_stats(destino)
 
 def main():
     """Función principal"""
@@ -16,71 +102,147 @@ def main():
         print("Uso: python main_mini0.py <archivo.mini0>", file=sys.stderr)
         print("\nEjemplo: python main_mini0.py tests/mini0/programa1_simple.mini0")
         sys.exit(1)
-    
-    archivo = sys.argv[1]
-    
+
+    arg_parser = build_arg_parser()
+    args = arg_parser.parse_args()
+    archivo = args.archivo
+    limites = limits_from_args(args)
+    if limites is not None and args.engine != 'vm':
+        arg_parser.error("los límites de ejecución (--max-*) solo se aplican con --engine vm")
+    # En modo JSON la salida estándar queda reservada para el registro
+    mostrar = print if not (args.stats and args.json) else (lambda *a, **k: None)
+
     # Verificar que el archivo existe
     if not Path(archivo).exists():
         print(f"Error: El archivo '{archivo}' no existe", file=sys.stderr)
         sys.exit(1)
-    
+
+    stats = PhaseStats(archivo)
+    args.semantic = args.semantic or args.run or args.optimize
+    parser_class = ParserASTMini0 if args.ast or args.semantic else ParserMini0
+
+    def terminar(codigo_salida: int):
+        """Emite estadísticas y perfil (si se pidieron) y sale"""
+        stats.exito = codigo_salida == 0
+        if args.stats:
+            measure_memory(archivo, stats, parser_class)
+            if args.json:
+                print(json.dumps(stats.to_dict(), ensure_ascii=False))
+            else:
+                print("\n[Estadísticas]")
+                print(stats.report())
+        if args.profile:
+            profile_phases(archivo, args.profile, parser_class)
+            mostrar(f"\nPerfil guardado en: {args.profile}")
+        sys.exit(codigo_salida)
+
     # Leer el código fuente
     try:
-        with open(archivo, 'r', encoding='utf-8') as f:
-            codigo = f.read()
+        with stats.phase('lectura'):
+            codigo = read_source(archivo)
     except Exception as e:
         print(f"Error al leer el archivo: {e}", file=sys.stderr)
         sys.exit(1)
-    
-    print(f"Analizando archivo: {archivo}")
-    print("=" * 60)
-    
+    stats.bytes = len(codigo.encode('utf-8'))
+
+    mostrar(f"Analizando archivo: {archivo}")
+    mostrar("=" * 60)
+
     # Análisis léxico
-    print("\n[1] Análisis Léxico...")
-    lexer = Lexer(codigo)
-    tokens, errores_lexicos = lexer.tokenize()
-    
+    mostrar("\n[1] Análisis Léxico...")
+    with stats.phase('lexico'):
+        lexer = Lexer(codigo)
+        tokens, errores_lexicos = lexer.tokenize()
+    stats.tokens = len(tokens)
+
     if errores_lexicos:
-        print("\n❌ Errores léxicos encontrados:")
+        mostrar("\n❌ Errores léxicos encontrados:")
         for error in errores_lexicos:
             print(f"  {error}", file=sys.stderr)
-        sys.exit(1)
-    
-    print(f"✓ Análisis léxico completado: {len(tokens)} tokens generados")
-    
+        terminar(1)
+
+    mostrar(f"✓ Análisis léxico completado: {len(tokens)} tokens generados")
+
     # Mostrar tokens si se solicita modo verbose
-    if '--verbose' in sys.argv or '-v' in sys.argv:
-        print("\nTokens generados:")
+    if args.verbose:
+        mostrar("\nTokens generados:")
         for i, token in enumerate(tokens[:20]):  # Mostrar primeros 20
-            print(f"  {i+1}. {token}")
+            mostrar(f"  {i+1}. {token}")
         if len(tokens) > 20:
-            print(f"  ... y {len(tokens) - 20} tokens más")
-    
+            mostrar(f"  ... y {len(tokens) - 20} tokens más")
+
     # Análisis sintáctico
-    print("\n[2] Análisis Sintáctico...")
-    parser = ParserMini0(tokens)
-    
+    mostrar("\n[2] Análisis Sintáctico...")
+    parser = parser_class(tokens)
+
     try:
-        exito = parser.parse()
-        
+        with stats.phase('sintactico'):
+            exito = parser.parse()
+
         if exito and not parser.errors:
-            print("\n✓ Análisis sintáctico completado exitosamente")
-            print("\n" + "=" * 60)
-            print("✅ El programa es sintácticamente correcto")
-            print("=" * 60)
-            sys.exit(0)
+            mostrar("\n✓ Análisis sintáctico completado exitosamente")
+            if args.ast:
+                arena = parser.arena
+                stats.nodos = len(arena)
+                stats.bytes_por_nodo = arena.nbytes / max(1, len(arena))
+                mostrar(f"✓ AST construido: {len(arena)} nodos, "
+                        f"{arena.bytes_per_node} bytes/nodo ({arena.nbytes} bytes en el arena)")
+            if args.semantic:
+                mostrar("\n[3] Análisis Semántico...")
+                checker = SemanticChecker(parser.arena)
+                with stats.phase('semantico'):
+                    correcto = checker.check()
+                if not correcto:
+                    mostrar("\n❌ Errores semánticos encontrados:")
+                    for error in checker.errors:
+                        print(f"  {error}", file=sys.stderr)
+                    terminar(1)
+                mostrar("✓ Análisis semántico completado exitosamente")
+            if args.optimize:
+                with stats.phase('optimizacion'):
+                    optimizador = optimize(parser.arena, checker)
+                mostrar(f"✓ Optimización: {optimizador.summary()}")
+            if args.run:
+                mostrar("\n[4] Ejecución...")
+                try:
+                    with stats.phase('compilacion'):
+                        if limites is not None:
+                            motor = VM(BytecodeCompiler(parser.arena, checker).compile(), limites)
+                        else:
+                            motor = ENGINES[args.engine](parser.arena, checker)
+                except CompileError as e:
+                    print(f"\n❌ {e}", file=sys.stderr)
+                    for detalle in e.errors[1:]:
+                        print(f"  {detalle}", file=sys.stderr)
+                    terminar(1)
+                try:
+                    with stats.phase('ejecucion'):
+                        valor = motor.run()
+                except Mini0RuntimeError as e:
+                    print(f"\n❌ {e}", file=sys.stderr)
+                    terminar(1)
+                except (OverflowError, MemoryError) as e:
+                    # Fuera del código que los motores traducen (sin número de línea)
+                    print(f"\n❌ {runtime_error(e, 0)}", file=sys.stderr)
+                    terminar(1)
+                detalle = f" ({motor.instructions:,} instrucciones)" if args.engine == 'vm' else ''
+                mostrar(f"✓ main() retornó: {valor}{detalle}")
+            mostrar("\n" + "=" * 60)
+            mostrar("✅ El programa es sintácticamente correcto")
+            mostrar("=" * 60)
+            terminar(0)
         else:
-            print("\n❌ Errores sintácticos encontrados:")
+            mostrar("\n❌ Errores sintácticos encontrados:")
             for error in parser.errors:
                 print(f"  {error}", file=sys.stderr)
-            sys.exit(1)
-    
+            terminar(1)
+
     except Exception as e:
         print(f"\n❌ Error durante el análisis sintáctico: {e}", file=sys.stderr)
-        if '--debug' in sys.argv:
+        if args.debug:
             import traceback
             traceback.print_exc()
-        sys.exit(1)
+        terminar(1)
 
 if __name__ == "__main__":
     main()
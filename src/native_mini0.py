@@ -0,0 +1,707 @@
+"""
+Backend nativo de Mini-0: genera C y lo compila con el compilador del sistema
+Cada función del AST verificado se traduce a una función C; int y char son
+int64_t, bool es int, string es un puntero a un literal y los arreglos son
+búferes en el heap con la longitud al principio (m0_array). El fuente C se
+compila con 'cc' (o $CC) como biblioteca compartida que se carga con ctypes,
+y la biblioteca queda en el caché de disco indexada por el hash del fuente
+C generado, así que volver a correr el mismo programa no invoca al
+compilador.
+
+Las expresiones se bajan a temporales en el orden de evaluación de los demás
+motores (C no fija el orden de los operandos), y los errores de ejecución
+(división por cero, índice fuera de rango, arreglo no inicializado, tamaño
+negativo, recursión demasiado profunda) salen por longjmp con su línea
+Mini-0. Como int tiene 64 bits, los desbordamientos también son un error de
+ejecución en lugar de un resultado distinto al de los motores en Python.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import ctypes
+import hashlib
+import shutil
+import subprocess
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ast_mini0 import ASTArena, NodeKind, NONE, numeral_value
+from src.semantic_mini0 import SemanticChecker
+from src.runtime_mini0 import CompileError, ENTRY_POINT, Mini0RuntimeError, load_program
+from src.files_mini0 import DEFAULT_CACHE_DIR
+
+# Cambia cuando cambia el código generado; invalida las bibliotecas del caché
+NATIVE_VERSION = 3
+
+CFLAGS = ['-std=c99', '-O2', '-shared', '-fPIC']
+
+# Profundidad máxima de llamadas antes de informar 'recursión demasiado profunda'
+MAX_CALL_DEPTH = 10000
+
+INT64_MAX = 2 ** 63 - 1
+
+# Tipo Mini-0 -> tipo C de variables y temporales, y de los elementos de un arreglo
+C_TYPES = {'int': 'int64_t', 'char': 'int64_t', 'bool': 'int', 'string': 'const char *'}
+ELEMENT_TYPES = {'int': 'int64_t', 'char': 'uint8_t', 'bool': 'uint8_t', 'string': 'const char *'}
+C_DEFAULTS = {'int': '0', 'char': '0', 'bool': '0', 'string': '""'}
+
+# Tipos que cruzan la frontera con Python (parámetros y retorno de las entradas)
+SCALAR_TYPES = frozenset(('int', 'char', 'bool'))
+
+# Código de error de m0_fail -> mensaje (el mismo que dan los motores en Python)
+ERROR_MESSAGES = {
+    1: "división por cero",
+    2: "índice fuera de rango",
+    3: "arreglo no inicializado",
+    4: "tamaño de arreglo negativo: {valor}",
+    5: "recursión demasiado profunda",
+    6: "desbordamiento de entero (int de 64 bits)",
+    7: "memoria insuficiente",
+    8: "tamaño de arreglo demasiado grande",
+}
+
+C_BINARY = {'=': '==', '<>': '!=', '<': '<', '<=': '<=', '>': '>', '>=': '>='}
+C_ARITHMETIC = {'+': 'm0_add', '-': 'm0_sub', '*': 'm0_mul', '/': 'm0_div'}
+
+RUNTIME_C = r"""#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include <setjmp.h>
+
+#if defined(_WIN32)
+#define M0_EXPORT __declspec(dllexport)
+#else
+#define M0_EXPORT
+#endif
+
+#if defined(__GNUC__)
+#define M0_NORETURN __attribute__((noreturn))
+#define M0_UNLIKELY(x) __builtin_expect(!!(x), 0)
+#else
+#define M0_NORETURN
+#define M0_UNLIKELY(x) (x)
+#endif
+
+#if defined(__clang__) || (defined(__GNUC__) && __GNUC__ >= 5)
+#define M0_BUILTIN_OVERFLOW 1
+#endif
+
+enum { M0_DIV = 1, M0_INDEX, M0_NULL, M0_SIZE, M0_DEPTH, M0_OVERFLOW, M0_MEMORY, M0_TOO_BIG };
+
+/* Arreglo: longitud, enlace a la lista de liberación y elementos */
+typedef struct m0_array {
+    int64_t len;
+    struct m0_array *next;
+    int64_t data[];
+} m0_array;
+
+static jmp_buf m0_exit;
+static int m0_line;
+static int64_t m0_value;
+static int m0_depth;
+static m0_array *m0_arrays;
+
+static M0_NORETURN void m0_fail(int code, int line, int64_t value) {
+    m0_line = line;
+    m0_value = value;
+    longjmp(m0_exit, code);
+}
+
+static inline int64_t m0_add(int64_t a, int64_t b, int line) {
+    int64_t r;
+#ifdef M0_BUILTIN_OVERFLOW
+    if (M0_UNLIKELY(__builtin_add_overflow(a, b, &r))) m0_fail(M0_OVERFLOW, line, 0);
+#else
+    if ((b > 0 && a > INT64_MAX - b) || (b < 0 && a < INT64_MIN - b)) m0_fail(M0_OVERFLOW, line, 0);
+    r = a + b;
+#endif
+    return r;
+}
+
+static inline int64_t m0_sub(int64_t a, int64_t b, int line) {
+    int64_t r;
+#ifdef M0_BUILTIN_OVERFLOW
+    if (M0_UNLIKELY(__builtin_sub_overflow(a, b, &r))) m0_fail(M0_OVERFLOW, line, 0);
+#else
+    if ((b < 0 && a > INT64_MAX + b) || (b > 0 && a < INT64_MIN + b)) m0_fail(M0_OVERFLOW, line, 0);
+    r = a - b;
+#endif
+    return r;
+}
+
+static inline int64_t m0_mul(int64_t a, int64_t b, int line) {
+    int64_t r;
+#ifdef M0_BUILTIN_OVERFLOW
+    if (M0_UNLIKELY(__builtin_mul_overflow(a, b, &r))) m0_fail(M0_OVERFLOW, line, 0);
+#else
+    if (a > 0 ? (b > 0 ? a > INT64_MAX / b : b < INT64_MIN / a)
+              : (b > 0 ? a < INT64_MIN / b : (a != 0 && b < INT64_MAX / a)))
+        m0_fail(M0_OVERFLOW, line, 0);
+    r = a * b;
+#endif
+    return r;
+}
+
+/* La división de C99 trunca hacia cero, como la de Mini-0 */
+static inline int64_t m0_div(int64_t a, int64_t b, int line) {
+    if (M0_UNLIKELY(b == 0)) m0_fail(M0_DIV, line, 0);
+    if (M0_UNLIKELY(b == -1 && a == INT64_MIN)) m0_fail(M0_OVERFLOW, line, 0);
+    return a / b;
+}
+
+static inline int64_t m0_neg(int64_t a, int line) {
+    if (M0_UNLIKELY(a == INT64_MIN)) m0_fail(M0_OVERFLOW, line, 0);
+    return -a;
+}
+
+static m0_array *m0_new(int64_t n, size_t size, int line) {
+    m0_array *a;
+    if (n < 0) m0_fail(M0_SIZE, line, n);
+    /* Como runtime_mini0.new_array: más bytes que INT64_MAX no es un tamaño válido */
+    if ((uint64_t)n > (INT64_MAX - sizeof(m0_array)) / size) m0_fail(M0_TOO_BIG, line, 0);
+    a = calloc(1, sizeof(m0_array) + (size_t)n * size);
+    if (a == NULL) m0_fail(M0_MEMORY, line, 0);
+    a->len = n;
+    a->next = m0_arrays;
+    m0_arrays = a;
+    return a;
+}
+
+static m0_array *m0_new_strings(int64_t n, int line) {
+    m0_array *a = m0_new(n, sizeof(const char *), line);
+    const char **datos = (const char **)a->data;
+    int64_t i;
+    for (i = 0; i < n; i++) datos[i] = "";
+    return a;
+}
+
+/* Elementos del arreglo tras verificar que existe y que el índice es válido */
+static inline void *m0_data(m0_array *a, int64_t i, int line) {
+    if (M0_UNLIKELY(a == NULL)) m0_fail(M0_NULL, line, 0);
+    if (M0_UNLIKELY((uint64_t)i >= (uint64_t)a->len)) m0_fail(M0_INDEX, line, i);
+    return a->data;
+}
+
+#define M0_AT(T, a, i, line) (((T *)m0_data((a), (i), (line)))[(i)])
+
+#define M0_ENTER(line) \
+    do { if (M0_UNLIKELY(++m0_depth > M0_MAX_DEPTH)) m0_fail(M0_DEPTH, (line), 0); } while (0)
+
+static void m0_release(void) {
+    while (m0_arrays != NULL) {
+        m0_array *siguiente = m0_arrays->next;
+        free(m0_arrays);
+        m0_arrays = siguiente;
+    }
+    m0_depth = 0;
+}
+
+M0_EXPORT int64_t m0_error_line(void) { return m0_line; }
+M0_EXPORT int64_t m0_error_value(void) { return m0_value; }
+
+/* Libera los arreglos de una entrada que retornó un arreglo, ya copiado a Python */
+M0_EXPORT void m0_free(void) { m0_release(); }
+"""
+
+def c_string(texto: str) -> str:
+    """Literal C con escapes octales para todo lo que no sea ASCII imprimible"""
+    partes = []
+    for byte in texto.encode('utf-8'):
+        caracter = chr(byte)
+        if 32 <= byte < 127 and caracter not in '"\\?':
+            partes.append(caracter)
+        else:
+            partes.append(f"\\{byte:03o}")
+    return '"' + ''.join(partes) + '"'
+
+class _M0Array(ctypes.Structure):
+    """Cabecera de m0_array (para ubicar sus elementos)"""
+    _fields_ = [('len', ctypes.c_int64), ('next', ctypes.c_void_p), ('data', ctypes.c_int64 * 0)]
+
+def read_array(direccion: Optional[int], tipo: str):
+    """Copia a Python el m0_array de la dirección dada ('tipo' es el del arreglo):
+    listas como las que da flatten_value en los demás motores"""
+    if not direccion:
+        return None
+    largo = _M0Array.from_address(direccion).len
+    datos = direccion + _M0Array.data.offset
+    elemento = tipo[2:]
+    if elemento.startswith('[]'):
+        return [read_array(p, elemento) for p in (ctypes.c_void_p * largo).from_address(datos)]
+    if elemento == 'string':
+        return [s.decode('utf-8') for s in (ctypes.c_char_p * largo).from_address(datos)]
+    if elemento == 'int':
+        return list((ctypes.c_int64 * largo).from_address(datos))
+    bytes_ = ctypes.string_at(datos, largo)
+    return [bool(b) for b in bytes_] if elemento == 'bool' else list(bytes_)
+
+class NativeProgram:
+    """Biblioteca compartida cargada con ctypes y las firmas de sus entradas"""
+
+    def __init__(self, ruta: str, signatures: Dict[str, Tuple[List[str], str]]):
+        self.path = ruta
+        self.signatures = signatures
+        self.library = ctypes.CDLL(ruta)
+        self.library.m0_error_line.restype = ctypes.c_int64
+        self.library.m0_error_value.restype = ctypes.c_int64
+        self.library.m0_free.restype = None
+
+    def run(self, nombre: str = ENTRY_POINT, args=()):
+        """Ejecuta la función 'nombre' con los globales recién inicializados"""
+        firma = self.signatures.get(nombre)
+        if firma is None:
+            raise CompileError([f"El programa no define la función '{nombre}' "
+                                f"o el backend C no puede llamarla desde Python"])
+        parametros, retorno = firma
+        entrada = getattr(self.library, f"m0_entry_{nombre}")
+        argumentos = (ctypes.c_int64 * max(len(args), 1))(*[int(a) for a in args])
+        entero = ctypes.c_int64()
+        cadena = ctypes.c_char_p()
+        arreglo = ctypes.c_void_p()
+        codigo = entrada(argumentos, ctypes.byref(entero), ctypes.byref(cadena), ctypes.byref(arreglo))
+        if retorno.startswith('[]') and not codigo:
+            # La entrada no libera los arreglos hasta que se copien
+            try:
+                return read_array(arreglo.value, retorno)
+            finally:
+                self.library.m0_free()
+        if codigo:
+            mensaje = ERROR_MESSAGES[codigo].format(valor=self.library.m0_error_value())
+            raise Mini0RuntimeError(mensaje, self.library.m0_error_line())
+        if retorno == 'void':
+            return None
+        if retorno == 'bool':
+            return bool(entero.value)
+        if retorno == 'string':
+            return cadena.value.decode('utf-8')
+        return entero.value
+
+class CGenerator:
+    """Genera el fuente C de un programa Mini-0 verificado"""
+
+    def __init__(self, arena: ASTArena, checker: SemanticChecker):
+        self.arena = arena
+        self.types = checker.types
+        self.signatures_by_node = checker.signatures
+        self.globals: Dict[str, str] = {}
+        self.scopes: List[Dict[str, str]] = []
+        self.declared: Dict[str, int] = {}
+        self.output: List[str] = []
+        self.indent = 0
+        self.temps = 0
+        # Funciones que se pueden llamar desde Python: nombre -> (parámetros, retorno)
+        self.signatures: Dict[str, Tuple[List[str], str]] = {}
+
+    def generate(self) -> str:
+        arena = self.arena
+        funciones = [d for d in arena.children(arena.root) if arena.kind[d] == NodeKind.FUNC]
+        globales = [d for d in arena.children(arena.root) if arena.kind[d] != NodeKind.FUNC]
+        self.output = [RUNTIME_C, f"#define M0_MAX_DEPTH {MAX_CALL_DEPTH}", ""]
+        reinicio = []
+        for decl in globales:
+            nombre = arena.text(decl)
+            tipo = self.type_of(arena.first_child[decl])
+            self.globals[nombre] = 'g_' + nombre
+            self.output.append(f"static {self.c_type(tipo)} g_{nombre};")
+            reinicio.append(f"    g_{nombre} = {self.default(tipo)};")
+        self.output.append("")
+        self.output.append("static void m0_reset(void) {")
+        self.output.extend(reinicio)
+        self.output.append("    m0_depth = 0;")
+        self.output.append("}")
+        self.output.append("")
+        for decl in funciones:
+            self.output.append(self.prototype(decl) + ';')
+        for decl in funciones:
+            self.output.append("")
+            self.generate_function(decl)
+        for decl in funciones:
+            self.generate_entry(decl)
+        return '\n'.join(self.output) + '\n'
+
+    # ========== Tipos y nombres ==========
+
+    def type_of(self, nodo: int) -> str:
+        kind = self.arena.kind[nodo]
+        if kind == NodeKind.VOID:
+            return 'void'
+        if kind == NodeKind.ARRAY_TYPE:
+            return '[]' + self.type_of(self.arena.first_child[nodo])
+        return self.arena.text(nodo)
+
+    @staticmethod
+    def c_type(tipo: str) -> str:
+        if tipo == 'void':
+            return 'void'
+        return 'm0_array *' if tipo.startswith('[]') else C_TYPES[tipo]
+
+    @staticmethod
+    def default(tipo: str) -> str:
+        return 'NULL' if tipo.startswith('[]') else C_DEFAULTS[tipo]
+
+    def declare(self, nombre: str) -> str:
+        veces = self.declared.get(nombre, 0) + 1
+        self.declared[nombre] = veces
+        identificador = f"v_{nombre}" if veces == 1 else f"v{veces}_{nombre}"
+        self.scopes[-1][nombre] = identificador
+        return identificador
+
+    def resolve(self, nombre: str) -> str:
+        for ambito in reversed(self.scopes):
+            if nombre in ambito:
+                return ambito[nombre]
+        return self.globals[nombre]
+
+    def emit(self, linea: str):
+        self.output.append('    ' * self.indent + linea)
+
+    def temp(self, tipo: str, valor: str) -> str:
+        """Temporal con el valor ya evaluado (fija el orden de evaluación)"""
+        self.temps += 1
+        nombre = f"t{self.temps}"
+        self.emit(f"{self.c_type(tipo)} {nombre} = {valor};")
+        return nombre
+
+    # ========== Funciones ==========
+
+    def prototype(self, nodo: int) -> str:
+        arena = self.arena
+        params, retorno, _ = arena.children(nodo)
+        parametros = [f"{self.c_type(self.type_of(arena.first_child[p]))} p_{arena.text(p)}"
+                      for p in arena.children(params)]
+        return (f"static {self.c_type(self.type_of(retorno))} f_{arena.text(nodo)}"
+                f"({', '.join(parametros) or 'void'})")
+
+    def generate_function(self, nodo: int):
+        arena = self.arena
+        params, retorno, bloque = arena.children(nodo)
+        linea = arena.line(nodo)
+        self.scopes = [{}]
+        self.declared = {}
+        self.temps = 0
+        self.return_type = self.type_of(retorno)
+        self.output.append(self.prototype(nodo) + " {")
+        self.indent = 1
+        for p in arena.children(params):
+            tipo = self.c_type(self.type_of(arena.first_child[p]))
+            self.emit(f"{tipo} {self.declare(arena.text(p))} = p_{arena.text(p)};")
+        self.generate_block(bloque, new_scope=False)
+        if self.return_type != 'void':
+            self.emit(f"return {self.default(self.return_type)};")
+        self.indent = 0
+        self.output.append("}")
+
+    def generate_entry(self, nodo: int):
+        """m0_entry_<nombre>: reinicia los globales, llama y atrapa los errores"""
+        arena = self.arena
+        firma = self.signatures_by_node[nodo]
+        parametros = list(firma.param_types)
+        retorno = firma.return_type
+        if not all(p in SCALAR_TYPES for p in parametros) or \
+                not (retorno in SCALAR_TYPES or retorno in ('void', 'string') or retorno.startswith('[]')):
+            return
+        nombre = arena.text(nodo)
+        self.signatures[nombre] = (parametros, retorno)
+        llamada = f"f_{nombre}({', '.join(f'args[{i}]' for i in range(len(parametros)))})"
+        liberar = ["    m0_release();"]
+        if retorno == 'string':
+            llamada = f"*cadena = {llamada}"
+        elif retorno.startswith('[]'):
+            # Sin error, los arreglos viven hasta que Python los copie y llame a m0_free
+            llamada = f"*arreglo = {llamada}"
+            liberar = ["    if (codigo != 0)", "        m0_release();"]
+        elif retorno != 'void':
+            llamada = f"*entero = {llamada}"
+        self.output.extend([
+            "",
+            f"M0_EXPORT int m0_entry_{nombre}(const int64_t *args, int64_t *entero, const char **cadena, "
+            f"m0_array **arreglo) {{",
+            "    int codigo;",
+            "    (void)args; (void)entero; (void)cadena; (void)arreglo;",
+            "    m0_reset();",
+            "    codigo = setjmp(m0_exit);",
+            "    if (codigo == 0)",
+            f"        {llamada};",
+            *liberar,
+            "    return codigo;",
+            "}",
+        ])
+
+    # ========== Comandos ==========
+
+    def generate_block(self, nodo: int, new_scope: bool = True):
+        if new_scope:
+            self.scopes.append({})
+        for hijo in self.arena.children(nodo):
+            self.generate_statement(hijo)
+        if new_scope:
+            self.scopes.pop()
+
+    def nested(self, generar) -> Tuple[List[str], str]:
+        """Líneas que emite generar(), quitadas de la salida"""
+        inicio = len(self.output)
+        resultado = generar()
+        lineas = self.output[inicio:]
+        del self.output[inicio:]
+        return lineas, resultado
+
+    def generate_statement(self, nodo: int):
+        arena = self.arena
+        kind = arena.kind[nodo]
+        linea = arena.line(nodo)
+        if kind == NodeKind.VARDECL:
+            tipo = self.type_of(arena.first_child[nodo])
+            self.emit(f"{self.c_type(tipo)} {self.declare(arena.text(nodo))} = {self.default(tipo)};")
+        elif kind == NodeKind.ASSIGN:
+            destino, valor_nodo = arena.children(nodo)
+            if arena.kind[destino] == NodeKind.VAR:
+                valor = self.expr(valor_nodo)
+                self.emit(f"{self.resolve(arena.text(destino))} = {valor};")
+            else:
+                base_nodo, indice_nodo = arena.children(destino)
+                base = self.expr(base_nodo)
+                indice = self.expr(indice_nodo)
+                valor = self.expr(valor_nodo)
+                elemento = self.element_type(self.types[destino])
+                self.emit(f"M0_AT({elemento}, {base}, {indice}, {linea}) = {valor};")
+        elif kind == NodeKind.CALL:
+            self.call(nodo, como_comando=True)
+        elif kind == NodeKind.IF:
+            self.generate_if(list(arena.children(nodo)))
+        elif kind == NodeKind.WHILE:
+            condicion_nodo, cuerpo = arena.children(nodo)
+            previas, condicion = self.nested(lambda: self.expr(condicion_nodo))
+            if previas:
+                self.emit("for (;;) {")
+                self.output.extend('    ' + l for l in previas)
+                self.emit(f"    if (!{condicion}) break;")
+            else:
+                self.emit(f"while ({condicion}) {{")
+            self.indent += 1
+            self.generate_block(cuerpo)
+            self.indent -= 1
+            self.emit("}")
+        else:  # RETURN
+            valor_nodo = arena.first_child[nodo]
+            valor = self.expr(valor_nodo) if valor_nodo != NONE else None
+            self.emit(f"return {valor};" if valor is not None else "return;")
+
+    def generate_if(self, hijos: List[int]):
+        self.emit(f"if ({self.expr(hijos[0])}) {{")
+        self.generate_branch(hijos[1])
+        self.generate_if_tail(hijos[2:])
+
+    def generate_branch(self, bloque: int):
+        self.indent += 1
+        self.generate_block(bloque)
+        self.indent -= 1
+
+    def generate_if_tail(self, resto: List[int]):
+        """Cierra la rama anterior y sigue con los 'else if' / 'else' que quedan"""
+        if not resto:
+            self.emit("}")
+            return
+        if len(resto) == 1:
+            self.emit("} else {")
+            self.generate_branch(resto[0])
+            self.emit("}")
+            return
+        previas, condicion = self.nested(lambda: self.expr(resto[0]))
+        if not previas:
+            self.emit(f"}} else if ({condicion}) {{")
+            self.generate_branch(resto[1])
+            self.generate_if_tail(resto[2:])
+            return
+        # La condición necesita comandos previos: el resto de la cadena va dentro del else
+        self.emit("} else {")
+        self.output.extend('    ' + l for l in previas)
+        self.indent += 1
+        self.emit(f"if ({condicion}) {{")
+        self.generate_branch(resto[1])
+        self.generate_if_tail(resto[2:])
+        self.indent -= 1
+        self.emit("}")
+
+    # ========== Expresiones ==========
+
+    @staticmethod
+    def element_type(tipo: str) -> str:
+        return 'm0_array *' if tipo.startswith('[]') else ELEMENT_TYPES[tipo]
+
+    def expr(self, nodo: int) -> str:
+        """Texto C sin efectos ni errores posibles (literal, variable local o temporal)"""
+        arena = self.arena
+        kind = arena.kind[nodo]
+        linea = arena.line(nodo)
+        if kind == NodeKind.NUM:
+            valor = numeral_value(arena.text(nodo))
+            if valor > INT64_MAX:
+                raise CompileError([f"Error en línea {linea}: el literal {arena.text(nodo)} "
+                                    f"no cabe en un int de 64 bits"])
+            return f"INT64_C({valor})"
+        if kind == NodeKind.STR:
+            if '\0' in arena.text(nodo):
+                raise CompileError([f"Error en línea {linea}: cadena con carácter nulo"])
+            return c_string(arena.text(nodo))
+        if kind == NodeKind.BOOL:
+            return '1' if arena.text(nodo) == 'true' else '0'
+        tipo = self.types[nodo]
+        if kind == NodeKind.VAR:
+            identificador = self.resolve(arena.text(nodo))
+            if identificador.startswith('g_'):
+                # Una llamada posterior de la misma expresión puede cambiar el global
+                return self.temp(tipo, identificador)
+            return identificador
+        if kind == NodeKind.BINOP:
+            return self.binary(nodo, tipo)
+        if kind == NodeKind.UNOP:
+            operando = self.expr(arena.first_child[nodo])
+            if arena.text(nodo) == 'not':
+                return f"(!{operando})"
+            return self.temp(tipo, f"m0_neg({operando}, {linea})")
+        if kind == NodeKind.INDEX:
+            base_nodo, indice_nodo = arena.children(nodo)
+            if self.types.get(base_nodo) == 'string':
+                raise CompileError([f"Error en línea {linea}: el backend C no indexa strings "
+                                    f"(solo usa literales); use otro motor"])
+            base = self.expr(base_nodo)
+            indice = self.expr(indice_nodo)
+            return self.temp(tipo, f"M0_AT({self.element_type(tipo)}, {base}, {indice}, {linea})")
+        if kind == NodeKind.NEW:
+            tamano_nodo = arena.first_child[nodo]
+            tamano = self.expr(tamano_nodo)
+            elemento = self.type_of(arena.next_sibling[tamano_nodo])
+            if elemento == 'string':
+                return self.temp(tipo, f"m0_new_strings({tamano}, {linea})")
+            return self.temp(tipo, f"m0_new({tamano}, sizeof({self.element_type(elemento)}), {linea})")
+        return self.call(nodo)
+
+    def call(self, nodo: int, como_comando: bool = False) -> Optional[str]:
+        arena = self.arena
+        argumentos = ', '.join(self.expr(hijo) for hijo in arena.children(nodo))
+        llamada = f"f_{arena.text(nodo)}({argumentos})"
+        tipo = self.types.get(nodo, 'void')
+        # La profundidad se cuenta en el llamador: el error lleva la línea de la llamada
+        self.emit(f"M0_ENTER({arena.line(nodo)});")
+        if como_comando or tipo == 'void':
+            self.emit(llamada + ';')
+            resultado = None
+        else:
+            resultado = self.temp(tipo, llamada)
+        self.emit("m0_depth--;")
+        return resultado
+
+    def binary(self, nodo: int, tipo: str) -> str:
+        arena = self.arena
+        operador = arena.text(nodo)
+        izquierda_nodo, derecha_nodo = arena.children(nodo)
+        linea = arena.line(nodo)
+        izquierda = self.expr(izquierda_nodo)
+        if operador in ('and', 'or'):
+            previas, derecha = self.nested(lambda: self.expr(derecha_nodo))
+            if not previas:
+                return f"({izquierda} {'&&' if operador == 'and' else '||'} {derecha})"
+            # El operando derecho solo se evalúa si hace falta
+            resultado = self.temp('bool', izquierda)
+            self.emit(f"if ({resultado if operador == 'and' else '!' + resultado}) {{")
+            self.output.extend('    ' + l for l in previas)
+            self.emit(f"    {resultado} = {derecha};")
+            self.emit("}")
+            return resultado
+        if tipo == 'string':
+            raise CompileError([f"Error en línea {linea}: el backend C no concatena strings "
+                                f"(solo usa literales); use otro motor"])
+        derecha = self.expr(derecha_nodo)
+        if operador in C_ARITHMETIC:
+            return self.temp(tipo, f"{C_ARITHMETIC[operador]}({izquierda}, {derecha}, {linea})")
+        if self.types.get(izquierda_nodo) == 'string':
+            return f"(strcmp({izquierda}, {derecha}) {C_BINARY[operador]} 0)"
+        return f"({izquierda} {C_BINARY[operador]} {derecha})"
+
+def find_compiler() -> Optional[str]:
+    """Compilador de C: $CC, o cc/gcc/clang del PATH"""
+    return os.environ.get('CC') or shutil.which('cc') or shutil.which('gcc') or shutil.which('clang')
+
+def library_key(fuente_c: str, compilador: str) -> str:
+    """Clave de caché: fuente C generado, compilador, opciones y versión del backend"""
+    h = hashlib.sha256()
+    h.update(f"{NATIVE_VERSION}\0{compilador}\0{' '.join(CFLAGS)}\0".encode('utf-8'))
+    h.update(fuente_c.encode('utf-8'))
+    return h.hexdigest()
+
+def build_library(fuente_c: str, cache_dir: str = DEFAULT_CACHE_DIR,
+                  rebuild: bool = False) -> Tuple[str, bool]:
+    """Ruta de la biblioteca compilada (del caché si ya existe); retorna (ruta, acierto)"""
+    compilador = find_compiler()
+    if compilador is None:
+        raise CompileError(["No se encontró un compilador de C (cc, gcc o clang; o $CC)"])
+    clave = library_key(fuente_c, compilador)
+    ruta = os.path.join(cache_dir, clave + '.so')
+    if not rebuild and os.path.exists(ruta):
+        return ruta, True
+    os.makedirs(cache_dir, exist_ok=True)
+    # Fuente y biblioteca en temporales por proceso: otro proceso que compile el
+    # mismo programa (los del pool del servidor) no pisa el archivo que lee cc
+    fuente_temporal = os.path.join(cache_dir, f"{clave}.{os.getpid()}.c")
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(fuente_temporal, 'w', encoding='utf-8') as f:
+        f.write(fuente_c)
+    try:
+        try:
+            proceso = subprocess.run([compilador, *CFLAGS, '-o', temporal, fuente_temporal],
+                                     capture_output=True, text=True)
+        except OSError as e:
+            raise CompileError([f"No se pudo ejecutar el compilador de C: {e}"]) from None
+        if proceso.returncode != 0:
+            raise CompileError([f"El compilador de C falló ({compilador}):"]
+                               + proceso.stderr.strip().splitlines()[:20])
+        os.replace(temporal, ruta)
+        # El fuente queda junto a la biblioteca para inspeccionarlo
+        os.replace(fuente_temporal, os.path.join(cache_dir, clave + '.c'))
+    finally:
+        for sobrante in (fuente_temporal, temporal):
+            if os.path.exists(sobrante):
+                os.remove(sobrante)
+    return ruta, False
+
+def compile_native(arena: ASTArena, checker: SemanticChecker,
+                   cache_dir: str = DEFAULT_CACHE_DIR) -> NativeProgram:
+    """Genera el C, lo compila (o lo toma del caché) y carga la biblioteca"""
+    generador = CGenerator(arena, checker)
+    ruta, _ = build_library(generador.generate(), cache_dir)
+    return NativeProgram(ruta, generador.signatures)
+
+def main():
+    import argparse
+    import time
+    arg_parser = argparse.ArgumentParser(description="Compila un programa Mini-0 a C nativo y lo ejecuta")
+    arg_parser.add_argument('archivo', help="archivo .mini0")
+    arg_parser.add_argument('--show', action='store_true', help="imprime el código C generado")
+    arg_parser.add_argument('--rebuild', action='store_true', help="recompila aunque esté en el caché")
+    arg_parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                            help=f"directorio del caché (por defecto {DEFAULT_CACHE_DIR})")
+    args = arg_parser.parse_args()
+
+    with open(args.archivo, 'r', encoding='utf-8') as f:
+        codigo = f.read()
+    try:
+        generador = CGenerator(*load_program(codigo))
+        fuente_c = generador.generate()
+        if args.show:
+            print(fuente_c)
+            return
+        inicio = time.perf_counter()
+        ruta, acierto = build_library(fuente_c, args.cache_dir, args.rebuild)
+        programa = NativeProgram(ruta, generador.signatures)
+        preparacion = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        valor = programa.run()
+        ejecucion = time.perf_counter() - inicio
+    except (CompileError, Mini0RuntimeError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    origen = 'caché' if acierto else 'compilado'
+    print(f"main() retornó: {valor}")
+    print(f"Preparación: {preparacion * 1000:.2f} ms ({origen}), ejecución: {ejecucion * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
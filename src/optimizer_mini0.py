@@ -0,0 +1,283 @@
+"""
+Optimizador del AST de Mini-0
+Pasadas sobre el arena ya verificado, antes de ejecutar o generar código:
+  - plegado de constantes (aritmética entera, comparaciones, not, - unario
+    y and/or con operando izquierdo constante), incluidos numerales hex, y
+    concatenación de literales de string
+  - eliminación de ramas 'if'/'else if' con condición constante y de
+    ciclos 'while false'
+  - eliminación de comandos inalcanzables después de un 'return' (o de un
+    'if' cuyas ramas, incluido el else, retornan todas)
+
+El arena se modifica en el lugar: un nodo plegado pasa a ser NUM/BOOL/STR con
+un token sintético agregado al final de arena.tokens, así que los índices
+de nodo y los tipos calculados por el SemanticChecker siguen valiendo.
+"""
+
+from typing import List, Optional
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.lexer_mini0 import Token, TokenType
+from src.ast_mini0 import ASTArena, NodeKind, NONE, numeral_value
+from src.semantic_mini0 import SemanticChecker
+from src.runtime_mini0 import int_div, load_program
+
+# Operadores que se pliegan directamente sobre los valores de Python
+FOLD_OPERATORS = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+    '*': lambda a, b: a * b,
+    '<': lambda a, b: a < b,
+    '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b,
+    '>=': lambda a, b: a >= b,
+    '=': lambda a, b: a == b,
+    '<>': lambda a, b: a != b,
+}
+
+CONSTANT_KINDS = (NodeKind.NUM, NodeKind.BOOL, NodeKind.STR)
+
+class ASTOptimizer:
+    """Aplica las pasadas al arena verificado y cuenta lo que eliminó"""
+
+    def __init__(self, arena: ASTArena, checker: SemanticChecker):
+        self.arena = arena
+        self.types = checker.types
+        self.folded = 0
+        self.pruned = 0
+        self.unreachable = 0
+        self.nodes_before = 0
+        self.nodes_after = 0
+
+    @property
+    def removed(self) -> int:
+        return self.nodes_before - self.nodes_after
+
+    def optimize(self) -> int:
+        """Optimiza todas las funciones; retorna la cantidad de nodos eliminados"""
+        arena = self.arena
+        self.nodes_before = self.count_nodes()
+        for decl in arena.children(arena.root):
+            if arena.kind[decl] == NodeKind.FUNC:
+                params, retorno, bloque = arena.children(decl)
+                self.optimize_block(bloque)
+        self.nodes_after = self.count_nodes()
+        return self.removed
+
+    def count_nodes(self) -> int:
+        """Nodos alcanzables desde la raíz (recorrido iterativo)"""
+        arena = self.arena
+        total = 0
+        pila = [arena.root]
+        while pila:
+            nodo = pila.pop()
+            total += 1
+            pila.extend(arena.children(nodo))
+        return total
+
+    def summary(self) -> str:
+        return (f"{self.removed} nodos eliminados ({self.nodes_before} → {self.nodes_after}): "
+                f"{self.folded} plegados, {self.pruned} ramas/ciclos muertos, "
+                f"{self.unreachable} comandos inalcanzables")
+
+    # ========== Arena ==========
+
+    def relink(self, padre: int, hijos: List[int]):
+        """Reemplaza la lista de hijos de un nodo"""
+        arena = self.arena
+        arena.first_child[padre] = hijos[0] if hijos else NONE
+        for actual, siguiente in zip(hijos, hijos[1:]):
+            arena.next_sibling[actual] = siguiente
+        if hijos:
+            arena.next_sibling[hijos[-1]] = NONE
+
+    def constant(self, nodo: int):
+        """Valor de un literal, o None si el nodo no es constante"""
+        arena = self.arena
+        kind = arena.kind[nodo]
+        if kind == NodeKind.NUM:
+            return numeral_value(arena.text(nodo))
+        if kind == NodeKind.BOOL:
+            return arena.text(nodo) == 'true'
+        if kind == NodeKind.STR:
+            return arena.text(nodo)
+        return None
+
+    def make_constant(self, nodo: int, valor):
+        """Convierte el nodo en un literal con un token sintético"""
+        arena = self.arena
+        if isinstance(valor, bool):
+            kind, tipo, texto = NodeKind.BOOL, (TokenType.TRUE if valor else TokenType.FALSE), \
+                ('true' if valor else 'false')
+        elif isinstance(valor, str):
+            kind, tipo, texto = NodeKind.STR, TokenType.LITSTRING, valor
+        else:
+            kind, tipo, texto = NodeKind.NUM, TokenType.LITNUMERAL, str(valor)
+        original = arena.tokens[arena.token[nodo]]
+        arena.tokens.append(Token(tipo, texto, original.line, original.column))
+        arena.kind[nodo] = kind
+        arena.token[nodo] = len(arena.tokens) - 1
+        arena.first_child[nodo] = NONE
+        self.folded += 1
+
+    def replace_with(self, nodo: int, otro: int):
+        """El nodo pasa a ser una copia de 'otro' (conserva su lugar entre hermanos)"""
+        arena = self.arena
+        arena.kind[nodo] = arena.kind[otro]
+        arena.token[nodo] = arena.token[otro]
+        arena.first_child[nodo] = arena.first_child[otro]
+        self.folded += 1
+
+    # ========== Plegado de constantes ==========
+
+    def fold(self, raiz: int):
+        """Pliega las subexpresiones constantes en postorden (iterativo)"""
+        arena = self.arena
+        pila = [(raiz, False)]
+        while pila:
+            nodo, visitado = pila.pop()
+            kind = arena.kind[nodo]
+            if not visitado:
+                if kind not in CONSTANT_KINDS and kind != NodeKind.VAR:
+                    pila.append((nodo, True))
+                    pila.extend((hijo, False) for hijo in arena.children(nodo))
+                continue
+            if kind == NodeKind.BINOP:
+                self.fold_binary(nodo)
+            elif kind == NodeKind.UNOP:
+                valor = self.constant(arena.first_child[nodo])
+                if valor is not None:
+                    self.make_constant(nodo, not valor if arena.text(nodo) == 'not' else -valor)
+
+    def fold_binary(self, nodo: int):
+        arena = self.arena
+        operador = arena.text(nodo)
+        izquierda, derecha = arena.children(nodo)
+        a = self.constant(izquierda)
+        if operador in ('and', 'or'):
+            # Solo importa el operando izquierdo: el derecho puede tener efectos
+            if a is not None:
+                if a == (operador == 'and'):
+                    self.replace_with(nodo, derecha)
+                else:
+                    self.make_constant(nodo, a)
+            return
+        b = self.constant(derecha)
+        if a is None or b is None:
+            return
+        if operador == '/':
+            if b != 0:  # la división por cero queda para el error de ejecución
+                self.make_constant(nodo, int_div(a, b))
+        elif isinstance(a, str) and operador not in ('=', '<>', '+'):
+            return
+        else:
+            self.make_constant(nodo, FOLD_OPERATORS[operador](a, b))
+
+    # ========== Comandos ==========
+
+    def optimize_block(self, bloque: int) -> bool:
+        """Optimiza los comandos del bloque; True si el bloque siempre retorna"""
+        arena = self.arena
+        comandos: List[int] = []
+        retorna = False
+        for comando in list(arena.children(bloque)):
+            if retorna:
+                self.unreachable += 1
+                continue
+            kind = arena.kind[comando]
+            if kind == NodeKind.IF:
+                reemplazo, retorna = self.optimize_if(comando)
+                comandos.extend(reemplazo)
+                continue
+            if kind == NodeKind.WHILE:
+                condicion, cuerpo = arena.children(comando)
+                self.fold(condicion)
+                if self.constant(condicion) is False:
+                    self.pruned += 1
+                    continue
+                self.optimize_block(cuerpo)
+            elif kind == NodeKind.RETURN:
+                if arena.first_child[comando] != NONE:
+                    self.fold(arena.first_child[comando])
+                retorna = True
+            elif kind != NodeKind.VARDECL:  # ASSIGN, CALL
+                for hijo in arena.children(comando):
+                    self.fold(hijo)
+            comandos.append(comando)
+        self.relink(bloque, comandos)
+        return retorna
+
+    def optimize_if(self, nodo: int):
+        """Comandos que reemplazan al 'if' y si todos sus caminos retornan"""
+        arena = self.arena
+        hijos = list(arena.children(nodo))
+        ramas: List[int] = []
+        otro: Optional[int] = hijos[-1] if len(hijos) % 2 else None
+        condicion_verdadera = NONE
+        for i in range(0, len(hijos) - 1, 2):
+            condicion, bloque = hijos[i], hijos[i + 1]
+            self.fold(condicion)
+            valor = self.constant(condicion)
+            if valor is False:
+                self.pruned += 1
+                continue
+            if valor is True:
+                # Las ramas siguientes y el else nunca se ejecutan
+                restantes = (len(hijos) - i - 2) // 2 + (otro is not None)
+                self.pruned += restantes
+                otro, condicion_verdadera = bloque, condicion
+                break
+            ramas.extend((condicion, bloque))
+        retornan = [self.optimize_block(bloque) for bloque in ramas[1::2]]
+        siempre = otro is not None and self.optimize_block(otro) and all(retornan)
+        if ramas:
+            self.relink(nodo, ramas + ([otro] if otro is not None else []))
+            return [nodo], siempre
+        if otro is None:
+            self.pruned += 1
+            return [], False
+        comandos = list(arena.children(otro))
+        if all(arena.kind[c] != NodeKind.VARDECL for c in comandos):
+            # Sin declaraciones propias el bloque se puede insertar en el de afuera
+            return comandos, siempre
+        if condicion_verdadera == NONE:
+            condicion_verdadera = hijos[0]
+            self.make_constant(condicion_verdadera, True)
+            self.folded -= 1
+        self.relink(nodo, [condicion_verdadera, otro])
+        return [nodo], siempre
+
+def optimize(arena: ASTArena, checker: SemanticChecker) -> ASTOptimizer:
+    """Optimiza el arena en el lugar; retorna el optimizador con sus contadores"""
+    optimizador = ASTOptimizer(arena, checker)
+    optimizador.optimize()
+    return optimizador
+
+def optimize_source(codigo: str):
+    """Analiza, verifica y optimiza; retorna (arena, checker, optimizador)"""
+    arena, checker = load_program(codigo)
+    return arena, checker, optimize(arena, checker)
+
+def main():
+    import argparse
+    from src.runtime_mini0 import CompileError
+    arg_parser = argparse.ArgumentParser(description="Optimiza el AST de programas Mini-0")
+    arg_parser.add_argument('archivos', nargs='+', help="archivos .mini0")
+    arg_parser.add_argument('--dump', action='store_true', help="imprime el AST optimizado")
+    args = arg_parser.parse_args()
+
+    for archivo in args.archivos:
+        with open(archivo, 'r', encoding='utf-8') as f:
+            codigo = f.read()
+        try:
+            arena, _, optimizador = optimize_source(codigo)
+        except CompileError as e:
+            print(f"  (omitido) {archivo}: {e}")
+            continue
+        print(f"{archivo}: {optimizador.summary()}")
+        if args.dump:
+            print(arena.dump())
+
+if __name__ == "__main__":
+    main()
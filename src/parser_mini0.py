@@ -1,6 +1,10 @@
 """
 Parser Recursivo Descendente para Mini-0
 Implementa análisis sintáctico LL(k) con lookahead para resolver conflictos
+
+El parser no tiene estado de clase ni de módulo: cada instancia guarda su
+posición y sus errores, y solo lee la lista de tokens. Instancias distintas
+se pueden usar en hilos distintos (una instancia, un hilo).
 """
 
 from typing import List, Optional
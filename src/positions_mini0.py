@@ -0,0 +1,186 @@
+"""
+Tabla de posiciones compacta para el código compilado de Mini-0
+Asocia cada ítem de un código compilado (instrucción de bytecode o línea de
+Python generada) con la línea y columna Mini-0 que lo originó, codificada
+con deltas como el co_linetable de CPython: ítems consecutivos con la
+misma posición forman una entrada, y cada entrada es un byte de cabecera
+(tipo y largo) seguido, solo si hace falta, de la diferencia de línea y la
+columna en varints. La mayoría de las entradas ocupan uno o dos bytes en
+lugar de dos enteros por ítem.
+
+La tabla no se decodifica al ejecutar: position_at() la recorre cuando un
+error necesita su línea, y decode() la expande entera para el perfilador o
+el desensamblador.
+"""
+
+from array import array
+from typing import Iterable, Iterator, Tuple
+
+# Tipo de entrada (3 bits altos de la cabecera); los 5 bits bajos son largo - 1
+SAME = 0        # misma posición que la entrada anterior
+NEXT_LINE = 1   # línea siguiente; sigue la columna
+COLUMN = 2      # misma línea; sigue la diferencia de columna (zigzag)
+LINE = 3        # siguen la diferencia de línea (zigzag) y la columna
+NO_POSITION = 4  # ítems sin posición (línea 0): no cambia la posición anterior
+
+# Ítems de una entrada como máximo
+MAX_RUN = 32
+
+def _write_varint(datos: bytearray, valor: int):
+    while valor >= 0x80:
+        datos.append((valor & 0x7F) | 0x80)
+        valor >>= 7
+    datos.append(valor)
+
+def _read_varint(datos: bytes, i: int) -> Tuple[int, int]:
+    """(valor, posición siguiente)"""
+    valor = 0
+    desplazamiento = 0
+    while True:
+        byte = datos[i]
+        i += 1
+        valor |= (byte & 0x7F) << desplazamiento
+        if byte < 0x80:
+            return valor, i
+        desplazamiento += 7
+
+def _zigzag(valor: int) -> int:
+    return valor * 2 if valor >= 0 else -valor * 2 - 1
+
+def _unzigzag(valor: int) -> int:
+    return valor >> 1 if not valor & 1 else -(valor >> 1) - 1
+
+class PositionTable:
+    """Posiciones (línea, columna) de 'count' ítems codificadas en 'data'"""
+
+    __slots__ = ('data', 'count')
+
+    def __init__(self, data: bytes = b'', count: int = 0):
+        self.data = data
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data)
+
+    def entries(self) -> Iterator[Tuple[int, int, int, int]]:
+        """(primer ítem, largo, línea, columna) de cada entrada"""
+        datos = self.data
+        fin = len(datos)
+        i = 0
+        indice = 0
+        linea = columna = 0
+        while i < fin:
+            cabecera = datos[i]
+            i += 1
+            tipo = cabecera >> 5
+            largo = (cabecera & 0x1F) + 1
+            if tipo == NO_POSITION:
+                yield indice, largo, 0, 0
+                indice += largo
+                continue
+            if tipo == NEXT_LINE:
+                linea += 1
+                columna, i = _read_varint(datos, i)
+            elif tipo == COLUMN:
+                delta, i = _read_varint(datos, i)
+                columna += _unzigzag(delta)
+            elif tipo == LINE:
+                delta, i = _read_varint(datos, i)
+                linea += _unzigzag(delta)
+                columna, i = _read_varint(datos, i)
+            yield indice, largo, linea, columna
+            indice += largo
+
+    def position_at(self, indice: int) -> Tuple[int, int]:
+        """(línea, columna) del ítem; (0, 0) si no tiene o está fuera de rango"""
+        if not 0 <= indice < self.count:
+            return 0, 0
+        for inicio, largo, linea, columna in self.entries():
+            if indice < inicio + largo:
+                return linea, columna
+        return 0, 0
+
+    def line_at(self, indice: int) -> int:
+        return self.position_at(indice)[0]
+
+    def decode(self) -> Tuple[array, array]:
+        """Línea y columna de cada ítem, en dos array('i')"""
+        lineas = array('i')
+        columnas = array('i')
+        agregar_linea = lineas.append
+        agregar_columna = columnas.append
+        for _, largo, linea, columna in self.entries():
+            if largo == 1:
+                agregar_linea(linea)
+                agregar_columna(columna)
+            else:
+                lineas.extend([linea] * largo)
+                columnas.extend([columna] * largo)
+        return lineas, columnas
+
+    def __reduce__(self):
+        return PositionTable, (self.data, self.count)
+
+class PositionTableBuilder:
+    """Agrega posiciones ítem por ítem y arma la PositionTable"""
+
+    __slots__ = ('data', 'count', 'run', 'line', 'column', 'last_line', 'last_column')
+
+    def __init__(self):
+        self.data = bytearray()
+        self.count = 0
+        # Entrada pendiente: 'run' ítems en (line, column)
+        self.run = 0
+        self.line = self.column = 0
+        # Última posición escrita (referencia de los deltas)
+        self.last_line = self.last_column = 0
+
+    def add(self, linea: int, columna: int = 0):
+        self.count += 1
+        if self.run and self.run < MAX_RUN and linea == self.line and columna == self.column:
+            self.run += 1
+            return
+        self.flush()
+        self.run = 1
+        self.line = linea
+        self.column = columna
+
+    def flush(self):
+        """Codifica la entrada pendiente"""
+        if not self.run:
+            return
+        datos = self.data
+        linea, columna = self.line, self.column
+        cabecera = self.run - 1
+        if linea == 0:
+            datos.append(NO_POSITION << 5 | cabecera)
+        elif linea == self.last_line and columna == self.last_column:
+            datos.append(SAME << 5 | cabecera)
+        elif linea == self.last_line:
+            datos.append(COLUMN << 5 | cabecera)
+            _write_varint(datos, _zigzag(columna - self.last_column))
+        elif linea == self.last_line + 1:
+            datos.append(NEXT_LINE << 5 | cabecera)
+            _write_varint(datos, columna)
+        else:
+            datos.append(LINE << 5 | cabecera)
+            _write_varint(datos, _zigzag(linea - self.last_line))
+            _write_varint(datos, columna)
+        if linea:
+            self.last_line, self.last_column = linea, columna
+        self.run = 0
+
+    def finish(self) -> PositionTable:
+        self.flush()
+        return PositionTable(bytes(self.data), self.count)
+
+def encode_lines(lineas: Iterable[int]) -> PositionTable:
+    """Tabla de una secuencia de líneas sin columna"""
+    constructor = PositionTableBuilder()
+    for linea in lineas:
+        constructor.add(linea)
+    return constructor.finish()
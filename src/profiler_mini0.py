@@ -0,0 +1,333 @@
+"""
+Perfilador de ejecución para programas Mini-0 sobre la máquina virtual
+Cuenta exactamente las llamadas (por par llamador -> llamado) y los saltos
+tomados de cada instrucción; el tiempo por función se mide por muestreo: un
+hilo anota cada 'interval' segundos la pila de llamadas Mini-0 que publica
+la VM. Las ejecuciones por línea salen de los conteos de saltos: dentro de
+un bloque básico todas las instrucciones se ejecutan las mismas veces, y las
+entradas a cada bloque son los saltos tomados hacia él más lo que cae desde
+el bloque anterior.
+
+ProfilingVM corre el mismo ciclo de despacho que la VM (con sus
+ExecutionLimits) y recibe cada llamada y retorno por los ganchos enter y
+leave de VM.execute; la VM normal paga solo una comparación por salto
+tomado, llamada y retorno. Con el perfilador activo el costo extra es un
+incremento por salto tomado y dos llamadas a métodos por llamada Mini-0.
+Salidas: tabla de funciones y líneas más calientes, archivo pstats (python
+-m pstats) y pilas folded (flamegraph.pl, speedscope).
+"""
+
+import marshal
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.bytecode_mini0 import (
+    Program, FunctionCode, compile_source,
+    JUMP, JUMP_IF_FALSE, JUMP_IF_FALSE_OR_POP, JUMP_IF_TRUE_OR_POP, RETURN,
+)
+from src.vm_mini0 import VM, add_limit_arguments, limits_from_args
+from src.runtime_mini0 import CompileError, ExecutionLimits, Mini0RuntimeError, ENTRY_POINT
+
+# Intervalo de muestreo por omisión (segundos)
+DEFAULT_INTERVAL = 0.001
+
+CONDITIONAL_JUMPS = (JUMP_IF_FALSE, JUMP_IF_FALSE_OR_POP, JUMP_IF_TRUE_OR_POP)
+
+class ProfilingVM(VM):
+    """VM que además cuenta llamadas y saltos tomados y publica su pila de llamadas
+
+    calls[llamador * n + llamado] cuenta las llamadas (llamador n: la entrada),
+    primitive_calls las que no son recursivas y jumps[f][pc] los saltos tomados
+    de la instrucción que termina en pc. call_stack tiene los índices de las
+    funciones activas; la lee el hilo de muestreo. Corre el ciclo de VM.execute,
+    así que respeta los mismos ExecutionLimits."""
+
+    profiling = True
+
+    def __init__(self, program: Program, limits: Optional[ExecutionLimits] = None):
+        super().__init__(program, limits)
+        n = len(program.functions)
+        self.calls = [0] * (n * (n + 1))
+        self.primitive_calls = [0] * (n * (n + 1))
+        self.jumps = [[0] * (len(f.code) + 2) for f in program.functions]
+        self.call_stack: List[int] = []
+        self.active = [0] * n
+
+    def run(self, nombre: str = ENTRY_POINT, args=()):
+        self.call_stack.clear()
+        self.active = [0] * len(self.program.functions)
+        return super().run(nombre, args)
+
+    def enter(self, llamador: Optional[FunctionCode], llamado: FunctionCode) -> List[int]:
+        """Cuenta la llamada (llamador None: la entrada) y retorna los saltos del llamado"""
+        n = len(self.program.functions)
+        arista = (llamador.index if llamador is not None else n) * n + llamado.index
+        self.calls[arista] += 1
+        if not self.active[llamado.index]:
+            self.primitive_calls[arista] += 1
+        self.active[llamado.index] += 1
+        self.call_stack.append(llamado.index)
+        return self.jumps[llamado.index]
+
+    def leave(self, funcion: FunctionCode, destino: Optional[FunctionCode]) -> Optional[List[int]]:
+        """Saca 'funcion' de la pila y retorna los saltos de 'destino' (None: fin)"""
+        self.active[funcion.index] -= 1
+        self.call_stack.pop()
+        return self.jumps[destino.index] if destino is not None else None
+
+def line_counts(funcion: FunctionCode, entradas: int, saltos: List[int]) -> Dict[int, List[int]]:
+    """Línea -> [ejecuciones, instrucciones] de una función, a partir de las veces
+    que se entró a ella y de los saltos tomados de cada instrucción
+
+    Una línea se ejecuta cada vez que se pasa a ella desde otra línea o con un
+    salto hacia atrás (el criterio de los eventos 'line' de Python). Si hubo un
+    error de ejecución, el bloque donde ocurrió se cuenta completo."""
+    code = funcion.code
+    fin = len(code)
+    lineas_pc, _ = funcion.positions.decode()
+    linea_en = lambda pc: lineas_pc[pc // 2]
+    entrantes = Counter()  # destino -> saltos tomados hacia él
+    hacia_linea = Counter()  # destino -> los que además cuentan como ejecución de la línea
+    for pc in range(0, fin, 2):
+        op, arg = code[pc], code[pc + 1]
+        if op == JUMP or op in CONDITIONAL_JUMPS:
+            tomados = saltos[pc + 2]
+            entrantes[arg] += tomados
+            if arg <= pc or arg >= fin or linea_en(arg) != linea_en(pc):
+                hacia_linea[arg] += tomados
+    lineas: Dict[int, List[int]] = {}
+    actual = 0
+    for pc in range(0, fin, 2):
+        linea = linea_en(pc)
+        cae = 0  # lo que llega desde la instrucción anterior
+        if pc == 0:
+            cae = entradas
+        else:
+            anterior = code[pc - 2]
+            if anterior in CONDITIONAL_JUMPS:
+                cae = actual - saltos[pc]
+            elif anterior not in (JUMP, RETURN):
+                cae = actual
+        actual = cae + entrantes[pc]
+        if not linea:
+            continue
+        conteo = lineas.setdefault(linea, [0, 0])
+        conteo[1] += actual
+        if code[pc] == JUMP:
+            # El salto de fin de bloque lleva la línea del if/while, pero no la ejecuta
+            continue
+        if pc == 0 or linea_en(pc - 2) != linea:
+            conteo[0] += cae
+        conteo[0] += hacia_linea[pc]
+    return lineas
+
+class ExecutionProfiler:
+    """Ejecuta un Program en una ProfilingVM y muestrea su pila de llamadas"""
+
+    def __init__(self, program: Program, interval: float = DEFAULT_INTERVAL,
+                 clock=time.perf_counter_ns, limits: Optional[ExecutionLimits] = None):
+        self.program = program
+        self.interval = interval
+        self.clock = clock
+        self.vm = ProfilingVM(program, limits)
+        # Pila de índices de funciones (tupla) -> nanosegundos muestreados
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self.elapsed_ns = 0
+
+    def run(self, nombre: str = ENTRY_POINT, args=()):
+        """Ejecuta 'nombre' con el muestreo activo y retorna su valor"""
+        vm = self.vm
+        detener = threading.Event()
+        anterior_intervalo = sys.getswitchinterval()
+
+        def muestrear():
+            anterior = self.clock()
+            while not detener.wait(self.interval):
+                pila = tuple(vm.call_stack)
+                ahora = self.clock()
+                if pila:
+                    self.samples[pila] += ahora - anterior
+                    self.sample_count += 1
+                anterior = ahora
+
+        hilo = threading.Thread(target=muestrear, name='mini0-muestreo', daemon=True)
+        # La VM suelta el GIL cada 'switch interval': que el muestreo no espere más
+        sys.setswitchinterval(min(anterior_intervalo, self.interval))
+        inicio = self.clock()
+        hilo.start()
+        try:
+            return vm.run(nombre, args)
+        finally:
+            self.elapsed_ns += self.clock() - inicio
+            detener.set()
+            hilo.join()
+            sys.setswitchinterval(anterior_intervalo)
+
+    # ========== Agregación ==========
+
+    def function_stats(self) -> List[dict]:
+        """Por función: llamadas, primitivas, tiempo propio y acumulado (ns)"""
+        funciones = self.program.functions
+        n = len(funciones)
+        propio = Counter()
+        acumulado = Counter()
+        for pila, ns in self.samples.items():
+            propio[pila[-1]] += ns
+            for indice in set(pila):
+                acumulado[indice] += ns
+        resultado = []
+        for funcion in funciones:
+            llamadas = sum(self.vm.calls[c * n + funcion.index] for c in range(n + 1))
+            primitivas = sum(self.vm.primitive_calls[c * n + funcion.index] for c in range(n + 1))
+            resultado.append({'funcion': funcion.name, 'linea': funcion.line, 'llamadas': llamadas,
+                              'primitivas': primitivas, 'propio_ns': propio[funcion.index],
+                              'acumulado_ns': acumulado[funcion.index]})
+        return resultado
+
+    def line_stats(self) -> Dict[int, List[int]]:
+        """Línea -> [ejecuciones, instrucciones ejecutadas] en todo el programa"""
+        n = len(self.program.functions)
+        total: Dict[int, List[int]] = {}
+        for funcion in self.program.functions:
+            entradas = sum(self.vm.calls[c * n + funcion.index] for c in range(n + 1))
+            for linea, (veces, instrucciones) in line_counts(
+                    funcion, entradas, self.vm.jumps[funcion.index]).items():
+                conteo = total.setdefault(linea, [0, 0])
+                conteo[0] += veces
+                conteo[1] += instrucciones
+        return total
+
+    # ========== Salidas ==========
+
+    def pstats_data(self, archivo: str = '<mini0>') -> dict:
+        """Diccionario con el formato de pstats: (archivo, línea, función) ->
+        (primitivas, llamadas, propio, acumulado, llamadores), tiempos en segundos"""
+        funciones = self.program.functions
+        n = len(funciones)
+        clave = lambda indice: (archivo, funciones[indice].line, funciones[indice].name)
+        propio_arista = Counter()
+        acumulado_arista = Counter()
+        for pila, ns in self.samples.items():
+            if len(pila) > 1:
+                propio_arista[pila[-2:]] += ns
+            for arista in set(zip(pila, pila[1:])):
+                acumulado_arista[arista] += ns
+        datos = {}
+        for estadistica, funcion in zip(self.function_stats(), funciones):
+            llamadores = {}
+            for llamador in range(n):
+                veces = self.vm.calls[llamador * n + funcion.index]
+                if veces:
+                    arista = (llamador, funcion.index)
+                    llamadores[clave(llamador)] = (
+                        veces, self.vm.primitive_calls[llamador * n + funcion.index],
+                        propio_arista[arista] / 1e9, acumulado_arista[arista] / 1e9)
+            datos[clave(funcion.index)] = (
+                estadistica['primitivas'], estadistica['llamadas'],
+                estadistica['propio_ns'] / 1e9, estadistica['acumulado_ns'] / 1e9, llamadores)
+        return datos
+
+    def write_pstats(self, filename: str, archivo: str = '<mini0>') -> str:
+        """Archivo que se abre con pstats.Stats(filename) o python -m pstats"""
+        with open(filename, 'wb') as f:
+            marshal.dump(self.pstats_data(archivo), f)
+        return filename
+
+    def folded_stacks(self) -> Iterator[Tuple[str, int]]:
+        """Pares ('main;f;g', tiempo muestreado en µs)"""
+        nombres = [f.name for f in self.program.functions]
+        for pila, ns in self.samples.items():
+            yield ';'.join(nombres[i] for i in pila), ns // 1000
+
+    def write_folded(self, filename: str) -> str:
+        """Escribe el archivo folded-stack (compatible con flamegraph.pl/speedscope)"""
+        with open(filename, 'w', encoding='utf-8') as f:
+            for pila, microsegundos in sorted(self.folded_stacks()):
+                if microsegundos > 0:
+                    f.write(f"{pila} {microsegundos}\n")
+        return filename
+
+    def report(self, codigo: Optional[str] = None, top: int = 10) -> str:
+        """Funciones ordenadas por tiempo propio y líneas más ejecutadas"""
+        total = max(1, sum(self.samples.values()))
+        lineas = [f"{'Función':<20}{'Llamadas':>14}{'Propio (ms)':>13}{'Acum. (ms)':>12}{'Propio %':>10}"]
+        lineas.append("-" * 69)
+        for e in sorted(self.function_stats(), key=lambda e: (-e['propio_ns'], -e['llamadas'])):
+            if not e['llamadas']:
+                continue
+            llamadas = str(e['llamadas']) if e['llamadas'] == e['primitivas'] \
+                else f"{e['llamadas']}/{e['primitivas']}"
+            lineas.append(f"{e['funcion']:<20}{llamadas:>14}{e['propio_ns'] / 1e6:>13.2f}"
+                          f"{e['acumulado_ns'] / 1e6:>12.2f}{e['propio_ns'] / total * 100:>9.1f}%")
+        lineas.append("-" * 69)
+        lineas.append(f"{self.sample_count} muestras en {self.elapsed_ns / 1e6:.2f} ms; "
+                      f"{self.vm.instructions:,} instrucciones")
+        fuente = codigo.splitlines() if codigo is not None else []
+        lineas.append(f"\n{'Línea':>6}{'Ejecuciones':>13}{'Instrucciones':>15}  Código")
+        calientes = sorted(self.line_stats().items(), key=lambda par: (-par[1][1], par[0]))
+        for linea, (veces, instrucciones) in calientes[:top]:
+            texto = fuente[linea - 1].strip() if linea <= len(fuente) else ''
+            lineas.append(f"{linea:>6}{veces:>13,}{instrucciones:>15,}  {texto}")
+        return "\n".join(lineas)
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Perfil de ejecución de un programa Mini-0 (VM)")
+    arg_parser.add_argument('archivo')
+    arg_parser.add_argument('--pstats', metavar='ARCHIVO', help="guarda el perfil en formato pstats")
+    arg_parser.add_argument('--folded', metavar='ARCHIVO', help="guarda las pilas muestreadas (folded)")
+    arg_parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL * 1000,
+                            help="intervalo de muestreo en ms (por omisión 1)")
+    arg_parser.add_argument('--top', type=int, default=10, help="líneas a mostrar")
+    arg_parser.add_argument('--overhead', action='store_true',
+                            help="compara el tiempo con y sin perfilador")
+    add_limit_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    limites = limits_from_args(args)
+
+    with open(args.archivo, 'r', encoding='utf-8') as f:
+        codigo = f.read()
+    try:
+        programa = compile_source(codigo)
+    except CompileError as e:
+        for error in e.errors:
+            print(f"  {error}", file=sys.stderr)
+        sys.exit(1)
+    perfilador = ExecutionProfiler(programa, args.interval / 1000, limits=limites)
+    completo = True
+    try:
+        valor = perfilador.run()
+    except Mini0RuntimeError as e:
+        print(f"❌ {e} (perfil hasta el error)", file=sys.stderr)
+        valor = None
+        completo = False
+    if valor is not None:
+        print(f"Resultado: {valor}\n")
+    print(perfilador.report(codigo, args.top))
+    if args.pstats:
+        print(f"\n✓ Perfil pstats escrito en: {perfilador.write_pstats(args.pstats, args.archivo)}")
+    if args.folded:
+        print(f"✓ Pilas folded escritas en: {perfilador.write_folded(args.folded)}")
+    # Solo se compara una ejecución que termina (sin error ni límite excedido)
+    if args.overhead and completo:
+        tiempos = {}
+        for nombre, ejecutar in (('sin perfilador', lambda: VM(programa, limites).run()),
+                                 ('con perfilador', lambda: ExecutionProfiler(
+                                     programa, args.interval / 1000, limits=limites).run())):
+            mejor = float('inf')
+            for _ in range(5):
+                inicio = time.perf_counter()
+                ejecutar()
+                mejor = min(mejor, time.perf_counter() - inicio)
+            tiempos[nombre] = mejor
+        extra = tiempos['con perfilador'] / tiempos['sin perfilador'] - 1
+        print(f"\nSin perfilador {tiempos['sin perfilador'] * 1000:.2f} ms, con perfilador "
+              f"{tiempos['con perfilador'] * 1000:.2f} ms ({extra * 100:+.1f}%)")
+
+if __name__ == "__main__":
+    main()
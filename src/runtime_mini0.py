@@ -0,0 +1,141 @@
+"""
+Soporte de ejecución compartido por los motores de Mini-0
+Valores por omisión de cada tipo, creación de arreglos, división entera,
+errores de ejecución con número de línea y límites de recursos.
+
+Los arreglos de int, bool y char son memoryviews sobre un búfer compacto
+(array('q') o bytearray): no guardan un objeto int por elemento, el índice
+se verifica en C y una rebanada comparte el búfer sin copiarlo. Los de
+string y los de arreglos (p. ej. las filas de un [][]int) son listas.
+"""
+
+from array import array
+from typing import Optional
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.lexer_mini0 import Lexer
+from src.ast_mini0 import ParserASTMini0
+from src.semantic_mini0 import SemanticChecker
+
+# Función que se ejecuta al correr un programa
+ENTRY_POINT = 'main'
+
+# Mensaje del OverflowError de new_array (runtime_error lo reconoce por él)
+ARRAY_TOO_BIG = "tamaño de arreglo demasiado grande"
+
+class Mini0RuntimeError(Exception):
+    """Error durante la ejecución de un programa Mini-0"""
+    def __init__(self, message: str, line: int = 0):
+        self.message = message
+        self.line = line
+        super().__init__(f"Error de ejecución en línea {line}: {message}" if line
+                         else f"Error de ejecución: {message}")
+
+# Límite -> descripción en los mensajes de error
+LIMIT_NAMES = {
+    'instructions': 'instrucciones',
+    'memory': 'memoria de arreglos en bytes',
+    'depth': 'profundidad de llamadas',
+}
+
+class Mini0LimitError(Mini0RuntimeError):
+    """El programa excedió un límite de ExecutionLimits ('limit' dice cuál)"""
+    def __init__(self, limit: str, maximum: int, line: int = 0):
+        self.limit = limit
+        self.maximum = maximum
+        super().__init__(f"límite de {LIMIT_NAMES[limit]} excedido ({maximum:,})", line)
+
+class ExecutionLimits:
+    """Límites de recursos de una ejecución (None: sin límite)
+
+    instructions: instrucciones ejecutadas, verificado en cada salto y llamada
+    (el exceso está acotado por el código sin saltos de un cuerpo de ciclo);
+    memory: bytes pedidos por new en total (ver array_bytes); depth: llamadas
+    anidadas."""
+
+    __slots__ = ('instructions', 'memory', 'depth')
+
+    def __init__(self, instructions: Optional[int] = None, memory: Optional[int] = None,
+                 depth: Optional[int] = None):
+        self.instructions = instructions
+        self.memory = memory
+        self.depth = depth
+
+class CompileError(Exception):
+    """El programa no pasa las etapas previas a la ejecución"""
+    def __init__(self, errors):
+        self.errors = list(errors)
+        super().__init__(self.errors[0] if self.errors else "Error de compilación")
+
+def default_value(tipo: str):
+    """Valor inicial de una variable del tipo dado (arreglos: sin inicializar)"""
+    if tipo in ('int', 'char'):
+        return 0
+    if tipo == 'bool':
+        return False
+    if tipo == 'string':
+        return ''
+    return None
+
+# Tipo de elemento -> formato del memoryview; los demás tipos usan listas
+ARRAY_FORMATS = {'int': 'q', 'bool': '?', 'char': 'B'}
+
+def new_array(tamano: int, elemento: str):
+    """Arreglo de 'tamano' elementos del tipo dado, con su valor por omisión"""
+    if tamano < 0:
+        raise ValueError(f"tamaño de arreglo negativo: {tamano}")
+    if array_bytes(tamano, elemento) > sys.maxsize:
+        # Igual en todos los motores: bytes(8 * n) y [x] * n fallan distinto
+        raise OverflowError(f"{ARRAY_TOO_BIG}: {tamano}")
+    formato = ARRAY_FORMATS.get(elemento)
+    if formato is None:
+        return [default_value(elemento)] * tamano
+    if formato == 'q':
+        return memoryview(array('q', bytes(8 * tamano)))
+    return memoryview(bytearray(tamano)).cast(formato)
+
+def array_bytes(tamano: int, elemento: str) -> int:
+    """Bytes de datos de un arreglo de new_array (referencias de 8 bytes en las listas)"""
+    return tamano * (1 if ARRAY_FORMATS.get(elemento) in ('?', 'B') else 8)
+
+def int_div(a: int, b: int) -> int:
+    """División entera truncada hacia cero (como en C), no hacia -infinito"""
+    cociente = a // b
+    if cociente < 0 and cociente * b != a:
+        cociente += 1
+    return cociente
+
+def runtime_error(exc: Exception, line: int) -> Mini0RuntimeError:
+    """Traduce una excepción de Python ocurrida en el código del programa"""
+    if isinstance(exc, ZeroDivisionError):
+        mensaje = "división por cero"
+    elif isinstance(exc, IndexError):
+        mensaje = "índice fuera de rango"
+    elif isinstance(exc, TypeError):
+        mensaje = "arreglo no inicializado"
+    elif isinstance(exc, ValueError) and str(exc).startswith('memoryview'):
+        mensaje = "valor fuera del rango del tipo de elemento del arreglo"
+    elif isinstance(exc, RecursionError):
+        mensaje = "recursión demasiado profunda"
+    elif isinstance(exc, OverflowError) and str(exc).startswith(ARRAY_TOO_BIG):
+        # Solo el de new_array; otros desbordamientos conservan su texto
+        mensaje = ARRAY_TOO_BIG
+    elif isinstance(exc, MemoryError):
+        mensaje = "memoria insuficiente"
+    else:
+        mensaje = str(exc)
+    return Mini0RuntimeError(mensaje, line)
+
+def load_program(codigo: str):
+    """Análisis léxico, sintáctico y semántico; retorna (arena, checker)"""
+    tokens, errores = Lexer(codigo).tokenize()
+    if errores:
+        raise CompileError(errores)
+    parser = ParserASTMini0(tokens)
+    if not parser.parse():
+        raise CompileError(parser.errors)
+    checker = SemanticChecker(parser.arena)
+    if not checker.check():
+        raise CompileError(checker.errors)
+    return parser.arena, checker
@@ -0,0 +1,379 @@
+"""
+Analizador Semántico para Mini-0
+Recorre el AST (ASTArena) en una sola pasada con una pila de ámbitos
+(diccionarios indexados por identificadores internados) y verifica
+declaraciones, tipos de expresiones, asignaciones, indexación, llamadas y
+'return'. Una pre-pasada sobre las declaraciones globales registra las
+funciones para permitir referencias hacia adelante.
+"""
+
+from typing import Dict, List, Optional, Union
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.lexer_mini0 import Lexer
+from src.ast_mini0 import ASTArena, NodeKind, ParserASTMini0, NONE
+
+# Tipos representados como cadenas internadas: 'int', '[]int', '[][]bool', ...
+INT = sys.intern('int')
+BOOL = sys.intern('bool')
+STRING = sys.intern('string')
+CHAR = sys.intern('char')
+VOID = sys.intern('void')
+# Tipo de una expresión con errores: compatible con todo para no encadenar errores
+ERROR = sys.intern('<error>')
+
+ARITHMETIC_OPS = frozenset(('+', '-', '*', '/'))
+RELATIONAL_OPS = frozenset(('>', '<', '>=', '<='))
+EQUALITY_OPS = frozenset(('=', '<>'))
+LOGICAL_OPS = frozenset(('and', 'or'))
+# Tipos ordenables con los operadores relacionales
+ORDERED_TYPES = frozenset((INT, CHAR))
+
+def array_of(tipo: str) -> str:
+    return sys.intern('[]' + tipo)
+
+def element_of(tipo: str) -> Optional[str]:
+    """Tipo de los elementos de un arreglo (None si no es arreglo)"""
+    return sys.intern(tipo[2:]) if tipo.startswith('[]') else None
+
+class FunctionSignature:
+    """Firma de una función declarada en el nivel superior"""
+
+    __slots__ = ('name', 'return_type', 'param_types', 'line')
+
+    def __init__(self, name: str, return_type: str, param_types: List[str], line: int):
+        self.name = name
+        self.return_type = return_type
+        self.param_types = param_types
+        self.line = line
+
+    def __repr__(self):
+        return f"fun {self.name}({', '.join(self.param_types)}): {self.return_type}"
+
+Symbol = Union[str, FunctionSignature]
+
+class SemanticChecker:
+    """Verificador semántico de una pasada sobre el AST"""
+
+    def __init__(self, arena: ASTArena):
+        self.arena = arena
+        self.errors: List[str] = []
+        # Pila de ámbitos; scopes[0] es el ámbito global
+        self.scopes: List[Dict[str, Symbol]] = []
+        self.current_function: Optional[FunctionSignature] = None
+        # Firma de cada nodo FUNC (aun si su nombre quedó duplicado)
+        self.signatures: Dict[int, FunctionSignature] = {}
+        # Tipo de cada nodo de expresión, para las etapas posteriores
+        self.types: Dict[int, str] = {}
+
+    def error(self, nodo: int, message: str):
+        """Registra un error semántico (el análisis continúa)"""
+        self.errors.append(f"Error semántico en línea {self.arena.line(nodo)}: {message}")
+
+    # ========== Ámbitos ==========
+
+    def name(self, nodo: int) -> str:
+        return sys.intern(self.arena.text(nodo))
+
+    def declare(self, nodo: int, simbolo: Symbol):
+        """Declara el nombre del token del nodo en el ámbito actual"""
+        nombre = self.name(nodo)
+        ambito = self.scopes[-1]
+        if nombre in ambito:
+            self.error(nodo, f"'{nombre}' ya fue declarado en este ámbito")
+            return
+        ambito[nombre] = simbolo
+
+    def lookup(self, nombre: str) -> Optional[Symbol]:
+        for ambito in reversed(self.scopes):
+            simbolo = ambito.get(nombre)
+            if simbolo is not None:
+                return simbolo
+        return None
+
+    # ========== Programa ==========
+
+    def check(self) -> bool:
+        """Verifica el programa completo; retorna True si no hay errores"""
+        arena = self.arena
+        self.scopes = [{}]
+        # Pre-pasada: firmas de funciones y globales del nivel superior
+        for decl in arena.children(arena.root):
+            if arena.kind[decl] == NodeKind.FUNC:
+                params, retorno, _ = arena.children(decl)
+                firma = FunctionSignature(self.name(decl), self.type_of(retorno),
+                                          [self.type_of(arena.first_child[p])
+                                           for p in arena.children(params)],
+                                          arena.line(decl))
+                self.signatures[decl] = firma
+                self.declare(decl, firma)
+            else:
+                self.declare(decl, self.type_of(arena.first_child[decl]))
+        for decl in arena.children(arena.root):
+            if arena.kind[decl] == NodeKind.FUNC:
+                self.check_function(decl)
+        return not self.errors
+
+    def type_of(self, nodo: int) -> str:
+        """Tipo denotado por un nodo TYPE, ARRAY_TYPE o VOID"""
+        kind = self.arena.kind[nodo]
+        if kind == NodeKind.VOID:
+            return VOID
+        dimensiones = 0
+        while kind == NodeKind.ARRAY_TYPE:
+            dimensiones += 1
+            nodo = self.arena.first_child[nodo]
+            kind = self.arena.kind[nodo]
+        return sys.intern('[]' * dimensiones + self.arena.text(nodo))
+
+    def check_function(self, nodo: int):
+        arena = self.arena
+        params, _, bloque = arena.children(nodo)
+        self.current_function = self.signatures[nodo]
+        self.scopes.append({})
+        for param in arena.children(params):
+            self.declare(param, self.type_of(arena.first_child[param]))
+        # Los parámetros y las variables locales del cuerpo comparten ámbito
+        self.check_block(bloque, new_scope=False)
+        self.scopes.pop()
+        self.current_function = None
+
+    # ========== Comandos ==========
+
+    def check_block(self, nodo: int, new_scope: bool = True):
+        arena = self.arena
+        kinds = arena.kind
+        if new_scope:
+            self.scopes.append({})
+        for hijo in arena.children(nodo):
+            kind = kinds[hijo]
+            if kind == NodeKind.VARDECL:
+                self.declare(hijo, self.type_of(arena.first_child[hijo]))
+            elif kind == NodeKind.ASSIGN:
+                self.check_assign(hijo)
+            elif kind == NodeKind.CALL:
+                self.expr_type(hijo, statement=True)
+            elif kind == NodeKind.IF:
+                self.check_if(hijo)
+            elif kind == NodeKind.WHILE:
+                condicion, cuerpo = arena.children(hijo)
+                self.check_condition(condicion, 'while')
+                self.check_block(cuerpo)
+            elif kind == NodeKind.RETURN:
+                self.check_return(hijo)
+        if new_scope:
+            self.scopes.pop()
+
+    def check_condition(self, nodo: int, comando: str):
+        tipo = self.expr_type(nodo)
+        if tipo not in (BOOL, ERROR):
+            self.error(nodo, f"la condición de '{comando}' debe ser bool, no {tipo}")
+
+    def check_if(self, nodo: int):
+        hijos = list(self.arena.children(nodo))
+        for i in range(0, len(hijos) - 1, 2):
+            self.check_condition(hijos[i], 'if')
+            self.check_block(hijos[i + 1])
+        if len(hijos) % 2:
+            self.check_block(hijos[-1])
+
+    def check_assign(self, nodo: int):
+        arena = self.arena
+        destino, valor = arena.children(nodo)
+        tipo_destino = self.expr_type(destino)
+        if arena.kind[destino] == NodeKind.INDEX and self.types.get(arena.first_child[destino]) == STRING:
+            self.error(nodo, "los string no se modifican: no se puede asignar a uno de sus caracteres")
+        tipo_valor = self.expr_type(valor)
+        if not compatible(tipo_destino, tipo_valor):
+            self.error(nodo, f"no se puede asignar {tipo_valor} a una variable de tipo {tipo_destino}")
+
+    def check_return(self, nodo: int):
+        funcion = self.current_function
+        valor = self.arena.first_child[nodo]
+        if valor == NONE:
+            if funcion.return_type != VOID:
+                self.error(nodo, f"'{funcion.name}' debe retornar un valor de tipo {funcion.return_type}")
+            return
+        tipo = self.expr_type(valor)
+        if funcion.return_type == VOID:
+            self.error(nodo, f"'{funcion.name}' no declara tipo de retorno y retorna {tipo}")
+        elif not compatible(funcion.return_type, tipo):
+            self.error(nodo, f"'{funcion.name}' retorna {funcion.return_type}, no {tipo}")
+
+    # ========== Expresiones ==========
+
+    def expr_type(self, raiz: int, statement: bool = False) -> str:
+        """Tipo de una expresión, con recorrido postorden iterativo
+
+        Las cadenas de operadores asociativos a izquierda (a + b + c ...)
+        producen árboles tan profundos como largas son, así que no se usa
+        la pila de Python.
+        """
+        arena = self.arena
+        kinds = arena.kind
+        first = arena.first_child
+        siguiente = arena.next_sibling
+        tipos: List[str] = []
+        registro = self.types
+        # Índices >= 0: visitar; ~nodo: combinar los tipos de los hijos
+        pila = [raiz]
+        while pila:
+            nodo = pila.pop()
+            if nodo >= 0:
+                kind = kinds[nodo]
+                if kind == NodeKind.NUM:
+                    tipo = INT
+                elif kind == NodeKind.STR:
+                    tipo = STRING
+                elif kind == NodeKind.BOOL:
+                    tipo = BOOL
+                elif kind == NodeKind.VAR:
+                    tipo = self.variable_type(nodo)
+                else:
+                    pila.append(~nodo)
+                    hijos = []
+                    hijo = first[nodo]
+                    while hijo != NONE:
+                        hijos.append(hijo)
+                        hijo = siguiente[hijo]
+                    if kind == NodeKind.NEW:
+                        hijos = hijos[:1]  # el segundo hijo es el tipo, no una expresión
+                    pila.extend(reversed(hijos))
+                    continue
+                tipos.append(tipo)
+                registro[nodo] = tipo
+                continue
+            nodo = ~nodo
+            kind = kinds[nodo]
+            if kind == NodeKind.BINOP:
+                derecha = tipos.pop()
+                tipo = self.binary_type(nodo, tipos.pop(), derecha)
+            elif kind == NodeKind.UNOP:
+                tipo = self.unary_type(nodo, tipos.pop())
+            elif kind == NodeKind.INDEX:
+                indice = tipos.pop()
+                tipo = self.index_type(nodo, tipos.pop(), indice)
+            elif kind == NodeKind.NEW:
+                tamano = tipos.pop()
+                if tamano not in (INT, ERROR):
+                    self.error(nodo, f"el tamaño de 'new' debe ser int, no {tamano}")
+                tipo = array_of(self.type_of(siguiente[first[nodo]]))
+            else:
+                n_args = sum(1 for _ in arena.children(nodo))
+                argumentos = tipos[len(tipos) - n_args:]
+                del tipos[len(tipos) - n_args:]
+                tipo = self.call_type(nodo, argumentos, statement and nodo == raiz)
+            tipos.append(tipo)
+            registro[nodo] = tipo
+        return tipos[-1]
+
+    def variable_type(self, nodo: int) -> str:
+        nombre = self.name(nodo)
+        simbolo = self.lookup(nombre)
+        if simbolo is None:
+            self.error(nodo, f"variable '{nombre}' no declarada")
+            return ERROR
+        if isinstance(simbolo, FunctionSignature):
+            self.error(nodo, f"'{nombre}' es una función, no una variable")
+            return ERROR
+        return simbolo
+
+    def call_type(self, nodo: int, argumentos: List[str], statement: bool) -> str:
+        nombre = self.name(nodo)
+        simbolo = self.lookup(nombre)
+        if simbolo is None:
+            self.error(nodo, f"función '{nombre}' no declarada")
+            return ERROR
+        if not isinstance(simbolo, FunctionSignature):
+            self.error(nodo, f"'{nombre}' no es una función")
+            return ERROR
+        if len(argumentos) != len(simbolo.param_types):
+            self.error(nodo, f"'{nombre}' espera {len(simbolo.param_types)} argumentos, "
+                             f"recibió {len(argumentos)}")
+        else:
+            for i, (esperado, recibido) in enumerate(zip(simbolo.param_types, argumentos), 1):
+                if not compatible(esperado, recibido):
+                    self.error(nodo, f"argumento {i} de '{nombre}': se esperaba {esperado}, "
+                                     f"se recibió {recibido}")
+        if simbolo.return_type == VOID and not statement:
+            self.error(nodo, f"'{nombre}' no retorna valor y se usa en una expresión")
+            return ERROR
+        return simbolo.return_type
+
+    def index_type(self, nodo: int, base: str, indice: str) -> str:
+        if indice not in (INT, ERROR):
+            self.error(nodo, f"el índice debe ser int, no {indice}")
+        if base == ERROR:
+            return ERROR
+        if base == STRING:
+            return CHAR
+        elemento = element_of(base)
+        if elemento is None:
+            self.error(nodo, f"no se puede indexar un valor de tipo {base}")
+            return ERROR
+        return elemento
+
+    def unary_type(self, nodo: int, operando: str) -> str:
+        operador = self.arena.text(nodo)
+        esperado = BOOL if operador == 'not' else INT
+        if operando not in (esperado, ERROR):
+            self.error(nodo, f"'{operador}' requiere {esperado}, no {operando}")
+        return esperado
+
+    def binary_type(self, nodo: int, izquierda: str, derecha: str) -> str:
+        operador = self.arena.text(nodo)
+        if operador == '+' and STRING in (izquierda, derecha):
+            # Concatenación
+            resultado, validos = STRING, (STRING,)
+        elif operador in ARITHMETIC_OPS:
+            resultado, validos = INT, (INT,)
+        elif operador in LOGICAL_OPS:
+            resultado, validos = BOOL, (BOOL,)
+        elif operador in RELATIONAL_OPS:
+            resultado, validos = BOOL, ORDERED_TYPES
+        else:
+            if not compatible(izquierda, derecha):
+                self.error(nodo, f"no se pueden comparar {izquierda} y {derecha} con '{operador}'")
+            return BOOL
+        for tipo in (izquierda, derecha):
+            if tipo != ERROR and tipo not in validos:
+                self.error(nodo, f"'{operador}' no se aplica a {tipo}")
+                return resultado
+        if izquierda != derecha and ERROR not in (izquierda, derecha):
+            self.error(nodo, f"'{operador}' con operandos de tipos distintos: {izquierda} y {derecha}")
+        return resultado
+
+def compatible(esperado: str, recibido: str) -> bool:
+    return esperado == recibido or ERROR in (esperado, recibido)
+
+def check_file(filename: str) -> bool:
+    """Analiza léxica, sintáctica y semánticamente un archivo Mini-0"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        tokens, errores = Lexer(f.read()).tokenize()
+    if errores:
+        for error in errores:
+            print(f"  {error}")
+        return False
+    parser = ParserASTMini0(tokens)
+    if not parser.parse():
+        for error in parser.errors:
+            print(f"  {error}")
+        return False
+    checker = SemanticChecker(parser.arena)
+    if not checker.check():
+        print("Errores semánticos encontrados:")
+        for error in checker.errors:
+            print(f"  {error}")
+        return False
+    print("✓ Análisis semántico completado sin errores")
+    return True
+
+def main():
+    if len(sys.argv) < 2:
+        print("Uso: python semantic_mini0.py <archivo.mini0>")
+        return
+    sys.exit(0 if check_file(sys.argv[1]) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+"""
+Servicio asyncio que ejecuta programas Mini-0 concurrentemente
+Recibe pedidos JSON (uno por línea) por un socket local, TCP o Unix:
+
+    {"id": 1, "source": "fun main(): int ... end", "engine": "python", "timeout": 2}
+    {"op": "metrics"}
+
+y responde una línea JSON por pedido con el mismo id, en el orden en que
+terminan: {"id": 1, "status": "ok", "value": 10, "ms": 0.4, "cached": true}.
+El estado es ok, error (de ejecución, con 'line'), limit (ExecutionLimits
+de la VM), compile_error, timeout o bad_request.
+
+El ciclo de eventos solo lee, encola y responde: compilar y ejecutar va a un
+pool de procesos que se calienta al arrancar. La forma compilada (objeto
+código del backend Python o Program de la VM) se guarda en un LRU indexado
+por el hash del fuente, así que un fuente repetido no se vuelve a analizar;
+cada proceso además conserva deserializados los últimos programas que
+corrió. Los pedidos esperan en una cola acotada: cuando se llena, el
+servidor deja de leer de esa conexión (contrapresión hasta el cliente). El
+tiempo límite se aplica dentro del proceso con una alarma (setitimer), que
+interrumpe el programa y libera el proceso; la espera del ciclo de eventos
+tiene el mismo límite más un margen, por si la alarma no está disponible.
+"""
+
+import asyncio
+import hashlib
+import json
+import pickle
+import signal
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.runtime_mini0 import (
+    CompileError, ExecutionLimits, Mini0LimitError, Mini0RuntimeError, load_program, runtime_error,
+)
+from src.bytecode_mini0 import BytecodeCompiler
+from src.vm_mini0 import VM, add_limit_arguments, limits_from_args
+from src.transpiler_mini0 import PythonProgram, PythonTranspiler
+from src.stats_mini0 import percentile
+
+DEFAULT_PORT = 8765
+DEFAULT_TIMEOUT = 5.0
+# Margen de la espera en el ciclo de eventos sobre el tiempo límite del pedido
+TIMEOUT_GRACE = 1.0
+# Programas compilados en el LRU del servidor y deserializados por proceso
+DEFAULT_CACHE_SIZE = 1024
+WORKER_CACHE_SIZE = 64
+# Latencias que se conservan para los percentiles
+LATENCY_WINDOW = 10000
+# Tamaño máximo de un pedido (una línea)
+MAX_REQUEST_BYTES = 1 << 20
+
+ENGINES = ('python', 'vm')
+
+# ========== Procesos del pool ==========
+
+class _Timeout(Exception):
+    """La alarma del proceso interrumpió el programa"""
+
+def _alarm(signum, frame):
+    raise _Timeout()
+
+_programs: 'OrderedDict[str, object]' = OrderedDict()
+
+def warm_worker():
+    """Inicializador de cada proceso: alarma para los tiempos límite; Ctrl-C solo
+    lo atiende el servidor, que cierra el pool ordenadamente"""
+    if hasattr(signal, 'setitimer'):
+        signal.signal(signal.SIGALRM, _alarm)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def ping() -> int:
+    return os.getpid()
+
+def compile_job(codigo: str, motor: str) -> Tuple[str, object]:
+    """('ok', forma compilada serializada) o ('compile_error', mensajes)"""
+    try:
+        arena, checker = load_program(codigo)
+        if motor == 'vm':
+            return 'ok', pickle.dumps(BytecodeCompiler(arena, checker).compile())
+        return 'ok', PythonTranspiler(arena, checker).compile().dumps()
+    except CompileError as e:
+        return 'compile_error', e.errors
+    except RecursionError:
+        return 'compile_error', ["Programa demasiado anidado"]
+
+def run_job(clave: str, motor: str, compilado: bytes, timeout: float,
+            limites: Optional[ExecutionLimits]) -> dict:
+    """Ejecuta main() de un programa compilado con compile_job"""
+    programa = _programs.pop(clave, None)
+    if programa is None:
+        programa = pickle.loads(compilado) if motor == 'vm' else PythonProgram.loads(compilado)
+    _programs[clave] = programa
+    while len(_programs) > WORKER_CACHE_SIZE:
+        _programs.popitem(last=False)
+    alarma = hasattr(signal, 'setitimer') and timeout > 0
+    try:
+        if alarma:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        inicio = time.perf_counter()
+        try:
+            valor = VM(programa, limites).run() if motor == 'vm' else programa.run()
+        finally:
+            if alarma:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        return {'status': 'ok', 'value': valor,
+                'run_ms': round((time.perf_counter() - inicio) * 1000, 3)}
+    except _Timeout:
+        return {'status': 'timeout', 'error': f"tiempo límite excedido ({timeout:g} s)"}
+    except Mini0LimitError as e:
+        return {'status': 'limit', 'limit': e.limit, 'error': e.message, 'line': e.line}
+    except Mini0RuntimeError as e:
+        return {'status': 'error', 'error': e.message, 'line': e.line}
+    except (OverflowError, MemoryError) as e:
+        return {'status': 'error', 'error': runtime_error(e, 0).message, 'line': 0}
+    except CompileError as e:
+        return {'status': 'compile_error', 'errors': e.errors}
+
+# ========== Servicio ==========
+
+class Mini0Service:
+    """Front end asyncio: cola acotada, caché de compilados y pool de procesos"""
+
+    def __init__(self, workers: int = os.cpu_count() or 1, queue_size: int = 256,
+                 timeout: float = DEFAULT_TIMEOUT, cache_size: int = DEFAULT_CACHE_SIZE,
+                 limits: Optional[ExecutionLimits] = None):
+        self.workers = workers
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self.limits = limits
+        self.queue: Optional[asyncio.Queue] = None
+        self.queue_size = queue_size
+        self.pool: Optional[ProcessPoolExecutor] = None
+        # clave -> ('ok', compilado) o ('compile_error', mensajes)
+        self.compiled: 'OrderedDict[str, Tuple[str, object]]' = OrderedDict()
+        self.compiling: Dict[str, asyncio.Future] = {}
+        self.dispatchers = []
+        # Métricas
+        self.started = time.monotonic()
+        self.counts: Dict[str, int] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.max_queue_depth = 0
+        self.in_flight = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.queue_waits = deque(maxlen=LATENCY_WINDOW)
+
+    async def start(self):
+        """Crea la cola, levanta los procesos del pool y los despachadores"""
+        loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(self.queue_size)
+        self.pool = ProcessPoolExecutor(self.workers, initializer=warm_worker)
+        # Un trabajo por proceso para que todos estén creados antes del primer pedido
+        await asyncio.gather(*(loop.run_in_executor(self.pool, ping) for _ in range(self.workers)))
+        self.dispatchers = [asyncio.create_task(self.dispatch()) for _ in range(self.workers)]
+
+    async def close(self):
+        for tarea in self.dispatchers:
+            tarea.cancel()
+        await asyncio.gather(*self.dispatchers, return_exceptions=True)
+        if self.pool is not None:
+            if sys.version_info >= (3, 9):
+                self.pool.shutdown(cancel_futures=True)
+            else:
+                # Sin cancel_futures (3.7/3.8): los trabajos de los despachadores ya se
+                # cancelaron con ellos; quedan las compilaciones en curso
+                for tarea in self.compiling.values():
+                    tarea.cancel()
+                self.pool.shutdown()
+
+    # ========== Conexiones ==========
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        pendientes = set()
+        try:
+            while True:
+                try:
+                    linea = await reader.readline()
+                except (ValueError, ConnectionError):  # línea demasiado larga o conexión cortada
+                    break
+                if not linea:
+                    break
+                if not linea.strip():
+                    continue
+                respuesta = await self.accept(linea)
+                if isinstance(respuesta, dict):
+                    self.reply(writer, respuesta)
+                else:
+                    tarea = asyncio.create_task(self.answer(writer, respuesta))
+                    pendientes.add(tarea)
+                    tarea.add_done_callback(pendientes.discard)
+            if pendientes:
+                await asyncio.gather(*pendientes, return_exceptions=True)
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def accept(self, linea: bytes):
+        """Respuesta inmediata (dict) o futuro del pedido ya encolado"""
+        try:
+            pedido = json.loads(linea)
+            if not isinstance(pedido, dict):
+                raise ValueError("el pedido debe ser un objeto JSON")
+        except ValueError as e:
+            return self.count({'status': 'bad_request', 'error': str(e)})
+        identificador = pedido.get('id')
+        if pedido.get('op', 'run') == 'metrics':
+            return {'id': identificador, 'status': 'ok', 'metrics': self.metrics()}
+        codigo = pedido.get('source')
+        motor = pedido.get('engine', 'python')
+        if not isinstance(codigo, str) or motor not in ENGINES:
+            return self.count({'id': identificador, 'status': 'bad_request',
+                               'error': f"se espera 'source' (texto) y 'engine' en {ENGINES}"})
+        timeout = pedido.get('timeout', self.timeout)
+        if not isinstance(timeout, (int, float)) or timeout <= 0:
+            timeout = self.timeout
+        futuro = asyncio.get_running_loop().create_future()
+        # Con la cola llena se espera aquí: no se leen más pedidos de esta conexión
+        await self.queue.put((time.perf_counter(), identificador, codigo, motor,
+                              min(timeout, self.timeout), futuro))
+        self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+        return futuro
+
+    async def answer(self, writer: asyncio.StreamWriter, futuro: asyncio.Future):
+        self.reply(writer, await futuro)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    @staticmethod
+    def reply(writer: asyncio.StreamWriter, respuesta: dict):
+        if not writer.is_closing():
+            writer.write(json.dumps(respuesta, ensure_ascii=False).encode('utf-8') + b'\n')
+
+    # ========== Ejecución ==========
+
+    async def dispatch(self):
+        """Toma pedidos de la cola de a uno: hay tantos despachadores como procesos"""
+        while True:
+            encolado, identificador, codigo, motor, timeout, futuro = await self.queue.get()
+            self.queue_waits.append((time.perf_counter() - encolado) * 1000)
+            self.in_flight += 1
+            try:
+                respuesta = await self.execute(codigo, motor, timeout)
+            except Exception as e:  # un proceso del pool murió o no se pudo serializar
+                respuesta = {'status': 'error', 'error': f"falla interna: {e!r}"}
+            finally:
+                self.in_flight -= 1
+                self.queue.task_done()
+            latencia = (time.perf_counter() - encolado) * 1000
+            self.latencies.append(latencia)
+            respuesta = dict(respuesta, id=identificador, ms=round(latencia, 3))
+            if not futuro.done():
+                futuro.set_result(self.count(respuesta))
+
+    async def execute(self, codigo: str, motor: str, timeout: float) -> dict:
+        loop = asyncio.get_running_loop()
+        clave = hashlib.sha256(f"{motor}\0{codigo}".encode('utf-8')).hexdigest()
+        compilado, en_cache = await self.compiled_form(clave, codigo, motor)
+        if compilado[0] == 'compile_error':
+            return {'status': 'compile_error', 'errors': compilado[1], 'cached': en_cache}
+        trabajo = loop.run_in_executor(self.pool, run_job, clave, motor, compilado[1],
+                                       timeout, self.limits if motor == 'vm' else None)
+        try:
+            respuesta = await asyncio.wait_for(trabajo, timeout + TIMEOUT_GRACE)
+        except asyncio.TimeoutError:
+            respuesta = {'status': 'timeout', 'error': f"tiempo límite excedido ({timeout:g} s)"}
+        return dict(respuesta, cached=en_cache)
+
+    async def compiled_form(self, clave: str, codigo: str, motor: str) -> Tuple[tuple, bool]:
+        """Forma compilada desde el LRU, o compilada en el pool (una sola vez por clave)"""
+        if clave in self.compiled:
+            self.compiled.move_to_end(clave)
+            self.cache_hits += 1
+            return self.compiled[clave], True
+        self.cache_misses += 1
+        en_curso = self.compiling.get(clave)
+        if en_curso is not None:
+            return await asyncio.shield(en_curso), False
+        loop = asyncio.get_running_loop()
+        tarea = loop.run_in_executor(self.pool, compile_job, codigo, motor)
+        self.compiling[clave] = tarea
+        try:
+            compilado = await tarea
+        finally:
+            del self.compiling[clave]
+        self.compiled[clave] = compilado
+        while len(self.compiled) > self.cache_size:
+            self.compiled.popitem(last=False)
+        return compilado, False
+
+    # ========== Métricas ==========
+
+    def count(self, respuesta: dict) -> dict:
+        estado = respuesta['status']
+        self.counts[estado] = self.counts.get(estado, 0) + 1
+        return respuesta
+
+    def metrics(self) -> dict:
+        latencias = list(self.latencies)
+        esperas = list(self.queue_waits)
+        atendidos = sum(self.counts.values())
+        return {
+            'uptime_s': round(time.monotonic() - self.started, 3),
+            'workers': self.workers,
+            'queue_depth': self.queue.qsize() if self.queue is not None else 0,
+            'queue_capacity': self.queue_size,
+            'max_queue_depth': self.max_queue_depth,
+            'in_flight': self.in_flight,
+            'requests': atendidos,
+            'status': dict(self.counts),
+            'cache': {'entries': len(self.compiled), 'hits': self.cache_hits,
+                      'misses': self.cache_misses},
+            'latency_ms': {f"p{q}": round(percentile(latencias, q), 3) for q in (50, 90, 99)},
+            'queue_wait_ms': {f"p{q}": round(percentile(esperas, q), 3) for q in (50, 90, 99)},
+        }
+
+async def serve(servicio: Mini0Service, host: str = '127.0.0.1', port: int = DEFAULT_PORT,
+                unix: Optional[str] = None, listo=None):
+    """Atiende conexiones hasta que se cancela (o llega SIGTERM/SIGINT);
+    'listo' recibe la dirección real"""
+    loop = asyncio.get_running_loop()
+    tarea = asyncio.current_task()
+    for senal in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(senal, tarea.cancel)
+        except (NotImplementedError, RuntimeError):  # Windows
+            pass
+    await servicio.start()
+    try:
+        if unix:
+            servidor = await asyncio.start_unix_server(servicio.handle_connection, unix,
+                                                       limit=MAX_REQUEST_BYTES)
+            direccion = unix
+        else:
+            servidor = await asyncio.start_server(servicio.handle_connection, host, port,
+                                                  limit=MAX_REQUEST_BYTES)
+            direccion = servidor.sockets[0].getsockname()[:2]
+        if listo is not None:
+            listo(direccion)
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        await servicio.close()
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Servicio que ejecuta programas Mini-0 (JSON por líneas)")
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="0: un puerto libre")
+    arg_parser.add_argument('--unix', metavar='RUTA', help="socket Unix en lugar de TCP")
+    arg_parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help="procesos del pool (por omisión, uno por CPU)")
+    arg_parser.add_argument('--queue-size', type=int, default=256,
+                            help="pedidos en espera antes de dejar de leer conexiones")
+    arg_parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                            help="tiempo límite máximo por pedido en segundos")
+    arg_parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                            help="programas compilados que se conservan")
+    add_limit_arguments(arg_parser)
+    args = arg_parser.parse_args()
+
+    servicio = Mini0Service(args.workers, args.queue_size, args.timeout, args.cache_size,
+                            limits_from_args(args))
+
+    def listo(direccion):
+        destino = direccion if isinstance(direccion, str) else f"{direccion[0]}:{direccion[1]}"
+        print(f"✓ Escuchando en {destino} ({args.workers} procesos)", flush=True)
+    try:
+        asyncio.run(serve(servicio, args.host, args.port, args.unix, listo))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+if __name__ == "__main__":
+    main()
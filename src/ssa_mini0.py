@@ -0,0 +1,934 @@
+"""
+Representación intermedia SSA de Mini-0
+Baja cada función del AST verificado a un grafo de bloques básicos en forma
+SSA, construida directamente con el algoritmo de Braun et al. ("Simple and
+Efficient Construction of Static Single Assignment Form"): las variables
+locales se leen y escriben por bloque, los bloques se sellan cuando se
+conocen todos sus predecesores y las phi triviales se eliminan.
+
+Además del grafo se conserva su estructura (secuencias, if y while) para que
+un backend pueda volver a generar código estructurado. Sobre el IR corren:
+  - plegado de constantes y eliminación de subexpresiones comunes sobre el
+    árbol de dominadores (las lecturas de arreglos y globales solo dentro
+    del bloque, hasta la siguiente escritura o llamada)
+  - movimiento de código invariante fuera de los ciclos (LICM)
+  - reducción de fuerza: i * k, con i variable de inducción y k invariante,
+    pasa a ser una nueva variable de inducción que se incrementa
+  - análisis de índices no negativos (para omitir esa verificación)
+  - eliminación de código muerto
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ast_mini0 import ASTArena, NodeKind, NONE, numeral_value
+from src.semantic_mini0 import SemanticChecker
+from src.runtime_mini0 import CompileError, default_value, int_div, load_program
+from src.strings_mini0 import intern_literal
+
+# Operaciones sin efectos que no pueden fallar: se pueden mover o descartar
+SAFE_BINARY = frozenset(('+', '-', '*', '<', '<=', '>', '>=', '=', '<>', 'is', 'is not', 'concat'))
+# Operaciones que escriben memoria o pueden hacerlo (invalidan lecturas previas)
+SIDE_EFFECTS = frozenset(('istore', 'gstore', 'call'))
+
+FOLD = {
+    '+': lambda a, b: a + b, '-': lambda a, b: a - b, '*': lambda a, b: a * b,
+    '<': lambda a, b: a < b, '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b, '>=': lambda a, b: a >= b,
+    '=': lambda a, b: a == b, '<>': lambda a, b: a != b,
+}
+COMMUTATIVE = frozenset(('+', '*', '=', '<>'))
+
+class Value:
+    """Valor SSA: constante, parámetro, phi o instrucción de un bloque
+
+    op: 'const' (attr = valor), 'param' (attr = nombre), 'phi' (attr = nombre
+    de la variable), 'bin'/'logic'/'un' (attr = operador; 'concat' para
+    strings), 'index' (attr = 'char' si indexa un string, si no None),
+    'istore', 'gload'/'gstore' (attr = global), 'new' (attr = tipo de
+    elemento) y 'call' (attr = función)."""
+
+    __slots__ = ('id', 'op', 'args', 'attr', 'block', 'line', 'forward')
+
+    def __init__(self, id: int, op: str, args: List['Value'], attr=None, block=None, line: int = 0):
+        self.id = id
+        self.op = op
+        self.args = args
+        self.attr = attr
+        self.block = block
+        self.line = line
+        self.forward: Optional['Value'] = None
+
+    def __repr__(self) -> str:
+        if self.op == 'const':
+            return repr(self.attr)
+        return f"%{self.id}"
+
+def resolve(valor: Value) -> Value:
+    """Sigue los reemplazos (phi triviales, subexpresiones eliminadas)"""
+    while valor.forward is not None:
+        valor = valor.forward
+    return valor
+
+class Block:
+    """Bloque básico; term es ('jump', destino), ('branch', cond, sí, no) o
+    ('return', valor o None)"""
+
+    __slots__ = ('id', 'instrs', 'phis', 'preds', 'term', 'sealed', 'incomplete')
+
+    def __init__(self, id: int):
+        self.id = id
+        self.instrs: List[Value] = []
+        self.phis: List[Value] = []
+        self.preds: List['Block'] = []
+        self.term: Optional[tuple] = None
+        self.sealed = False
+        self.incomplete: Dict[object, Value] = {}
+
+    @property
+    def succs(self) -> List['Block']:
+        if self.term is None or self.term[0] == 'return':
+            return []
+        if self.term[0] == 'jump':
+            return [self.term[1]]
+        return [self.term[2], self.term[3]]
+
+    def __repr__(self) -> str:
+        return f"B{self.id}"
+
+class IfRegion:
+    """if/else estructurado: el bloque anterior en la secuencia termina en el
+    branch; logic es 'and'/'or' si la región viene de un cortocircuito"""
+
+    __slots__ = ('then', 'orelse', 'logic')
+
+    def __init__(self, logic: Optional[str] = None):
+        self.then: list = []
+        self.orelse: list = []
+        self.logic = logic
+
+class LoopRegion:
+    """while estructurado: la cabecera termina en el branch de la condición"""
+
+    __slots__ = ('preheader', 'header', 'body', 'exit_branch')
+
+    def __init__(self, preheader: Block):
+        self.preheader = preheader
+        self.header: list = []
+        self.body: list = []
+        self.exit_branch: Optional[Block] = None
+
+def region_blocks(secuencia: list) -> List[Block]:
+    """Bloques de una secuencia de regiones, en orden de programa"""
+    bloques: List[Block] = []
+    pila = [iter(secuencia)]
+    while pila:
+        elemento = next(pila[-1], None)
+        if elemento is None:
+            pila.pop()
+        elif isinstance(elemento, Block):
+            bloques.append(elemento)
+        elif isinstance(elemento, IfRegion):
+            pila.append(iter(elemento.then + elemento.orelse))
+        else:
+            pila.append(iter(elemento.header + elemento.body))
+    return bloques
+
+def region_loops(secuencia: list) -> List[LoopRegion]:
+    """Ciclos de la secuencia, los internos antes que los que los contienen"""
+    ciclos: List[LoopRegion] = []
+
+    def visitar(items: list):
+        for elemento in items:
+            if isinstance(elemento, IfRegion):
+                visitar(elemento.then)
+                visitar(elemento.orelse)
+            elif isinstance(elemento, LoopRegion):
+                visitar(elemento.header)
+                visitar(elemento.body)
+                ciclos.append(elemento)
+    visitar(secuencia)
+    return ciclos
+
+class SSAFunction:
+    """Función en forma SSA"""
+
+    def __init__(self, name: str, line: int):
+        self.name = name
+        self.line = line
+        self.params: List[Value] = []
+        self.body: list = []
+        self.blocks: List[Block] = []
+        self.entry: Optional[Block] = None
+        self.next_id = 0
+        self.consts: Dict[tuple, Value] = {}
+        # Resultado del análisis de rango (valores enteros que nunca son negativos)
+        self.nonneg: Set[int] = set()
+
+    def new_value(self, op: str, args: List[Value], attr=None, block=None, line: int = 0) -> Value:
+        valor = Value(self.next_id, op, args, attr, block, line)
+        self.next_id += 1
+        return valor
+
+    def const(self, valor) -> Value:
+        clave = (type(valor), valor)
+        if clave not in self.consts:
+            self.consts[clave] = self.new_value('const', [], valor)
+        return self.consts[clave]
+
+    def new_block(self) -> Block:
+        bloque = Block(len(self.blocks))
+        self.blocks.append(bloque)
+        return bloque
+
+    def live_blocks(self) -> List[Block]:
+        return region_blocks(self.body)
+
+    def instruction_count(self) -> int:
+        return sum(len(b.instrs) + len(b.phis) for b in self.live_blocks())
+
+    def dump(self) -> str:
+        lineas = [f"fun {self.name}({', '.join(f'%{p.id}:{p.attr}' for p in self.params)})"]
+        for bloque in self.live_blocks():
+            preds = ', '.join(map(repr, bloque.preds))
+            lineas.append(f"  {bloque!r}:" + (f"  ; preds {preds}" if preds else ''))
+            for instr in bloque.phis + bloque.instrs:
+                args = ', '.join(repr(resolve(a)) for a in instr.args)
+                attr = f" {instr.attr}" if instr.attr is not None else ''
+                lineas.append(f"    %{instr.id} = {instr.op}{attr} {args}".rstrip())
+            term = bloque.term
+            if term is None:
+                continue
+            if term[0] == 'jump':
+                lineas.append(f"    jump {term[1]!r}")
+            elif term[0] == 'branch':
+                lineas.append(f"    branch {resolve(term[1])!r} ? {term[2]!r} : {term[3]!r}")
+            else:
+                lineas.append(f"    return {resolve(term[1])!r}" if term[1] is not None else "    return")
+        return '\n'.join(lineas)
+
+class SSAProgram:
+    def __init__(self):
+        self.globals: List[Tuple[str, object]] = []
+        self.functions: List[SSAFunction] = []
+
+    def dump(self) -> str:
+        partes = [f"global {nombre} = {valor!r}" for nombre, valor in self.globals]
+        partes.extend(funcion.dump() for funcion in self.functions)
+        return '\n'.join(partes)
+
+class SSABuilder:
+    """Baja el AST verificado a SSA con el algoritmo de Braun et al."""
+
+    def __init__(self, arena: ASTArena, checker: SemanticChecker):
+        self.arena = arena
+        self.types = checker.types
+        self.program = SSAProgram()
+        self.global_names: Set[str] = set()
+        self.func: Optional[SSAFunction] = None
+        self.block: Optional[Block] = None
+        self.seq: list = []
+        self.scopes: List[Dict[str, int]] = []
+        # Definición actual de cada variable (nodo de la declaración) por bloque
+        self.defs: Dict[int, Dict[Block, Value]] = {}
+        self.var_names: Dict[int, str] = {}
+
+    def build(self) -> SSAProgram:
+        arena = self.arena
+        for decl in arena.children(arena.root):
+            if arena.kind[decl] != NodeKind.FUNC:
+                nombre = arena.text(decl)
+                self.global_names.add(nombre)
+                self.program.globals.append((nombre, default_value(self.type_of(arena.first_child[decl]))))
+        try:
+            for decl in arena.children(arena.root):
+                if arena.kind[decl] == NodeKind.FUNC:
+                    self.program.functions.append(self.build_function(decl))
+        except RecursionError:
+            raise CompileError(["Programa demasiado anidado para el IR SSA"]) from None
+        return self.program
+
+    def type_of(self, nodo: int) -> str:
+        kind = self.arena.kind[nodo]
+        if kind == NodeKind.VOID:
+            return 'void'
+        if kind == NodeKind.ARRAY_TYPE:
+            return '[]' + self.type_of(self.arena.first_child[nodo])
+        return self.arena.text(nodo)
+
+    # ========== Bloques y variables (Braun et al.) ==========
+
+    def emit(self, op: str, args: List[Value], attr=None, nodo: int = NONE) -> Value:
+        valor = self.func.new_value(op, args, attr, self.block, self.arena.line(nodo) if nodo != NONE else 0)
+        self.block.instrs.append(valor)
+        return valor
+
+    def start_block(self, bloque: Block):
+        self.block = bloque
+        self.seq.append(bloque)
+
+    def jump(self, origen: Block, destino: Block):
+        origen.term = ('jump', destino)
+        destino.preds.append(origen)
+
+    def branch(self, condicion: Value, si: Block, no: Block):
+        origen = self.block
+        origen.term = ('branch', condicion, si, no)
+        si.preds.append(origen)
+        no.preds.append(origen)
+
+    def write_var(self, clave: int, bloque: Block, valor: Value):
+        self.defs.setdefault(clave, {})[bloque] = valor
+
+    def read_var(self, clave: int, bloque: Block) -> Value:
+        definiciones = self.defs.setdefault(clave, {})
+        camino = []
+        # Cadenas de un solo predecesor: iterativo en lugar de recursivo
+        while bloque not in definiciones and bloque.sealed and len(bloque.preds) == 1:
+            camino.append(bloque)
+            bloque = bloque.preds[0]
+        if bloque in definiciones:
+            valor = resolve(definiciones[bloque])
+        elif not bloque.sealed:
+            valor = self.new_phi(bloque, clave)
+            bloque.incomplete[clave] = valor
+            definiciones[bloque] = valor
+        else:
+            phi = self.new_phi(bloque, clave)
+            definiciones[bloque] = phi
+            valor = self.add_phi_operands(clave, phi)
+            definiciones[bloque] = valor
+        for intermedio in camino:
+            definiciones[intermedio] = valor
+        return valor
+
+    def new_phi(self, bloque: Block, clave: int) -> Value:
+        phi = self.func.new_value('phi', [], self.var_names[clave], bloque)
+        bloque.phis.append(phi)
+        return phi
+
+    def add_phi_operands(self, clave: int, phi: Value) -> Value:
+        for pred in phi.block.preds:
+            phi.args.append(self.read_var(clave, pred))
+        return remove_trivial_phi(phi)
+
+    def seal(self, bloque: Block):
+        for clave, phi in bloque.incomplete.items():
+            self.add_phi_operands(clave, phi)
+        bloque.incomplete = {}
+        bloque.sealed = True
+
+    def declare(self, nombre: str, nodo: int) -> int:
+        self.scopes[-1][nombre] = nodo
+        self.var_names[nodo] = nombre
+        return nodo
+
+    def lookup(self, nombre: str) -> Optional[int]:
+        for ambito in reversed(self.scopes):
+            if nombre in ambito:
+                return ambito[nombre]
+        return None
+
+    # ========== Funciones y comandos ==========
+
+    def build_function(self, nodo: int) -> SSAFunction:
+        arena = self.arena
+        params, retorno, cuerpo = arena.children(nodo)
+        self.func = funcion = SSAFunction(arena.text(nodo), arena.line(nodo))
+        self.seq = funcion.body
+        self.scopes = [{}]
+        self.defs = {}
+        entrada = funcion.entry = funcion.new_block()
+        entrada.sealed = True
+        self.start_block(entrada)
+        for param in arena.children(params):
+            clave = self.declare(arena.text(param), param)
+            valor = funcion.new_value('param', [], arena.text(param), None, arena.line(param))
+            funcion.params.append(valor)
+            self.write_var(clave, entrada, valor)
+        self.lower_block(cuerpo, new_scope=False)
+        if self.block is not None:
+            tipo = self.type_of(retorno)
+            self.block.term = ('return', funcion.const(None if tipo == 'void' else default_value(tipo)))
+        finish_phis(funcion)
+        return funcion
+
+    def lower_block(self, nodo: int, new_scope: bool = True):
+        if new_scope:
+            self.scopes.append({})
+        for comando in self.arena.children(nodo):
+            if self.block is None:
+                break  # inalcanzable después de un return
+            self.lower_statement(comando)
+        if new_scope:
+            self.scopes.pop()
+
+    def lower_statement(self, nodo: int):
+        arena = self.arena
+        kind = arena.kind[nodo]
+        if kind == NodeKind.VARDECL:
+            clave = self.declare(arena.text(nodo), nodo)
+            inicial = default_value(self.type_of(arena.first_child[nodo]))
+            self.write_var(clave, self.block, self.func.const(inicial))
+        elif kind == NodeKind.ASSIGN:
+            destino, valor_nodo = arena.children(nodo)
+            if arena.kind[destino] == NodeKind.VAR:
+                valor = self.expr(valor_nodo)
+                clave = self.lookup(arena.text(destino))
+                if clave is None:
+                    self.emit('gstore', [valor], arena.text(destino), nodo)
+                else:
+                    self.write_var(clave, self.block, valor)
+            else:
+                base_nodo, indice_nodo = arena.children(destino)
+                base = self.expr(base_nodo)
+                indice = self.expr(indice_nodo)
+                valor = self.expr(valor_nodo)
+                self.emit('istore', [base, indice, valor], None, nodo)
+        elif kind == NodeKind.CALL:
+            self.expr(nodo)
+        elif kind == NodeKind.IF:
+            self.lower_if(nodo)
+        elif kind == NodeKind.WHILE:
+            self.lower_while(nodo)
+        else:  # RETURN
+            valor_nodo = arena.first_child[nodo]
+            valor = self.expr(valor_nodo) if valor_nodo != NONE else None
+            self.block.term = ('return', valor)
+            self.block = None
+
+    def lower_if(self, nodo: int):
+        """if / else if / else con un único bloque de unión para todas las ramas"""
+        funcion = self.func
+        hijos = list(self.arena.children(nodo))
+        secuencia_externa = self.seq
+        finales: List[Block] = []
+        for i in range(0, len(hijos) - 1, 2):
+            condicion = self.expr(hijos[i])
+            si, no = funcion.new_block(), funcion.new_block()
+            self.branch(condicion, si, no)
+            si.sealed = no.sealed = True
+            region = IfRegion()
+            self.seq.append(region)
+            self.seq = region.then
+            self.start_block(si)
+            self.lower_block(hijos[i + 1])
+            if self.block is not None:
+                finales.append(self.block)
+            self.seq = region.orelse
+            self.start_block(no)
+        if len(hijos) % 2:
+            self.lower_block(hijos[-1])
+        if self.block is not None:
+            finales.append(self.block)
+        self.seq = secuencia_externa
+        if not finales:
+            self.block = None
+            return
+        union = funcion.new_block()
+        for final in finales:
+            self.jump(final, union)
+        self.seal(union)
+        self.start_block(union)
+
+    def lower_while(self, nodo: int):
+        funcion = self.func
+        condicion_nodo, cuerpo_nodo = self.arena.children(nodo)
+        region = LoopRegion(self.block)
+        cabecera = funcion.new_block()
+        self.jump(self.block, cabecera)
+        self.seq.append(region)
+        secuencia_externa = self.seq
+        self.seq = region.header
+        self.start_block(cabecera)
+        condicion = self.expr(condicion_nodo)
+        region.exit_branch = self.block
+        cuerpo, salida = funcion.new_block(), funcion.new_block()
+        self.branch(condicion, cuerpo, salida)
+        cuerpo.sealed = salida.sealed = True
+        self.seq = region.body
+        self.start_block(cuerpo)
+        self.lower_block(cuerpo_nodo)
+        if self.block is not None:
+            self.jump(self.block, cabecera)
+        self.seal(cabecera)
+        self.seq = secuencia_externa
+        self.start_block(salida)
+
+    # ========== Expresiones ==========
+
+    def expr(self, nodo: int) -> Value:
+        arena = self.arena
+        funcion = self.func
+        kind = arena.kind[nodo]
+        if kind == NodeKind.NUM:
+            return funcion.const(numeral_value(arena.text(nodo)))
+        if kind == NodeKind.STR:
+            return funcion.const(intern_literal(arena.text(nodo)))
+        if kind == NodeKind.BOOL:
+            return funcion.const(arena.text(nodo) == 'true')
+        if kind == NodeKind.VAR:
+            clave = self.lookup(arena.text(nodo))
+            if clave is None:
+                return self.emit('gload', [], arena.text(nodo), nodo)
+            return self.read_var(clave, self.block)
+        if kind == NodeKind.BINOP:
+            operador = arena.text(nodo)
+            izquierda, derecha = arena.children(nodo)
+            if operador in ('and', 'or'):
+                return self.lower_logic(nodo, operador, izquierda, derecha)
+            a = self.expr(izquierda)
+            b = self.expr(derecha)
+            if operador in ('=', '<>') and self.types.get(izquierda, '').startswith('[]'):
+                operador = 'is' if operador == '=' else 'is not'
+            elif operador == '+' and self.types.get(nodo) == 'string':
+                operador = 'concat'
+            return self.emit('bin', [a, b], operador, nodo)
+        if kind == NodeKind.UNOP:
+            return self.emit('un', [self.expr(arena.first_child[nodo])], arena.text(nodo), nodo)
+        if kind == NodeKind.INDEX:
+            base_nodo, indice_nodo = arena.children(nodo)
+            base = self.expr(base_nodo)
+            caracter = 'char' if self.types.get(base_nodo) == 'string' else None
+            return self.emit('index', [base, self.expr(indice_nodo)], caracter, nodo)
+        if kind == NodeKind.NEW:
+            tamano = arena.first_child[nodo]
+            return self.emit('new', [self.expr(tamano)], self.type_of(arena.next_sibling[tamano]), nodo)
+        argumentos = [self.expr(hijo) for hijo in arena.children(nodo)]
+        return self.emit('call', argumentos, arena.text(nodo), nodo)
+
+    def safe_subtree(self, raiz: int) -> bool:
+        """El subárbol no tiene efectos ni puede fallar (se puede evaluar antes de tiempo)"""
+        arena = self.arena
+        pila = [raiz]
+        while pila:
+            nodo = pila.pop()
+            kind = arena.kind[nodo]
+            if kind in (NodeKind.INDEX, NodeKind.CALL, NodeKind.NEW):
+                return False
+            if kind == NodeKind.BINOP and arena.text(nodo) == '/':
+                return False
+            pila.extend(arena.children(nodo))
+        return True
+
+    def lower_logic(self, nodo: int, operador: str, izquierda: int, derecha: int) -> Value:
+        a = self.expr(izquierda)
+        if self.safe_subtree(derecha):
+            # El operando derecho se puede evaluar siempre: una sola instrucción
+            return self.emit('logic', [a, self.expr(derecha)], operador, nodo)
+        funcion = self.func
+        evalua, corta = funcion.new_block(), funcion.new_block()
+        if operador == 'and':
+            self.branch(a, evalua, corta)
+        else:
+            self.branch(a, corta, evalua)
+        evalua.sealed = corta.sealed = True
+        region = IfRegion(operador)
+        self.seq.append(region)
+        secuencia_externa = self.seq
+        self.seq = region.then if operador == 'and' else region.orelse
+        self.start_block(evalua)
+        b = self.expr(derecha)
+        final = self.block
+        self.seq = region.orelse if operador == 'and' else region.then
+        self.start_block(corta)
+        self.seq = secuencia_externa
+        union = funcion.new_block()
+        self.jump(final, union)
+        self.jump(corta, union)
+        union.sealed = True
+        phi = funcion.new_value('phi', [b, a], operador, union, self.arena.line(nodo))
+        union.phis.append(phi)
+        self.start_block(union)
+        return phi
+
+def remove_trivial_phi(phi: Value) -> Value:
+    """Reemplaza la phi si todos sus operandos (salvo ella misma) son el mismo valor"""
+    unico = None
+    for operando in phi.args:
+        operando = resolve(operando)
+        if operando is unico or operando is phi:
+            continue
+        if unico is not None:
+            return phi
+        unico = operando
+    if unico is None:
+        return phi
+    phi.forward = unico
+    return unico
+
+def finish_phis(funcion: SSAFunction):
+    """Elimina las phi triviales hasta un punto fijo y resuelve los operandos"""
+    cambio = True
+    while cambio:
+        cambio = False
+        for bloque in funcion.blocks:
+            vivas = []
+            for phi in bloque.phis:
+                if phi.forward is None and remove_trivial_phi(phi) is phi:
+                    vivas.append(phi)
+                else:
+                    cambio = True
+            bloque.phis = vivas
+    resolve_all(funcion)
+
+def resolve_all(funcion: SSAFunction):
+    for bloque in funcion.blocks:
+        for instr in bloque.phis + bloque.instrs:
+            instr.args = [resolve(a) for a in instr.args]
+        term = bloque.term
+        if term is not None and term[0] == 'branch':
+            bloque.term = ('branch', resolve(term[1]), term[2], term[3])
+        elif term is not None and term[0] == 'return' and term[1] is not None:
+            bloque.term = ('return', resolve(term[1]))
+
+# ========== Optimizaciones ==========
+
+class SSAOptimizer:
+    """Pasadas sobre una función SSA; cuenta lo que cambió cada una"""
+
+    def __init__(self, funcion: SSAFunction):
+        self.func = funcion
+        self.folded = 0
+        self.cse = 0
+        self.hoisted = 0
+        self.reduced = 0
+        self.removed = 0
+
+    def run(self):
+        self.value_numbering()
+        resolve_all(self.func)
+        for ciclo in region_loops(self.func.body):
+            self.hoist_invariants(ciclo)
+            self.strength_reduce(ciclo)
+        resolve_all(self.func)
+        self.eliminate_dead_code()
+        self.func.nonneg = nonnegative_values(self.func)
+
+    # ---- plegado y subexpresiones comunes ----
+
+    def dominator_children(self) -> Dict[Block, List[Block]]:
+        """Hijos en el árbol de dominadores (Cooper, Harvey y Kennedy)"""
+        entrada = self.func.entry
+        orden: List[Block] = []
+        visitados = {entrada}
+        pila = [(entrada, iter(entrada.succs))]
+        while pila:
+            bloque, sucesores = pila[-1]
+            siguiente = next(sucesores, None)
+            if siguiente is None:
+                pila.pop()
+                orden.append(bloque)
+            elif siguiente not in visitados:
+                visitados.add(siguiente)
+                pila.append((siguiente, iter(siguiente.succs)))
+        orden.reverse()
+        numero = {b: i for i, b in enumerate(orden)}
+        idom: Dict[Block, Block] = {entrada: entrada}
+
+        def interseccion(a: Block, b: Block) -> Block:
+            while a is not b:
+                while numero[a] > numero[b]:
+                    a = idom[a]
+                while numero[b] > numero[a]:
+                    b = idom[b]
+            return a
+
+        cambio = True
+        while cambio:
+            cambio = False
+            for bloque in orden[1:]:
+                procesados = [p for p in bloque.preds if p in idom]
+                nuevo = procesados[0]
+                for pred in procesados[1:]:
+                    nuevo = interseccion(pred, nuevo)
+                if idom.get(bloque) is not nuevo:
+                    idom[bloque] = nuevo
+                    cambio = True
+        hijos: Dict[Block, List[Block]] = {b: [] for b in orden}
+        for bloque in orden[1:]:
+            hijos[idom[bloque]].append(bloque)
+        return hijos
+
+    def fold(self, instr: Value) -> Optional[Value]:
+        args = instr.args
+        if not all(a.op == 'const' for a in args):
+            return None
+        funcion = self.func
+        if instr.op == 'un':
+            valor = args[0].attr
+            return funcion.const(not valor if instr.attr == 'not' else -valor)
+        if instr.op == 'bin' and instr.attr in FOLD and not isinstance(args[0].attr, str):
+            return funcion.const(FOLD[instr.attr](args[0].attr, args[1].attr))
+        if instr.op == 'bin' and instr.attr == 'concat':
+            return funcion.const(intern_literal(args[0].attr + args[1].attr))
+        if instr.op == 'bin' and instr.attr == '/' and args[1].attr != 0:
+            return funcion.const(int_div(args[0].attr, args[1].attr))
+        return None
+
+    def value_numbering(self):
+        """Numeración de valores sobre el árbol de dominadores"""
+        hijos = self.dominator_children()
+        disponibles: Dict[tuple, Value] = {}
+        pila: List[object] = [self.func.entry]
+        while pila:
+            elemento = pila.pop()
+            if isinstance(elemento, list):
+                for clave in elemento:  # salida del subárbol: deshacer
+                    del disponibles[clave]
+                continue
+            bloque = elemento
+            agregadas: List[tuple] = []
+            memoria: Dict[tuple, Value] = {}
+            conservadas = []
+            for instr in bloque.instrs:
+                instr.args = [resolve(a) for a in instr.args]
+                plegado = self.fold(instr)
+                if plegado is not None:
+                    instr.forward = plegado
+                    self.folded += 1
+                    continue
+                clave = self.key(instr)
+                if clave is not None:
+                    existente = disponibles.get(clave)
+                    if existente is not None:
+                        instr.forward = existente
+                        self.cse += 1
+                        continue
+                    disponibles[clave] = instr
+                    agregadas.append(clave)
+                elif instr.op in ('index', 'gload'):
+                    clave = (instr.op, instr.attr) + tuple(a.id for a in instr.args)
+                    if clave in memoria:
+                        instr.forward = memoria[clave]
+                        self.cse += 1
+                        continue
+                    memoria[clave] = instr
+                elif instr.op == 'istore':
+                    base, indice, valor = instr.args
+                    memoria = {c: v for c, v in memoria.items() if c[0] != 'index'}
+                    memoria[('index', None, base.id, indice.id)] = valor
+                elif instr.op == 'gstore':
+                    memoria[('gload', instr.attr)] = instr.args[0]
+                elif instr.op == 'call':
+                    memoria = {}
+                conservadas.append(instr)
+            bloque.instrs = conservadas
+            pila.append(agregadas)
+            pila.extend(reversed(hijos[bloque]))
+
+    @staticmethod
+    def key(instr: Value) -> Optional[tuple]:
+        """Clave de una operación pura (None si no se puede reutilizar)"""
+        if instr.op not in ('bin', 'un', 'logic'):
+            return None
+        ids = [a.id for a in instr.args]
+        if instr.op == 'bin' and instr.attr in COMMUTATIVE:
+            ids.sort()
+        return (instr.op, instr.attr) + tuple(ids)
+
+    # ---- código invariante ----
+
+    def hoist_invariants(self, ciclo: LoopRegion):
+        bloques = region_blocks(ciclo.header + ciclo.body)
+        dentro = set(bloques)
+        instrucciones = [i for b in bloques for i in b.instrs]
+        llama = any(i.op == 'call' for i in instrucciones)
+        globales_escritas = {i.attr for i in instrucciones if i.op == 'gstore'}
+        preheader = ciclo.preheader
+        for bloque in bloques:
+            conservadas = []
+            for instr in bloque.instrs:
+                movible = hoistable(instr) or (instr.op == 'gload' and not llama
+                                               and instr.attr not in globales_escritas)
+                if movible and all(a.block not in dentro for a in instr.args):
+                    instr.block = preheader
+                    preheader.instrs.append(instr)
+                    self.hoisted += 1
+                else:
+                    conservadas.append(instr)
+            bloque.instrs = conservadas
+
+    # ---- reducción de fuerza ----
+
+    def induction_step(self, phi: Value, ciclo: LoopRegion, dentro: Set[Block]) -> Optional[Tuple[Value, Block, int]]:
+        """(valor inicial, bloque del salto hacia atrás, paso) si phi = phi(inicio, phi ± c)"""
+        cabecera = ciclo.header[0]
+        if len(cabecera.preds) != 2 or len(phi.args) != 2:
+            return None
+        inicial = siguiente = latch = None
+        for pred, arg in zip(cabecera.preds, phi.args):
+            if pred in dentro:
+                latch, siguiente = pred, arg
+            else:
+                inicial = arg
+        if siguiente is None or inicial is None or siguiente.op != 'bin':
+            return None
+        a, b = siguiente.args
+        if siguiente.attr == '+' and a is phi and b.op == 'const' and type(b.attr) is int:
+            return inicial, latch, b.attr
+        if siguiente.attr == '+' and b is phi and a.op == 'const' and type(a.attr) is int:
+            return inicial, latch, a.attr
+        if siguiente.attr == '-' and a is phi and b.op == 'const' and type(b.attr) is int:
+            return inicial, latch, -b.attr
+        return None
+
+    def strength_reduce(self, ciclo: LoopRegion):
+        """i * k (k invariante) -> variable de inducción q, con q += paso * k"""
+        bloques = region_blocks(ciclo.header + ciclo.body)
+        dentro = set(bloques)
+        cabecera = ciclo.header[0]
+        inducciones = {}
+        for phi in cabecera.phis:
+            paso = self.induction_step(phi, ciclo, dentro)
+            if paso is not None:
+                inducciones[phi] = paso
+        if not inducciones:
+            return
+        candidatas = []
+        for bloque in bloques:
+            for instr in bloque.instrs:
+                if instr.op == 'bin' and instr.attr == '*':
+                    a, b = instr.args
+                    if a not in inducciones:
+                        a, b = b, a
+                    if a in inducciones and b.block not in dentro:
+                        candidatas.append((instr, a, b))
+        reducidas: Dict[Tuple[int, int], Value] = {}
+        for instr, induccion, factor in candidatas:
+            clave = (induccion.id, factor.id)
+            if clave not in reducidas:
+                reducidas[clave] = self.new_induction(ciclo, inducciones[induccion], factor, instr.line)
+            instr.block.instrs.remove(instr)
+            instr.forward = reducidas[clave]
+            self.reduced += 1
+
+    def new_induction(self, ciclo: LoopRegion, induccion, factor: Value, linea: int) -> Value:
+        funcion = self.func
+        inicial, latch, paso = induccion
+        cabecera = ciclo.header[0]
+        inicio = self.multiply(inicial, factor, ciclo.preheader, linea)
+        incremento = self.multiply(funcion.const(paso), factor, ciclo.preheader, linea)
+        phi = funcion.new_value('phi', [], 'q', cabecera, linea)
+        siguiente = funcion.new_value('bin', [phi, incremento], '+', latch, linea)
+        latch.instrs.append(siguiente)
+        phi.args = [siguiente if pred is latch else inicio for pred in cabecera.preds]
+        cabecera.phis.append(phi)
+        return phi
+
+    def multiply(self, a: Value, b: Value, bloque: Block, linea: int) -> Value:
+        """a * b al final del bloque, plegando constantes y los factores 0 y 1"""
+        funcion = self.func
+        if a.op == 'const' and b.op == 'const':
+            return funcion.const(a.attr * b.attr)
+        if a.op != 'const':
+            a, b = b, a
+        if a.op == 'const' and a.attr in (0, 1):
+            return funcion.const(0) if a.attr == 0 else b
+        producto = funcion.new_value('bin', [a, b], '*', bloque, linea)
+        bloque.instrs.append(producto)
+        return producto
+
+    # ---- código muerto ----
+
+    def eliminate_dead_code(self):
+        """Marca lo vivo desde los efectos, terminadores y operaciones que pueden fallar"""
+        bloques = self.func.live_blocks()
+        vivos: Set[Value] = set()
+        pendientes: List[Value] = []
+        for bloque in bloques:
+            for instr in bloque.instrs:
+                if not hoistable(instr) and instr.op != 'gload':
+                    pendientes.append(instr)
+            term = bloque.term
+            if term is not None and term[0] == 'branch':
+                pendientes.append(term[1])
+            elif term is not None and term[0] == 'return' and term[1] is not None:
+                pendientes.append(term[1])
+        while pendientes:
+            valor = pendientes.pop()
+            if valor in vivos:
+                continue
+            vivos.add(valor)
+            pendientes.extend(valor.args)
+        for bloque in bloques:
+            antes = len(bloque.instrs) + len(bloque.phis)
+            bloque.instrs = [i for i in bloque.instrs if i in vivos]
+            bloque.phis = [p for p in bloque.phis if p in vivos]
+            self.removed += antes - len(bloque.instrs) - len(bloque.phis)
+
+def hoistable(instr: Value) -> bool:
+    """Operación pura que no puede fallar (se puede evaluar de más)"""
+    if instr.op in ('un', 'logic'):
+        return True
+    if instr.op != 'bin':
+        return False
+    if instr.attr in SAFE_BINARY:
+        return True
+    divisor = instr.args[1]
+    return instr.attr == '/' and divisor.op == 'const' and divisor.attr != 0
+
+def nonnegative_values(funcion: SSAFunction) -> Set[int]:
+    """Ids de valores enteros que nunca son negativos: punto fijo optimista
+    (phi, sumas, productos y cocientes empiezan como no negativos y se
+    descartan hasta estabilizar)"""
+    valores = [v for b in funcion.live_blocks() for v in b.phis + b.instrs
+               if v.op == 'phi' or (v.op == 'bin' and v.attr in ('+', '*', '/'))]
+    no_negativos = {v.id for v in valores}
+
+    def no_negativo(valor: Value) -> bool:
+        if valor.op == 'const':
+            return type(valor.attr) is int and valor.attr >= 0
+        return valor.id in no_negativos
+
+    cambio = True
+    while cambio:
+        cambio = False
+        for valor in valores:
+            actual = all(no_negativo(a) for a in valor.args)
+            if actual != (valor.id in no_negativos):
+                (no_negativos.add if actual else no_negativos.discard)(valor.id)
+                cambio = True
+    return no_negativos
+
+def build_ssa(arena: ASTArena, checker: SemanticChecker, optimize: bool = True):
+    """Construye el IR (y lo optimiza); retorna (programa, optimizadores por función)"""
+    programa = SSABuilder(arena, checker).build()
+    optimizadores = []
+    for funcion in programa.functions:
+        optimizador = SSAOptimizer(funcion)
+        if optimize:
+            optimizador.run()
+        else:
+            funcion.nonneg = set()
+        optimizadores.append(optimizador)
+    return programa, optimizadores
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Muestra el IR SSA de un programa Mini-0")
+    arg_parser.add_argument('archivo', help="archivo .mini0")
+    arg_parser.add_argument('--no-opt', action='store_true', help="sin optimizaciones")
+    arg_parser.add_argument('--quiet', action='store_true', help="solo el resumen de las pasadas")
+    args = arg_parser.parse_args()
+
+    with open(args.archivo, 'r', encoding='utf-8') as f:
+        codigo = f.read()
+    try:
+        arena, checker = load_program(codigo)
+        programa, optimizadores = build_ssa(arena, checker, not args.no_opt)
+    except CompileError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    if not args.quiet:
+        print(programa.dump())
+    if not args.no_opt:
+        print()
+        for funcion, o in zip(programa.functions, optimizadores):
+            print(f"{funcion.name}: {o.folded} plegadas, {o.cse} subexpresiones comunes, "
+                  f"{o.hoisted} invariantes movidas, {o.reduced} reducciones de fuerza, "
+                  f"{o.removed} muertas, {len(funcion.nonneg)} valores no negativos")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,441 @@
+"""
+Backend Python del IR SSA de Mini-0
+Genera código Python estructurado a partir de las regiones del IR (if y
+while) y sale de SSA copiando los valores de cada phi al final de los
+bloques predecesores. Las instrucciones con un solo uso en el mismo bloque
+se anidan en la expresión que las usa, las copias de 'i = i + 1' se
+fusionan con la definición y los índices que el análisis de rango prueba
+no negativos se usan sin verificar. Comparte con transpiler_mini0 el
+runtime, la tabla de líneas y el objeto PythonProgram.
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ast_mini0 import ASTArena
+from src.semantic_mini0 import SemanticChecker
+from src.runtime_mini0 import CompileError, load_program
+from src.ssa_mini0 import (
+    Block, IfRegion, LoopRegion, SSAFunction, SSAProgram, Value, build_ssa,
+)
+from src.positions_mini0 import encode_lines
+from src.transpiler_mini0 import (
+    CODE_FILENAME, PREC_ATOM, PREC_CMP, PREC_NOT, PREC_UNARY, PYTHON_BINARY, PythonProgram,
+)
+
+# Instrucciones que se emiten como comando aunque no tengan usos
+STATEMENT_OPS = frozenset(('istore', 'gstore'))
+# Orden en que Python evalúa base, índice y valor de 'base[indice] = valor'
+ISTORE_ORDER = (1, 2, 0)
+
+def pure(instr: Value) -> bool:
+    """No lee memoria, no falla y no tiene efectos: se puede evaluar en cualquier momento"""
+    return instr.op in ('bin', 'logic', 'un') and instr.attr != '/'
+
+def evaluation_order(ranura: Optional[int], orden: Optional[tuple]) -> int:
+    return ranura if orden is None else orden[ranura]
+
+class SSAPythonBackend:
+    """Traduce un SSAProgram a código fuente Python"""
+
+    def __init__(self, programa: SSAProgram):
+        self.program = programa
+        self.output: List[str] = []
+        self.lines: List[int] = [0]
+        self.indent = 0
+        self.func: Optional[SSAFunction] = None
+        self.names: Dict[Value, str] = {}
+        self.inlined: Set[Value] = set()
+        # Copias de phi ya hechas por la definición fusionada
+        self.coalesced: Set[Value] = set()
+        self.resugared: Set[int] = set()
+
+    def generate(self) -> Tuple[str, List[int]]:
+        """Código fuente del módulo y tabla de líneas Python -> Mini-0"""
+        for nombre, valor in self.program.globals:
+            self.emit(f"g_{nombre} = {valor!r}", 0)
+        for funcion in self.program.functions:
+            self.generate_function(funcion)
+        return '\n'.join(self.output) + '\n', self.lines
+
+    def compile(self) -> PythonProgram:
+        fuente, lineas = self.generate()
+        try:
+            code = compile(fuente, CODE_FILENAME, 'exec')
+        except (SyntaxError, RecursionError, MemoryError):
+            raise CompileError(["Programa demasiado anidado para el backend Python"]) from None
+        return PythonProgram(code, encode_lines(lineas))
+
+    def emit(self, linea: str, mini0: int):
+        self.output.append('    ' * self.indent + linea)
+        self.lines.append(mini0)
+
+    # ========== Análisis previo ==========
+
+    def analyze(self, funcion: SSAFunction):
+        """Usos, instrucciones anidables, nombres y copias fusionadas"""
+        bloques = funcion.live_blocks()
+        usos: Dict[Value, list] = {}
+        for bloque in bloques:
+            for instr in bloque.phis + bloque.instrs:
+                for arg in instr.args:
+                    usos.setdefault(arg, []).append(instr)
+            if bloque.term is not None and bloque.term[0] != 'jump' and bloque.term[1] is not None:
+                usos.setdefault(bloque.term[1], []).append(bloque)
+        self.inlined = set()
+        for bloque in bloques:
+            self.inline_block(bloque, usos)
+        self.usos = usos
+        # Locales con prefijo v_, como en el backend Python: no chocan con g_ y f_
+        self.names = {}
+        for valor in funcion.params:
+            self.names[valor] = f"v_{valor.attr}_{valor.id}"
+        for bloque in bloques:
+            for phi in bloque.phis:
+                self.names[phi] = f"v_{phi.attr}_{phi.id}"
+            for instr in bloque.instrs:
+                if instr not in self.inlined:
+                    self.names[instr] = f"v_t{instr.id}"
+        self.resugared = set()
+        self.find_resugared(funcion.body)
+        self.coalesced = set()
+        for bloque in bloques:
+            self.coalesce(bloque)
+
+    def inline_block(self, bloque: Block, usos: Dict[Value, list]):
+        """Decide qué instrucciones del bloque se anidan en su usuario
+
+        Se recorre de atrás hacia adelante: raiz[i] es el comando donde se
+        evalúa finalmente la instrucción i (len(instrs) es el terminador) y
+        ranura[i] el argumento de ese comando que la contiene. Una instrucción
+        que no es pura solo se anida si todas las no puras que salta quedan en
+        el mismo comando y Python las evalúa después (en 'a[i] = v' evalúa v
+        antes que a e i)."""
+        instrs = bloque.instrs
+        fin = len(instrs)
+        posicion = {instr: i for i, instr in enumerate(instrs)}
+        raiz: Dict[int, int] = {}
+        ranura: Dict[int, Optional[int]] = {}
+        for i in range(fin - 1, -1, -1):
+            instr = instrs[i]
+            raiz[i], ranura[i] = i, None
+            usuarios = usos.get(instr, [])
+            if instr.op in STATEMENT_OPS or len(usuarios) != 1:
+                continue
+            usuario = usuarios[0]
+            if usuario is bloque:
+                destino, lugar = fin, 0
+            elif isinstance(usuario, Value) and usuario.op != 'phi' and usuario.block is bloque:
+                u = posicion[usuario]
+                destino = raiz[u]
+                lugar = ranura[u] if ranura[u] is not None else usuario.args.index(instr)
+            else:
+                continue
+            if not pure(instr):
+                # Si falla, el error se informa con la línea del comando que la contiene
+                linea = instrs[destino].line if destino < fin else self.term_line(bloque)
+                if instr.line != linea:
+                    continue
+                orden = ISTORE_ORDER if destino < fin and instrs[destino].op == 'istore' else None
+                if any(not pure(instrs[k]) and (raiz[k] != destino or evaluation_order(ranura[k], orden)
+                                                < evaluation_order(lugar, orden))
+                       for k in range(i + 1, destino)):
+                    continue
+            raiz[i], ranura[i] = destino, lugar
+            self.inlined.add(instr)
+
+    def find_resugared(self, secuencia: list):
+        """Cortocircuitos que se pueden volver a escribir como 'a and b' / 'a or b'"""
+        for i, elemento in enumerate(secuencia):
+            if isinstance(elemento, IfRegion):
+                self.find_resugared(elemento.then)
+                self.find_resugared(elemento.orelse)
+                if elemento.logic is None:
+                    continue
+                brazo = elemento.then if elemento.logic == 'and' else elemento.orelse
+                union = secuencia[i + 1]
+                if len(brazo) != 1 or not union.phis or union.phis[0].attr != elemento.logic:
+                    continue
+                bloque = brazo[0]
+                phi = union.phis[0]
+                valor = phi.args[union.preds.index(bloque)]
+                restantes = [x for x in bloque.instrs if x not in self.inlined and x is not valor]
+                if restantes or (valor.block is bloque and bloque.instrs[-1] is not valor):
+                    continue
+                if valor.block is bloque:
+                    self.inlined.add(valor)
+                    self.names.pop(valor, None)
+                self.resugared.add(id(elemento))
+            elif isinstance(elemento, LoopRegion):
+                self.find_resugared(elemento.header)
+                self.find_resugared(elemento.body)
+
+    def effective_position(self, instr: Value, posicion: Dict[Value, int], bloque: Block) -> int:
+        """Posición del comando donde se evalúa la instrucción (la de su usuario si se anida)"""
+        while instr in self.inlined:
+            usuario = self.usos[instr][0]
+            if usuario is bloque or not isinstance(usuario, Value) or usuario.block is not bloque:
+                return len(bloque.instrs)
+            instr = usuario
+        return posicion[instr]
+
+    def coalesce(self, bloque: Block):
+        """Asigna directamente la variable de la phi cuando no se lee después"""
+        if bloque.term is None or bloque.term[0] != 'jump' or not bloque.term[1].phis:
+            return
+        destino = bloque.term[1]
+        indice = destino.preds.index(bloque)
+        fuentes = [phi.args[indice] for phi in destino.phis]
+        posicion = {instr: i for i, instr in enumerate(bloque.instrs)}
+        for phi, fuente in zip(destino.phis, fuentes):
+            if (fuente.block is not bloque or fuente not in posicion or fuente in self.inlined
+                    or len(self.usos.get(fuente, [])) != 1 or phi in fuentes):
+                continue
+            definicion = posicion[fuente]
+            lecturas = [self.effective_position(x, posicion, bloque) for x in bloque.instrs
+                        if phi in x.args]
+            if all(p <= definicion for p in lecturas):
+                self.names[fuente] = self.names[phi]
+                self.coalesced.add(fuente)
+
+    # ========== Funciones y regiones ==========
+
+    def generate_function(self, funcion: SSAFunction):
+        self.func = funcion
+        self.analyze(funcion)
+        parametros = ', '.join(self.names[p] for p in funcion.params)
+        self.emit(f"def f_{funcion.name}({parametros}):", funcion.line)
+        self.indent += 1
+        globales = sorted({f"g_{i.attr}" for b in funcion.live_blocks() for i in b.instrs
+                           if i.op == 'gstore'})
+        if globales:
+            self.emit(f"global {', '.join(globales)}", funcion.line)
+        inicio = len(self.output)
+        self.emit_seq(funcion.body)
+        if len(self.output) == inicio:
+            self.emit("pass", funcion.line)
+        self.indent -= 1
+
+    def emit_seq(self, secuencia: list):
+        anterior: Optional[Block] = None
+        for i, elemento in enumerate(secuencia):
+            if isinstance(elemento, Block):
+                self.emit_block(elemento)
+                anterior = elemento
+            elif isinstance(elemento, IfRegion):
+                if id(elemento) in self.resugared:
+                    self.emit_logic(anterior, elemento, secuencia[i + 1])
+                else:
+                    self.emit_if(anterior, elemento, 'if')
+            else:
+                self.emit_loop(elemento)
+
+    def silent(self, bloque: Block) -> bool:
+        """El bloque no emite comandos (todas sus instrucciones se anidan)"""
+        return all(instr in self.inlined for instr in bloque.instrs) and \
+            bloque.term is not None and bloque.term[0] == 'branch'
+
+    def emit_if(self, bloque: Block, region: IfRegion, palabra: str):
+        condicion = self.text(bloque.term[1])
+        self.emit(f"{palabra} {condicion}:", self.term_line(bloque))
+        self.indent += 1
+        inicio = len(self.output)
+        self.emit_seq(region.then)
+        if len(self.output) == inicio:
+            self.emit("pass", self.line_of(bloque))
+        self.indent -= 1
+        otro = region.orelse
+        if (len(otro) == 2 and isinstance(otro[1], IfRegion) and otro[1].logic is None
+                and self.silent(otro[0])):
+            self.emit_if(otro[0], otro[1], 'elif')
+            return
+        self.emit("else:", self.line_of(bloque))
+        self.indent += 1
+        inicio = len(self.output)
+        self.emit_seq(otro)
+        self.indent -= 1
+        if len(self.output) == inicio:
+            self.output.pop()
+            self.lines.pop()
+
+    def emit_logic(self, bloque: Block, region: IfRegion, union: Block):
+        phi = union.phis[0]
+        brazo = (region.then if region.logic == 'and' else region.orelse)[0]
+        a, precedencia_a = self.expr(bloque.term[1])
+        b, precedencia_b = self.expr(phi.args[union.preds.index(brazo)])
+        python, precedencia = PYTHON_BINARY[region.logic]
+        a = f"({a})" if precedencia_a < precedencia else a
+        b = f"({b})" if precedencia_b <= precedencia else b
+        self.emit(f"{self.names[phi]} = {a} {python} {b}", phi.line)
+
+    def emit_loop(self, region: LoopRegion):
+        cabecera = region.header[0]
+        condicion = region.exit_branch.term[1]
+        if len(region.header) == 1 and self.silent(cabecera):
+            self.emit(f"while {self.text(condicion)}:", self.term_line(cabecera))
+            self.indent += 1
+        else:
+            self.emit("while True:", self.line_of(cabecera))
+            self.indent += 1
+            self.emit_seq(region.header)
+            texto, precedencia = self.expr(condicion)
+            texto = f"({texto})" if precedencia < PREC_NOT else texto
+            self.emit(f"if not {texto}:", self.term_line(region.exit_branch))
+            self.emit("    break", self.term_line(region.exit_branch))
+        inicio = len(self.output)
+        self.emit_seq(region.body)
+        if len(self.output) == inicio:
+            self.emit("pass", self.line_of(cabecera))
+        self.indent -= 1
+
+    def term_line(self, bloque: Block) -> int:
+        """Línea del branch o return (la de su valor, si la tiene)"""
+        term = bloque.term
+        if term is not None and term[0] != 'jump' and term[1] is not None and term[1].line:
+            return term[1].line
+        return self.line_of(bloque)
+
+    def line_of(self, bloque: Block) -> int:
+        """Línea de la última instrucción del bloque (o la de la función)"""
+        for instr in reversed(bloque.instrs):
+            if instr.line:
+                return instr.line
+        return self.func.line
+
+    # ========== Bloques ==========
+
+    def emit_block(self, bloque: Block):
+        for instr in bloque.instrs:
+            if instr in self.inlined:
+                continue
+            if instr.op == 'istore':
+                base, indice, valor = instr.args
+                self.emit(f"{self.atom(base)}[{self.index(indice)}] = {self.text(valor)}", instr.line)
+            elif instr.op == 'gstore':
+                self.emit(f"g_{instr.attr} = {self.text(instr.args[0])}", instr.line)
+            elif not self.usos.get(instr):
+                self.emit(self.text(instr, nombre=False), instr.line)
+            else:
+                self.emit(f"{self.names[instr]} = {self.text(instr, nombre=False)}", instr.line)
+        term = bloque.term
+        if term is None:
+            return
+        if term[0] == 'jump' and term[1].phis:
+            destino = term[1]
+            indice = destino.preds.index(bloque)
+            copias = [(self.names[phi], self.text(phi.args[indice])) for phi in destino.phis
+                      if phi.args[indice] not in self.coalesced]
+            copias = [(d, f) for d, f in copias if d != f]
+            if copias:
+                destinos = ', '.join(d for d, _ in copias)
+                fuentes = ', '.join(f for _, f in copias)
+                self.emit(f"{destinos} = {fuentes}", self.line_of(bloque))
+        elif term[0] == 'return':
+            valor = f" {self.text(term[1])}" if term[1] is not None else " None"
+            self.emit(f"return{valor}", self.term_line(bloque))
+
+    # ========== Expresiones ==========
+
+    def text(self, valor: Value, nombre: bool = True) -> str:
+        return self.expr(valor, nombre)[0]
+
+    def atom(self, valor: Value) -> str:
+        texto, precedencia = self.expr(valor)
+        return f"({texto})" if precedencia < PREC_ATOM else texto
+
+    def expr(self, valor: Value, nombre: bool = True) -> Tuple[str, int]:
+        """Texto y precedencia; con nombre=False construye la expresión aunque tenga nombre"""
+        if valor.op == 'const':
+            if isinstance(valor.attr, int) and not isinstance(valor.attr, bool) and valor.attr < 0:
+                return repr(valor.attr), PREC_UNARY
+            return repr(valor.attr), PREC_ATOM
+        if nombre and valor in self.names:
+            return self.names[valor], PREC_ATOM
+        op = valor.op
+        args = valor.args
+        if op in ('bin', 'logic'):
+            a, b = args
+            if valor.attr == '/':
+                return f"_div({self.text(a)}, {self.text(b)})", PREC_ATOM
+            if valor.attr == 'concat':
+                return f"_concat({self.text(a)}, {self.text(b)})", PREC_ATOM
+            if valor.attr in ('is', 'is not'):
+                python, precedencia = valor.attr, PREC_CMP
+            else:
+                python, precedencia = PYTHON_BINARY[valor.attr]
+            izquierda, prec_izq = self.expr(a)
+            derecha, prec_der = self.expr(b)
+            if precedencia == PREC_CMP:
+                izquierda = f"({izquierda})" if prec_izq <= PREC_CMP else izquierda
+            else:
+                izquierda = f"({izquierda})" if prec_izq < precedencia else izquierda
+            derecha = f"({derecha})" if prec_der <= precedencia else derecha
+            return f"{izquierda} {python} {derecha}", precedencia
+        if op == 'un':
+            operando, precedencia = self.expr(args[0])
+            if valor.attr == 'not':
+                return f"not {f'({operando})' if precedencia < PREC_NOT else operando}", PREC_NOT
+            return f"-{f'({operando})' if precedencia < PREC_UNARY else operando}", PREC_UNARY
+        if op == 'index' and valor.attr == 'char':
+            return f"_char({self.text(args[0])}, {self.text(args[1])})", PREC_ATOM
+        if op == 'index':
+            return f"{self.atom(args[0])}[{self.index(args[1])}]", PREC_ATOM
+        if op == 'new':
+            return f"_new_array({self.text(args[0])}, {valor.attr!r})", PREC_ATOM
+        if op == 'call':
+            return f"f_{valor.attr}({', '.join(self.text(a) for a in args)})", PREC_ATOM
+        if op == 'gload':
+            return f"g_{valor.attr}", PREC_ATOM
+        raise CompileError([f"Instrucción SSA sin traducción: {op}"])
+
+    def index(self, valor: Value) -> str:
+        """Índice, con la verificación de negativos solo si el análisis no la descarta"""
+        texto = self.text(valor)
+        if valor.op == 'const':
+            return texto if valor.attr >= 0 else f"_idx({texto})"
+        if valor.id in self.func.nonneg:
+            return texto
+        if valor in self.names:
+            return f"{texto} if {texto} >= 0 else _neg({texto})"
+        return f"_idx({texto})"
+
+def compile_ssa(arena: ASTArena, checker: SemanticChecker, optimize: bool = True) -> PythonProgram:
+    """IR SSA (optimizado o no) traducido a Python y compilado"""
+    programa, _ = build_ssa(arena, checker, optimize)
+    return SSAPythonBackend(programa).compile()
+
+def compile_source(codigo: str, optimize: bool = True) -> PythonProgram:
+    return compile_ssa(*load_program(codigo), optimize=optimize)
+
+def main():
+    import argparse
+    import time
+    from src.runtime_mini0 import Mini0RuntimeError
+    arg_parser = argparse.ArgumentParser(description="Ejecuta un programa Mini-0 a través del IR SSA")
+    arg_parser.add_argument('archivo', help="archivo .mini0")
+    arg_parser.add_argument('--show', action='store_true', help="imprime el código Python generado")
+    arg_parser.add_argument('--no-opt', action='store_true', help="sin optimizaciones sobre el IR")
+    args = arg_parser.parse_args()
+
+    with open(args.archivo, 'r', encoding='utf-8') as f:
+        codigo = f.read()
+    try:
+        arena, checker = load_program(codigo)
+        programa, _ = build_ssa(arena, checker, not args.no_opt)
+        backend = SSAPythonBackend(programa)
+        if args.show:
+            print(backend.generate()[0])
+            return
+        ejecutable = backend.compile()
+        inicio = time.perf_counter()
+        valor = ejecutable.run()
+        ejecucion = time.perf_counter() - inicio
+    except (CompileError, Mini0RuntimeError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"main() retornó: {valor}")
+    print(f"Ejecución: {ejecucion * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
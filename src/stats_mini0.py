@@ -0,0 +1,189 @@
+"""
+Instrumentación por fases para el front end Mini-0
+Mide tiempo de pared, tiempo de CPU y memoria pico (tracemalloc) de cada fase
+y agrega registros JSON de varias ejecuciones en percentiles
+"""
+
+import json
+import math
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+
+class PhaseStats:
+    """Acumula las métricas de cada fase (lectura, léxico, sintáctico) de un archivo"""
+
+    def __init__(self, archivo: str):
+        self.archivo = archivo
+        self.fases: Dict[str, Dict[str, float]] = {}
+        self.bytes = 0
+        self.tokens = 0
+        self.exito = False
+        # Solo con --ast: nodos del arena y bytes por nodo
+        self.nodos = 0
+        self.bytes_por_nodo = 0
+
+    @contextmanager
+    def phase(self, nombre: str):
+        """Mide tiempo de pared y de CPU del bloque asociado a la fase"""
+        inicio_pared = time.perf_counter()
+        inicio_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            fase = self.fases.setdefault(nombre, {})
+            fase['pared_s'] = time.perf_counter() - inicio_pared
+            fase['cpu_s'] = time.process_time() - inicio_cpu
+
+    @contextmanager
+    def memory(self, nombre: str):
+        """Mide la memoria pico asignada durante el bloque con tracemalloc
+
+        Se usa en una pasada separada de la medición de tiempos, porque
+        tracemalloc ralentiza varias veces la asignación de objetos.
+        """
+        ya_activo = tracemalloc.is_tracing()
+        if not ya_activo:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            _, pico = tracemalloc.get_traced_memory()
+            if not ya_activo:
+                tracemalloc.stop()
+            fase = self.fases.setdefault(nombre, {})
+            fase['memoria_pico_bytes'] = max(0, pico - base)
+
+    def total(self, clave: str) -> float:
+        """Suma una métrica sobre todas las fases"""
+        return sum(fase.get(clave, 0.0) for fase in self.fases.values())
+
+    def throughput(self) -> Dict[str, float]:
+        """Calcula tokens/s y bytes/s sobre las fases léxica y sintáctica"""
+        tiempo = sum(self.fases.get(f, {}).get('pared_s', 0.0)
+                     for f in ('lexico', 'sintactico'))
+        if tiempo <= 0:
+            return {'tokens_por_s': 0.0, 'bytes_por_s': 0.0}
+        return {
+            'tokens_por_s': self.tokens / tiempo,
+            'bytes_por_s': self.bytes / tiempo,
+        }
+
+    def to_dict(self) -> dict:
+        """Representación serializable a JSON (una línea por archivo)"""
+        registro = {
+            'archivo': self.archivo,
+            'exito': self.exito,
+            'bytes': self.bytes,
+            'tokens': self.tokens,
+            'fases': self.fases,
+            'total_pared_s': self.total('pared_s'),
+            'total_cpu_s': self.total('cpu_s'),
+        }
+        if self.nodos:
+            registro['nodos_ast'] = self.nodos
+            registro['bytes_por_nodo'] = self.bytes_por_nodo
+        registro.update(self.throughput())
+        return registro
+
+    def report(self) -> str:
+        """Genera el reporte legible de las métricas"""
+        lineas = [f"{'Fase':<12}{'Pared (ms)':>12}{'CPU (ms)':>12}{'Mem. pico (KB)':>16}"]
+        lineas.append("-" * 52)
+        for nombre, fase in self.fases.items():
+            memoria = fase.get('memoria_pico_bytes')
+            memoria_str = f"{memoria / 1024:.1f}" if memoria is not None else "—"
+            lineas.append(f"{nombre:<12}{fase.get('pared_s', 0.0) * 1000:>12.3f}"
+                          f"{fase.get('cpu_s', 0.0) * 1000:>12.3f}{memoria_str:>16}")
+        lineas.append("-" * 52)
+        lineas.append(f"{'total':<12}{self.total('pared_s') * 1000:>12.3f}"
+                      f"{self.total('cpu_s') * 1000:>12.3f}")
+        rendimiento = self.throughput()
+        lineas.append(f"Tamaño: {self.bytes} bytes, {self.tokens} tokens")
+        if self.nodos:
+            lineas.append(f"AST: {self.nodos} nodos, {self.bytes_por_nodo:.1f} bytes/nodo")
+        lineas.append(f"Rendimiento: {rendimiento['tokens_por_s']:,.0f} tokens/s, "
+                      f"{rendimiento['bytes_por_s']:,.0f} bytes/s")
+        return "\n".join(lineas)
+
+
+def percentile(valores: List[float], q: float) -> float:
+    """Percentil q (0-100) por interpolación lineal entre rangos"""
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    rango = (len(ordenados) - 1) * q / 100.0
+    inferior = math.floor(rango)
+    superior = math.ceil(rango)
+    if inferior == superior:
+        return ordenados[int(rango)]
+    peso = rango - inferior
+    return ordenados[inferior] * (1 - peso) + ordenados[superior] * peso
+
+
+def aggregate(registros: Iterable[dict], percentiles=(50, 90, 99)) -> dict:
+    """Agrega registros por archivo en percentiles por métrica y fase"""
+    series: Dict[str, List[float]] = {}
+
+    def agregar(clave: str, valor: Optional[float]):
+        if valor is not None:
+            series.setdefault(clave, []).append(valor)
+
+    total = 0
+    fallidos = 0
+    for registro in registros:
+        total += 1
+        if not registro.get('exito'):
+            fallidos += 1
+        for clave in ('bytes', 'tokens', 'total_pared_s', 'total_cpu_s',
+                      'tokens_por_s', 'bytes_por_s'):
+            agregar(clave, registro.get(clave))
+        for nombre, fase in registro.get('fases', {}).items():
+            for clave, valor in fase.items():
+                agregar(f"{nombre}.{clave}", valor)
+
+    resumen = {'archivos': total, 'fallidos': fallidos, 'metricas': {}}
+    for clave, valores in sorted(series.items()):
+        metrica = {f"p{q}": percentile(valores, q) for q in percentiles}
+        metrica['min'] = min(valores)
+        metrica['max'] = max(valores)
+        metrica['media'] = sum(valores) / len(valores)
+        resumen['metricas'][clave] = metrica
+    return resumen
+
+
+def load_records(rutas: Iterable[str]) -> List[dict]:
+    """Lee registros JSON (uno por línea) de los archivos dados"""
+    registros = []
+    for ruta in rutas:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            for linea in f:
+                linea = linea.strip()
+                if linea:
+                    registros.append(json.loads(linea))
+    return registros
+
+
+def main():
+    """Agrega las estadísticas JSON producidas por main_mini0.py --stats --json"""
+    if len(sys.argv) < 2:
+        print("Uso: python stats_mini0.py <stats.jsonl> [...]", file=sys.stderr)
+        print("\nEjemplo:")
+        print("  for f in tests/mini0/*.mini0; do")
+        print("    python src/main_mini0.py --stats --json $f >> stats.jsonl")
+        print("  done")
+        print("  python src/stats_mini0.py stats.jsonl")
+        sys.exit(1)
+
+    resumen = aggregate(load_records(sys.argv[1:]))
+    print(json.dumps(resumen, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Strings de Mini-0 en tiempo de ejecución
+Un string es un str de Python o una Rope. Los literales se internan al
+armar el pool de constantes (sys.intern): todas las apariciones del mismo
+literal son un único objeto y compararlas termina en la verificación de
+identidad. Concatenar dos str cortos da un str; desde ROPE_THRESHOLD
+caracteres el resultado es una Rope, una lista de piezas que crece por el
+final, así que 's = s + t' dentro de un ciclo agrega una pieza en lugar de
+copiar s entero (construir n caracteres cuesta O(n), no O(n²)). La Rope se
+aplana con ''.join recién cuando se indexa, se compara o se entrega como
+resultado, y guarda el str aplanado.
+
+Las Ropes comparten la lista de piezas: cada una ve solo sus primeras
+'count' piezas, de modo que extender la lista no cambia a las anteriores.
+Solo la Rope que llega al final de la lista la extiende sin copiar;
+concatenar a una Rope anterior o agregar al principio copia la lista de
+piezas, o si tiene más de MAX_COPIED_PIECES la aplana primero, para que
+agregar carácter por carácter al principio no copie 8 bytes por carácter.
+"""
+
+import sys
+
+# Largo desde el cual una concatenación produce una Rope en lugar de un str
+ROPE_THRESHOLD = 128
+# Piezas desde las cuales una Rope se aplana antes de copiarse a otra lista
+MAX_COPIED_PIECES = 32
+
+class Rope:
+    """String de Mini-0 formado por piezas (ver el docstring del módulo)"""
+
+    __slots__ = ('parts', 'count', 'length', 'flat')
+
+    def __init__(self, parts: list, count: int, length: int):
+        self.parts = parts
+        self.count = count
+        self.length = length
+        self.flat = None
+
+    def flatten(self) -> str:
+        """El string como str (se calcula una sola vez)"""
+        if self.flat is None:
+            partes = self.parts
+            self.flat = ''.join(partes if self.count == len(partes) else partes[:self.count])
+        return self.flat
+
+    def pieces(self) -> list:
+        """Lista nueva con el contenido (una sola pieza si ya se aplanó o si
+        tiene demasiadas para copiarlas)"""
+        if self.flat is None and self.count <= MAX_COPIED_PIECES:
+            return self.parts[:self.count]
+        return [self.flatten()]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, i):
+        return self.flatten()[i]
+
+    def __eq__(self, otro):
+        if isinstance(otro, Rope):
+            return self.length == otro.length and self.flatten() == otro.flatten()
+        if isinstance(otro, str):
+            return self.length == len(otro) and self.flatten() == otro
+        return NotImplemented
+
+    def __ne__(self, otro):
+        igual = self.__eq__(otro)
+        return igual if igual is NotImplemented else not igual
+
+    def __hash__(self) -> int:
+        return hash(self.flatten())
+
+    def __str__(self) -> str:
+        return self.flatten()
+
+    def __repr__(self) -> str:
+        return repr(self.flatten())
+
+    def __format__(self, formato: str) -> str:
+        return format(self.flatten(), formato)
+
+def intern_literal(texto: str) -> str:
+    """Literal de string tal como se guarda en el pool de constantes"""
+    return sys.intern(texto)
+
+def concat(a, b):
+    """a + b para strings de Mini-0 (str o Rope)"""
+    if not b:
+        return a
+    if not a:
+        return b
+    largo = len(a) + len(b)
+    if type(a) is Rope:
+        # La última Rope de la lista la extiende; las anteriores la copian
+        partes = a.parts if a.count == len(a.parts) else a.pieces()
+    elif largo < ROPE_THRESHOLD and type(b) is str:
+        return a + b
+    else:
+        partes = [a]
+    if type(b) is Rope:
+        partes.extend(b.pieces())
+    else:
+        partes.append(b)
+    return Rope(partes, len(partes), largo)
+
+def char_at(s, i: int) -> int:
+    """Carácter i de un string como char de Mini-0 (su código)"""
+    if i < 0:
+        raise IndexError(i)
+    return ord(s[i])
+
+def flatten_value(valor):
+    """Resultado de un programa con valores de Python: sin Ropes (también dentro
+    de arreglos de string) y con los arreglos compactos como listas"""
+    if type(valor) is Rope:
+        return valor.flatten()
+    if type(valor) is list:
+        return [flatten_value(v) for v in valor]
+    if type(valor) is memoryview:
+        return valor.tolist()
+    return valor
@@ -0,0 +1,437 @@
+"""
+Backend de Mini-0 que traduce a código fuente Python
+Cada función del AST verificado se convierte en un 'def', cada 'while' en
+un 'while' de Python y los arreglos son los del runtime (memoryviews sobre
+búferes tipados para int/bool/char). El
+módulo generado se compila una sola vez con compile() y el objeto código
+se guarda en disco con marshal, indexado por un hash del fuente Mini-0: al
+volver a correr el mismo programa no hay análisis léxico, sintáctico,
+semántico ni generación de código.
+
+Nombres en el código generado: funciones f_<nombre>, globales g_<nombre>,
+locales v_<nombre> (vN_<nombre> si un bloque interno redeclara el nombre)
+y auxiliares del runtime con prefijo '_'.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import importlib.util
+import marshal
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ast_mini0 import ASTArena, NodeKind, NONE, numeral_value
+from src.semantic_mini0 import SemanticChecker
+from src.runtime_mini0 import (
+    CompileError, ENTRY_POINT, default_value, int_div, load_program, new_array,
+    runtime_error,
+)
+from src.strings_mini0 import char_at, concat, flatten_value
+from src.positions_mini0 import PositionTable, encode_lines
+from src.files_mini0 import DEFAULT_CACHE_DIR
+
+# Cambia cuando cambia el código generado; invalida las entradas del caché
+TRANSPILER_VERSION = 5
+
+# Nombre de archivo de los objetos código (para ubicar las líneas en las trazas)
+CODE_FILENAME = '<mini0>'
+
+# Precedencias de Python usadas para decidir dónde hacen falta paréntesis
+PREC_OR, PREC_AND, PREC_NOT, PREC_CMP, PREC_ADD, PREC_MUL, PREC_UNARY, PREC_ATOM = range(1, 9)
+
+# Operador de Mini-0 -> (operador de Python, precedencia)
+PYTHON_BINARY = {
+    'or': ('or', PREC_OR), 'and': ('and', PREC_AND),
+    '=': ('==', PREC_CMP), '<>': ('!=', PREC_CMP),
+    '<': ('<', PREC_CMP), '<=': ('<=', PREC_CMP), '>': ('>', PREC_CMP), '>=': ('>=', PREC_CMP),
+    '+': ('+', PREC_ADD), '-': ('-', PREC_ADD), '*': ('*', PREC_MUL),
+}
+
+def _neg(i: int):
+    raise IndexError(i)
+
+def _idx(i: int) -> int:
+    """Índice verificado: Python aceptaría los negativos contando desde el final"""
+    if i < 0:
+        raise IndexError(i)
+    return i
+
+# Nombres visibles para el código generado
+RUNTIME_NAMESPACE = {
+    '__builtins__': {},
+    '_div': int_div,
+    '_neg': _neg,
+    '_idx': _idx,
+    '_new_array': new_array,
+    '_concat': concat,
+    '_char': char_at,
+}
+
+class PythonProgram:
+    """Objeto código del módulo generado y su tabla de líneas Python -> Mini-0
+    (una PositionTable: solo se decodifica para ubicar un error)"""
+
+    # Nombres con los que se ejecuta el módulo (las subclases agregan auxiliares)
+    namespace = RUNTIME_NAMESPACE
+
+    def __init__(self, code, positions: PositionTable):
+        self.code = code
+        self.positions = positions
+
+    def run(self, nombre: str = ENTRY_POINT, args=()):
+        """Ejecuta la función 'nombre' con los globales recién inicializados"""
+        espacio = dict(self.namespace)
+        exec(self.code, espacio)
+        funcion = espacio.get('f_' + nombre)
+        if funcion is None:
+            raise CompileError([f"El programa no define la función '{nombre}'"])
+        try:
+            return flatten_value(funcion(*args))
+        except (ZeroDivisionError, IndexError, TypeError, ValueError, OverflowError, MemoryError,
+                RecursionError) as e:
+            raise runtime_error(e, self.line_of(e.__traceback__)) from None
+
+    def line_of(self, traza) -> int:
+        """Línea Mini-0 del marco generado más interno de la traza"""
+        linea = 0
+        while traza is not None:
+            if traza.tb_frame.f_code.co_filename == CODE_FILENAME:
+                linea = self.positions.line_at(traza.tb_lineno)
+            traza = traza.tb_next
+        return linea
+
+    def dumps(self) -> bytes:
+        return marshal.dumps((TRANSPILER_VERSION, self.code, self.positions.data, len(self.positions)))
+
+    @classmethod
+    def loads(cls, datos: bytes) -> Optional['PythonProgram']:
+        """Programa guardado con dumps(); None si es de otra versión del transpilador"""
+        version, code, *posiciones = marshal.loads(datos)
+        if version != TRANSPILER_VERSION:
+            return None
+        return cls(code, PositionTable(*posiciones))
+
+class PythonTranspiler:
+    """Genera el código Python de un programa Mini-0 verificado"""
+
+    def __init__(self, arena: ASTArena, checker: SemanticChecker):
+        self.arena = arena
+        self.types = checker.types
+        self.globals: Dict[str, str] = {}
+        # Por función: ámbitos nombre -> identificador Python, y redeclaraciones por nombre
+        self.scopes: List[Dict[str, str]] = []
+        self.declared: Dict[str, int] = {}
+        self.assigned_globals: set = set()
+        self.output: List[str] = []
+        # Línea Mini-0 de cada línea generada (índice = número de línea, base 1)
+        self.lines: List[int] = [0]
+        self.indent = 0
+
+    def transpile(self) -> Tuple[str, List[int]]:
+        """Código fuente del módulo y tabla de líneas Python -> Mini-0"""
+        arena = self.arena
+        for decl in arena.children(arena.root):
+            if arena.kind[decl] != NodeKind.FUNC:
+                nombre = arena.text(decl)
+                self.globals[nombre] = 'g_' + nombre
+                inicial = default_value(self.type_of(arena.first_child[decl]))
+                self.emit(f"g_{nombre} = {inicial!r}", arena.line(decl))
+        for decl in arena.children(arena.root):
+            if arena.kind[decl] == NodeKind.FUNC:
+                self.transpile_function(decl)
+        return '\n'.join(self.output) + '\n', self.lines
+
+    def compile(self) -> PythonProgram:
+        fuente, lineas = self.transpile()
+        try:
+            code = compile(fuente, CODE_FILENAME, 'exec')
+        except (SyntaxError, RecursionError, MemoryError):
+            raise CompileError(["Programa demasiado anidado para el backend Python"]) from None
+        return PythonProgram(code, encode_lines(lineas))
+
+    def type_of(self, nodo: int) -> str:
+        kind = self.arena.kind[nodo]
+        if kind == NodeKind.VOID:
+            return 'void'
+        if kind == NodeKind.ARRAY_TYPE:
+            return '[]' + self.type_of(self.arena.first_child[nodo])
+        return self.arena.text(nodo)
+
+    def emit(self, linea: str, mini0: int):
+        self.output.append('    ' * self.indent + linea)
+        self.lines.append(mini0)
+
+    # ========== Variables ==========
+
+    def declare(self, nombre: str) -> str:
+        veces = self.declared.get(nombre, 0) + 1
+        self.declared[nombre] = veces
+        identificador = f"v_{nombre}" if veces == 1 else f"v{veces}_{nombre}"
+        self.scopes[-1][nombre] = identificador
+        return identificador
+
+    def resolve(self, nombre: str) -> str:
+        for ambito in reversed(self.scopes):
+            if nombre in ambito:
+                return ambito[nombre]
+        return self.globals[nombre]
+
+    # ========== Funciones y comandos ==========
+
+    def transpile_function(self, nodo: int):
+        arena = self.arena
+        params, retorno, bloque = arena.children(nodo)
+        linea = arena.line(nodo)
+        self.scopes = [{}]
+        self.declared = {}
+        self.assigned_globals = set()
+        parametros = [self.declare(arena.text(p)) for p in arena.children(params)]
+        self.emit(f"def f_{arena.text(nodo)}({', '.join(parametros)}):", linea)
+        self.indent += 1
+        inicio = len(self.output)
+        self.transpile_block(bloque, new_scope=False)
+        tipo_retorno = self.type_of(retorno)
+        implicito = None if tipo_retorno == 'void' else default_value(tipo_retorno)
+        self.emit(f"return {implicito!r}", linea)
+        if self.assigned_globals:
+            # La declaración 'global' va al principio del cuerpo
+            self.output.insert(inicio, '    ' * self.indent
+                               + f"global {', '.join(sorted(self.assigned_globals))}")
+            self.lines.insert(inicio + 1, linea)
+        self.indent -= 1
+
+    def transpile_block(self, nodo: int, new_scope: bool = True):
+        if new_scope:
+            self.scopes.append({})
+        inicio = len(self.output)
+        for hijo in self.arena.children(nodo):
+            self.transpile_statement(hijo)
+        if len(self.output) == inicio:
+            self.emit("pass", self.arena.line(nodo))
+        if new_scope:
+            self.scopes.pop()
+
+    def transpile_statement(self, nodo: int):
+        arena = self.arena
+        kind = arena.kind[nodo]
+        linea = arena.line(nodo)
+        if kind == NodeKind.VARDECL:
+            inicial = default_value(self.type_of(arena.first_child[nodo]))
+            self.emit(f"{self.declare(arena.text(nodo))} = {inicial!r}", linea)
+        elif kind == NodeKind.ASSIGN:
+            destino, valor = arena.children(nodo)
+            if arena.kind[destino] == NodeKind.VAR:
+                nombre = arena.text(destino)
+                identificador = self.resolve(nombre)
+                if identificador.startswith('g_'):
+                    self.assigned_globals.add(identificador)
+                self.emit(f"{identificador} = {self.expr(valor)[0]}", linea)
+            elif (self.safe(valor) and not self.has_call(destino)) or self.stable_target(destino):
+                self.emit(f"{self.expr(destino)[0]} = {self.expr(valor)[0]}", linea)
+            else:
+                # Python evalúa el valor antes que el destino; los demás motores, al revés
+                base, indice = arena.children(destino)
+                self.emit(f"_b, _i = {self.expr(base)[0]}, {self.expr(indice)[0]}", linea)
+                self.emit(f"_b[_i if _i >= 0 else _neg(_i)] = {self.expr(valor)[0]}", linea)
+        elif kind == NodeKind.CALL:
+            self.emit(self.expr(nodo)[0], linea)
+        elif kind == NodeKind.IF:
+            hijos = list(arena.children(nodo))
+            for i in range(0, len(hijos) - 1, 2):
+                palabra = 'if' if i == 0 else 'elif'
+                self.emit(f"{palabra} {self.expr(hijos[i])[0]}:", arena.line(hijos[i]))
+                self.indent += 1
+                self.transpile_block(hijos[i + 1])
+                self.indent -= 1
+            if len(hijos) % 2:
+                self.emit("else:", linea)
+                self.indent += 1
+                self.transpile_block(hijos[-1])
+                self.indent -= 1
+        elif kind == NodeKind.WHILE:
+            condicion, cuerpo = arena.children(nodo)
+            self.emit(f"while {self.expr(condicion)[0]}:", linea)
+            self.indent += 1
+            self.transpile_block(cuerpo)
+            self.indent -= 1
+        else:  # RETURN
+            valor = arena.first_child[nodo]
+            self.emit(f"return {self.expr(valor)[0]}" if valor != NONE else "return None", linea)
+
+    # ========== Expresiones ==========
+
+    def expr(self, nodo: int) -> Tuple[str, int]:
+        """Texto Python de la expresión y su precedencia"""
+        arena = self.arena
+        kind = arena.kind[nodo]
+        if kind == NodeKind.NUM:
+            return str(numeral_value(arena.text(nodo))), PREC_ATOM
+        if kind == NodeKind.STR:
+            return repr(arena.text(nodo)), PREC_ATOM
+        if kind == NodeKind.BOOL:
+            return ('True' if arena.text(nodo) == 'true' else 'False'), PREC_ATOM
+        if kind == NodeKind.VAR:
+            return self.resolve(arena.text(nodo)), PREC_ATOM
+        if kind == NodeKind.BINOP:
+            return self.binary(nodo)
+        if kind == NodeKind.UNOP:
+            operando, precedencia = self.expr(arena.first_child[nodo])
+            if arena.text(nodo) == 'not':
+                return f"not {self.wrap(operando, precedencia < PREC_NOT)}", PREC_NOT
+            return f"-{self.wrap(operando, precedencia < PREC_UNARY)}", PREC_UNARY
+        if kind == NodeKind.INDEX:
+            base_nodo, indice_nodo = arena.children(nodo)
+            base, precedencia = self.expr(base_nodo)
+            if self.types.get(base_nodo) == 'string':
+                return f"_char({base}, {self.expr(indice_nodo)[0]})", PREC_ATOM
+            return f"{self.wrap(base, precedencia < PREC_ATOM)}[{self.index(indice_nodo)}]", PREC_ATOM
+        if kind == NodeKind.NEW:
+            tamano_nodo = arena.first_child[nodo]
+            tamano = self.expr(tamano_nodo)[0]
+            elemento = self.type_of(arena.next_sibling[tamano_nodo])
+            return f"_new_array({tamano}, {elemento!r})", PREC_ATOM
+        # CALL
+        argumentos = ', '.join(self.expr(hijo)[0] for hijo in arena.children(nodo))
+        return f"f_{arena.text(nodo)}({argumentos})", PREC_ATOM
+
+    def safe(self, raiz: int) -> bool:
+        """La expresión no llama funciones ni puede fallar"""
+        arena = self.arena
+        pila = [raiz]
+        while pila:
+            nodo = pila.pop()
+            kind = arena.kind[nodo]
+            if kind in (NodeKind.INDEX, NodeKind.CALL, NodeKind.NEW):
+                return False
+            if kind == NodeKind.BINOP and arena.text(nodo) == '/':
+                return False
+            pila.extend(arena.children(nodo))
+        return True
+
+    def has_call(self, raiz: int) -> bool:
+        arena = self.arena
+        pila = [raiz]
+        while pila:
+            nodo = pila.pop()
+            if arena.kind[nodo] == NodeKind.CALL:
+                return True
+            pila.extend(arena.children(nodo))
+        return False
+
+    def stable_target(self, destino: int) -> bool:
+        """'v[i] = ...' con v local e i local o literal: evaluar el valor primero no cambia nada"""
+        arena = self.arena
+        base, indice = arena.children(destino)
+        local = lambda nodo: arena.kind[nodo] == NodeKind.VAR and \
+            not self.resolve(arena.text(nodo)).startswith('g_')
+        return local(base) and (local(indice) or arena.kind[indice] == NodeKind.NUM)
+
+    @staticmethod
+    def wrap(texto: str, parentesis: bool) -> str:
+        return f"({texto})" if parentesis else texto
+
+    def index(self, nodo: int) -> str:
+        """Índice con la verificación de negativos que Python no hace"""
+        arena = self.arena
+        texto = self.expr(nodo)[0]
+        if arena.kind[nodo] == NodeKind.NUM and numeral_value(arena.text(nodo)) >= 0:
+            return texto
+        if arena.kind[nodo] == NodeKind.VAR:
+            return f"{texto} if {texto} >= 0 else _neg({texto})"
+        return f"_idx({texto})"
+
+    def binary(self, nodo: int) -> Tuple[str, int]:
+        arena = self.arena
+        operador = arena.text(nodo)
+        izquierda_nodo, derecha_nodo = arena.children(nodo)
+        izquierda, prec_izq = self.expr(izquierda_nodo)
+        derecha, prec_der = self.expr(derecha_nodo)
+        if operador == '/':
+            return f"_div({izquierda}, {derecha})", PREC_ATOM
+        if operador == '+' and self.types.get(nodo) == 'string':
+            return f"_concat({izquierda}, {derecha})", PREC_ATOM
+        python, precedencia = PYTHON_BINARY[operador]
+        if operador in ('=', '<>') and self.types.get(izquierda_nodo, '').startswith('[]'):
+            python = 'is' if operador == '=' else 'is not'
+        if precedencia == PREC_CMP:
+            # Python encadena las comparaciones: a < b == c no es (a < b) == c
+            izquierda = self.wrap(izquierda, prec_izq <= PREC_CMP)
+        else:
+            izquierda = self.wrap(izquierda, prec_izq < precedencia)
+        derecha = self.wrap(derecha, prec_der <= precedencia)
+        return f"{izquierda} {python} {derecha}", precedencia
+
+def source_key(codigo: str) -> str:
+    """Clave de caché: fuente, versión del transpilador y del bytecode de Python"""
+    h = hashlib.sha256()
+    h.update(importlib.util.MAGIC_NUMBER)
+    h.update(str(TRANSPILER_VERSION).encode('ascii'))
+    h.update(codigo.encode('utf-8'))
+    return h.hexdigest()
+
+def compile_source(codigo: str) -> PythonProgram:
+    """Analiza, verifica y traduce código Mini-0 (sin caché)"""
+    arena, checker = load_program(codigo)
+    try:
+        return PythonTranspiler(arena, checker).compile()
+    except RecursionError:
+        raise CompileError(["Expresión demasiado anidada para el backend Python"]) from None
+
+def load_cached(codigo: str, cache_dir: str = DEFAULT_CACHE_DIR) -> Tuple[PythonProgram, bool]:
+    """Programa desde el caché en disco si existe; si no, lo compila y lo guarda.
+    Retorna (programa, acierto)"""
+    ruta = os.path.join(cache_dir, source_key(codigo) + '.m0c')
+    try:
+        with open(ruta, 'rb') as f:
+            programa = PythonProgram.loads(f.read())
+        if programa is not None:
+            return programa, True
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+    programa = compile_source(codigo)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, 'wb') as f:
+            f.write(programa.dumps())
+        os.replace(temporal, ruta)
+    except OSError:
+        pass  # sin caché el programa igual se ejecuta
+    return programa, False
+
+def main():
+    import argparse
+    import time
+    from src.runtime_mini0 import Mini0RuntimeError
+    arg_parser = argparse.ArgumentParser(description="Traduce un programa Mini-0 a Python y lo ejecuta")
+    arg_parser.add_argument('archivo', help="archivo .mini0")
+    arg_parser.add_argument('--show', action='store_true', help="imprime el código Python generado")
+    arg_parser.add_argument('--no-cache', action='store_true', help="no lee ni escribe el caché")
+    arg_parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                            help=f"directorio del caché (por defecto {DEFAULT_CACHE_DIR})")
+    args = arg_parser.parse_args()
+
+    with open(args.archivo, 'r', encoding='utf-8') as f:
+        codigo = f.read()
+    try:
+        if args.show:
+            print(PythonTranspiler(*load_program(codigo)).transpile()[0])
+            return
+        inicio = time.perf_counter()
+        if args.no_cache:
+            programa, acierto = compile_source(codigo), False
+        else:
+            programa, acierto = load_cached(codigo, args.cache_dir)
+        preparacion = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        valor = programa.run()
+        ejecucion = time.perf_counter() - inicio
+    except (CompileError, Mini0RuntimeError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    origen = 'caché' if acierto else 'compilado'
+    print(f"main() retornó: {valor}")
+    print(f"Preparación: {preparacion * 1000:.2f} ms ({origen}), ejecución: {ejecucion * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,535 @@
+"""
+Vectorización con NumPy de ciclos reconocibles de Mini-0
+Un 'while' contado como el de programa6_arrays
+
+    while i < n
+        numeros[i] = i * 2
+        suma = suma + numeros[i]
+        i = i + 1
+    loop
+
+se ejecuta como operaciones sobre vistas NumPy de los arreglos del runtime
+(sin copiarlos). Se reconocen los ciclos cuyo cuerpo son solo asignaciones:
+escrituras en arreglos de int o bool con índice afín en la variable de
+inducción (c*i + k), reducciones 's = s + e1 - e2 ...' y, al final, el
+avance 'i = i + paso' con paso invariante. No puede haber otras
+dependencias entre iteraciones: un arreglo escrito solo se accede con el
+mismo índice.
+
+El backend Python genera las dos versiones: antes del ciclo llama a
+_vloop(plan, valores) y, si retorna None, corre el ciclo escalar. Eso pasa
+si NumPy no está instalado, si el ciclo es corto, si algún índice quedaría
+fuera de rango o algún arreglo sin inicializar (el ciclo escalar informa el
+error en su línea), si dos nombres del mismo arreglo se cruzan, o si la
+aritmética podría salirse de int64 (los enteros de Mini-0 no tienen límite).
+Todo se verifica antes de escribir en los arreglos.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ast_mini0 import ASTArena, NodeKind, numeral_value
+from src.semantic_mini0 import SemanticChecker
+from src.runtime_mini0 import CompileError, int_div, load_program
+from src.transpiler_mini0 import PythonProgram, PythonTranspiler, RUNTIME_NAMESPACE
+
+try:
+    import numpy as np
+except ImportError:  # sin NumPy todos los ciclos corren en la versión escalar
+    np = None
+
+# Iteraciones mínimas para que convenga pagar el armado de las vistas NumPy
+MIN_TRIP = 64
+
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+# Formato del memoryview del runtime -> tipo de elemento que se vectoriza
+VECTOR_FORMATS = {'q': 'int', '?': 'bool'}
+
+# ========== Reconocimiento (sobre el AST) ==========
+
+class LoopVectorizer:
+    """Traduce un 'while' a un plan vectorial, o None si no tiene la forma
+
+    El plan es una tupla de constantes (se guarda en el objeto código):
+    (ranura_i, paso, límite, inclusivo, comandos, salidas), con expresiones
+    ('const', v), ('var', ranura), ('iv',), ('load', ranura, coef, desp),
+    ('+' | '-' | '*', a, b) y ('neg', a), y comandos
+    ('store', ranura, coef, desp, valor) y ('reduce', ranura, valor).
+    Las ranuras indexan la tupla de valores de las variables locales que
+    se pasa en tiempo de ejecución."""
+
+    def __init__(self, arena: ASTArena, types: Dict[int, str], is_local: Callable[[str], bool]):
+        self.arena = arena
+        self.types = types
+        self.is_local = is_local
+        self.names: List[str] = []
+        self.assigned: set = set()
+        self.induction = ''
+        self.reduction = ''
+
+    def slot(self, nombre: str) -> int:
+        if nombre not in self.names:
+            self.names.append(nombre)
+        return self.names.index(nombre)
+
+    def analyze(self, nodo: int) -> Optional[Tuple[tuple, List[str]]]:
+        """(plan, nombres de las variables de cada ranura) o None"""
+        arena = self.arena
+        condicion, cuerpo = arena.children(nodo)
+        comandos = list(arena.children(cuerpo))
+        if not comandos or any(arena.kind[c] != NodeKind.ASSIGN for c in comandos):
+            return None
+        self.assigned = {arena.text(arena.first_child[c]) for c in comandos
+                         if arena.kind[arena.first_child[c]] == NodeKind.VAR}
+        limite = self.bound(condicion)
+        if limite is None:
+            return None
+        iv_nodo, limite_nodo, inclusivo = limite
+        self.induction = arena.text(iv_nodo)
+        paso = self.step(comandos[-1])
+        limite_expr = self.invariant(limite_nodo)
+        if paso is None or limite_expr is None:
+            return None
+        plan_comandos = []
+        reducciones = []
+        for comando in comandos[:-1]:
+            traducido = self.statement(comando)
+            if traducido is None:
+                return None
+            if traducido[0] == 'reduce':
+                reducciones.append(traducido[1])
+            plan_comandos.append(traducido)
+        # Cada variable asignada es la de inducción o una única reducción
+        if len(reducciones) != len(set(reducciones)) or \
+                len(self.assigned) != len(reducciones) + 1:
+            return None
+        if not self.independent(plan_comandos):
+            return None
+        salidas = (self.slot(self.induction),) + tuple(reducciones)
+        plan = (self.slot(self.induction), paso, limite_expr, int(inclusivo),
+                tuple(plan_comandos), salidas)
+        return plan, list(self.names)
+
+    def local_int(self, nodo: int) -> bool:
+        arena = self.arena
+        return arena.kind[nodo] == NodeKind.VAR and self.is_local(arena.text(nodo)) and \
+            self.types.get(nodo) == 'int'
+
+    def bound(self, condicion: int):
+        """(variable de inducción, límite, inclusivo) de 'i < e', 'i <= e', 'e > i' o 'e >= i'"""
+        arena = self.arena
+        if arena.kind[condicion] != NodeKind.BINOP:
+            return None
+        operador = arena.text(condicion)
+        izquierda, derecha = arena.children(condicion)
+        if operador in ('<', '<='):
+            iv, limite = izquierda, derecha
+        elif operador in ('>', '>='):
+            iv, limite = derecha, izquierda
+        else:
+            return None
+        if not self.local_int(iv) or arena.text(iv) not in self.assigned:
+            return None
+        return iv, limite, operador in ('<=', '>=')
+
+    def step(self, comando: int) -> Optional[tuple]:
+        """Paso de 'i = i + e' / 'i = e + i' con e invariante"""
+        arena = self.arena
+        destino, valor = arena.children(comando)
+        if arena.kind[destino] != NodeKind.VAR or arena.text(destino) != self.induction:
+            return None
+        if arena.kind[valor] != NodeKind.BINOP or arena.text(valor) != '+':
+            return None
+        a, b = arena.children(valor)
+        for propio, otro in ((a, b), (b, a)):
+            if arena.kind[propio] == NodeKind.VAR and arena.text(propio) == self.induction:
+                return self.invariant(otro)
+        return None
+
+    def statement(self, comando: int) -> Optional[tuple]:
+        arena = self.arena
+        destino, valor = arena.children(comando)
+        if arena.kind[destino] == NodeKind.VAR:
+            nombre = arena.text(destino)
+            if nombre == self.induction or not self.local_int(destino) or \
+                    not self.accumulates(valor, nombre):
+                return None
+            # s = s + e1 - e2 ... se acumula como s + (0 + e1 - e2 ...)
+            self.reduction = nombre
+            expresion = self.expr(valor, 'int')
+            self.reduction = ''
+            return None if expresion is None else ('reduce', self.slot(nombre), expresion)
+        acceso = self.access(destino)
+        if acceso is None:
+            return None
+        expresion = self.expr(valor, self.types.get(destino))
+        return None if expresion is None else ('store',) + acceso + (expresion,)
+
+    def accumulates(self, nodo: int, nombre: str) -> bool:
+        """La variable aparece una sola vez, sumada (no restada ni multiplicada)"""
+        arena = self.arena
+        if arena.kind[nodo] == NodeKind.VAR:
+            return arena.text(nodo) == nombre
+        if arena.kind[nodo] != NodeKind.BINOP or arena.text(nodo) not in ('+', '-'):
+            return False
+        a, b = arena.children(nodo)
+        if self.accumulates(a, nombre):
+            return not self.mentions(b, nombre)
+        return arena.text(nodo) == '+' and self.accumulates(b, nombre) and \
+            not self.mentions(a, nombre)
+
+    def mentions(self, nodo: int, nombre: str) -> bool:
+        arena = self.arena
+        if arena.kind[nodo] == NodeKind.VAR:
+            return arena.text(nodo) == nombre
+        return any(self.mentions(h, nombre) for h in arena.children(nodo))
+
+    def access(self, nodo: int) -> Optional[tuple]:
+        """(ranura, coef, desplazamiento) de 'a[c*i + k]' con a arreglo local de int o bool"""
+        arena = self.arena
+        base, indice = arena.children(nodo)
+        if arena.kind[base] != NodeKind.VAR or not self.is_local(arena.text(base)) or \
+                arena.text(base) in self.assigned or self.types.get(base) not in ('[]int', '[]bool'):
+            return None
+        afin = self.affine(indice)
+        if afin is None or afin[0] < 1:
+            return None
+        return (self.slot(arena.text(base)),) + afin
+
+    def affine(self, nodo: int) -> Optional[Tuple[int, tuple]]:
+        """(coef, desplazamiento invariante) del índice, o None"""
+        arena = self.arena
+        kind = arena.kind[nodo]
+        if kind == NodeKind.VAR and arena.text(nodo) == self.induction:
+            return 1, ('const', 0)
+        invariante = self.invariant(nodo)
+        if invariante is not None:
+            return 0, invariante
+        if kind != NodeKind.BINOP:
+            return None
+        operador = arena.text(nodo)
+        a, b = arena.children(nodo)
+        if operador == '*':
+            for factor, otro in ((a, b), (b, a)):
+                if arena.kind[factor] == NodeKind.NUM:
+                    afin = self.affine(otro)
+                    k = numeral_value(arena.text(factor))
+                    if afin is not None:
+                        return k * afin[0], ('*', ('const', k), afin[1])
+            return None
+        if operador not in ('+', '-'):
+            return None
+        afin_a, afin_b = self.affine(a), self.affine(b)
+        if afin_a is None or afin_b is None or (operador == '-' and afin_b[0]):
+            return None
+        return afin_a[0] + afin_b[0], (operador, afin_a[1], afin_b[1])
+
+    def invariant(self, nodo: int) -> Optional[tuple]:
+        """Expresión entera que no cambia en el ciclo (literales y locales no asignadas);
+        solo aquí se admite '/', que se evalúa una vez antes del ciclo"""
+        arena = self.arena
+        kind = arena.kind[nodo]
+        if kind == NodeKind.NUM:
+            return ('const', numeral_value(arena.text(nodo)))
+        if kind == NodeKind.VAR:
+            if not self.local_int(nodo) or arena.text(nodo) in self.assigned:
+                return None
+            return ('var', self.slot(arena.text(nodo)))
+        if kind == NodeKind.UNOP and arena.text(nodo) == '-':
+            operando = self.invariant(arena.first_child[nodo])
+            return None if operando is None else ('neg', operando)
+        if kind == NodeKind.BINOP and arena.text(nodo) in ('+', '-', '*', '/'):
+            a, b = (self.invariant(h) for h in arena.children(nodo))
+            return None if a is None or b is None else (arena.text(nodo), a, b)
+        return None
+
+    def expr(self, nodo: int, tipo: str) -> Optional[tuple]:
+        """Valor por iteración: aritmética entera, o literales/variables/lecturas si es bool"""
+        arena = self.arena
+        kind = arena.kind[nodo]
+        if tipo == 'bool':
+            if kind == NodeKind.BOOL:
+                return ('const', arena.text(nodo) == 'true')
+            if kind == NodeKind.VAR and self.is_local(arena.text(nodo)) and \
+                    arena.text(nodo) not in self.assigned:
+                return ('var', self.slot(arena.text(nodo)))
+            if kind == NodeKind.INDEX:
+                acceso = self.access(nodo)
+                return None if acceso is None else ('load',) + acceso
+            return None
+        if kind == NodeKind.VAR and arena.text(nodo) == self.induction:
+            return ('iv',)
+        if kind == NodeKind.VAR and arena.text(nodo) == self.reduction:
+            return ('const', 0)
+        invariante = self.invariant(nodo)
+        if invariante is not None:
+            return invariante
+        if kind == NodeKind.INDEX:
+            acceso = self.access(nodo)
+            return None if acceso is None else ('load',) + acceso
+        if kind == NodeKind.UNOP and arena.text(nodo) == '-':
+            operando = self.expr(arena.first_child[nodo], tipo)
+            return None if operando is None else ('neg', operando)
+        if kind == NodeKind.BINOP and arena.text(nodo) in ('+', '-', '*'):
+            a, b = (self.expr(h, tipo) for h in arena.children(nodo))
+            return None if a is None or b is None else (arena.text(nodo), a, b)
+        return None
+
+    @staticmethod
+    def independent(comandos: List[tuple]) -> bool:
+        """Un arreglo escrito no se accede con otro índice (dependencia entre iteraciones)"""
+        accesos: Dict[int, set] = {}
+        escritos = set()
+        for acceso, escritura in plan_accesses(comandos):
+            accesos.setdefault(acceso[0], set()).add(acceso[1:])
+            if escritura:
+                escritos.add(acceso[0])
+        return all(len(accesos[ranura]) == 1 for ranura in escritos)
+
+def plan_accesses(comandos) -> List[Tuple[tuple, bool]]:
+    """((ranura, coef, desp), es_escritura) de cada acceso a arreglo del plan"""
+    accesos = []
+
+    def visitar(expresion: tuple):
+        if expresion[0] == 'load':
+            accesos.append((expresion[1:4], False))
+        elif expresion[0] in ('+', '-', '*', 'neg'):
+            for hijo in expresion[1:]:
+                visitar(hijo)
+    for comando in comandos:
+        if comando[0] == 'store':
+            visitar(comando[4])
+            accesos.append((comando[1:4], True))
+        else:
+            visitar(comando[2])
+    return accesos
+
+# ========== Ejecución (sobre los valores en tiempo de ejecución) ==========
+
+class _Fallback(Exception):
+    """El ciclo tiene que correr en la versión escalar"""
+
+def scalar_value(expresion: tuple, valores: tuple) -> int:
+    op = expresion[0]
+    if op == 'const':
+        return expresion[1]
+    if op == 'var':
+        return valores[expresion[1]]
+    if op == 'neg':
+        return -scalar_value(expresion[1], valores)
+    a = scalar_value(expresion[1], valores)
+    b = scalar_value(expresion[2], valores)
+    if op == '/':
+        if b == 0:  # el ciclo escalar informa la división por cero
+            raise _Fallback()
+        return int_div(a, b)
+    return a + b if op == '+' else a - b if op == '-' else a * b
+
+def checked(intervalo: Tuple[int, int]) -> Tuple[int, int]:
+    if intervalo[0] < INT64_MIN or intervalo[1] > INT64_MAX:
+        raise _Fallback()
+    return intervalo
+
+def vector_loop(plan: tuple, valores: tuple) -> Optional[tuple]:
+    """Valores finales de (i, reducciones...) tras ejecutar el ciclo con NumPy,
+    o None si tiene que correr la versión escalar (no se modificó nada)"""
+    if np is None:
+        return None
+    ranura_iv, paso_expr, limite_expr, inclusivo, comandos, salidas = plan
+    inicio = valores[ranura_iv]
+    try:
+        paso = scalar_value(paso_expr, valores)
+        limite = scalar_value(limite_expr, valores) + inclusivo
+        desplazamientos = {acceso: scalar_value(acceso[2], valores)
+                           for acceso, _ in plan_accesses(comandos)}
+    except _Fallback:
+        return None
+    if paso < 1 or limite - inicio < MIN_TRIP * paso:
+        return None
+    cuenta = (limite - inicio + paso - 1) // paso
+    ultimo = inicio + (cuenta - 1) * paso
+
+    # Arreglos, límites y aliasing antes de tocar nada
+    vistas: Dict[tuple, object] = {}
+    arreglos = []
+    for (ranura, coef, desp_expr), escritura in plan_accesses(comandos):
+        arreglo = valores[ranura]
+        if type(arreglo) is not memoryview or arreglo.format not in VECTOR_FORMATS:
+            return None
+        desplazamiento = desplazamientos[(ranura, coef, desp_expr)]
+        primero = coef * inicio + desplazamiento
+        if primero < 0 or coef * ultimo + desplazamiento >= len(arreglo):
+            return None
+        clave = (ranura, coef, desp_expr)
+        if clave not in vistas:
+            salto = coef * paso
+            vistas[clave] = np.asarray(arreglo)[primero:primero + salto * (cuenta - 1) + 1:salto]
+        arreglos.append((arreglo, (coef, desplazamiento), vistas[clave], escritura))
+    # Un arreglo escrito no puede cruzarse con otro acceso (alias o filas de una matriz)
+    for arreglo, indice, vista, escritura in arreglos:
+        for otro, otro_indice, otra_vista, _ in arreglos:
+            if escritura and (otro_indice != indice if otro is arreglo
+                              else np.may_share_memory(vista, otra_vista)):
+                return None
+
+    # Intervalos de cada subexpresión: todo tiene que caber en int64
+    guardados: Dict[int, Tuple[int, int]] = {}
+
+    def intervalo(expresion: tuple) -> Tuple[int, int]:
+        op = expresion[0]
+        if op in ('const', 'var', '/'):
+            valor = scalar_value(expresion, valores)
+            return checked((valor, valor))
+        if op == 'iv':
+            return checked((inicio, ultimo))
+        if op == 'load':
+            arreglo = valores[expresion[1]]
+            if id(arreglo) in guardados:
+                return guardados[id(arreglo)]
+            vista = vistas[expresion[1:4]]
+            return int(vista.min()), int(vista.max())
+        if op == 'neg':
+            a, b = intervalo(expresion[1])
+            return checked((-b, -a))
+        a, b = intervalo(expresion[1]), intervalo(expresion[2])
+        if op == '+':
+            return checked((a[0] + b[0], a[1] + b[1]))
+        if op == '-':
+            return checked((a[0] - b[1], a[1] - b[0]))
+        productos = [x * y for x in a for y in b]
+        return checked((min(productos), max(productos)))
+
+    sumas_exactas = {}
+    try:
+        for comando in comandos:
+            if comando[0] == 'store':
+                arreglo = valores[comando[1]]
+                if arreglo.format == 'q':
+                    guardados[id(arreglo)] = checked(intervalo(comando[4]))
+            else:
+                bajo, alto = intervalo(comando[2])
+                total = (cuenta * bajo, cuenta * alto)
+                sumas_exactas[comando[1]] = total[0] < INT64_MIN or total[1] > INT64_MAX
+    except _Fallback:
+        return None
+
+    # Ejecución, comando por comando sobre todas las iteraciones
+    indices = None
+
+    def valor(expresion: tuple):
+        nonlocal indices
+        op = expresion[0]
+        if op in ('const', 'var', '/'):
+            return scalar_value(expresion, valores)
+        if op == 'iv':
+            if indices is None:
+                indices = np.arange(inicio, ultimo + 1, paso, dtype=np.int64)
+            return indices
+        if op == 'load':
+            return vistas[expresion[1:4]]
+        if op == 'neg':
+            return -valor(expresion[1])
+        a, b = valor(expresion[1]), valor(expresion[2])
+        return a + b if op == '+' else a - b if op == '-' else a * b
+
+    resultado = list(valores)
+    for comando in comandos:
+        if comando[0] == 'store':
+            vistas[comando[1:4]][...] = valor(comando[4])
+            continue
+        _, ranura, expresion = comando
+        terminos = valor(expresion)
+        if not isinstance(terminos, np.ndarray):
+            total = cuenta * terminos
+        elif sumas_exactas[ranura]:
+            total = sum(terminos.tolist())
+        else:
+            total = int(terminos.sum(dtype=np.int64))
+        resultado[ranura] = valores[ranura] + total
+    resultado[ranura_iv] = inicio + cuenta * paso
+    return tuple(resultado[s] for s in salidas)
+
+# ========== Backend ==========
+
+class VectorProgram(PythonProgram):
+    """Programa del backend Python con _vloop disponible en el código generado"""
+    namespace = dict(RUNTIME_NAMESPACE, _vloop=vector_loop)
+
+class VectorizingTranspiler(PythonTranspiler):
+    """Backend Python que antepone la versión vectorial a los ciclos reconocidos"""
+
+    def __init__(self, arena: ASTArena, checker: SemanticChecker):
+        super().__init__(arena, checker)
+        self.loops = 0
+        self.vectorized: List[int] = []
+
+    def is_local(self, nombre: str) -> bool:
+        return not self.resolve(nombre).startswith('g_')
+
+    def transpile_statement(self, nodo: int):
+        arena = self.arena
+        if arena.kind[nodo] != NodeKind.WHILE:
+            return super().transpile_statement(nodo)
+        self.loops += 1
+        analisis = LoopVectorizer(arena, self.types, self.is_local).analyze(nodo)
+        if analisis is None:
+            return super().transpile_statement(nodo)
+        plan, nombres = analisis
+        self.vectorized.append(arena.line(nodo))
+        linea = arena.line(nodo)
+        identificadores = [self.resolve(nombre) for nombre in nombres]
+        salidas = ', '.join(identificadores[s] for s in plan[-1])
+        self.emit(f"_r = _vloop({plan!r}, ({', '.join(identificadores)},))", linea)
+        self.emit("if _r is None:", linea)
+        self.indent += 1
+        super().transpile_statement(nodo)
+        self.indent -= 1
+        self.emit("else:", linea)
+        self.emit(f"    {salidas}, = _r", linea)
+
+    def compile(self) -> VectorProgram:
+        programa = super().compile()
+        return VectorProgram(programa.code, programa.positions)
+
+def compile_vectorized(arena: ASTArena, checker: SemanticChecker) -> VectorProgram:
+    return VectorizingTranspiler(arena, checker).compile()
+
+def main():
+    import argparse
+    import time
+    from src.runtime_mini0 import Mini0RuntimeError
+    arg_parser = argparse.ArgumentParser(description="Ejecuta un programa Mini-0 vectorizando sus ciclos con NumPy")
+    arg_parser.add_argument('archivos', nargs='+', help="archivos .mini0")
+    arg_parser.add_argument('--show', action='store_true', help="imprime el código Python generado")
+    arg_parser.add_argument('--report', action='store_true',
+                            help="solo informa qué ciclos se vectorizan (sin ejecutar)")
+    args = arg_parser.parse_args()
+
+    if np is None and not (args.show or args.report):
+        print("⚠ NumPy no está instalado: todos los ciclos corren en la versión escalar")
+    for archivo in args.archivos:
+        with open(archivo, 'r', encoding='utf-8') as f:
+            codigo = f.read()
+        try:
+            transpilador = VectorizingTranspiler(*load_program(codigo))
+            if args.show:
+                print(transpilador.transpile()[0])
+                continue
+            programa = transpilador.compile()
+            lineas = ', '.join(map(str, transpilador.vectorized)) or '—'
+            print(f"{archivo}: {len(transpilador.vectorized)}/{transpilador.loops} ciclos "
+                  f"vectorizables (líneas {lineas})")
+            if args.report:
+                continue
+            inicio = time.perf_counter()
+            valor = programa.run()
+            ejecucion = time.perf_counter() - inicio
+        except (CompileError, Mini0RuntimeError) as e:
+            print(f"❌ {archivo}: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"  main() retornó: {valor}  ({ejecucion * 1000:.2f} ms)")
+
+if __name__ == "__main__":
+    main()
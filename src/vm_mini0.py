@@ -0,0 +1,303 @@
+"""
+Máquina virtual de pila para el bytecode de Mini-0
+Un único ciclo de despacho ejecuta todas las funciones: las llamadas
+apilan marcos (Frame) explícitos en lugar de usar la pila de Python, y
+los valores intermedios comparten una sola pila de operandos.
+
+Con ExecutionLimits la VM corta programas que no terminan o que piden
+demasiada memoria: el presupuesto de instrucciones se compara solo en los
+saltos y las llamadas (una vez por vuelta de ciclo, no por instrucción), el
+total de bytes pedidos por new antes de crear cada arreglo y la profundidad
+en cada llamada. Exceder uno lanza Mini0LimitError con la línea Mini-0.
+Sin límite de profundidad la VM corta igual en sys.getrecursionlimit()
+llamadas, con el mismo error que los motores que recurren en Python.
+
+El perfilador (profiler_mini0.ProfilingVM) usa este mismo ciclo: con
+'profiling' activo, execute avisa cada CALL y RETURN con enter y leave y
+cuenta los saltos tomados en la lista que estos le retornan. Sin perfilador
+el costo es una comparación por salto tomado, llamada y retorno.
+"""
+
+import time
+from typing import List, Optional
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.bytecode_mini0 import (
+    Program, FunctionCode, compile_source, disassemble,
+    LOAD_CONST, LOAD_LOCAL, STORE_LOCAL, LOAD_GLOBAL, STORE_GLOBAL,
+    ADD, SUB, MUL, DIV, NEG, NOT, EQ, NE, IS, IS_NOT, LT, LE, GT, GE,
+    JUMP, JUMP_IF_FALSE, JUMP_IF_FALSE_OR_POP, JUMP_IF_TRUE_OR_POP,
+    CALL, RETURN, POP, NEW_ARRAY, INDEX_LOAD, INDEX_STORE, CONCAT, CHAR_AT,
+)
+from src.runtime_mini0 import (
+    CompileError, ExecutionLimits, Mini0LimitError, Mini0RuntimeError, ENTRY_POINT,
+    array_bytes, new_array, runtime_error,
+)
+from src.strings_mini0 import char_at, concat, flatten_value
+
+class Frame:
+    """Marco de activación de una llamada pendiente"""
+
+    __slots__ = ('function', 'locals', 'pc')
+
+    def __init__(self, function: FunctionCode, locals_: list, pc: int):
+        self.function = function
+        self.locals = locals_
+        self.pc = pc
+
+class VM:
+    """Ejecuta un Program; 'instructions' cuenta las instrucciones ejecutadas y
+    'allocated' los bytes pedidos por new (ver ExecutionLimits)"""
+
+    # ProfilingVM lo activa y define enter/leave (ver el docstring del módulo)
+    profiling = False
+
+    def __init__(self, program: Program, limits: Optional[ExecutionLimits] = None):
+        self.program = program
+        self.globals = list(program.global_defaults)
+        self.instructions = 0
+        self.allocated = 0
+        self.limits = limits or ExecutionLimits()
+
+    def run(self, nombre: str = ENTRY_POINT, args=()):
+        """Ejecuta la función 'nombre' y retorna su valor de retorno"""
+        funcion = self.program.entry(nombre)
+        locals_ = list(args) + [None] * (funcion.n_locals - len(args))
+        return flatten_value(self.execute(funcion, locals_))
+
+    def execute(self, funcion: FunctionCode, locals_: list):
+        consts = self.program.consts
+        functions = self.program.functions
+        globals_ = self.globals
+        limites = self.limits
+        # Sin límite: un máximo inalcanzable, para no agregar otra comparación
+        max_instrucciones = limites.instructions if limites.instructions is not None else sys.maxsize
+        # Sin --max-depth, la misma cota que la pila de Python en los demás motores
+        max_profundidad = limites.depth if limites.depth is not None else sys.getrecursionlimit()
+        max_memoria = limites.memory
+        perfilar = self.profiling
+        saltos = self.enter(None, funcion) if perfilar else None
+        frames: List[Frame] = []
+        stack: list = []
+        push = stack.append
+        pop = stack.pop
+        code = funcion.code
+        pc = 0
+        ejecutadas = 0
+        try:
+            while True:
+                op = code[pc]
+                arg = code[pc + 1]
+                pc += 2
+                ejecutadas += 1
+                # Orden aproximado por frecuencia en programas con ciclos
+                if op == LOAD_LOCAL:
+                    push(locals_[arg])
+                elif op == LOAD_CONST:
+                    push(consts[arg])
+                elif op == STORE_LOCAL:
+                    locals_[arg] = pop()
+                elif op == JUMP_IF_FALSE:
+                    if not pop():
+                        if perfilar:
+                            saltos[pc] += 1
+                        pc = arg
+                elif op == ADD:
+                    b = pop()
+                    stack[-1] += b
+                elif op == LT:
+                    b = pop()
+                    push(pop() < b)
+                elif op == JUMP:
+                    # Todo ciclo pasa por aquí: el presupuesto se verifica una vez por vuelta
+                    if ejecutadas > max_instrucciones:
+                        raise Mini0LimitError('instructions', max_instrucciones,
+                                              funcion.line_at(pc - 2))
+                    if perfilar:
+                        saltos[pc] += 1
+                    pc = arg
+                elif op == SUB:
+                    b = pop()
+                    stack[-1] -= b
+                elif op == INDEX_LOAD:
+                    i = pop()
+                    if i < 0:
+                        raise IndexError(i)
+                    push(pop()[i])
+                elif op == INDEX_STORE:
+                    v = pop()
+                    i = pop()
+                    if i < 0:
+                        raise IndexError(i)
+                    pop()[i] = v
+                elif op == MUL:
+                    b = pop()
+                    stack[-1] *= b
+                elif op == LE:
+                    b = pop()
+                    push(pop() <= b)
+                elif op == GT:
+                    b = pop()
+                    push(pop() > b)
+                elif op == GE:
+                    b = pop()
+                    push(pop() >= b)
+                elif op == EQ:
+                    b = pop()
+                    push(pop() == b)
+                elif op == NE:
+                    b = pop()
+                    push(pop() != b)
+                elif op == LOAD_GLOBAL:
+                    push(globals_[arg])
+                elif op == STORE_GLOBAL:
+                    globals_[arg] = pop()
+                elif op == CALL:
+                    if ejecutadas > max_instrucciones or len(frames) >= max_profundidad:
+                        linea = funcion.line_at(pc - 2)
+                        if len(frames) < max_profundidad:
+                            raise Mini0LimitError('instructions', max_instrucciones, linea)
+                        if limites.depth is None:
+                            raise runtime_error(RecursionError(), linea)
+                        raise Mini0LimitError('depth', limites.depth, linea)
+                    llamada = functions[arg]
+                    if perfilar:
+                        saltos = self.enter(funcion, llamada)
+                    n = llamada.n_params
+                    frames.append(Frame(funcion, locals_, pc))
+                    if n:
+                        nuevos = stack[-n:]
+                        del stack[-n:]
+                    else:
+                        nuevos = []
+                    if llamada.n_locals > n:
+                        nuevos.extend([None] * (llamada.n_locals - n))
+                    funcion = llamada
+                    code = funcion.code
+                    locals_ = nuevos
+                    pc = 0
+                elif op == RETURN:
+                    # El valor de retorno queda en el tope de la pila
+                    if not frames:
+                        if perfilar:
+                            self.leave(funcion, None)
+                        return pop()
+                    marco = frames.pop()
+                    if perfilar:
+                        saltos = self.leave(funcion, marco.function)
+                    funcion = marco.function
+                    code = funcion.code
+                    locals_ = marco.locals
+                    pc = marco.pc
+                elif op == DIV:
+                    b = pop()
+                    a = pop()
+                    q = a // b
+                    if q < 0 and q * b != a:
+                        q += 1
+                    push(q)
+                elif op == POP:
+                    pop()
+                elif op == NOT:
+                    push(not pop())
+                elif op == NEG:
+                    push(-pop())
+                elif op == JUMP_IF_FALSE_OR_POP:
+                    if not stack[-1]:
+                        if perfilar:
+                            saltos[pc] += 1
+                        pc = arg
+                    else:
+                        pop()
+                elif op == JUMP_IF_TRUE_OR_POP:
+                    if stack[-1]:
+                        if perfilar:
+                            saltos[pc] += 1
+                        pc = arg
+                    else:
+                        pop()
+                elif op == NEW_ARRAY:
+                    tamano = pop()
+                    # Antes de pedir la memoria: un new enorme no llega a asignarse.
+                    # Sin límite, new_array da el error de ejecución de siempre
+                    self.allocated += max(0, array_bytes(tamano, consts[arg]))
+                    if max_memoria is not None and self.allocated > max_memoria:
+                        raise Mini0LimitError('memory', max_memoria, funcion.line_at(pc - 2))
+                    push(new_array(tamano, consts[arg]))
+                elif op == CONCAT:
+                    b = pop()
+                    push(concat(pop(), b))
+                elif op == CHAR_AT:
+                    i = pop()
+                    push(char_at(pop(), i))
+                elif op == IS:
+                    b = pop()
+                    push(pop() is b)
+                elif op == IS_NOT:
+                    b = pop()
+                    push(pop() is not b)
+                else:
+                    raise Mini0RuntimeError(f"opcode inválido {op}", funcion.line_at(pc - 2))
+        except (ZeroDivisionError, IndexError, TypeError, ValueError, OverflowError, MemoryError) as e:
+            raise runtime_error(e, funcion.line_at(pc - 2)) from None
+        finally:
+            self.instructions += ejecutadas
+
+def run_source(codigo: str, nombre: str = ENTRY_POINT):
+    """Compila y ejecuta código Mini-0; retorna (valor, instrucciones ejecutadas)"""
+    vm = VM(compile_source(codigo))
+    valor = vm.run(nombre)
+    return valor, vm.instructions
+
+def add_limit_arguments(arg_parser):
+    """Opciones --max-instructions, --max-memory y --max-depth"""
+    arg_parser.add_argument('--max-instructions', type=int, metavar='N',
+                            help="corta la ejecución después de unas N instrucciones")
+    arg_parser.add_argument('--max-memory', type=int, metavar='BYTES',
+                            help="máximo de bytes pedidos por new en total")
+    arg_parser.add_argument('--max-depth', type=int, metavar='N',
+                            help="máximo de llamadas anidadas")
+
+def limits_from_args(args) -> Optional[ExecutionLimits]:
+    """ExecutionLimits de las opciones de add_limit_arguments (None si no hay ninguna)"""
+    if args.max_instructions is None and args.max_memory is None and args.max_depth is None:
+        return None
+    return ExecutionLimits(args.max_instructions, args.max_memory, args.max_depth)
+
+def main():
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Ejecuta un programa Mini-0 en la máquina virtual")
+    arg_parser.add_argument('archivo')
+    arg_parser.add_argument('--dis', action='store_true', help="muestra el bytecode generado")
+    arg_parser.add_argument('--stats', action='store_true', help="instrucciones ejecutadas y por segundo")
+    add_limit_arguments(arg_parser)
+    args = arg_parser.parse_args()
+
+    with open(args.archivo, 'r', encoding='utf-8') as f:
+        codigo = f.read()
+    try:
+        programa = compile_source(codigo)
+    except CompileError as e:
+        for error in e.errors:
+            print(f"  {error}", file=sys.stderr)
+        sys.exit(1)
+    if args.dis:
+        for funcion in programa.functions:
+            print(disassemble(programa, funcion))
+            print()
+    vm = VM(programa, limits_from_args(args))
+    inicio = time.perf_counter()
+    try:
+        valor = vm.run()
+    except Mini0RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    segundos = time.perf_counter() - inicio
+    print(f"Resultado: {valor}")
+    if args.stats:
+        print(f"{vm.instructions:,} instrucciones en {segundos * 1000:.2f} ms "
+              f"({vm.instructions / max(segundos, 1e-9):,.0f} instr/s)")
+
+if __name__ == "__main__":
+    main()